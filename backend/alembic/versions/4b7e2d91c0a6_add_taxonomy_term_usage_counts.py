@@ -0,0 +1,54 @@
+"""add taxonomy term usage counts
+
+Revision ID: 4b7e2d91c0a6
+Revises: 8fda3e22245d
+Create Date: 2026-10-17 10:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b7e2d91c0a6"
+down_revision: Union[str, Sequence[str], None] = "8fda3e22245d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TERM_ASSIGNMENTS = (
+    ("categories", "project_categories", "category_id"),
+    ("tags", "project_tags", "tag_id"),
+    ("tech_stacks", "project_tech_stacks", "tech_stack_id"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for term_table, join_table, term_fk in _TERM_ASSIGNMENTS:
+        op.add_column(
+            term_table,
+            sa.Column("usage_count", sa.Integer(), server_default="0", nullable=False),
+        )
+        op.execute(
+            f"""
+            UPDATE {term_table} AS term
+            SET usage_count = counted.usage_count
+            FROM (
+                SELECT assignment.{term_fk} AS term_id, count(*) AS usage_count
+                FROM {join_table} AS assignment
+                JOIN projects ON projects.id = assignment.project_id
+                WHERE projects.is_published = true AND projects.deleted_at IS NULL
+                GROUP BY assignment.{term_fk}
+            ) AS counted
+            WHERE term.id = counted.term_id
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for term_table, _, _ in reversed(_TERM_ASSIGNMENTS):
+        op.drop_column(term_table, "usage_count")
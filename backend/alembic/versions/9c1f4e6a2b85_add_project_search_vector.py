@@ -0,0 +1,56 @@
+"""add project search vector
+
+Revision ID: 9c1f4e6a2b85
+Revises: 4b7e2d91c0a6
+Create Date: 2026-10-17 14:02:19.770431
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1f4e6a2b85"
+down_revision: Union[str, Sequence[str], None] = "4b7e2d91c0a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.models.project.PROJECT_SEARCH_VECTOR_EXPRESSION.
+_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', title), 'A') || "
+    "setweight(to_tsvector('english', short_description), 'B') || "
+    "setweight(to_tsvector('english', coalesce(long_description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a stored generated column rewrites `projects` once.
+    op.add_column(
+        "projects",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(_SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_projects_search_vector",
+        "projects",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_projects_search_vector", table_name="projects", postgresql_using="gin"
+    )
+    op.drop_column("projects", "search_vector")
@@ -1,3 +1,5 @@
+import hashlib
+import time
 from uuid import UUID
 
 import jwt
@@ -6,23 +8,40 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import get_settings
-from app.db.database import get_db
+from app.db.database import get_db, read_your_writes
 from app.models.user import User
 from app.services.auth_bootstrap import (
     AuthBootstrapService,
     AuthIdentity,
     EmailPolicyError,
+    SupabaseAdminUnavailableError,
     UsernameConflictError,
 )
+from app.services.jwks import JwksFetchError, JwksProvider, SigningKeyNotFoundError
+from app.utils.cache import CacheStats, ExpiringLRUCache
 
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 settings = get_settings()
-_jwk_client = jwt.PyJWKClient(settings.SUPABASE_JWKS_URL)
+jwks_provider = JwksProvider(
+    settings.SUPABASE_JWKS_URL,
+    refresh_interval=settings.AUTH_JWKS_REFRESH_INTERVAL_SECONDS,
+    min_refresh_interval=settings.AUTH_JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+    timeout=settings.AUTH_JWKS_FETCH_TIMEOUT_SECONDS,
+)
+_claims_cache: ExpiringLRUCache[bytes, dict[str, object]] | None = (
+    ExpiringLRUCache(max_entries=settings.AUTH_JWT_CACHE_MAX_ENTRIES)
+    if settings.AUTH_JWT_CACHE_ENABLED
+    else None
+)
 
 
-def _decode_supabase_jwt(token: str) -> dict[str, object]:
-    signing_key = _jwk_client.get_signing_key_from_jwt(token).key
+def _verify_supabase_jwt(token: str) -> dict[str, object]:
+    kid = jwt.get_unverified_header(token).get("kid")
+    signing_key = jwks_provider.get_signing_key(
+        kid if isinstance(kid, str) else None
+    ).key
     payload = jwt.decode(
         token,
         signing_key,
@@ -36,6 +55,39 @@ def _decode_supabase_jwt(token: str) -> dict[str, object]:
     return payload
 
 
+def _decode_supabase_jwt(token: str) -> dict[str, object]:
+    """Return verified claims, reusing prior verification until the token's `exp`."""
+    if _claims_cache is None:
+        return _verify_supabase_jwt(token)
+
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _claims_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    payload = _verify_supabase_jwt(token)
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        _claims_cache.set(cache_key, payload, ttl=float(exp) - time.time())
+    return payload
+
+
+async def _load_verified_claims(token: str) -> dict[str, object]:
+    """Decode a token, refreshing the JWKS once if it was signed with an unknown key."""
+    try:
+        return _decode_supabase_jwt(token)
+    except SigningKeyNotFoundError as exc:
+        await jwks_provider.ensure_key(exc.kid)
+        return _decode_supabase_jwt(token)
+
+
+def get_jwt_claims_cache_stats() -> CacheStats | None:
+    """Return verified-claims cache counters, or None when caching is disabled."""
+    if _claims_cache is None:
+        return None
+    return _claims_cache.stats
+
+
 def _read_optional_str(payload: dict[str, object], key: str) -> str | None:
     raw = payload.get(key)
     if not isinstance(raw, str):
@@ -70,7 +122,7 @@ async def _resolve_authenticated_user(
 ) -> User:
     """Validate a bearer token, sync request auth state, and return the user."""
     try:
-        payload = _decode_supabase_jwt(token)
+        payload = await _load_verified_claims(token)
         auth_user_id_str = payload.get("sub")
         raw_email = payload.get("email")
 
@@ -100,6 +152,11 @@ async def _resolve_authenticated_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         )
+    except JwksFetchError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Token verification unavailable",
+        )
 
     service = AuthBootstrapService(db, settings)
     try:
@@ -121,6 +178,10 @@ async def _resolve_authenticated_user(
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(exc)
         ) from exc
+    except SupabaseAdminUnavailableError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
 
     # Shared Contract: Set auth context in backend request state
     request.state.current_user_id = user.id
@@ -135,7 +196,11 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """Require a valid bearer token and return the authenticated user."""
-    return await _resolve_authenticated_user(request, credentials.credentials, db)
+    user = await _resolve_authenticated_user(request, credentials.credentials, db)
+    if request.method not in _SAFE_METHODS:
+        # Writes require auth; keep this user's follow-up reads on the primary.
+        read_your_writes.mark_write(user.id)
+    return user
 
 
 async def get_current_user_optional(
@@ -1,20 +1,26 @@
 from datetime import date
-from typing import Literal
 
 from fastapi import Depends, Query
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db.database import get_db
-from app.schemas.search import ProjectSearchRequest
-from app.services.search import PostgresSearchService, SearchService
+from app.core.config import get_settings
+from app.db.database import get_read_db
+from app.schemas.search import ProjectSearchRequest, SearchSort, TaxonomyMatch
+from app.services.search import (
+    InMemorySearchService,
+    PostgresSearchService,
+    SearchService,
+)
 
 
 def get_search_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> SearchService:
     """Return the configured project search service implementation."""
+    if get_settings().SEARCH_BACKEND == "memory":
+        return InMemorySearchService(db)
     return PostgresSearchService(db)
 
 
@@ -23,7 +29,10 @@ def get_project_search_request(
         default=None,
         description=(
             "Optional keyword query matched against project `title` and "
-            "`short_description`."
+            "`short_description`. With `sort=relevance` it is a full-text query "
+            "over title and both descriptions (quotes, `or` and `-` supported); "
+            "with `sort=similarity` it tolerates typos in title and short "
+            "description words."
         ),
     ),
     categories: list[str] = Query(
@@ -53,6 +62,14 @@ def get_project_search_request(
         alias="tech_stack[]",
         include_in_schema=False,
     ),
+    match: TaxonomyMatch = Query(
+        default="any",
+        description=(
+            "How terms within one taxonomy family combine: `any` (default) "
+            "matches at least one, `all` requires every one. Families always "
+            "combine with AND."
+        ),
+    ),
     limit: int = Query(
         default=20,
         description="Page size. Values are clamped to the service-supported range.",
@@ -61,9 +78,13 @@ def get_project_search_request(
         default=None,
         description="Opaque pagination cursor returned by a previous search response.",
     ),
-    sort: Literal["top", "new"] = Query(
+    sort: SearchSort = Query(
         default="top",
-        description="Sort mode (`top` or `new`). Defaults to `top`.",
+        description=(
+            "Sort mode (`top`, `new`, `relevance` or `similarity`). Defaults to "
+            "`top`. `relevance` ranks full-text matches of `q`; `similarity` ranks "
+            "trigram word similarity to `q`. Both require `q`."
+        ),
     ),
     published_from: date | None = Query(
         default=None,
@@ -79,6 +100,13 @@ def get_project_search_request(
             "`YYYY-MM-DD` format. Ignored for `sort=new`."
         ),
     ),
+    facets: bool = Query(
+        default=False,
+        description=(
+            "Also return per-family taxonomy term counts over every matching "
+            "project, capped per family."
+        ),
+    ),
 ) -> ProjectSearchRequest:
     """Build and validate the search query contract for project search requests."""
     try:
@@ -87,11 +115,13 @@ def get_project_search_request(
             categories=[*categories, *categories_legacy],
             tags=[*tags, *tags_legacy],
             tech_stack=[*tech_stack, *tech_stack_legacy],
+            match=match,
             limit=limit,
             cursor=cursor,
             sort=sort,
             published_from=published_from,
             published_to=published_to,
+            facets=facets,
         )
     except ValidationError as exc:
         raise RequestValidationError(exc.errors()) from exc
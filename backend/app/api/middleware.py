@@ -0,0 +1,45 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Track SQL statements per request and report them.
+
+    Adds a `Server-Timing` header with the statement count, total DB time and
+    slowest statement time, and logs the same numbers once the response is
+    sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_server_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_with_server_timing)
+
+        if stats.count:
+            logger.info(
+                "%s %s queries=%d db_ms=%.1f slowest_ms=%.1f",
+                scope["method"],
+                scope["path"],
+                stats.count,
+                stats.total_ms,
+                stats.slowest_ms,
+            )
@@ -3,9 +3,13 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.schemas.health import HealthResponse
-from app.services.health import get_health_response, get_db_health_response
-from app.db.database import get_db
+from app.schemas.health import DbPoolStatsResponse, HealthResponse
+from app.services.health import (
+    get_db_health_response,
+    get_db_pool_stats_response,
+    get_health_response,
+)
+from app.db.database import engine, get_db
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -45,3 +49,19 @@ async def db_health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
     except Exception:
         logger.exception("Database health check failed")
         raise HTTPException(status_code=503, detail="Database unavailable")
+
+
+@router.get(
+    "/db-pool",
+    summary="DB pool stats",
+    description="Report connection pool usage and checkout wait times for this worker",
+    response_model=DbPoolStatsResponse,
+)
+def db_pool_stats() -> DbPoolStatsResponse:
+    """
+    Connection pool stats endpoint.
+
+    Returns:
+        DbPoolStatsResponse: Pool occupancy, overflow, and checkout wait percentiles
+    """
+    return get_db_pool_stats_response(engine)
@@ -8,7 +8,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.api.deps.auth import get_current_user, get_current_user_optional
 from app.api.deps.policy import raise_policy_forbidden
 from app.api.deps.search import get_project_search_request, get_search_service
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.models.user import User
 from app.policy.roles import PolicyDeniedError
 from app.schemas.project import (
@@ -99,7 +99,7 @@ async def create_project(
 )
 async def get_project_detail_by_slug(
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User | None = Depends(get_current_user_optional),
 ) -> ProjectDetailResponse:
     """Return project details by immutable slug with team and taxonomy parity."""
@@ -119,12 +119,19 @@ async def get_project_detail_by_slug(
     summary="Search published projects",
     description=(
         "Search published, non-deleted projects using optional keyword query and taxonomy "
-        "filters with cursor pagination. Keyword matching is case-insensitive and limited "
-        "to `title` + `short_description`. Taxonomy filters apply OR logic within each "
-        "family and AND logic across families. Unknown taxonomy terms are treated as "
+        "filters with cursor pagination. For `top` and `new`, keyword matching is "
+        "case-insensitive and limited to `title` + `short_description`. Taxonomy filters apply OR logic within each "
+        "family (AND with `match=all`) and AND logic across families. Unknown "
+        "taxonomy terms are treated as "
         "non-matching values (not validation errors). "
         "For `sort=top`, published date-window defaults match the feed (last 90 days). "
-        "Relevance sophistication is intentionally deferred in v1."
+        "With `facets=true`, the response also carries per-family taxonomy term "
+        "counts over all matches, cached briefly per search. "
+        "`sort=relevance` requires `q` and switches keyword matching to English "
+        "full-text search over title, short and long description, ranked with title "
+        "matches weighted highest. `sort=similarity` also requires `q` and matches "
+        "title and short description words by trigram similarity, so typos still "
+        "match. An empty first page of a keyword search carries `suggestions`."
     ),
     response_model=ProjectSearchResponse,
     responses={
@@ -165,7 +172,7 @@ async def search_projects(
 )
 async def get_project_detail(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User | None = Depends(get_current_user_optional),
 ) -> ProjectDetailResponse:
     """Return project details with team and taxonomy parity when requester can view."""
@@ -226,7 +233,7 @@ async def delete_project(
 )
 async def list_project_members(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User | None = Depends(get_current_user_optional),
 ) -> list[ProjectMemberInfo]:
     """List members for a project when the requester has project visibility."""
@@ -590,7 +597,7 @@ async def list_projects(
             "Ignored for `sort=new`. Defaults to today (UTC date)."
         ),
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User | None = Depends(get_current_user_optional),
 ) -> ProjectListResponse:
     """Return the published projects feed with project-card taxonomy parity.
@@ -1,16 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps.auth import get_current_user
 from app.api.deps.policy import require_policy
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.models.user import User
 from app.policy.roles import require_taxonomy_management
-from app.schemas.taxonomy import TaxonomyTermCreateRequest, TaxonomyTermResponse
+from app.schemas.taxonomy import (
+    TaxonomyFamily,
+    TaxonomyTermCreateRequest,
+    TaxonomyTermResponse,
+)
 from app.services.taxonomy import TaxonomyConflictError, TaxonomyService
+from app.services.taxonomy_dictionary import TaxonomyListing
+from app.utils.http_cache import etag_matches
 
 router = APIRouter(prefix="/taxonomy")
 
+# Clients revalidate every time; an unchanged list costs a 304 and no body.
+_LISTING_CACHE_CONTROL = "private, no-cache"
+_LISTING_RESPONSES: dict[int | str, dict[str, str]] = {
+    304: {"description": "Term list unchanged since the given ETag"},
+    401: {"description": "Authentication required"},
+}
+
+
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+
 
 def _require_taxonomy_admin(user: User) -> None:
     require_policy(
@@ -19,24 +45,35 @@ def _require_taxonomy_admin(user: User) -> None:
     )
 
 
+def _listing_response(request: Request, listing: TaxonomyListing) -> Response:
+    headers = {"ETag": listing.etag, "Cache-Control": _LISTING_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), listing.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=listing.body, media_type="application/json", headers=headers
+    )
+
+
 @router.get(
     "/categories",
     summary="List taxonomy categories",
     description=(
         "Return the full taxonomy categories list for authenticated users. "
-        "Clients are responsible for filtering/sorting for typeahead UX."
+        "Clients are responsible for filtering/sorting for typeahead UX. "
+        "Send the last `ETag` as `If-None-Match` to get a 304 when unchanged."
     ),
     response_model=list[TaxonomyTermResponse],
-    responses={401: {"description": "Authentication required"}},
+    responses=_LISTING_RESPONSES,
 )
 async def list_categories(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list[TaxonomyTermResponse]:
+) -> Response:
     """Return all category terms in deterministic alphabetical order."""
     _ = current_user
     service = TaxonomyService(db)
-    return await service.list_categories()
+    return _listing_response(request, await service.get_categories_listing())
 
 
 @router.post(
@@ -75,19 +112,21 @@ async def create_category(
     summary="List taxonomy tags",
     description=(
         "Return the full taxonomy tags list for authenticated users. "
-        "Clients are responsible for filtering/sorting for typeahead UX."
+        "Clients are responsible for filtering/sorting for typeahead UX. "
+        "Send the last `ETag` as `If-None-Match` to get a 304 when unchanged."
     ),
     response_model=list[TaxonomyTermResponse],
-    responses={401: {"description": "Authentication required"}},
+    responses=_LISTING_RESPONSES,
 )
 async def list_tags(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list[TaxonomyTermResponse]:
+) -> Response:
     """Return all tag terms in deterministic alphabetical order."""
     _ = current_user
     service = TaxonomyService(db)
-    return await service.list_tags()
+    return _listing_response(request, await service.get_tags_listing())
 
 
 @router.post(
@@ -126,19 +165,21 @@ async def create_tag(
     summary="List taxonomy tech stacks",
     description=(
         "Return the full taxonomy tech stack list for authenticated users. "
-        "Clients are responsible for filtering/sorting for typeahead UX."
+        "Clients are responsible for filtering/sorting for typeahead UX. "
+        "Send the last `ETag` as `If-None-Match` to get a 304 when unchanged."
     ),
     response_model=list[TaxonomyTermResponse],
-    responses={401: {"description": "Authentication required"}},
+    responses=_LISTING_RESPONSES,
 )
 async def list_tech_stacks(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list[TaxonomyTermResponse]:
+) -> Response:
     """Return all tech stack terms in deterministic alphabetical order."""
     _ = current_user
     service = TaxonomyService(db)
-    return await service.list_tech_stacks()
+    return _listing_response(request, await service.get_tech_stacks_listing())
 
 
 @router.post(
@@ -170,3 +211,37 @@ async def create_tech_stack(
         return await service.create_tech_stack(payload)
     except TaxonomyConflictError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+@router.get(
+    "/{family}/suggest",
+    summary="Suggest taxonomy terms by prefix",
+    description=(
+        "Return up to `limit` terms from one taxonomy family whose name starts "
+        "with `prefix` (case-insensitive), most used by published projects first. "
+        "Usage counts refresh with the cached vocabulary, so ranking can trail "
+        "recent assignments by a few minutes."
+    ),
+    response_model=list[TaxonomyTermResponse],
+    responses={401: {"description": "Authentication required"}},
+)
+async def suggest_terms(
+    family: TaxonomyFamily = Path(description="Taxonomy family to search."),
+    prefix: str = Query(
+        min_length=1,
+        max_length=64,
+        description="Leading characters of the term name.",
+    ),
+    limit: int = Query(
+        default=SUGGEST_DEFAULT_LIMIT,
+        ge=1,
+        le=SUGGEST_MAX_LIMIT,
+        description="Maximum number of suggestions.",
+    ),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> list[TaxonomyTermResponse]:
+    """Return prefix matches from the in-memory vocabulary index."""
+    _ = current_user
+    service = TaxonomyService(db)
+    return await service.suggest_terms(family, prefix, limit=limit)
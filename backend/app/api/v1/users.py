@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps.auth import get_current_user, get_current_user_optional
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.models.user import User
 from app.schemas.project import ProjectListResponse
 from app.schemas.user import UserPrivate, UserPublic, UserUpdate
@@ -146,7 +146,7 @@ async def list_my_voted_projects(
         default=None,
         description="Opaque pagination cursor from a previous response.",
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> ProjectListResponse:
     """Return voted project cards, including computed team size and taxonomy fields."""
@@ -186,7 +186,7 @@ async def list_my_projects(
     sort: ProjectsSort = "new",
     published_from: ProjectsPublishedFrom = None,
     published_to: ProjectsPublishedTo = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> ProjectListResponse:
     """Return creator/member-associated project cards, including drafts, with taxonomy parity."""
@@ -217,7 +217,7 @@ async def list_my_projects(
 )
 async def get_user_profile(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> UserPublic:
     """Return public-safe fields for a given user."""
     service = UserService(db)
@@ -241,7 +241,7 @@ async def get_user_profile(
 )
 async def get_user_profile_by_username(
     username: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> UserPublic:
     """Return public-safe fields for a given username (case-insensitive lookup)."""
     service = UserService(db)
@@ -316,7 +316,7 @@ async def list_user_projects(
     sort: ProjectsSort = "new",
     published_from: ProjectsPublishedFrom = None,
     published_to: ProjectsPublishedTo = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User | None = Depends(get_current_user_optional),
 ) -> ProjectListResponse:
     """Return a user's published associated project cards with team/taxonomy parity."""
@@ -356,7 +356,7 @@ async def list_user_projects_by_username(
     sort: ProjectsSort = "new",
     published_from: ProjectsPublishedFrom = None,
     published_to: ProjectsPublishedTo = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User | None = Depends(get_current_user_optional),
 ) -> ProjectListResponse:
     """Return username-associated project cards with team/taxonomy parity."""
@@ -1,5 +1,6 @@
 import json
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,10 +14,76 @@ class Settings(BaseSettings):
     DATABASE_SSL_VERIFY: bool = True
     DATABASE_JWT_SECRET: str | None = None
     DATABASE_CONNECT_TIMEOUT: int = 10
+    # `pooler` for Supavisor/PgBouncer transaction pooling, `direct` for a
+    # dedicated Postgres where prepared statements can be cached.
+    DATABASE_CONNECTION_MODE: Literal["pooler", "direct"] = "pooler"
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    # Optional replica for GET handlers; reads fall back to DATABASE_URL.
+    DATABASE_READ_URL: str | None = None
+    # After a user's write, their reads stay on the primary for this long.
+    DATABASE_READ_STICKY_SECONDS: float = 5.0
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30.0
+    # Ping connections idle at least this long on checkout; 0 pings every
+    # checkout, a negative value disables the check.
+    DATABASE_POOL_PING_IDLE_SECONDS: float = 30.0
+    # Log per-request SQL count/time and send it in a Server-Timing header.
+    DATABASE_QUERY_STATS_ENABLED: bool = True
+    # Statements slower than this are logged; <= 0 disables the slow-query log.
+    DATABASE_SLOW_QUERY_THRESHOLD_MS: float = 250.0
+    # Share of slow reads re-run under EXPLAIN (ANALYZE, BUFFERS); 0 disables.
+    DATABASE_SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
+    DATABASE_SLOW_QUERY_EXPLAIN_PATH: str = "logs/slow_query_explain.jsonl"
+    DATABASE_SLOW_QUERY_EXPLAIN_MAX_BYTES: int = 10 * 1024 * 1024
+    DATABASE_SLOW_QUERY_EXPLAIN_BACKUP_COUNT: int = 5
     SUPABASE_URL: str
     SUPABASE_ISSUER: str
     SUPABASE_JWKS_URL: str
     SUPABASE_SECRET_KEY: str
+    SUPABASE_ADMIN_TIMEOUT_SECONDS: float = 10.0
+    SUPABASE_ADMIN_MAX_CONNECTIONS: int = 20
+    SUPABASE_ADMIN_BREAKER_FAILURE_THRESHOLD: int = 5
+    SUPABASE_ADMIN_BREAKER_RESET_SECONDS: float = 30.0
+    # Auth
+    AUTH_JWT_CACHE_ENABLED: bool = True
+    AUTH_JWT_CACHE_MAX_ENTRIES: int = 4096
+    AUTH_JWKS_REFRESH_INTERVAL_SECONDS: float = 600.0
+    AUTH_JWKS_MIN_REFRESH_INTERVAL_SECONDS: float = 30.0
+    AUTH_JWKS_FETCH_TIMEOUT_SECONDS: float = 5.0
+    # Opt-in staleness window for cached user rows (0, the default, disables
+    # the cache). Role changes made outside this process, including every
+    # demotion today, keep applying the cached role until it expires.
+    AUTH_USER_CACHE_TTL_SECONDS: float = 0.0
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10000
+    # Slug -> project id lookups; unknown slugs are cached for the negative TTL.
+    PROJECT_SLUG_CACHE_TTL_SECONDS: float = 3600.0
+    PROJECT_SLUG_CACHE_NEGATIVE_TTL_SECONDS: float = 10.0
+    PROJECT_SLUG_CACHE_MAX_ENTRIES: int = 10000
+    # Taxonomy listings are served from memory and reloaded after this long,
+    # or sooner on a change notification (`direct` connection mode only).
+    TAXONOMY_DICTIONARY_MAX_AGE_SECONDS: float = 300.0
+    # Search facet counts per search signature; 0 disables the cache. Kept no
+    # longer than SEARCH_RESULT_CACHE_TTL_SECONDS so counts match the page.
+    SEARCH_FACET_CACHE_TTL_SECONDS: float = 30.0
+    SEARCH_FACET_CACHE_MAX_ENTRIES: int = 1024
+    # Search result pages (ordered ids) per signature, cursor and page size;
+    # 0 disables the cache. Bounds how long other processes' writes can lag.
+    SEARCH_RESULT_CACHE_TTL_SECONDS: float = 30.0
+    SEARCH_RESULT_CACHE_MAX_ENTRIES: int = 2048
+    # Minimum pg_trgm word similarity for `sort=similarity` matches and
+    # "did you mean" suggestions (0-1; lower is more forgiving).
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.5
+    # `memory` serves `top`/`new` searches from an in-process index kept
+    # current by this process's writes (single-node deployments); other
+    # processes' writes show up after the index max age.
+    SEARCH_BACKEND: Literal["postgres", "memory"] = "postgres"
+    SEARCH_INDEX_MAX_AGE_SECONDS: float = 300.0
+    # `bitmap` resolves Postgres-search taxonomy filters to project ids from
+    # in-process per-term bitmaps (same staleness bound as the index) instead
+    # of one EXISTS subquery per family.
+    SEARCH_TAXONOMY_FILTER: Literal["exists", "bitmap"] = "exists"
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000"
 
@@ -47,14 +114,14 @@ class Settings(BaseSettings):
     @property
     def async_database_url(self) -> str:
         """Return DATABASE_URL normalized for async SQLAlchemy runtime."""
-        value = self.DATABASE_URL.strip()
-        if value.startswith("postgresql+psycopg2://"):
-            return value.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
-        if value.startswith("postgresql+psycopg://"):
-            return value.replace("postgresql+psycopg://", "postgresql+asyncpg://", 1)
-        if value.startswith("postgresql://"):
-            return value.replace("postgresql://", "postgresql+asyncpg://", 1)
-        return value
+        return _to_async_database_url(self.DATABASE_URL)
+
+    @property
+    def async_database_read_url(self) -> str | None:
+        """Return DATABASE_READ_URL normalized for async SQLAlchemy, if configured."""
+        if self.DATABASE_READ_URL is None or not self.DATABASE_READ_URL.strip():
+            return None
+        return _to_async_database_url(self.DATABASE_READ_URL)
 
     @property
     def sync_database_url(self) -> str:
@@ -69,6 +136,17 @@ class Settings(BaseSettings):
         return value
 
 
+def _to_async_database_url(url: str) -> str:
+    value = url.strip()
+    if value.startswith("postgresql+psycopg2://"):
+        return value.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    if value.startswith("postgresql+psycopg://"):
+        return value.replace("postgresql+psycopg://", "postgresql+asyncpg://", 1)
+    if value.startswith("postgresql://"):
+        return value.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return value
+
+
 @lru_cache
 def get_settings() -> Settings:
     return Settings()  # pyright: ignore[reportCallIssue]
@@ -1,30 +1,100 @@
 import ssl
 from collections.abc import AsyncGenerator
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.db.pool import InstrumentedAsyncQueuePool, install_idle_ping
+from app.db.query_stats import install_query_stats_hooks
+from app.db.read_routing import ReadRoutingSession, ReadYourWritesTracker
+from app.db.slow_query import (
+    SlowQueryLog,
+    build_explain_writer,
+    install_slow_query_log,
+)
 
 settings = get_settings()
 
-connect_args: dict[str, object] = {
-    "timeout": settings.DATABASE_CONNECT_TIMEOUT,
-    "statement_cache_size": 0,
-}
-
-if settings.DATABASE_SSL:
-    ssl_context = ssl.create_default_context()
-    if not settings.DATABASE_SSL_VERIFY:
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-    connect_args["ssl"] = ssl_context
-
-# create engine
-engine = create_async_engine(
-    settings.async_database_url,
-    pool_pre_ping=True,
-    connect_args=connect_args,
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4().hex}__"
+
+
+def build_connect_args(settings: Settings) -> dict[str, object]:
+    """Return asyncpg connect args for the configured connection mode."""
+    connect_args: dict[str, object] = {"timeout": settings.DATABASE_CONNECT_TIMEOUT}
+
+    if settings.DATABASE_CONNECTION_MODE == "direct":
+        # Dedicated Postgres keeps a backend per pooled connection, so prepared
+        # statements can be reused across requests.
+        connect_args["statement_cache_size"] = settings.DATABASE_STATEMENT_CACHE_SIZE
+        connect_args["prepared_statement_cache_size"] = (
+            settings.DATABASE_STATEMENT_CACHE_SIZE
+        )
+    else:
+        # Transaction poolers may route each transaction to a different backend:
+        # cached statements are not reusable and sequential names can collide.
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+
+    if settings.DATABASE_SSL:
+        ssl_context = ssl.create_default_context()
+        if not settings.DATABASE_SSL_VERIFY:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        connect_args["ssl"] = ssl_context
+    return connect_args
+
+
+def build_slow_query_log(settings: Settings) -> SlowQueryLog:
+    explain_writer = None
+    if (
+        settings.DATABASE_SLOW_QUERY_THRESHOLD_MS > 0
+        and settings.DATABASE_SLOW_QUERY_EXPLAIN_SAMPLE_RATE > 0
+    ):
+        explain_writer = build_explain_writer(
+            settings.DATABASE_SLOW_QUERY_EXPLAIN_PATH,
+            max_bytes=settings.DATABASE_SLOW_QUERY_EXPLAIN_MAX_BYTES,
+            backup_count=settings.DATABASE_SLOW_QUERY_EXPLAIN_BACKUP_COUNT,
+        )
+    return SlowQueryLog(
+        threshold_ms=settings.DATABASE_SLOW_QUERY_THRESHOLD_MS,
+        explain_sample_rate=settings.DATABASE_SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+        explain_writer=explain_writer,
+    )
+
+
+def create_database_engine(
+    settings: Settings, *, database_url: str | None = None
+) -> AsyncEngine:
+    engine = create_async_engine(
+        database_url or settings.async_database_url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_POOL_MAX_OVERFLOW,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        connect_args=build_connect_args(settings),
+    )
+    install_idle_ping(engine, idle_seconds=settings.DATABASE_POOL_PING_IDLE_SECONDS)
+    install_slow_query_log(engine, build_slow_query_log(settings))
+    return engine
+
+
+# create engines
+install_query_stats_hooks()
+engine = create_database_engine(settings)
+read_engine = (
+    create_database_engine(settings, database_url=settings.async_database_read_url)
+    if settings.async_database_read_url
+    else engine
+)
+read_your_writes = ReadYourWritesTracker(
+    window_seconds=settings.DATABASE_READ_STICKY_SECONDS
 )
 
 # create session factory
@@ -35,6 +105,21 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
     expire_on_commit=False,
 )
+_readonly_primary = engine.sync_engine.execution_options(postgresql_readonly=True)
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=ReadRoutingSession,
+    primary_bind=_readonly_primary,
+    # The same bind without a replica, so sessions know they read the primary.
+    replica_bind=(
+        read_engine.sync_engine.execution_options(postgresql_readonly=True)
+        if read_engine is not engine
+        else _readonly_primary
+    ),
+    autoflush=False,
+    autocommit=False,
+    expire_on_commit=False,
+)
 
 
 # dependency to get db session
@@ -43,3 +128,14 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a read-only session on the replica, or the primary after a recent write."""
+
+    def prefer_primary() -> bool:
+        user_id = getattr(request.state, "current_user_id", None)
+        return read_your_writes.should_read_primary(user_id)
+
+    async with ReadSessionLocal(prefer_primary=prefer_primary) as session:
+        yield session
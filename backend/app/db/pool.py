@@ -0,0 +1,99 @@
+from collections import deque
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+_LAST_CHECKIN_KEY = "last_checkin_at"
+
+
+class PoolWaitStats:
+    """Rolling record of how long callers waited to check out a connection."""
+
+    def __init__(self, *, max_samples: int = 1024):
+        self._samples_ms: deque[float] = deque(maxlen=max_samples)
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self._samples_ms.append(seconds * 1000)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+    def percentiles(self) -> dict[str, float | None]:
+        samples = sorted(self._samples_ms)
+        if not samples:
+            return {"p50": None, "p95": None, "p99": None, "max": None}
+        return {
+            "p50": _nearest_rank(samples, 50),
+            "p95": _nearest_rank(samples, 95),
+            "p99": _nearest_rank(samples, 99),
+            "max": samples[-1],
+        }
+
+
+def _nearest_rank(sorted_samples: list[float], percentile: int) -> float:
+    rank = max(-(-percentile * len(sorted_samples) // 100), 1)
+    return sorted_samples[rank - 1]
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait time and timeouts."""
+
+    def __init__(self, *args: Any, wait_stats: PoolWaitStats | None = None, **kw: Any):
+        super().__init__(*args, **kw)
+        self.wait_stats = wait_stats or PoolWaitStats()
+
+    @property
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        # Keep history across engine.dispose().
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def connect(self) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.wait_stats.record_timeout()
+            raise
+        self.wait_stats.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def install_idle_ping(engine: AsyncEngine, *, idle_seconds: float) -> None:
+    """Ping pooled connections on checkout only after they sat idle for a while.
+
+    Unlike `pool_pre_ping`, recently used connections skip the extra round
+    trip. A failed ping raises `DisconnectionError`, which makes the pool
+    discard the connection and retry with a fresh one.
+    """
+    if idle_seconds < 0:
+        return
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "checkin")
+    def _record_checkin(_dbapi_connection: Any, connection_record: Any) -> None:
+        connection_record.info[_LAST_CHECKIN_KEY] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _ping_if_idle(
+        dbapi_connection: Any, connection_record: Any, _connection_proxy: Any
+    ) -> None:
+        last_checkin = connection_record.info.get(_LAST_CHECKIN_KEY)
+        if last_checkin is None or time.monotonic() - last_checkin < idle_seconds:
+            return
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as error:
+            raise exc.DisconnectionError("Idle connection failed liveness ping") from (
+                error
+            )
@@ -0,0 +1,114 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_STARTED_AT_ATTR = "_query_stats_started_at"
+
+
+class QueryStats:
+    """SQL statements executed while a `track_queries()` block was active.
+
+    Blocks nest: statements are recorded in the innermost block and every
+    block around it, so a test can wrap a request that also tracks itself.
+    """
+
+    def __init__(
+        self, *, parent: "QueryStats | None" = None, keep_statements: bool = False
+    ):
+        self.parent = parent
+        self.keep_statements = keep_statements
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: str | None = None
+        self.statements: list[str] = []
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+    @property
+    def slowest_ms(self) -> float:
+        return self.slowest_seconds * 1000
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds >= self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+        if self.keep_statements:
+            self.statements.append(statement)
+        if self.parent is not None:
+            self.parent.record(statement, seconds)
+
+    def server_timing(self) -> str:
+        """Format the stats as a `Server-Timing` header value."""
+        return (
+            f'db;dur={self.total_ms:.2f};desc="queries={self.count}", '
+            f"db-slowest;dur={self.slowest_ms:.2f}"
+        )
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(*, keep_statements: bool = False) -> Iterator[QueryStats]:
+    """Record statements executed in the current context until the block exits."""
+    stats = QueryStats(parent=_current_stats.get(), keep_statements=keep_statements)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(
+    _conn: Any,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: Any,
+    _executemany: bool,
+) -> None:
+    if context is not None and _current_stats.get() is not None:
+        setattr(context, _STARTED_AT_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(
+    _conn: Any,
+    _cursor: Any,
+    statement: str,
+    _parameters: Any,
+    context: Any,
+    _executemany: bool,
+) -> None:
+    stats = _current_stats.get()
+    started_at = getattr(context, _STARTED_AT_ATTR, None)
+    if stats is None or started_at is None:
+        return
+    stats.record(statement, time.perf_counter() - started_at)
+
+
+def install_query_stats_hooks() -> None:
+    """Listen on every engine so tracked blocks see statements from any bind.
+
+    Statements executed outside a `track_queries()` block cost one context
+    variable lookup.
+    """
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,78 @@
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.utils.cache import ExpiringLRUCache
+
+
+class ReadYourWritesTracker:
+    """Remembers which users wrote recently so their reads can skip the replica.
+
+    State is process-local; keep `window_seconds` above typical replica lag.
+    """
+
+    def __init__(self, *, window_seconds: float, max_entries: int = 10000):
+        self.window_seconds = window_seconds
+        self._recent_writers: ExpiringLRUCache[UUID, bool] = ExpiringLRUCache(
+            max_entries=max_entries
+        )
+
+    def mark_write(self, user_id: UUID) -> None:
+        if self.window_seconds <= 0:
+            return
+        self._recent_writers.set(user_id, True, ttl=self.window_seconds)
+
+    def should_read_primary(self, user_id: UUID | None) -> bool:
+        if user_id is None or self.window_seconds <= 0:
+            return False
+        return self._recent_writers.get(user_id) is not None
+
+
+class ReadRoutingSession(Session):
+    """Read-only session that picks the replica or the primary on first use.
+
+    The choice is deferred to `get_bind` so request auth state, which is
+    resolved after the session dependency, is available when deciding.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        primary_bind: Engine,
+        replica_bind: Engine,
+        prefer_primary: Callable[[], bool] | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self._primary_bind = primary_bind
+        self._replica_bind = replica_bind
+        self._prefer_primary = prefer_primary
+
+    def prefers_primary(self) -> bool:
+        """Whether this session's user wrote recently and must read the primary."""
+        return self._prefer_primary is not None and self._prefer_primary()
+
+    def reads_replica(self) -> bool:
+        """Whether reads go to a replica that can trail the primary."""
+        return self.get_bind() is not self._primary_bind
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Engine:
+        if self.prefers_primary():
+            return self._primary_bind
+        return self._replica_bind
+
+
+def prefers_primary(db: AsyncSession) -> bool:
+    """Whether `db` serves a recent writer; False for sessions that never route."""
+    session = db.sync_session
+    return isinstance(session, ReadRoutingSession) and session.prefers_primary()
+
+
+def reads_replica(db: AsyncSession) -> bool:
+    """Whether `db` reads a lagging replica; False for sessions that never route."""
+    session = db.sync_session
+    return isinstance(session, ReadRoutingSession) and session.reads_replica()
@@ -0,0 +1,254 @@
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+import random
+import re
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_STARTED_AT_ATTR = "_slow_query_started_at"
+_EXPLAIN_SAVEPOINT = "slow_query_explain"
+_EXPLAIN_OPTIONS = "ANALYZE, BUFFERS, FORMAT JSON"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+")
+_PLACEHOLDER_LIST = re.compile(
+    r"\$\?(::\w+(?:\[\])?)?(?:\s*,\s*\$\?(?:::\w+(?:\[\])?)?)+"
+)
+_WHITESPACE = re.compile(r"\s+")
+_WRITE_KEYWORDS = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|TRUNCATE|ALTER|CREATE|DROP|GRANT|REVOKE|"
+    r"FOR\s+UPDATE|FOR\s+SHARE|NEXTVAL|SETVAL|LOCK)\b",
+    re.IGNORECASE,
+)
+# Functions with effects a savepoint rollback does not undo, or that change
+# session state: a SELECT calling them is not a plain read.
+_SIDE_EFFECT_CALLS = re.compile(
+    r"\b(PG_NOTIFY|SET_CONFIG|PG_ADVISORY_\w*LOCK\w*|PG_TERMINATE_BACKEND|"
+    r"PG_CANCEL_BACKEND|DBLINK\w*)\s*\(",
+    re.IGNORECASE,
+)
+
+
+def normalize_statement(statement: str) -> str:
+    """Strip literals and placeholder numbering so equivalent statements match.
+
+    Expanded `IN` lists of any length collapse to one placeholder, so queries
+    that differ only in how many ids they bind share a fingerprint.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("$?", normalized)
+    return _PLACEHOLDER_LIST.sub(
+        lambda match: f"$?{match.group(1) or ''}, ...", normalized
+    )
+
+
+def statement_fingerprint(statement: str) -> str:
+    normalized = normalize_statement(statement)
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def _value_shape(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return f"str[{len(value)}]"
+    if isinstance(value, (bytes, bytearray)):
+        return f"bytes[{len(value)}]"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def parameter_shapes(parameters: Any, *, executemany: bool = False) -> list[str]:
+    """Describe bound parameters by type and size only; values are never logged."""
+    if executemany:
+        rows = list(parameters or [])
+        first = parameter_shapes(rows[0]) if rows else []
+        return [f"rows[{len(rows)}]", *first]
+    if parameters is None:
+        return []
+    if isinstance(parameters, dict):
+        return [f"{key}:{_value_shape(value)}" for key, value in parameters.items()]
+    if isinstance(parameters, Sequence) and not isinstance(parameters, str):
+        return [_value_shape(value) for value in parameters]
+    return [_value_shape(parameters)]
+
+
+def is_explainable(statement: str) -> bool:
+    """Only plain reads are re-run under EXPLAIN ANALYZE, which executes them.
+
+    Reads that write through a CTE or call a side-effecting function such as
+    `pg_notify` or `set_config` are skipped too.
+    """
+    head = statement.lstrip().split(None, 1)
+    if not head or head[0].upper() not in {"SELECT", "WITH"}:
+        return False
+    return (
+        _WRITE_KEYWORDS.search(statement) is None
+        and _SIDE_EFFECT_CALLS.search(statement) is None
+    )
+
+
+def build_explain_writer(
+    path: str, *, max_bytes: int, backup_count: int
+) -> Callable[[str], None]:
+    """Return a writer that appends lines to a size-rotated local file."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    handler = RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    explain_logger = logging.getLogger(f"{__name__}.explain")
+    explain_logger.propagate = False
+    explain_logger.setLevel(logging.INFO)
+    for existing in list(explain_logger.handlers):
+        explain_logger.removeHandler(existing)
+        existing.close()
+    explain_logger.addHandler(handler)
+    return explain_logger.info
+
+
+class SlowQueryLog:
+    """Log statements slower than `threshold_ms` and sample their plans.
+
+    Slow statements are logged with a fingerprint, parameter shapes and
+    duration. An `explain_sample_rate` share of the slow reads is re-run as
+    `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` inside a savepoint, and each
+    plan is passed to `explain_writer` as one JSON line. ANALYZE executes the
+    statement again, so sampled requests pay for it twice.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold_ms: float,
+        explain_sample_rate: float = 0.0,
+        explain_writer: Callable[[str], None] | None = None,
+        sample: Callable[[], float] = random.random,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._explain_writer = explain_writer
+        self._sample = sample
+
+    def should_explain(self) -> bool:
+        return (
+            self._explain_writer is not None
+            and self.explain_sample_rate > 0
+            and self._sample() < self.explain_sample_rate
+        )
+
+    def record(
+        self,
+        *,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        duration_ms: float,
+        explain: Callable[[], Any] | None,
+    ) -> None:
+        if duration_ms < self.threshold_ms:
+            return
+        fingerprint = statement_fingerprint(statement)
+        logger.warning(
+            "Slow query fingerprint=%s duration_ms=%.1f params=%s statement=%s",
+            fingerprint,
+            duration_ms,
+            parameter_shapes(parameters, executemany=executemany),
+            normalize_statement(statement)[:500],
+        )
+        if explain is None or executemany or not is_explainable(statement):
+            return
+        if self._explain_writer is None or not self.should_explain():
+            return
+        try:
+            plan = explain()
+        except Exception:
+            logger.warning("EXPLAIN capture failed for fingerprint=%s", fingerprint)
+            return
+        self._explain_writer(
+            json.dumps(
+                {
+                    "captured_at": datetime.now(timezone.utc).isoformat(),
+                    "fingerprint": fingerprint,
+                    "duration_ms": round(duration_ms, 3),
+                    "statement": normalize_statement(statement),
+                    "parameter_shapes": parameter_shapes(parameters),
+                    "plan": plan,
+                },
+                default=str,
+            )
+        )
+
+
+def _explain_in_savepoint(connection: Any, statement: str, parameters: Any) -> Any:
+    # A failing EXPLAIN must not abort the caller's transaction.
+    cursor = connection.connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(f"EXPLAIN ({_EXPLAIN_OPTIONS}) {statement}", parameters)
+            row = cursor.fetchone()
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            raise
+        cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+    finally:
+        cursor.close()
+    plan = row[0] if row else None
+    return json.loads(plan) if isinstance(plan, str) else plan
+
+
+def install_slow_query_log(engine: AsyncEngine, slow_query_log: SlowQueryLog) -> None:
+    """Time every statement on `engine`; a threshold <= 0 installs nothing."""
+    if slow_query_log.threshold_ms <= 0:
+        return
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(
+        _conn: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        context: Any,
+        _executemany: bool,
+    ) -> None:
+        if context is not None:
+            setattr(context, _STARTED_AT_ATTR, time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _record_if_slow(
+        conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        started_at = getattr(context, _STARTED_AT_ATTR, None)
+        if started_at is None:
+            return
+        server_side = bool(getattr(context, "is_server_side", False))
+        slow_query_log.record(
+            statement=statement,
+            parameters=parameters,
+            executemany=executemany,
+            duration_ms=(time.perf_counter() - started_at) * 1000,
+            explain=None
+            if server_side
+            else lambda: _explain_in_savepoint(conn, statement, parameters),
+        )
@@ -18,13 +18,56 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     settings: Settings = app.state.settings
     logger.info(f"CORS allowed origins: {settings.cors_origins_list}")
-    yield
+
+    from app.api.deps.auth import jwks_provider
+    from app.db.database import AsyncSessionLocal, engine
+    from app.services.auth_bootstrap import get_supabase_admin_client
+    from app.services.search_index import get_project_search_index
+    from app.services.taxonomy_bitmaps import get_taxonomy_bitmap_index
+    from app.services.taxonomy_dictionary import (
+        TaxonomyChangeListener,
+        get_taxonomy_dictionary,
+    )
+
+    await jwks_provider.start()
+    taxonomy_dictionary = get_taxonomy_dictionary()
+    try:
+        async with AsyncSessionLocal() as session:
+            await taxonomy_dictionary.load(session)
+    except Exception as exc:
+        logger.warning("Taxonomy dictionary preload failed; loading on demand: %s", exc)
+    if settings.SEARCH_BACKEND == "memory":
+        try:
+            await get_project_search_index().ensure_fresh()
+        except Exception as exc:
+            logger.warning("Search index preload failed; loading on demand: %s", exc)
+    if settings.SEARCH_TAXONOMY_FILTER == "bitmap":
+        try:
+            await get_taxonomy_bitmap_index().ensure_fresh()
+        except Exception as exc:
+            logger.warning("Taxonomy bitmap preload failed; loading on demand: %s", exc)
+    # Transaction poolers do not keep LISTEN sessions; rely on the max age there.
+    taxonomy_listener = (
+        TaxonomyChangeListener(taxonomy_dictionary, engine)
+        if settings.DATABASE_CONNECTION_MODE == "direct"
+        else None
+    )
+    if taxonomy_listener is not None:
+        await taxonomy_listener.start()
+    try:
+        yield
+    finally:
+        if taxonomy_listener is not None:
+            await taxonomy_listener.stop()
+        await jwks_provider.stop()
+        await get_supabase_admin_client().aclose()
 
 
 def create_app() -> FastAPI:
     settings = load_settings_or_exit()
 
     # Import routes after config validation so missing env vars fail with a concise message.
+    from app.api.middleware import QueryStatsMiddleware
     from app.api.v1.health import router as health_router
     from app.api.v1.projects import router as projects_router
     from app.api.v1.taxonomy import router as taxonomy_router
@@ -33,6 +76,9 @@ def create_app() -> FastAPI:
     app = FastAPI(lifespan=lifespan)
     app.state.settings = settings
 
+    if settings.DATABASE_QUERY_STATS_ENABLED:
+        app.add_middleware(QueryStatsMiddleware)
+
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
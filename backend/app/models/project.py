@@ -3,12 +3,31 @@ from uuid import UUID, uuid4
 
 import sqlalchemy as sa
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, SQLModel
 
+# Text search configuration used to build and query `projects.search_vector`.
+PROJECT_SEARCH_CONFIG = "english"
+PROJECT_SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{PROJECT_SEARCH_CONFIG}', title), 'A') || "
+    f"setweight(to_tsvector('{PROJECT_SEARCH_CONFIG}', short_description), 'B') || "
+    f"setweight(to_tsvector('{PROJECT_SEARCH_CONFIG}', "
+    "coalesce(long_description, '')), 'C')"
+)
+
 
 class Project(SQLModel, table=True):
     __tablename__ = "projects"  # pyright: ignore[reportAssignmentType]
     __table_args__ = (
+        # Generated by Postgres on every write. Left unmapped so loading a
+        # project never fetches it; query it through `__table__.c`.
+        sa.Column(
+            "search_vector",
+            TSVECTOR(),
+            sa.Computed(PROJECT_SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+        sa.Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
         sa.Index(
             "ix_projects_title_lower_trgm",
             sa.text("lower(title) gin_trgm_ops"),
@@ -27,6 +46,12 @@ class Project(SQLModel, table=True):
             postgresql_where=sa.text("is_published = true AND deleted_at IS NULL"),
         ),
     )
+    # Return server-set timestamps from INSERT/UPDATE so writes can respond
+    # without re-reading the row.
+    __mapper_args__ = {
+        "eager_defaults": True,
+        "exclude_properties": ["search_vector"],
+    }
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, nullable=False)
     created_by_id: UUID = Field(foreign_key="users.id", nullable=False, index=True)
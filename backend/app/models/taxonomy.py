@@ -16,6 +16,12 @@ class Category(SQLModel, table=True):
             sa.String(length=64), nullable=False, unique=True, index=True
         )
     )
+    # Published, non-deleted projects assigned this term. Maintained by
+    # app.services.taxonomy_usage.
+    usage_count: int = Field(
+        default=0,
+        sa_column=sa.Column(sa.Integer(), nullable=False, server_default="0"),
+    )
     created_at: datetime = Field(
         sa_column=sa.Column(
             sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
@@ -33,6 +39,12 @@ class Tag(SQLModel, table=True):
             sa.String(length=64), nullable=False, unique=True, index=True
         )
     )
+    # Published, non-deleted projects assigned this term. Maintained by
+    # app.services.taxonomy_usage.
+    usage_count: int = Field(
+        default=0,
+        sa_column=sa.Column(sa.Integer(), nullable=False, server_default="0"),
+    )
     created_at: datetime = Field(
         sa_column=sa.Column(
             sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
@@ -50,6 +62,12 @@ class TechStack(SQLModel, table=True):
             sa.String(length=64), nullable=False, unique=True, index=True
         )
     )
+    # Published, non-deleted projects assigned this term. Maintained by
+    # app.services.taxonomy_usage.
+    usage_count: int = Field(
+        default=0,
+        sa_column=sa.Column(sa.Integer(), nullable=False, server_default="0"),
+    )
     created_at: datetime = Field(
         sa_column=sa.Column(
             sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
@@ -9,3 +9,27 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Service status")
     message: str = Field(..., description="Health check message")
     timestamp: datetime = Field(..., description="Timestamp of the health check")
+
+
+class DbPoolWaitPercentiles(BaseModel):
+    """Checkout wait-time percentiles in milliseconds over recent checkouts."""
+
+    p50: float | None = Field(None, description="Median checkout wait (ms)")
+    p95: float | None = Field(None, description="95th percentile checkout wait (ms)")
+    p99: float | None = Field(None, description="99th percentile checkout wait (ms)")
+    max: float | None = Field(None, description="Slowest recent checkout wait (ms)")
+
+
+class DbPoolStatsResponse(BaseModel):
+    """Connection pool usage snapshot for this worker process."""
+
+    pool_size: int = Field(..., description="Configured persistent pool size")
+    max_overflow: int = Field(..., description="Configured overflow allowance")
+    checked_out: int = Field(..., description="Connections currently in use")
+    checked_in: int = Field(..., description="Idle connections held by the pool")
+    overflow: int = Field(..., description="Overflow connections currently open")
+    checkouts: int = Field(..., description="Checkouts recorded since startup")
+    timeouts: int = Field(..., description="Checkouts that hit the pool timeout")
+    wait_ms: DbPoolWaitPercentiles = Field(
+        ..., description="Checkout wait-time percentiles"
+    )
@@ -1,11 +1,16 @@
 from datetime import date
 from typing import Literal
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.schemas.project import ProjectListItemResponse
 
-SearchSort = Literal["top", "new"]
+SearchSort = Literal["top", "new", "relevance", "similarity"]
+TaxonomyMatch = Literal["any", "all"]
+
+# Sorts that order by a per-query score and page with a (rank, id) cursor.
+RANKED_SEARCH_SORTS: frozenset[str] = frozenset({"relevance", "similarity"})
 
 
 def _contains_control_chars(value: str) -> bool:
@@ -51,6 +56,14 @@ class ProjectSearchRequest(BaseModel):
         default_factory=list,
         description="Optional tech-stack filters. Repeated query params are supported.",
     )
+    match: TaxonomyMatch = Field(
+        default="any",
+        description=(
+            "How terms within one taxonomy family combine: `any` (default) "
+            "matches projects with at least one, `all` only projects with "
+            "every one. Families always combine with AND."
+        ),
+    )
     limit: int = Field(
         default=20,
         ge=1,
@@ -62,7 +75,10 @@ class ProjectSearchRequest(BaseModel):
     )
     sort: SearchSort = Field(
         default="top",
-        description="Sort mode (`top` or `new`). Defaults to `top`.",
+        description=(
+            "Sort mode (`top`, `new`, `relevance` or `similarity`). Defaults to "
+            "`top`. `relevance` and `similarity` require `q`."
+        ),
     )
     published_from: date | None = Field(
         default=None,
@@ -76,6 +92,12 @@ class ProjectSearchRequest(BaseModel):
             "End date (inclusive) for `sort=top` published-date window in `YYYY-MM-DD`."
         ),
     )
+    facets: bool = Field(
+        default=False,
+        description=(
+            "Also return per-family taxonomy term counts over every matching project."
+        ),
+    )
 
     @field_validator("q", mode="before")
     @classmethod
@@ -98,7 +120,40 @@ class ProjectSearchRequest(BaseModel):
     def _normalize_terms(cls, value: list[str]) -> list[str]:
         return _normalize_term_list(value)
 
+    @model_validator(mode="after")
+    def _require_query_for_ranked_sorts(self) -> "ProjectSearchRequest":
+        if self.sort in RANKED_SEARCH_SORTS and self.q is None:
+            raise ValueError(f"sort={self.sort} requires a keyword query (q)")
+        return self
+
+
+class SearchFacetCount(BaseModel):
+    id: UUID
+    name: str
+    count: int
+
+
+class ProjectSearchFacets(BaseModel):
+    categories: list[SearchFacetCount] = Field(default_factory=list)
+    tags: list[SearchFacetCount] = Field(default_factory=list)
+    tech_stack: list[SearchFacetCount] = Field(default_factory=list)
+
 
 class ProjectSearchResponse(BaseModel):
     items: list[ProjectListItemResponse] = Field(default_factory=list)
     next_cursor: str | None = None
+    facets: ProjectSearchFacets | None = Field(
+        default=None,
+        description=(
+            "Taxonomy term counts for the whole result set, most frequent first "
+            "and capped per family. Only present when `facets=true`."
+        ),
+    )
+    suggestions: list[str] = Field(
+        default_factory=list,
+        description=(
+            '"Did you mean" project titles and taxonomy names similar to `q`, '
+            "best first. Only filled when the first page of a keyword search "
+            "is empty."
+        ),
+    )
@@ -1,8 +1,11 @@
+from typing import Literal
 import unicodedata
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+TaxonomyFamily = Literal["categories", "tags", "tech-stacks"]
+
 
 def _contains_control_chars(value: str) -> bool:
     return any(unicodedata.category(char) == "Cc" for char in value)
@@ -0,0 +1,202 @@
+"""Compare list and search throughput between `pooler` and `direct` connection modes.
+
+Runs the same project-list and search workloads through the real services with
+an engine built for each `DATABASE_CONNECTION_MODE` and prints throughput and
+latency percentiles. Point DATABASE_URL at a seeded database (see
+seed_mock_data.py); in `direct` mode it must reach Postgres without a
+transaction pooler in between.
+
+Usage:
+  PYTHONPATH=. uv run python app/scripts/benchmark_connection_modes.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.database import create_database_engine
+from app.schemas.search import ProjectSearchRequest
+from app.services.project import ProjectService
+from app.services.search import PostgresSearchService
+
+CONNECTION_MODES = ("pooler", "direct")
+
+Workload = Callable[[AsyncSession], Awaitable[object]]
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    modes: list[str]
+    requests: int
+    concurrency: int
+    warmup: int
+    limit: int
+    query: str
+
+
+@dataclass(frozen=True)
+class WorkloadResult:
+    mode: str
+    workload: str
+    requests: int
+    elapsed_seconds: float
+    latencies_ms: list[float]
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def percentile(self, percentile: int) -> float:
+        ordered = sorted(self.latencies_ms)
+        rank = max(-(-percentile * len(ordered) // 100), 1)
+        return ordered[rank - 1]
+
+
+def log(message: str) -> None:
+    print(message, flush=True)
+
+
+def parse_args() -> BenchmarkConfig:
+    parser = argparse.ArgumentParser(
+        description="Benchmark list/search throughput for pooler vs direct modes."
+    )
+    parser.add_argument(
+        "--mode",
+        dest="modes",
+        action="append",
+        choices=CONNECTION_MODES,
+        help="Connection mode to run (repeatable; default: both).",
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--query", default="project")
+    args = parser.parse_args()
+
+    if args.requests <= 0:
+        raise SystemExit("--requests must be > 0")
+    if args.concurrency <= 0:
+        raise SystemExit("--concurrency must be > 0")
+    if args.warmup < 0:
+        raise SystemExit("--warmup must be >= 0")
+
+    return BenchmarkConfig(
+        modes=args.modes or list(CONNECTION_MODES),
+        requests=args.requests,
+        concurrency=args.concurrency,
+        warmup=args.warmup,
+        limit=args.limit,
+        query=args.query,
+    )
+
+
+def build_workloads(cfg: BenchmarkConfig) -> dict[str, Workload]:
+    async def list_projects(session: AsyncSession) -> object:
+        return await ProjectService(session).list_projects(sort="top", limit=cfg.limit)
+
+    async def search_projects(session: AsyncSession) -> object:
+        return await PostgresSearchService(session).search_projects(
+            request=ProjectSearchRequest(q=cfg.query, limit=cfg.limit)
+        )
+
+    return {"list": list_projects, "search": search_projects}
+
+
+async def run_workload(
+    engine: AsyncEngine,
+    *,
+    mode: str,
+    name: str,
+    workload: Workload,
+    cfg: BenchmarkConfig,
+) -> WorkloadResult:
+    session_factory = async_sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def call_once() -> float:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await workload(session)
+            return (time.perf_counter() - started) * 1000
+
+    for _ in range(cfg.warmup):
+        await call_once()
+
+    remaining = cfg.requests
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            latencies.append(await call_once())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(cfg.concurrency)))
+    elapsed = time.perf_counter() - started
+    return WorkloadResult(
+        mode=mode,
+        workload=name,
+        requests=len(latencies),
+        elapsed_seconds=elapsed,
+        latencies_ms=latencies,
+    )
+
+
+async def benchmark(cfg: BenchmarkConfig) -> list[WorkloadResult]:
+    base_settings = get_settings()
+    workloads = build_workloads(cfg)
+    results: list[WorkloadResult] = []
+    for mode in cfg.modes:
+        settings = base_settings.model_copy(
+            update={
+                "DATABASE_CONNECTION_MODE": mode,
+                "DATABASE_POOL_SIZE": max(
+                    base_settings.DATABASE_POOL_SIZE, cfg.concurrency
+                ),
+            }
+        )
+        engine = create_database_engine(settings)
+        try:
+            for name, workload in workloads.items():
+                log(f"Running {name} workload in {mode} mode...")
+                results.append(
+                    await run_workload(
+                        engine, mode=mode, name=name, workload=workload, cfg=cfg
+                    )
+                )
+        finally:
+            await engine.dispose()
+    return results
+
+
+def print_results(results: list[WorkloadResult]) -> None:
+    log("")
+    log(
+        f"{'mode':<8} {'workload':<8} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for result in results:
+        log(
+            f"{result.mode:<8} {result.workload:<8} {result.throughput:>9.1f} "
+            f"{result.percentile(50):>8.2f} {result.percentile(95):>8.2f} "
+            f"{result.percentile(99):>8.2f}"
+        )
+
+
+def main() -> None:
+    cfg = parse_args()
+    print_results(asyncio.run(benchmark(cfg)))
+
+
+if __name__ == "__main__":
+    main()
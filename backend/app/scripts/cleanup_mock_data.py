@@ -25,6 +25,7 @@ from app.db.database import AsyncSessionLocal
 from app.models.project import Project, ProjectMember, Vote
 from app.models.taxonomy import ProjectCategory, ProjectTag, ProjectTechStack
 from app.models.user import User
+from app.services.taxonomy_usage import reconcile_taxonomy_usage
 
 
 @dataclass
@@ -36,6 +37,7 @@ class CleanupCounts:
     project_tech_stacks: int = 0
     projects: int = 0
     users: int = 0
+    taxonomy_usage_fixed: int = 0
 
 
 def parse_args() -> argparse.Namespace:
@@ -183,6 +185,10 @@ async def cleanup_mock_data(*, email_domain: str) -> CleanupCounts:
 
         await session.commit()
 
+        # Deleted assignments were not counted down.
+        usage_report = await reconcile_taxonomy_usage(session)
+        counts.taxonomy_usage_fixed = len(usage_report.drift)
+
     return counts
 
 
@@ -203,6 +209,7 @@ async def main() -> None:
     print(f"- project_tech_stacks: {counts.project_tech_stacks}")
     print(f"- projects: {counts.projects}")
     print(f"- users: {counts.users}")
+    print(f"- taxonomy usage counters fixed: {counts.taxonomy_usage_fixed}")
 
 
 if __name__ == "__main__":
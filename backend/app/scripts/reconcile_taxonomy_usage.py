@@ -0,0 +1,72 @@
+"""Recount taxonomy term usage and report counters that drifted.
+
+`usage_count` on categories, tags and tech stacks is kept current by project
+writes. This recounts published, non-deleted assignments in id-ordered
+batches, prints every drifted term and rewrites its counter unless
+`--dry-run` is given. Each batch commits on its own, so it is safe to run
+against a live database.
+
+Usage:
+  PYTHONPATH=. uv run python app/scripts/reconcile_taxonomy_usage.py --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from app.db.database import AsyncSessionLocal
+from app.services.taxonomy_usage import (
+    TaxonomyUsageReport,
+    reconcile_taxonomy_usage,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recount taxonomy term usage and report drift."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Terms recounted per batch (default: 500).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report drift without rewriting counters.",
+    )
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    return args
+
+
+def print_report(report: TaxonomyUsageReport, *, fixed: bool) -> None:
+    print("Taxonomy usage reconciliation complete")
+    for table_name, checked in report.checked.items():
+        drifted = sum(1 for entry in report.drift if entry.table == table_name)
+        print(f"- {table_name}: {checked} checked, {drifted} drifted")
+    for entry in report.drift:
+        print(
+            f"  {entry.table} {entry.term_id} {entry.name!r}: "
+            f"stored={entry.stored} counted={entry.counted} "
+            f"({entry.counted - entry.stored:+d})"
+        )
+    if report.drift and not fixed:
+        print("Dry run: counters were not changed")
+
+
+async def main() -> None:
+    args = parse_args()
+    async with AsyncSessionLocal() as session:
+        report = await reconcile_taxonomy_usage(
+            session, batch_size=args.batch_size, fix=not args.dry_run
+        )
+    print_report(report, fixed=not args.dry_run)
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    asyncio.run(main())
@@ -14,7 +14,6 @@ from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy import delete
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -35,6 +34,9 @@ from app.models.taxonomy import (
 )
 from app.models.user import User
 from app.models.user_roles import USER_ROLE_ADMIN, USER_ROLE_FACULTY, USER_ROLE_STUDENT
+from app.schemas.taxonomy import TaxonomyTermResponse
+from app.services.taxonomy import resolve_or_create_taxonomy_terms
+from app.services.taxonomy_usage import reconcile_taxonomy_usage
 
 
 @dataclass
@@ -401,10 +403,6 @@ def project_timeline(index: int, now_date: date) -> tuple[date | None, date | No
     return start, None
 
 
-def normalize_taxonomy_name(value: str) -> str:
-    return value.strip().lower()
-
-
 def role_for_user_index(index: int) -> str:
     if index == 1:
         return USER_ROLE_ADMIN
@@ -467,38 +465,8 @@ async def _resolve_or_create_terms(
     session: AsyncSession,
     model: type[Category] | type[Tag] | type[TechStack],
     values: list[str],
-) -> list[tuple[UUID, str]]:
-    terms: list[tuple[UUID, str]] = []
-    model_cols = getattr(model, "__table__").c
-    for value in values:
-        normalized_name = normalize_taxonomy_name(value)
-        existing_result = await session.exec(
-            select(model).where(model_cols.normalized_name == normalized_name)
-        )
-        existing = existing_result.first()
-        if existing is not None:
-            terms.append((existing.id, existing.name))
-            continue
-
-        insert_statement = (
-            pg_insert(getattr(model, "__table__"))
-            .values(name=value.strip(), normalized_name=normalized_name)
-            .on_conflict_do_nothing(index_elements=["normalized_name"])
-            .returning(model_cols.id, model_cols.name)
-        )
-        insert_result = await session.exec(insert_statement)
-        inserted = insert_result.first()
-        if inserted is not None:
-            terms.append((inserted.id, inserted.name))
-            continue
-
-        raced_result = await session.exec(
-            select(model).where(model_cols.normalized_name == normalized_name)
-        )
-        raced_existing = raced_result.first()
-        if raced_existing is None:
-            raise RuntimeError("Taxonomy term could not be resolved")
-        terms.append((raced_existing.id, raced_existing.name))
+) -> list[TaxonomyTermResponse]:
+    terms, _ = await resolve_or_create_taxonomy_terms(session, model, values)
     return terms
 
 
@@ -534,27 +502,27 @@ async def _replace_project_taxonomy(
     tag_terms = await _resolve_or_create_terms(session, Tag, tags)
     tech_terms = await _resolve_or_create_terms(session, TechStack, tech_stack)
 
-    for position, (term_id, _) in enumerate(category_terms):
+    for position, term in enumerate(category_terms):
         session.add(
             ProjectCategory(  # pyright: ignore[reportCallIssue]
                 project_id=project_id,
-                category_id=term_id,
+                category_id=term.id,
                 position=position,
             )
         )
-    for position, (term_id, _) in enumerate(tag_terms):
+    for position, term in enumerate(tag_terms):
         session.add(
             ProjectTag(  # pyright: ignore[reportCallIssue]
                 project_id=project_id,
-                tag_id=term_id,
+                tag_id=term.id,
                 position=position,
             )
         )
-    for position, (term_id, _) in enumerate(tech_terms):
+    for position, term in enumerate(tech_terms):
         session.add(
             ProjectTechStack(  # pyright: ignore[reportCallIssue]
                 project_id=project_id,
-                tech_stack_id=term_id,
+                tech_stack_id=term.id,
                 position=position,
             )
         )
@@ -1056,6 +1024,11 @@ async def seed_mock_data(cfg: SeedConfig) -> None:
 
         await session.commit()
 
+        # Assignments and publication state above are written directly.
+        log("Recounting taxonomy usage...")
+        usage_report = await reconcile_taxonomy_usage(session)
+        log(f"  taxonomy usage counters fixed: {len(usage_report.drift)}")
+
     log("Seed complete")
     log(f"- Users: {cfg.total_users}")
     log(
@@ -1,6 +1,10 @@
 from app.services.auth_bootstrap import AuthBootstrapService
 from app.services.project import CursorError, ProjectService
-from app.services.search import PostgresSearchService, SearchService
+from app.services.search import (
+    InMemorySearchService,
+    PostgresSearchService,
+    SearchService,
+)
 from app.services.taxonomy import TaxonomyConflictError, TaxonomyService
 from app.services.vote import VoteService, VoteTargetNotFoundError
 
@@ -12,6 +16,7 @@ __all__ = [
     "TaxonomyConflictError",
     "SearchService",
     "PostgresSearchService",
+    "InMemorySearchService",
     "VoteService",
     "VoteTargetNotFoundError",
 ]
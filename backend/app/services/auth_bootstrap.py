@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-import json
+from functools import lru_cache, partial
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 from uuid import UUID
 
+import httpx
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
 from app.models.user import User
 from app.models.user_roles import USER_ROLE_STUDENT
+from app.services.user_cache import UserSnapshotCache, get_user_snapshot_cache
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from app.utils.username import validate_username
 
 
@@ -29,6 +31,10 @@ class EmailPolicyError(AuthBootstrapError):
     """Raised when identity does not satisfy required email policies."""
 
 
+class SupabaseAdminUnavailableError(AuthBootstrapError):
+    """Raised when the Supabase admin API is unreachable or its circuit is open."""
+
+
 @dataclass(frozen=True)
 class AuthIdentity:
     auth_user_id: UUID
@@ -39,36 +45,117 @@ class AuthIdentity:
 
 
 class SupabaseAdminClient:
-    """Minimal server-side Supabase Auth admin client used for bootstrap validation."""
+    """Server-side Supabase Auth admin client used for bootstrap validation.
+
+    Requests share one pooled `httpx.AsyncClient`, concurrent lookups for the
+    same auth user share one in-flight request, and repeated transport or 5xx
+    failures open a circuit breaker so callers fail fast instead of queueing
+    behind timeouts.
+    """
 
     def __init__(self, settings: Settings):
         self._base = settings.SUPABASE_URL.rstrip("/")
         self._secret = settings.SUPABASE_SECRET_KEY
+        self._timeout = settings.SUPABASE_ADMIN_TIMEOUT_SECONDS
+        self._limits = httpx.Limits(
+            max_connections=settings.SUPABASE_ADMIN_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_ADMIN_MAX_CONNECTIONS,
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.SUPABASE_ADMIN_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.SUPABASE_ADMIN_BREAKER_RESET_SECONDS,
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[UUID, asyncio.Future[dict[str, Any]]] = {}
+
+    async def get_user(self, auth_user_id: UUID) -> dict[str, Any]:
+        """Fetch an auth user, joining an in-flight request for the same id."""
+        inflight = self._inflight.get(auth_user_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_user(auth_user_id))
+            self._inflight[auth_user_id] = inflight
+            inflight.add_done_callback(partial(self._release_inflight, auth_user_id))
+        return await asyncio.shield(inflight)
+
+    def _release_inflight(
+        self, auth_user_id: UUID, future: asyncio.Future[dict[str, Any]]
+    ) -> None:
+        if self._inflight.get(auth_user_id) is future:
+            del self._inflight[auth_user_id]
+        if not future.cancelled():
+            # Mark the exception retrieved; awaiting callers re-raise it.
+            future.exception()
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        self._client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Pooled connections are bound to the loop that opened them.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self._timeout, limits=self._limits)
+            self._client_loop = loop
+        return self._client
+
+    async def _fetch_user(self, auth_user_id: UUID) -> dict[str, Any]:
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError as exc:
+            raise SupabaseAdminUnavailableError(
+                "Supabase admin API unavailable"
+            ) from exc
+        try:
+            return await self._request_user(auth_user_id)
+        finally:
+            self.breaker.release_trial()
 
-    def get_user(self, auth_user_id: UUID) -> dict[str, Any]:
+    async def _request_user(self, auth_user_id: UUID) -> dict[str, Any]:
         url = f"{self._base}/auth/v1/admin/users/{auth_user_id}"
-        request = Request(
-            url,
-            method="GET",
-            headers={
-                "Authorization": f"Bearer {self._secret}",
-                "apikey": self._secret,
-            },
-        )
         try:
-            with urlopen(request, timeout=10) as response:  # noqa: S310
-                payload = json.loads(response.read().decode("utf-8"))
-                if not isinstance(payload, dict):
-                    raise AuthBootstrapError("Invalid Supabase admin response payload")
-                return payload
-        except HTTPError as exc:
-            raise AuthBootstrapError(
-                f"Supabase admin request failed: {exc.code}"
+            response = await self._get_client().get(
+                url,
+                headers={
+                    "Authorization": f"Bearer {self._secret}",
+                    "apikey": self._secret,
+                },
+            )
+        except httpx.TimeoutException as exc:
+            self.breaker.record_failure()
+            raise SupabaseAdminUnavailableError(
+                "Supabase admin request timed out"
+            ) from exc
+        except httpx.HTTPError as exc:
+            self.breaker.record_failure()
+            raise SupabaseAdminUnavailableError(
+                "Supabase admin request failed"
             ) from exc
-        except URLError as exc:
-            raise AuthBootstrapError("Supabase admin request failed") from exc
-        except TimeoutError as exc:
-            raise AuthBootstrapError("Supabase admin request timed out") from exc
+
+        if response.status_code >= 500 or response.status_code == 429:
+            self.breaker.record_failure()
+            raise SupabaseAdminUnavailableError(
+                f"Supabase admin request failed: {response.status_code}"
+            )
+        self.breaker.record_success()
+        if response.status_code >= 400:
+            raise AuthBootstrapError(
+                f"Supabase admin request failed: {response.status_code}"
+            )
+        try:
+            payload = response.json()
+        except ValueError as exc:
+            raise AuthBootstrapError("Invalid Supabase admin response payload") from exc
+        if not isinstance(payload, dict):
+            raise AuthBootstrapError("Invalid Supabase admin response payload")
+        return payload
+
+
+@lru_cache
+def get_supabase_admin_client() -> SupabaseAdminClient:
+    return SupabaseAdminClient(get_settings())
 
 
 class AuthBootstrapService:
@@ -92,20 +179,32 @@ class AuthBootstrapService:
         "(email)",
     )
 
-    def __init__(self, db: AsyncSession, settings: Settings):
+    def __init__(
+        self,
+        db: AsyncSession,
+        settings: Settings,
+        user_cache: UserSnapshotCache | None = None,
+        admin_client: SupabaseAdminClient | None = None,
+    ):
         self.db = db
         self.settings = settings
-        self.admin_client = SupabaseAdminClient(settings)
+        self.admin_client = admin_client or get_supabase_admin_client()
+        self.user_cache = user_cache or get_user_snapshot_cache()
 
     async def get_or_create_user(self, identity: AuthIdentity) -> User:
         """Resolve app user by Supabase auth id; bootstrap row on first authenticated call."""
         email = identity.email.strip().lower()
 
+        cached = self.user_cache.get(identity.auth_user_id)
+        if cached is not None:
+            return cached
+
         existing = await self._get_by_auth_user_id(identity.auth_user_id)
         if existing is not None:
+            self.user_cache.put(existing)
             return existing
 
-        admin_user = self.admin_client.get_user(identity.auth_user_id)
+        admin_user = await self.admin_client.get_user(identity.auth_user_id)
         self._enforce_email_confirmed(identity=identity, admin_user=admin_user)
 
         metadata = self._extract_metadata(admin_user)
@@ -129,6 +228,7 @@ class AuthBootstrapService:
             self.db.add(user)
             await self.db.commit()
             await self.db.refresh(user)
+            self.user_cache.put(user)
             return user
         except IntegrityError as exc:
             await self.db.rollback()
@@ -1,8 +1,14 @@
 from datetime import datetime, timezone
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.schemas.health import HealthResponse
+from app.db.pool import InstrumentedAsyncQueuePool
+from app.schemas.health import (
+    DbPoolStatsResponse,
+    DbPoolWaitPercentiles,
+    HealthResponse,
+)
 
 
 def get_health_response() -> HealthResponse:
@@ -19,3 +25,19 @@ async def get_db_health_response(db: AsyncSession) -> HealthResponse:
     return HealthResponse(
         status="connected", message="Database connection successful", timestamp=db_now
     )
+
+
+def get_db_pool_stats_response(engine: AsyncEngine) -> DbPoolStatsResponse:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        raise RuntimeError("Engine is not using the instrumented connection pool")
+    return DbPoolStatsResponse(
+        pool_size=pool.size(),
+        max_overflow=pool.max_overflow,
+        checked_out=pool.checkedout(),
+        checked_in=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        checkouts=pool.wait_stats.checkouts,
+        timeouts=pool.wait_stats.timeouts,
+        wait_ms=DbPoolWaitPercentiles(**pool.wait_stats.percentiles()),
+    )
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import re
+import time
+from typing import Any
+
+import httpx
+import jwt
+from jwt import PyJWK
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class SigningKeyNotFoundError(jwt.InvalidTokenError):
+    """Raised when a token references a key id that is not in the loaded JWKS."""
+
+    def __init__(self, kid: str | None):
+        super().__init__(f"No signing key found for kid {kid!r}")
+        self.kid = kid
+
+
+class JwksFetchError(RuntimeError):
+    """Raised when the JWKS endpoint cannot be fetched or parsed."""
+
+
+@dataclass
+class JwksFetchStats:
+    fetches: int = 0
+    failures: int = 0
+    last_duration_ms: float | None = None
+    max_duration_ms: float = 0.0
+    total_duration_ms: float = 0.0
+    last_success_at: float | None = None
+    key_count: int = 0
+
+    @property
+    def avg_duration_ms(self) -> float | None:
+        if self.fetches == 0:
+            return None
+        return self.total_duration_ms / self.fetches
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        return {
+            "fetches": self.fetches,
+            "failures": self.failures,
+            "last_duration_ms": self.last_duration_ms,
+            "avg_duration_ms": self.avg_duration_ms,
+            "max_duration_ms": self.max_duration_ms,
+            "last_success_at": self.last_success_at,
+            "key_count": self.key_count,
+        }
+
+
+class JwksProvider:
+    """Async JWKS key store with background refresh.
+
+    Signing keys are served from memory without I/O. A background task refreshes
+    the key set ahead of its advertised `max-age`, and lookups for an unknown
+    `kid` share a single in-flight refresh, rate limited by
+    `min_refresh_interval`, so key rotation never blocks the event loop on a
+    synchronous fetch.
+    """
+
+    # Refresh when this fraction of the key set's lifetime has elapsed.
+    _EARLY_REFRESH_RATIO = 0.8
+
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        refresh_interval: float,
+        min_refresh_interval: float,
+        timeout: float,
+    ):
+        self._url = jwks_url
+        self._refresh_interval = refresh_interval
+        self._min_refresh_interval = min_refresh_interval
+        self._timeout = timeout
+        self._keys: dict[str, PyJWK] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._inflight: asyncio.Task[None] | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._last_attempt_at: float | None = None
+        self._next_refresh_at: float = 0.0
+        self.stats = JwksFetchStats()
+
+    async def start(self) -> None:
+        """Load keys and start background refresh; fetch failures are retried later."""
+        if self._refresh_task is not None:
+            return
+        self._client = httpx.AsyncClient(timeout=self._timeout)
+        try:
+            await self.refresh()
+        except JwksFetchError:
+            logger.warning("Initial JWKS fetch failed; retrying in background")
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def get_signing_key(self, kid: str | None) -> PyJWK:
+        """Return a loaded key without performing I/O."""
+        key = self._keys.get(kid) if kid else None
+        if key is None:
+            raise SigningKeyNotFoundError(kid)
+        return key
+
+    async def ensure_key(self, kid: str | None) -> None:
+        """Refresh once for an unknown `kid`, joining any refresh already in flight.
+
+        Raises `JwksFetchError` when the key set has never loaded, even during
+        the refresh cooldown: the kid is unknown because the endpoint is down,
+        not because the token is bad.
+        """
+        if not kid or kid in self._keys:
+            return
+        if self._inflight is None and self._in_cooldown():
+            if self.stats.last_success_at is None:
+                raise JwksFetchError("JWKS has not been loaded")
+            return
+        await self.refresh()
+
+    async def refresh(self) -> None:
+        """Fetch the key set, coalescing concurrent callers into one request."""
+        if self._inflight is None:
+            task = asyncio.create_task(self._fetch())
+            task.add_done_callback(self._clear_inflight)
+            self._inflight = task
+        await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, task: asyncio.Task[None]) -> None:
+        if self._inflight is task:
+            self._inflight = None
+        if not task.cancelled():
+            # Mark the exception retrieved; awaiting callers re-raise it.
+            task.exception()
+
+    def _in_cooldown(self) -> bool:
+        if self._last_attempt_at is None:
+            return False
+        return time.monotonic() - self._last_attempt_at < self._min_refresh_interval
+
+    async def _fetch(self) -> None:
+        self._last_attempt_at = time.monotonic()
+        started = time.perf_counter()
+        try:
+            if self._client is not None:
+                response = await self._client.get(self._url)
+            else:
+                async with httpx.AsyncClient(timeout=self._timeout) as client:
+                    response = await client.get(self._url)
+            response.raise_for_status()
+            keys = _parse_jwks(response.json())
+        except (httpx.HTTPError, ValueError) as exc:
+            self._record_fetch(started, succeeded=False)
+            self._next_refresh_at = time.monotonic() + self._min_refresh_interval
+            logger.warning("JWKS fetch failed: %s", exc)
+            raise JwksFetchError("JWKS fetch failed") from exc
+
+        self._keys = keys
+        self._record_fetch(started, succeeded=True)
+        lifetime = _read_max_age(response.headers.get("cache-control"))
+        if lifetime is None:
+            lifetime = self._refresh_interval
+        self._next_refresh_at = time.monotonic() + max(
+            lifetime * self._EARLY_REFRESH_RATIO, self._min_refresh_interval
+        )
+
+    def _record_fetch(self, started: float, *, succeeded: bool) -> None:
+        duration_ms = (time.perf_counter() - started) * 1000
+        stats = self.stats
+        stats.fetches += 1
+        stats.last_duration_ms = duration_ms
+        stats.total_duration_ms += duration_ms
+        stats.max_duration_ms = max(stats.max_duration_ms, duration_ms)
+        if succeeded:
+            stats.last_success_at = time.time()
+            stats.key_count = len(self._keys)
+        else:
+            stats.failures += 1
+        logger.debug(
+            "JWKS fetch %s in %.1fms",
+            "succeeded" if succeeded else "failed",
+            duration_ms,
+        )
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(max(self._next_refresh_at - time.monotonic(), 0.0))
+            try:
+                await self.refresh()
+            except JwksFetchError:
+                pass
+
+
+def _read_max_age(cache_control: str | None) -> float | None:
+    if not cache_control:
+        return None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    if match is None:
+        return None
+    return float(match.group(1))
+
+
+def _parse_jwks(payload: Any) -> dict[str, PyJWK]:
+    if not isinstance(payload, dict) or not isinstance(payload.get("keys"), list):
+        raise ValueError("Invalid JWKS payload")
+    keys: dict[str, PyJWK] = {}
+    for raw in payload["keys"]:
+        if not isinstance(raw, dict) or raw.get("use", "sig") != "sig":
+            continue
+        kid = raw.get("kid")
+        if not isinstance(kid, str) or not kid:
+            continue
+        try:
+            keys[kid] = PyJWK(raw)
+        except jwt.PyJWTError:
+            logger.warning("Skipping unusable JWKS key %s", kid)
+    if not keys:
+        raise ValueError("JWKS contains no usable signing keys")
+    return keys
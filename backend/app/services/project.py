@@ -5,13 +5,12 @@ import unicodedata
 from uuid import UUID
 
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.project import Project, ProjectMember, Vote
+from app.models.project import Project, ProjectMember
 from app.models.project_roles import (
     PROJECT_ROLE_OWNER,
     ProjectMemberRole,
@@ -33,7 +32,6 @@ from app.models.taxonomy import (
 from app.schemas.project import (
     ProjectCreateRequest,
     ProjectDetailResponse,
-    ProjectListItemResponse,
     ProjectListResponse,
     ProjectMemberCreateRequest,
     ProjectMemberInfo,
@@ -41,8 +39,37 @@ from app.schemas.project import (
     ProjectUpdateRequest,
 )
 from app.schemas.taxonomy import TaxonomyTermResponse
-from app.services.taxonomy import normalize_taxonomy_name
-from app.services.project_members import get_members_for_projects
+from app.services.taxonomy import resolve_or_create_taxonomy_terms
+from app.services.taxonomy_dictionary import (
+    TaxonomyDictionary,
+    get_taxonomy_dictionary,
+)
+from app.services.taxonomy_usage import adjust_project_term_usage, adjust_term_usage
+from app.services.project_cards import (
+    build_project_detail_statement,
+    hydrate_project_cards,
+    hydration_from_row,
+    load_project_card_hydration,
+    resolve_hydration_terms,
+)
+from app.services.project_slug_cache import (
+    UNKNOWN_SLUG,
+    ProjectSlugCache,
+    get_project_slug_cache,
+)
+from app.services.search_facet_cache import (
+    SearchFacetCache,
+    get_search_facet_cache,
+)
+from app.services.search_index import ProjectSearchIndex, get_project_search_index
+from app.services.search_result_cache import (
+    SearchResultCache,
+    get_search_result_cache,
+)
+from app.services.taxonomy_bitmaps import (
+    TaxonomyBitmapIndex,
+    get_taxonomy_bitmap_index,
+)
 from app.utils.pagination import (
     CursorError,
     decode_cursor_payload,
@@ -72,8 +99,29 @@ class ProjectResourceNotFoundError(LookupError):
 class ProjectService:
     _MAX_SLUG_RETRY_ATTEMPTS = 8
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        slug_cache: ProjectSlugCache | None = None,
+        search_index: ProjectSearchIndex | None = None,
+        taxonomy_bitmaps: TaxonomyBitmapIndex | None = None,
+        result_cache: SearchResultCache | None = None,
+        facet_cache: SearchFacetCache | None = None,
+        taxonomy_dictionary: TaxonomyDictionary | None = None,
+    ):
         self.db = db
+        self.slug_cache = slug_cache or get_project_slug_cache()
+        self.search_index = search_index or get_project_search_index()
+        self.taxonomy_bitmaps = taxonomy_bitmaps or get_taxonomy_bitmap_index()
+        self.result_cache = result_cache or get_search_result_cache()
+        self.facet_cache = facet_cache or get_search_facet_cache()
+        self.taxonomy_dictionary = taxonomy_dictionary or get_taxonomy_dictionary()
+        # Families that gained terms in the open transaction; their cached
+        # listings are marked stale only once it commits.
+        self._created_term_models: set[type[Category] | type[Tag] | type[TechStack]] = (
+            set()
+        )
 
     async def get_project_by_id(
         self, project_id: UUID, *, include_deleted: bool = False
@@ -145,27 +193,41 @@ class ProjectService:
                 create_categories = payload.categories or None
                 create_tags = payload.tags or None
                 create_tech_stack = payload.tech_stack or None
-                await self._replace_project_taxonomy_assignments(
+                taxonomy = await self._replace_project_taxonomy_assignments(
                     project_id=project.id,
                     categories=create_categories,
                     tags=create_tags,
                     tech_stack=create_tech_stack,
                     taxonomy_principal=taxonomy_principal,
+                    project_is_new=True,
                 )
                 await self.db.commit()
             except IntegrityError as exc:
                 await self.db.rollback()
+                self._created_term_models.clear()
                 if self._is_project_slug_conflict(exc):
                     continue
                 raise
             except Exception:
                 await self.db.rollback()
+                self._created_term_models.clear()
                 raise
-
-            created = await self.get_project_detail(project.id, created_by_id)
-            if created is None:
-                raise RuntimeError("Created project could not be loaded")
-            return created
+            self._mark_created_terms_stale()
+
+            # Drop a cached miss for this slug from before the project existed.
+            self.slug_cache.invalidate(project.slug)
+            if taxonomy_principal is None:
+                created = await self.get_project_detail(project.id, created_by_id)
+                if created is None:
+                    raise RuntimeError("Created project could not be loaded")
+                return created
+            # A new draft has exactly its owner as member and no votes.
+            return self._project_detail_from_write(
+                project,
+                members=[self._member_to_info(owner_member, taxonomy_principal)],
+                taxonomy={**self._empty_taxonomy_payload(), **(taxonomy or {})},
+                viewer_has_voted=False,
+            )
 
         raise RuntimeError("Project slug generation failed after retry attempts")
 
@@ -182,14 +244,31 @@ class ProjectService:
         if project.created_by_id != current_user_id:
             raise ProjectAccessForbiddenError("Project access forbidden")
 
-        project.deleted_at = datetime.now(UTC)
+        deleted_at = datetime.now(UTC)
+        project_cols = getattr(Project, "__table__").c
+        delete_statement = (
+            update(Project)
+            .where(project_cols.id == project_id, project_cols.deleted_at.is_(None))
+            .values(deleted_at=deleted_at)
+            .returning(project_cols.is_published)
+            .execution_options(synchronize_session=False)
+        )
         try:
-            self.db.add(project)
+            deleted_row = (await self.db.exec(delete_statement)).first()
+            if deleted_row is not None and deleted_row.is_published:
+                await adjust_project_term_usage(self.db, project_id, -1)
             await self.db.commit()
         except Exception:
             await self.db.rollback()
             raise
 
+        if deleted_row is not None:
+            project.deleted_at = deleted_at
+            self.search_index.remove(project_id)
+            self.taxonomy_bitmaps.remove(project_id)
+            self.result_cache.project_removed(project_id)
+            self.facet_cache.clear()
+        self.slug_cache.invalidate(project.slug)
         return True
 
     async def update_project(
@@ -287,22 +366,36 @@ class ProjectService:
         try:
             self.db.add(project)
             await self.db.flush()
-            await self._replace_project_taxonomy_assignments(
+            # Usage deltas follow the committed visibility: lock the row so a
+            # concurrent publish, unpublish or delete waits for this one.
+            await self.db.refresh(
+                project, ["is_published", "deleted_at"], with_for_update=True
+            )
+            taxonomy = await self._replace_project_taxonomy_assignments(
                 project_id=project.id,
                 categories=categories,
                 tags=tags,
                 tech_stack=tech_stack,
                 taxonomy_principal=taxonomy_principal,
+                count_usage=project.is_published and project.deleted_at is None,
             )
             await self.db.commit()
         except Exception:
             await self.db.rollback()
+            self._created_term_models.clear()
             raise
+        self._mark_created_terms_stale()
 
-        updated_project = await self.get_project_detail(project.id, current_user_id)
-        if updated_project is None:
-            raise RuntimeError("Updated project could not be loaded")
-        return updated_project
+        await self._reindex_if_published(project)
+        if project.is_published:
+            # Title, description and terms decide which searches match.
+            self.result_cache.project_changed(project)
+            self.facet_cache.clear()
+            if any(terms is not None for terms in (categories, tags, tech_stack)):
+                await self.taxonomy_bitmaps.refresh_project(self.db, project.id)
+        return await self._project_detail_after_write(
+            project, current_user_id=current_user_id, taxonomy=taxonomy
+        )
 
     async def publish_project(
         self,
@@ -321,12 +414,9 @@ class ProjectService:
             raise ProjectAccessForbiddenError("Project publish forbidden")
 
         if project.is_published:
-            published_project = await self.get_project_detail(
-                project.id, current_user_id
+            return await self._project_detail_after_write(
+                project, current_user_id=current_user_id
             )
-            if published_project is None:
-                raise RuntimeError("Published project could not be loaded")
-            return published_project
 
         publish_at = datetime.now(UTC)
         project_cols = getattr(Project, "__table__").c
@@ -340,20 +430,39 @@ class ProjectService:
                 is_published=True,
                 published_at=publish_at,
             )
+            .returning(project_cols.updated_at)
+            .execution_options(synchronize_session=False)
         )
 
         try:
             result = await self.db.exec(publish_statement)
-            if result.rowcount and result.rowcount > 0:
+            published_row = result.first()
+            if published_row is not None:
+                await adjust_project_term_usage(self.db, project_id, 1)
                 await self.db.commit()
         except Exception:
             await self.db.rollback()
             raise
 
-        published_project = await self.get_project_detail(project.id, current_user_id)
-        if published_project is None:
-            raise RuntimeError("Published project could not be loaded")
-        return published_project
+        if published_row is None:
+            # A concurrent request published first; report what it wrote.
+            published_project = await self.get_project_detail(
+                project.id, current_user_id
+            )
+            if published_project is None:
+                raise RuntimeError("Published project could not be loaded")
+            return published_project
+
+        project.is_published = True
+        project.published_at = publish_at
+        project.updated_at = published_row.updated_at
+        await self.search_index.refresh_project(self.db, project.id)
+        await self.taxonomy_bitmaps.refresh_project(self.db, project.id)
+        self.result_cache.project_changed(project)
+        self.facet_cache.clear()
+        return await self._project_detail_after_write(
+            project, current_user_id=current_user_id
+        )
 
     async def unpublish_project(
         self,
@@ -372,6 +481,34 @@ class ProjectService:
             raise ProjectAccessForbiddenError("Project unpublish forbidden")
 
         if not project.is_published:
+            return await self._project_detail_after_write(
+                project, current_user_id=current_user_id
+            )
+
+        project_cols = getattr(Project, "__table__").c
+        unpublish_statement = (
+            update(Project)
+            .where(
+                project_cols.id == project_id,
+                project_cols.is_published.is_(True),
+            )
+            .values(is_published=False, published_at=None)
+            .returning(project_cols.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            result = await self.db.exec(unpublish_statement)
+            unpublished_row = result.first()
+            if unpublished_row is not None:
+                await adjust_project_term_usage(self.db, project_id, -1)
+                await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        if unpublished_row is None:
+            # A concurrent request unpublished first; report what it wrote.
             unpublished_project = await self.get_project_detail(
                 project.id, current_user_id
             )
@@ -381,18 +518,14 @@ class ProjectService:
 
         project.is_published = False
         project.published_at = None
-
-        try:
-            self.db.add(project)
-            await self.db.commit()
-        except Exception:
-            await self.db.rollback()
-            raise
-
-        unpublished_project = await self.get_project_detail(project.id, current_user_id)
-        if unpublished_project is None:
-            raise RuntimeError("Unpublished project could not be loaded")
-        return unpublished_project
+        project.updated_at = unpublished_row.updated_at
+        self.search_index.remove(project.id)
+        self.taxonomy_bitmaps.remove(project.id)
+        self.result_cache.project_removed(project.id)
+        self.facet_cache.clear()
+        return await self._project_detail_after_write(
+            project, current_user_id=current_user_id
+        )
 
     async def get_member_role(self, project_id: UUID, user_id: UUID) -> str | None:
         statement = select(ProjectMember).where(
@@ -452,47 +585,125 @@ class ProjectService:
         current_user_id: UUID | None,
     ) -> ProjectDetailResponse | None:
         """Return visible project detail with team size and taxonomy in assignment order."""
-        project = await self.get_project_by_id(project_id)
-        if project is None:
+        row = await self._fetch_project_detail_row(
+            build_project_detail_statement(
+                viewer_id=current_user_id, project_id=project_id
+            )
+        )
+        if row is None:
             return None
+        return await self._project_detail_from_row(row, current_user_id)
 
-        member_role: str | None = None
-        if current_user_id is not None:
-            member_role = await self.get_member_role(project.id, current_user_id)
+    async def get_project_detail_by_slug(
+        self,
+        slug: str,
+        current_user_id: UUID | None,
+    ) -> ProjectDetailResponse | None:
+        """Return visible project detail by slug with the same payload parity guarantees."""
+        normalized_slug = slug.strip().lower()
+        cached = self.slug_cache.get(normalized_slug)
+        if cached == UNKNOWN_SLUG:
+            return None
 
-        if not self.can_view_project(project, current_user_id, member_role):
+        row = None
+        if cached is not None:
+            row = await self._fetch_project_detail_row(
+                build_project_detail_statement(
+                    viewer_id=current_user_id, project_id=cached
+                )
+            )
+            if row is not None and row.Project.slug != normalized_slug:
+                row = None
+        if row is None:
+            # Cache miss, or the cached id no longer resolves to a live project.
+            row = await self._fetch_project_detail_row(
+                build_project_detail_statement(
+                    viewer_id=current_user_id, slug=normalized_slug
+                )
+            )
+        if row is None:
+            self.slug_cache.put_unknown(normalized_slug)
+            return None
+
+        self.slug_cache.put(normalized_slug, row.Project.id)
+        return await self._project_detail_from_row(row, current_user_id)
+
+    async def _fetch_project_detail_row(self, statement: Any) -> Any:
+        # One round trip: project row, viewer role, members, taxonomy, vote state.
+        result = await self.db.exec(statement)
+        return result.first()
+
+    async def _project_detail_from_row(
+        self, row: Any, current_user_id: UUID | None
+    ) -> ProjectDetailResponse | None:
+        project: Project = row.Project
+        if not self.can_view_project(project, current_user_id, row.viewer_role):
             if current_user_id is not None:
                 raise ProjectAccessForbiddenError("Project access forbidden")
             return None
 
-        members = await self.get_project_members(project.id)
-        taxonomy_by_project = await self.get_project_taxonomy_by_project_ids(
-            [project.id]
+        hydration = hydration_from_row(
+            row, await resolve_hydration_terms(self.db, [row])
         )
-        taxonomy = taxonomy_by_project.get(project.id, self._empty_taxonomy_payload())
-        viewer_has_voted = False
-        if project.is_published and current_user_id is not None:
-            viewer_has_voted = await self._viewer_has_voted(project.id, current_user_id)
+        return ProjectDetailResponse(
+            **project.model_dump(),
+            members=hydration.members,
+            team_size=len(hydration.members),
+            viewer_has_voted=project.is_published and hydration.viewer_has_voted,
+            categories=hydration.categories,
+            tags=hydration.tags,
+            tech_stack=hydration.tech_stack,
+        )
+
+    def _project_detail_from_write(
+        self,
+        project: Project,
+        *,
+        members: list[ProjectMemberInfo],
+        taxonomy: dict[str, list[TaxonomyTermResponse]],
+        viewer_has_voted: bool,
+    ) -> ProjectDetailResponse:
         return ProjectDetailResponse(
             **project.model_dump(),
             members=members,
             team_size=len(members),
-            viewer_has_voted=viewer_has_voted,
+            viewer_has_voted=project.is_published and viewer_has_voted,
             categories=taxonomy["categories"],
             tags=taxonomy["tags"],
             tech_stack=taxonomy["tech_stack"],
         )
 
-    async def get_project_detail_by_slug(
+    async def _project_detail_after_write(
         self,
-        slug: str,
-        current_user_id: UUID | None,
-    ) -> ProjectDetailResponse | None:
-        """Return visible project detail by slug with the same payload parity guarantees."""
-        project = await self.get_project_by_slug(slug)
-        if project is None:
-            return None
-        return await self.get_project_detail(project.id, current_user_id)
+        project: Project,
+        *,
+        current_user_id: UUID,
+        taxonomy: dict[str, list[TaxonomyTermResponse]] | None = None,
+    ) -> ProjectDetailResponse:
+        """Build the detail response for an edit from the row it just wrote.
+
+        Edits do not change members or votes, so only those (and taxonomy
+        families the edit left alone) are read, in one hydration statement.
+        The edit's access check already covers visibility.
+        """
+        hydration = (
+            await load_project_card_hydration(
+                self.db, [project.id], viewer_id=current_user_id
+            )
+        ).get(project.id)
+        if hydration is None:
+            raise RuntimeError("Project could not be loaded after write")
+        return self._project_detail_from_write(
+            project,
+            members=hydration.members,
+            taxonomy={
+                "categories": hydration.categories,
+                "tags": hydration.tags,
+                "tech_stack": hydration.tech_stack,
+                **(taxonomy or {}),
+            },
+            viewer_has_voted=hydration.viewer_has_voted,
+        )
 
     async def get_project_members(self, project_id: UUID) -> list[ProjectMemberInfo]:
         project_member_cols = getattr(ProjectMember, "__table__").c
@@ -570,6 +781,7 @@ class ProjectService:
             await self.db.rollback()
             raise
 
+        await self._reindex_if_published(project)
         return self._member_to_info(member, user)
 
     async def update_project_member(
@@ -635,6 +847,7 @@ class ProjectService:
         except Exception:
             await self.db.rollback()
             raise
+        await self._reindex_if_published(project)
         return True
 
     async def leave_project(
@@ -663,6 +876,7 @@ class ProjectService:
         except Exception:
             await self.db.rollback()
             raise
+        await self._reindex_if_published(project)
         return True
 
     async def list_projects(
@@ -764,34 +978,15 @@ class ProjectService:
         has_more = len(rows) > limit
         projects = rows[:limit]
 
-        members_by_project = await self._get_members_for_projects(
-            [p.id for p in projects]
-        )
-        taxonomy_by_project = await self.get_project_taxonomy_by_project_ids(
-            [p.id for p in projects]
-        )
-        voted_project_ids: set[UUID] = set()
-        if current_user_id is not None:
-            voted_project_ids = await self._get_voted_project_ids(
-                user_id=current_user_id,
-                project_ids=[project.id for project in projects],
-            )
-
-        items = [
-            self._to_project_list_item(
-                project,
-                members_by_project,
-                taxonomy_by_project,
-                voted_project_ids,
-            )
-            for project in projects
-        ]
-
         next_cursor: str | None = None
         if has_more and projects:
             next_cursor = self._encode_cursor(projects[-1], sort, top_range=top_range)
 
-        return ProjectListResponse(items=items, next_cursor=next_cursor)
+        return await self._hydrate_project_list_response(
+            projects=projects,
+            next_cursor=next_cursor,
+            current_user_id=current_user_id,
+        )
 
     async def list_projects_for_owner(
         self,
@@ -878,43 +1073,68 @@ class ProjectService:
         tags: list[str] | None,
         tech_stack: list[str] | None,
         taxonomy_principal: PolicyPrincipal | None = None,
-    ) -> None:
+        project_is_new: bool = False,
+        count_usage: bool = False,
+    ) -> dict[str, list[TaxonomyTermResponse]]:
+        """Replace the given taxonomy families and return their resolved terms.
+
+        Families passed as `None` are left untouched and absent from the result.
+        `project_is_new` skips reading assignments a new project cannot have.
+        `count_usage` moves term usage counters with the assignment changes and
+        is set for published projects.
+        """
+        replaced: dict[str, list[TaxonomyTermResponse]] = {}
         if categories is not None:
             category_terms = await self._resolve_or_create_terms(
                 Category,
                 categories,
                 taxonomy_principal=taxonomy_principal,
             )
-            await self._replace_join_assignments(
+            added, removed = await self._replace_join_assignments(
                 join_model=ProjectCategory,
                 term_fk_field="category_id",
                 project_id=project_id,
                 terms=category_terms,
+                project_is_new=project_is_new,
             )
+            if count_usage:
+                await adjust_term_usage(self.db, Category, added=added, removed=removed)
+            replaced["categories"] = category_terms
         if tags is not None:
             tag_terms = await self._resolve_or_create_terms(
                 Tag,
                 tags,
                 taxonomy_principal=taxonomy_principal,
             )
-            await self._replace_join_assignments(
+            added, removed = await self._replace_join_assignments(
                 join_model=ProjectTag,
                 term_fk_field="tag_id",
                 project_id=project_id,
                 terms=tag_terms,
+                project_is_new=project_is_new,
             )
+            if count_usage:
+                await adjust_term_usage(self.db, Tag, added=added, removed=removed)
+            replaced["tags"] = tag_terms
         if tech_stack is not None:
             tech_stack_terms = await self._resolve_or_create_terms(
                 TechStack,
                 tech_stack,
                 taxonomy_principal=taxonomy_principal,
             )
-            await self._replace_join_assignments(
+            added, removed = await self._replace_join_assignments(
                 join_model=ProjectTechStack,
                 term_fk_field="tech_stack_id",
                 project_id=project_id,
                 terms=tech_stack_terms,
+                project_is_new=project_is_new,
             )
+            if count_usage:
+                await adjust_term_usage(
+                    self.db, TechStack, added=added, removed=removed
+                )
+            replaced["tech_stack"] = tech_stack_terms
+        return replaced
 
     async def _resolve_or_create_terms(
         self,
@@ -922,41 +1142,25 @@ class ProjectService:
         values: list[str],
         taxonomy_principal: PolicyPrincipal | None = None,
     ) -> list[TaxonomyTermResponse]:
-        terms: list[TaxonomyTermResponse] = []
-        for value in values:
-            normalized_name = normalize_taxonomy_name(value)
-            model_cols = getattr(model, "__table__").c
-            existing_statement = select(model).where(
-                model_cols.normalized_name == normalized_name
-            )
-            existing_result = await self.db.exec(existing_statement)
-            existing = existing_result.first()
-            if existing is not None:
-                terms.append(TaxonomyTermResponse.model_validate(existing))
-                continue
-
-            require_taxonomy_create_on_miss(taxonomy_principal)
-
-            insert_statement = (
-                pg_insert(getattr(model, "__table__"))
-                .values(name=value.strip(), normalized_name=normalized_name)
-                .on_conflict_do_nothing(index_elements=["normalized_name"])
-                .returning(model_cols.id, model_cols.name)
-            )
-            insert_result = await self.db.exec(insert_statement)
-            inserted = insert_result.first()
-            if inserted is not None:
-                terms.append(TaxonomyTermResponse(id=inserted.id, name=inserted.name))
-                continue
-
-            race_result = await self.db.exec(existing_statement)
-            raced_existing = race_result.first()
-            if raced_existing is None:
-                raise RuntimeError("Taxonomy term could not be resolved")
-            terms.append(TaxonomyTermResponse.model_validate(raced_existing))
-
+        terms, created = await resolve_or_create_taxonomy_terms(
+            self.db,
+            model,
+            values,
+            authorize_create=lambda: require_taxonomy_create_on_miss(
+                taxonomy_principal
+            ),
+        )
+        if created:
+            self._created_term_models.add(model)
         return terms
 
+    def _mark_created_terms_stale(self) -> None:
+        # After the commit, so a listing reload cannot read the old vocabulary
+        # and keep it for the dictionary's max age.
+        for model in self._created_term_models:
+            self.taxonomy_dictionary.mark_stale(model)
+        self._created_term_models.clear()
+
     async def _replace_join_assignments(
         self,
         *,
@@ -964,36 +1168,107 @@ class ProjectService:
         term_fk_field: Literal["category_id", "tag_id", "tech_stack_id"],
         project_id: UUID,
         terms: list[TaxonomyTermResponse],
-    ) -> None:
+        project_is_new: bool = False,
+    ) -> tuple[list[UUID], list[UUID]]:
+        """Write `terms` as the project's ordered assignments for one family.
+
+        Only rows that were added, removed or moved are touched. Moved rows
+        are parked at negative positions first when their targets are still
+        occupied, since `(project_id, position)` is checked row by row.
+        Returns the term ids that were added and removed.
+        """
+        if term_fk_field not in {"category_id", "tag_id", "tech_stack_id"}:
+            raise ValueError(f"Unsupported taxonomy term_fk_field: {term_fk_field}")
         join_cols = getattr(join_model, "__table__").c
-        delete_statement = sa.delete(join_model).where(
-            join_cols.project_id == project_id
+        term_fk_col = getattr(join_cols, term_fk_field)
+
+        current: list[tuple[UUID, UUID, int]] = []
+        if not project_is_new:
+            current_result = await self.db.exec(
+                select(join_cols.id, term_fk_col, join_cols.position).where(
+                    join_cols.project_id == project_id
+                )
+            )
+            current = [(row[0], row[1], row[2]) for row in current_result.all()]
+
+        removed_ids, moves, added = self._diff_join_assignments(
+            current, [term.id for term in terms]
         )
-        await self.db.exec(delete_statement)
+        if removed_ids:
+            await self.db.exec(
+                sa.delete(join_model).where(join_cols.id.in_(removed_ids))
+            )
+        if moves:
+            occupied = {
+                position for row_id, _, position in current if row_id not in removed_ids
+            }
+            if any(position in occupied for position in moves.values()):
+                await self.db.exec(
+                    sa.update(join_model)
+                    .where(join_cols.id.in_(list(moves)))
+                    .values(position=-join_cols.position - 1)
+                )
+            await self.db.exec(
+                sa.update(join_model)
+                .where(join_cols.id.in_(list(moves)))
+                .values(position=sa.case(moves, value=join_cols.id))
+            )
 
-        for position, term in enumerate(terms):
+        for term_id, position in added:
             if term_fk_field == "category_id":
                 assignment = ProjectCategory(  # pyright: ignore[reportCallIssue]
                     project_id=project_id,
-                    category_id=term.id,
+                    category_id=term_id,
                     position=position,
                 )
             elif term_fk_field == "tag_id":
                 assignment = ProjectTag(  # pyright: ignore[reportCallIssue]
                     project_id=project_id,
-                    tag_id=term.id,
+                    tag_id=term_id,
                     position=position,
                 )
-            elif term_fk_field == "tech_stack_id":
+            else:
                 assignment = ProjectTechStack(  # pyright: ignore[reportCallIssue]
                     project_id=project_id,
-                    tech_stack_id=term.id,
+                    tech_stack_id=term_id,
                     position=position,
                 )
-            else:
-                raise ValueError(f"Unsupported taxonomy term_fk_field: {term_fk_field}")
             self.db.add(assignment)
 
+        removed_row_ids = set(removed_ids)
+        return (
+            [term_id for term_id, _ in added],
+            [term_id for row_id, term_id, _ in current if row_id in removed_row_ids],
+        )
+
+    @staticmethod
+    def _diff_join_assignments(
+        current: list[tuple[UUID, UUID, int]], term_ids: list[UUID]
+    ) -> tuple[list[UUID], dict[UUID, int], list[tuple[UUID, int]]]:
+        """Diff `(row_id, term_id, position)` rows against the wanted order.
+
+        Returns the row ids to delete, the new position of each moved row and
+        the `(term_id, position)` pairs to insert.
+        """
+        wanted = {term_id: position for position, term_id in enumerate(term_ids)}
+        removed_ids: list[UUID] = []
+        moves: dict[UUID, int] = {}
+        kept: set[UUID] = set()
+        for row_id, term_id, position in current:
+            target = wanted.get(term_id)
+            if target is None:
+                removed_ids.append(row_id)
+                continue
+            kept.add(term_id)
+            if target != position:
+                moves[row_id] = target
+        added = [
+            (term_id, position)
+            for term_id, position in wanted.items()
+            if term_id not in kept
+        ]
+        return removed_ids, moves, added
+
     async def get_project_taxonomy_by_project_ids(
         self, project_ids: list[UUID]
     ) -> dict[UUID, dict[str, list[TaxonomyTermResponse]]]:
@@ -1090,6 +1365,11 @@ class ProjectService:
         result = await self.db.exec(statement)
         return int(result.one())
 
+    async def _reindex_if_published(self, project: Project) -> None:
+        # Search cards carry project columns such as the title and group flag.
+        if project.is_published:
+            await self.search_index.refresh_project(self.db, project.id)
+
     async def _sync_group_project_flag(self, project: Project) -> None:
         statement = (
             select(sa.func.count())
@@ -1166,54 +1446,6 @@ class ProjectService:
             stmt = stmt.where(project_cols.is_published.is_(False))
         return stmt
 
-    async def _get_members_for_projects(
-        self, project_ids: list[UUID]
-    ) -> dict[UUID, list[ProjectMemberInfo]]:
-        return await get_members_for_projects(self.db, project_ids)
-
-    @staticmethod
-    def _to_project_list_item(
-        project: Project,
-        members_by_project: dict[UUID, list[ProjectMemberInfo]],
-        taxonomy_by_project: dict[UUID, dict[str, list[TaxonomyTermResponse]]],
-        voted_project_ids: set[UUID],
-    ) -> ProjectListItemResponse:
-        members = members_by_project.get(project.id, [])
-        taxonomy = taxonomy_by_project.get(
-            project.id, ProjectService._empty_taxonomy_payload()
-        )
-        return ProjectListItemResponse(
-            **project.model_dump(),
-            members=members,
-            team_size=len(members),
-            viewer_has_voted=project.id in voted_project_ids,
-            categories=taxonomy["categories"],
-            tags=taxonomy["tags"],
-            tech_stack=taxonomy["tech_stack"],
-        )
-
-    async def _viewer_has_voted(self, project_id: UUID, user_id: UUID) -> bool:
-        vote_cols = getattr(Vote, "__table__").c
-        statement = select(Vote).where(
-            vote_cols.project_id == project_id,
-            vote_cols.user_id == user_id,
-        )
-        result = await self.db.exec(statement)
-        return result.one_or_none() is not None
-
-    async def _get_voted_project_ids(
-        self, *, user_id: UUID, project_ids: list[UUID]
-    ) -> set[UUID]:
-        if not project_ids:
-            return set()
-        vote_cols = getattr(Vote, "__table__").c
-        statement = select(vote_cols.project_id).where(
-            vote_cols.user_id == user_id,
-            vote_cols.project_id.in_(project_ids),
-        )
-        result = await self.db.exec(statement)
-        return {row for row in result.all()}
-
     async def _hydrate_project_list_response(
         self,
         *,
@@ -1221,29 +1453,9 @@ class ProjectService:
         next_cursor: str | None,
         current_user_id: UUID | None,
     ) -> ProjectListResponse:
-        members_by_project = await self._get_members_for_projects(
-            [p.id for p in projects]
+        items = await hydrate_project_cards(
+            self.db, projects, viewer_id=current_user_id
         )
-        taxonomy_by_project = await self.get_project_taxonomy_by_project_ids(
-            [p.id for p in projects]
-        )
-        voted_project_ids: set[UUID] = set()
-        if current_user_id is not None:
-            voted_project_ids = await self._get_voted_project_ids(
-                user_id=current_user_id,
-                project_ids=[project.id for project in projects],
-            )
-
-        items = [
-            self._to_project_list_item(
-                project,
-                members_by_project,
-                taxonomy_by_project,
-                voted_project_ids,
-            )
-            for project in projects
-        ]
-
         return ProjectListResponse(items=items, next_cursor=next_cursor)
 
     async def _list_owner_new_projects(
@@ -0,0 +1,371 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.project import Project, ProjectMember, Vote
+from app.models.project_roles import ProjectMemberRole, cast_project_member_role
+from app.models.taxonomy import (
+    Category,
+    ProjectCategory,
+    ProjectTag,
+    ProjectTechStack,
+    Tag,
+    TechStack,
+)
+from app.models.user import User
+from app.schemas.project import ProjectListItemResponse, ProjectMemberInfo
+from app.schemas.taxonomy import TaxonomyTermResponse
+from app.services.taxonomy_dictionary import (
+    TaxonomyDictionary,
+    TaxonomyTermModel,
+    get_taxonomy_dictionary,
+)
+
+TaxonomyJoinModel = type[ProjectCategory] | type[ProjectTag] | type[ProjectTechStack]
+# Hydration row column -> vocabulary its term ids belong to.
+_TAXONOMY_COLUMNS: tuple[tuple[str, TaxonomyTermModel], ...] = (
+    ("categories", Category),
+    ("tags", Tag),
+    ("tech_stack", TechStack),
+)
+HydrationTerms = dict[str, dict[UUID, TaxonomyTermResponse]]
+
+
+@dataclass(frozen=True)
+class ProjectCardHydration:
+    members: list[ProjectMemberInfo]
+    categories: list[TaxonomyTermResponse]
+    tags: list[TaxonomyTermResponse]
+    tech_stack: list[TaxonomyTermResponse]
+    viewer_has_voted: bool
+
+
+def _coerce_member_role(value: str) -> ProjectMemberRole:
+    try:
+        return cast_project_member_role(value)
+    except ValueError as exc:
+        raise RuntimeError("Unexpected project member role in database") from exc
+
+
+def members_json_lateral(project_id: Any, *, name: str = "card_members") -> Any:
+    """Build a LATERAL subquery aggregating project members (by `added_at`) as JSON."""
+    member_cols = getattr(ProjectMember, "__table__").c
+    user_cols = getattr(User, "__table__").c
+    member_object = sa.func.json_build_object(
+        "user_id",
+        user_cols.id,
+        "username",
+        user_cols.username,
+        "role",
+        member_cols.role,
+        "full_name",
+        user_cols.full_name,
+        "profile_picture_url",
+        user_cols.profile_picture_url,
+    )
+    return (
+        select(
+            sa.func.json_agg(
+                aggregate_order_by(member_object, member_cols.added_at.asc()),
+                type_=JSON,
+            ).label("payload")
+        )
+        .select_from(
+            getattr(ProjectMember, "__table__").join(
+                getattr(User, "__table__"),
+                user_cols.id == member_cols.user_id,
+            )
+        )
+        .where(member_cols.project_id == project_id)
+        .lateral(name)
+    )
+
+
+def taxonomy_json_lateral(
+    *,
+    join_model: TaxonomyJoinModel,
+    term_fk_field: str,
+    project_id: Any,
+    name: str,
+) -> Any:
+    """Build a LATERAL subquery aggregating assigned term ids (by `position`) as JSON.
+
+    Term names come from the taxonomy dictionary, so only join rows are read.
+    """
+    join_cols = getattr(join_model, "__table__").c
+    return (
+        select(
+            sa.func.json_agg(
+                aggregate_order_by(
+                    getattr(join_cols, term_fk_field), join_cols.position.asc()
+                ),
+                type_=JSON,
+            ).label("payload")
+        )
+        .where(join_cols.project_id == project_id)
+        .lateral(name)
+    )
+
+
+def viewer_has_voted_expression(project_id: Any, viewer_id: UUID | None) -> Any:
+    if viewer_id is None:
+        return sa.false()
+    vote_cols = getattr(Vote, "__table__").c
+    return sa.exists(
+        select(sa.literal(1)).where(
+            vote_cols.project_id == project_id,
+            vote_cols.user_id == viewer_id,
+        )
+    )
+
+
+def _hydration_columns_and_source(project_table: Any, *, viewer_id: UUID | None):
+    project_cols = project_table.c
+    members = members_json_lateral(project_cols.id)
+    categories = taxonomy_json_lateral(
+        join_model=ProjectCategory,
+        term_fk_field="category_id",
+        project_id=project_cols.id,
+        name="card_categories",
+    )
+    tags = taxonomy_json_lateral(
+        join_model=ProjectTag,
+        term_fk_field="tag_id",
+        project_id=project_cols.id,
+        name="card_tags",
+    )
+    tech_stack = taxonomy_json_lateral(
+        join_model=ProjectTechStack,
+        term_fk_field="tech_stack_id",
+        project_id=project_cols.id,
+        name="card_tech_stack",
+    )
+    columns = (
+        members.c.payload.label("members"),
+        categories.c.payload.label("categories"),
+        tags.c.payload.label("tags"),
+        tech_stack.c.payload.label("tech_stack"),
+        viewer_has_voted_expression(project_cols.id, viewer_id).label(
+            "viewer_has_voted"
+        ),
+    )
+    source = (
+        project_table.outerjoin(members, sa.true())
+        .outerjoin(categories, sa.true())
+        .outerjoin(tags, sa.true())
+        .outerjoin(tech_stack, sa.true())
+    )
+    return columns, source
+
+
+def build_project_card_hydration_statement(
+    project_ids: list[UUID], *, viewer_id: UUID | None
+) -> Any:
+    """Build the single statement that hydrates members, taxonomy, and vote state."""
+    project_table = getattr(Project, "__table__")
+    columns, source = _hydration_columns_and_source(project_table, viewer_id=viewer_id)
+    return (
+        select(project_table.c.id.label("project_id"), *columns)
+        .select_from(source)
+        .where(project_table.c.id.in_(project_ids))
+    )
+
+
+def build_published_project_cards_statement(
+    project_ids: list[UUID], *, viewer_id: UUID | None
+) -> Any:
+    """Select live published projects by id with their card hydration columns."""
+    project_table = getattr(Project, "__table__")
+    project_cols = project_table.c
+    columns, source = _hydration_columns_and_source(project_table, viewer_id=viewer_id)
+    return (
+        select(Project, *columns)
+        .select_from(source)
+        .where(
+            project_cols.id.in_(project_ids),
+            project_cols.is_published.is_(True),
+            project_cols.deleted_at.is_(None),
+        )
+    )
+
+
+def build_project_detail_statement(
+    *,
+    viewer_id: UUID | None,
+    project_id: UUID | None = None,
+    slug: str | None = None,
+) -> Any:
+    """Build the single statement behind project detail pages.
+
+    Selects the non-deleted project by id or slug together with the viewer's
+    member role and the card hydration columns, so the caller can apply
+    visibility rules without another round trip.
+    """
+    if (project_id is None) == (slug is None):
+        raise ValueError("Pass exactly one of project_id or slug")
+    project_table = getattr(Project, "__table__")
+    project_cols = project_table.c
+    member_cols = getattr(ProjectMember, "__table__").c
+    if viewer_id is None:
+        viewer_role: Any = sa.null()
+    else:
+        viewer_role = (
+            select(member_cols.role)
+            .where(
+                member_cols.project_id == project_cols.id,
+                member_cols.user_id == viewer_id,
+            )
+            .scalar_subquery()
+        )
+    columns, source = _hydration_columns_and_source(project_table, viewer_id=viewer_id)
+    lookup = (
+        project_cols.id == project_id
+        if project_id is not None
+        else project_cols.slug == slug
+    )
+    return (
+        select(Project, viewer_role.label("viewer_role"), *columns)
+        .select_from(source)
+        .where(lookup, project_cols.deleted_at.is_(None))
+    )
+
+
+async def resolve_hydration_terms(
+    db: AsyncSession,
+    rows: Sequence[Any],
+    *,
+    taxonomy_dictionary: TaxonomyDictionary | None = None,
+) -> HydrationTerms:
+    """Look up the terms behind hydration rows' id arrays, per vocabulary.
+
+    Known terms come from the taxonomy dictionary; only ids it has not seen
+    yet cost a query.
+    """
+    dictionary = taxonomy_dictionary or get_taxonomy_dictionary()
+    terms: HydrationTerms = {}
+    for column, model in _TAXONOMY_COLUMNS:
+        term_ids = [
+            UUID(str(term_id)) for row in rows for term_id in getattr(row, column) or []
+        ]
+        terms[column] = (
+            await dictionary.terms_by_id(db, model, term_ids) if term_ids else {}
+        )
+    return terms
+
+
+def hydration_from_row(row: Any, terms: HydrationTerms) -> ProjectCardHydration:
+    return ProjectCardHydration(
+        members=parse_members_json(row.members),
+        categories=parse_terms_json(row.categories, terms["categories"]),
+        tags=parse_terms_json(row.tags, terms["tags"]),
+        tech_stack=parse_terms_json(row.tech_stack, terms["tech_stack"]),
+        viewer_has_voted=bool(row.viewer_has_voted),
+    )
+
+
+def parse_members_json(raw: list[dict[str, Any]] | None) -> list[ProjectMemberInfo]:
+    return [
+        ProjectMemberInfo(
+            user_id=UUID(str(item["user_id"])),
+            username=item["username"],
+            role=_coerce_member_role(item["role"]),
+            full_name=item["full_name"],
+            profile_picture_url=item["profile_picture_url"],
+        )
+        for item in raw or []
+    ]
+
+
+def parse_terms_json(
+    raw: list[Any] | None, terms: dict[UUID, TaxonomyTermResponse]
+) -> list[TaxonomyTermResponse]:
+    term_ids = (UUID(str(term_id)) for term_id in raw or [])
+    return [terms[term_id] for term_id in term_ids if term_id in terms]
+
+
+async def load_project_card_hydration(
+    db: AsyncSession,
+    project_ids: list[UUID],
+    *,
+    viewer_id: UUID | None,
+) -> dict[UUID, ProjectCardHydration]:
+    """Return members, ordered taxonomy, and viewer vote state keyed by project id."""
+    if not project_ids:
+        return {}
+
+    statement = build_project_card_hydration_statement(project_ids, viewer_id=viewer_id)
+    result = await db.exec(statement)
+    rows = result.all()
+    terms = await resolve_hydration_terms(db, rows)
+    return {row.project_id: hydration_from_row(row, terms) for row in rows}
+
+
+def to_project_list_item(
+    project: Project, hydration: ProjectCardHydration | None
+) -> ProjectListItemResponse:
+    if hydration is None:
+        hydration = ProjectCardHydration(
+            members=[],
+            categories=[],
+            tags=[],
+            tech_stack=[],
+            viewer_has_voted=False,
+        )
+    return ProjectListItemResponse(
+        **project.model_dump(),
+        members=hydration.members,
+        team_size=len(hydration.members),
+        viewer_has_voted=hydration.viewer_has_voted,
+        categories=hydration.categories,
+        tags=hydration.tags,
+        tech_stack=hydration.tech_stack,
+    )
+
+
+async def load_published_project_cards(
+    db: AsyncSession,
+    project_ids: list[UUID],
+    *,
+    viewer_id: UUID | None,
+) -> list[ProjectListItemResponse]:
+    """Return cards for the ids that are still published, in the given order.
+
+    Project rows and hydration come back in one round trip.
+    """
+    if not project_ids:
+        return []
+
+    statement = build_published_project_cards_statement(
+        project_ids, viewer_id=viewer_id
+    )
+    result = await db.exec(statement)
+    rows = result.all()
+    terms = await resolve_hydration_terms(db, rows)
+    cards = {
+        row.Project.id: to_project_list_item(
+            row.Project, hydration_from_row(row, terms)
+        )
+        for row in rows
+    }
+    return [cards[project_id] for project_id in project_ids if project_id in cards]
+
+
+async def hydrate_project_cards(
+    db: AsyncSession,
+    projects: list[Project],
+    *,
+    viewer_id: UUID | None,
+) -> list[ProjectListItemResponse]:
+    """Return list cards for a page of projects using one hydration round trip."""
+    hydration = await load_project_card_hydration(
+        db, [project.id for project in projects], viewer_id=viewer_id
+    )
+    return [
+        to_project_list_item(project, hydration.get(project.id)) for project in projects
+    ]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Literal
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.utils.cache import CacheStats, ExpiringLRUCache
+
+UNKNOWN_SLUG: Literal["unknown"] = "unknown"
+
+
+class ProjectSlugCache:
+    """Process-local normalized slug -> project id cache.
+
+    Slugs never change after creation, so resolved ids are kept for
+    `ttl_seconds`; callers still confirm the id on use, which covers soft
+    deletes made by other processes. Slugs with no live project are cached as
+    `UNKNOWN_SLUG` for the shorter `negative_ttl_seconds`, so repeated misses
+    stop reaching the database. A TTL of zero disables that kind of entry.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        max_entries: int,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._cache: ExpiringLRUCache[str, UUID | Literal["unknown"]] = (
+            ExpiringLRUCache(max_entries=max_entries)
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, slug: str) -> UUID | Literal["unknown"] | None:
+        return self._cache.get(slug)
+
+    def put(self, slug: str, project_id: UUID) -> None:
+        self._cache.set(slug, project_id, ttl=self.ttl_seconds)
+
+    def put_unknown(self, slug: str) -> None:
+        self._cache.set(slug, UNKNOWN_SLUG, ttl=self.negative_ttl_seconds)
+
+    def invalidate(self, slug: str) -> None:
+        self._cache.pop(slug)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+@lru_cache
+def get_project_slug_cache() -> ProjectSlugCache:
+    settings = get_settings()
+    return ProjectSlugCache(
+        ttl_seconds=settings.PROJECT_SLUG_CACHE_TTL_SECONDS,
+        negative_ttl_seconds=settings.PROJECT_SLUG_CACHE_NEGATIVE_TTL_SECONDS,
+        max_entries=settings.PROJECT_SLUG_CACHE_MAX_ENTRIES,
+    )
@@ -1,31 +1,82 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
 import hashlib
 import json
-from typing import Any
+import math
+from typing import Any, Literal
 from uuid import UUID
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.project import Project
-from app.models.taxonomy import (
-    Category,
-    ProjectCategory,
-    ProjectTag,
-    ProjectTechStack,
-    Tag,
-    TechStack,
+from app.core.config import get_settings
+from app.db.read_routing import prefers_primary, reads_replica
+from app.models.project import PROJECT_SEARCH_CONFIG, Project
+from app.schemas.search import (
+    ProjectSearchFacets,
+    ProjectSearchRequest,
+    ProjectSearchResponse,
+    RANKED_SEARCH_SORTS,
+    SearchFacetCount,
+    SearchSort,
 )
-from app.schemas.search import ProjectSearchRequest, ProjectSearchResponse, SearchSort
 from app.services.project import CursorError, ProjectService
+from app.services.project_cards import (
+    hydrate_project_cards,
+    load_published_project_cards,
+)
+from app.services.search_facet_cache import SearchFacetCache, get_search_facet_cache
+from app.services.search_index import (
+    INDEXED_SEARCH_SORTS,
+    TAXONOMY_FAMILIES,
+    NewKey,
+    ProjectSearchIndex,
+    SearchIndexQuery,
+    TaxonomyJoinModel,
+    TaxonomyModel,
+    TopKey,
+    get_project_search_index,
+)
+from app.services.search_result_cache import (
+    CachedSearchPage,
+    SearchPageKey,
+    SearchResultCache,
+    get_search_result_cache,
+)
 from app.services.taxonomy import normalize_taxonomy_name
+from app.services.taxonomy_bitmaps import (
+    TaxonomyBitmapIndex,
+    get_taxonomy_bitmap_index,
+)
+from app.services.taxonomy_dictionary import (
+    TaxonomyDictionary,
+    get_taxonomy_dictionary,
+)
 from app.utils.pagination import decode_cursor_payload, encode_cursor_payload
 
 
+@dataclass(frozen=True)
+class _SearchContext:
+    limit: int
+    top_range: tuple[date, date] | None
+    search_signature: str
+    cursor_payload: dict[str, str | int] | None
+    page_key: SearchPageKey
+    # Result and facet cache generations read before any search query ran.
+    cache_generation: int
+    facet_generation: int
+    # False for a recent writer, who must see their own write, not a page
+    # another reader stored; such requests neither read nor fill the cache.
+    use_result_cache: bool
+    # Whether this request reads a replica that can trail writes.
+    page_from_replica: bool
+
+
 class SearchService(ABC):
     """Service boundary for project search implementations."""
 
@@ -42,9 +93,36 @@ class SearchService(ABC):
 class PostgresSearchService(SearchService):
     """Postgres-backed implementation of the project search contract."""
 
-    def __init__(self, db: AsyncSession):
+    _FACET_LIMIT_PER_FAMILY = 20
+    # ts_rank_cd normalization 1 divides by 1 + log(document length), so long
+    # descriptions do not outrank a title match on volume alone.
+    _RELEVANCE_NORMALIZATION = 1
+    _SUGGESTION_LIMIT = 5
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        taxonomy_dictionary: TaxonomyDictionary | None = None,
+        facet_cache: SearchFacetCache | None = None,
+        similarity_threshold: float | None = None,
+        taxonomy_bitmaps: TaxonomyBitmapIndex | None = None,
+        taxonomy_filter: Literal["exists", "bitmap"] | None = None,
+        result_cache: SearchResultCache | None = None,
+    ):
+        settings = get_settings()
         self.db = db
-        self._project_service = ProjectService(db)
+        self.taxonomy_dictionary = taxonomy_dictionary or get_taxonomy_dictionary()
+        self.facet_cache = facet_cache or get_search_facet_cache()
+        self.result_cache = result_cache or get_search_result_cache()
+        self.similarity_threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else settings.SEARCH_SIMILARITY_THRESHOLD
+        )
+        self.taxonomy_bitmaps = taxonomy_bitmaps or get_taxonomy_bitmap_index()
+        self.taxonomy_filter = taxonomy_filter or settings.SEARCH_TAXONOMY_FILTER
+        self._similarity_threshold_applied = False
 
     async def search_projects(
         self,
@@ -52,42 +130,27 @@ class PostgresSearchService(SearchService):
         request: ProjectSearchRequest,
         current_user_id: UUID | None = None,
     ) -> ProjectSearchResponse:
-        limit = max(1, min(request.limit, 100))
-        project_cols = getattr(Project, "__table__").c
-
-        top_range = self._resolve_top_date_range(
-            sort=request.sort,
-            published_from=request.published_from,
-            published_to=request.published_to,
+        context = self._search_context(request)
+        cached = await self._cached_search_response(
+            request, context=context, current_user_id=current_user_id
         )
-        if (
-            request.sort == "top"
-            and request.cursor is not None
-            and request.published_from is None
-            and request.published_to is None
-        ):
-            cursor_range = self._extract_top_range_from_cursor(request.cursor)
-            if cursor_range is not None:
-                top_range = cursor_range
-
-        if request.sort == "top" and top_range is None:
-            raise CursorError("Invalid date range")
+        if cached is not None:
+            return cached
+        top_range = context.top_range
+        cursor_payload = context.cursor_payload
+        project_cols = getattr(Project, "__table__").c
 
-        search_signature = self._build_search_signature(
-            request=request, top_range=top_range
-        )
-        cursor_payload: dict[str, str | int] | None = None
-        if request.cursor is not None:
-            cursor_payload = self._decode_cursor(
-                cursor=request.cursor,
-                sort=request.sort,
-                search_signature=search_signature,
-                top_range=top_range,
-            )
+        if request.sort == "similarity":
+            await self._apply_similarity_threshold()
 
         statement = ProjectService._base_published_projects_query()
         statement = self._apply_keyword_filter(statement, request=request)
         statement = await self._apply_taxonomy_filters(statement, request=request)
+        search_rank: Any = None
+        if request.sort == "relevance":
+            search_rank = self._relevance_rank(request)
+        elif request.sort == "similarity":
+            search_rank = self._similarity_rank(request)
 
         if request.sort == "top":
             if top_range is None:
@@ -98,9 +161,32 @@ class PostgresSearchService(SearchService):
                 project_cols.published_at >= range_start_dt,
                 project_cols.published_at < range_end_exclusive_dt,
             )
-
-        if request.sort == "new":
+        else:
             statement = statement.where(project_cols.published_at.is_not(None))
+
+        facets: ProjectSearchFacets | None = None
+        if request.facets:
+            facets = await self._load_facets(statement, context=context)
+
+        if search_rank is not None:
+            if cursor_payload is not None:
+                rank = self._parse_rank(cursor_payload["rank"])
+                cursor_id = UUID(str(cursor_payload["id"]))
+                statement = statement.where(
+                    (search_rank < rank)
+                    | ((search_rank == rank) & (project_cols.id < cursor_id))
+                )
+            # Every search filter is a WHERE clause; re-selecting with the rank
+            # makes session.exec return (project, rank) rows instead of scalars.
+            statement = (
+                select(Project, search_rank)
+                .where(statement.whereclause)
+                .order_by(
+                    search_rank.desc(),
+                    project_cols.id.desc(),
+                )
+            )
+        elif request.sort == "new":
             if cursor_payload is not None:
                 published_at = self._parse_datetime(cursor_payload["published_at"])
                 cursor_id = UUID(str(cursor_payload["id"]))
@@ -138,47 +224,338 @@ class PostgresSearchService(SearchService):
                 project_cols.id.desc(),
             )
 
-        statement = statement.limit(limit + 1)
+        statement = statement.limit(context.limit + 1)
         result = await self.db.exec(statement)
-        rows = list(result.all())
+        ranks: list[float] = []
+        if search_rank is not None:
+            ranked_rows = list(result.all())
+            rows = [row[0] for row in ranked_rows]
+            ranks = [row[1] for row in ranked_rows]
+        else:
+            rows = list(result.all())
 
-        has_more = len(rows) > limit
-        projects = rows[:limit]
-        project_ids = [project.id for project in projects]
+        return await self._search_response(
+            request,
+            context=context,
+            projects=rows[: context.limit],
+            has_more=len(rows) > context.limit,
+            last_rank=ranks[context.limit - 1] if len(ranks) > context.limit else None,
+            facets=facets,
+            current_user_id=current_user_id,
+        )
 
-        members_by_project = await self._project_service._get_members_for_projects(
-            project_ids
+    def _search_context(self, request: ProjectSearchRequest) -> _SearchContext:
+        """Resolve the page size, `top` window, signature and decoded cursor."""
+        top_range = self._resolve_top_date_range(
+            sort=request.sort,
+            published_from=request.published_from,
+            published_to=request.published_to,
         )
-        taxonomy_by_project = (
-            await self._project_service.get_project_taxonomy_by_project_ids(project_ids)
+        if (
+            request.sort == "top"
+            and request.cursor is not None
+            and request.published_from is None
+            and request.published_to is None
+        ):
+            cursor_range = self._extract_top_range_from_cursor(request.cursor)
+            if cursor_range is not None:
+                top_range = cursor_range
+
+        if request.sort == "top" and top_range is None:
+            raise CursorError("Invalid date range")
+
+        search_signature = self._build_search_signature(
+            request=request, top_range=top_range
         )
-        voted_project_ids: set[UUID] = set()
-        if current_user_id is not None:
-            voted_project_ids = await self._project_service._get_voted_project_ids(
-                user_id=current_user_id,
-                project_ids=project_ids,
+        cursor_payload: dict[str, str | int] | None = None
+        if request.cursor is not None:
+            cursor_payload = self._decode_cursor(
+                cursor=request.cursor,
+                sort=request.sort,
+                search_signature=search_signature,
+                top_range=top_range,
             )
+        limit = max(1, min(request.limit, 100))
+        return _SearchContext(
+            limit=limit,
+            top_range=top_range,
+            search_signature=search_signature,
+            cursor_payload=cursor_payload,
+            page_key=(
+                search_signature,
+                request.cursor,
+                limit,
+                self.similarity_threshold,
+            ),
+            cache_generation=self.result_cache.generation,
+            facet_generation=self.facet_cache.generation,
+            use_result_cache=not prefers_primary(self.db),
+            page_from_replica=reads_replica(self.db),
+        )
 
-        items = [
-            self._project_service._to_project_list_item(
-                project,
-                members_by_project,
-                taxonomy_by_project,
-                voted_project_ids,
-            )
-            for project in projects
-        ]
+    async def _cached_search_response(
+        self,
+        request: ProjectSearchRequest,
+        *,
+        context: _SearchContext,
+        current_user_id: UUID | None,
+    ) -> ProjectSearchResponse | None:
+        """Answer from a cached page, loading only its cards; None on a miss.
+
+        The filter and sort query is skipped. Cards, vote counts and viewer
+        state are still read for this request.
+        """
+        if not context.use_result_cache:
+            return None
+        page = self.result_cache.get(context.page_key)
+        if page is None:
+            return None
+        facets: ProjectSearchFacets | None = None
+        if request.facets:
+            facets = self.facet_cache.get(context.search_signature)
+            if facets is None:
+                return None
+        items = await load_published_project_cards(
+            self.db, list(page.project_ids), viewer_id=current_user_id
+        )
+        if len(items) != len(page.project_ids):
+            # Another process unpublished or deleted a listed project.
+            self.result_cache.discard(context.page_key)
+            return None
+        return ProjectSearchResponse(
+            items=items,
+            next_cursor=page.next_cursor,
+            facets=facets,
+            suggestions=list(page.suggestions),
+        )
+
+    def _cache_page(
+        self,
+        request: ProjectSearchRequest,
+        *,
+        context: _SearchContext,
+        projects: list[Project],
+        has_more: bool,
+        next_cursor: str | None,
+        suggestions: list[str],
+    ) -> None:
+        """Remember the page's ids and the sort key span writers check."""
+        if not context.use_result_cache:
+            return
+        span_high: int | datetime | None = None
+        span_low: int | datetime | None = None
+        cursor_payload = context.cursor_payload
+        last = projects[-1] if has_more and projects else None
+        if request.sort == "top":
+            if cursor_payload is not None:
+                span_high = int(cursor_payload["vote_count"])
+            if last is not None:
+                span_low = last.vote_count
+        elif request.sort == "new":
+            if cursor_payload is not None:
+                span_high = self._parse_datetime(cursor_payload["published_at"])
+            if last is not None:
+                span_low = last.published_at
+        self.result_cache.put(
+            context.page_key,
+            CachedSearchPage(
+                sort=request.sort,
+                project_ids=tuple(project.id for project in projects),
+                next_cursor=next_cursor,
+                suggestions=tuple(suggestions),
+                span_high=span_high,
+                span_low=span_low,
+            ),
+            generation=context.cache_generation,
+            from_replica=context.page_from_replica,
+        )
+
+    async def _search_response(
+        self,
+        request: ProjectSearchRequest,
+        *,
+        context: _SearchContext,
+        projects: list[Project],
+        has_more: bool,
+        last_rank: float | None,
+        facets: ProjectSearchFacets | None,
+        current_user_id: UUID | None,
+    ) -> ProjectSearchResponse:
+        items = await hydrate_project_cards(
+            self.db, projects, viewer_id=current_user_id
+        )
 
         next_cursor: str | None = None
         if has_more and projects:
             next_cursor = self._encode_cursor(
                 project=projects[-1],
                 sort=request.sort,
-                search_signature=search_signature,
-                top_range=top_range,
+                search_signature=context.search_signature,
+                top_range=context.top_range,
+                rank=last_rank,
+            )
+
+        suggestions: list[str] = []
+        if not items and request.q is not None and request.cursor is None:
+            suggestions = await self._load_suggestions(request.q)
+
+        self._cache_page(
+            request,
+            context=context,
+            projects=projects,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            suggestions=suggestions,
+        )
+        return ProjectSearchResponse(
+            items=items,
+            next_cursor=next_cursor,
+            facets=facets,
+            suggestions=suggestions,
+        )
+
+    async def _apply_similarity_threshold(self) -> None:
+        # The trigram operators read their cutoff from this setting, which is
+        # what lets the lower(title) / lower(short_description) GIN indexes
+        # serve them. It is transaction-local, so pooled connections keep the
+        # server default.
+        if self._similarity_threshold_applied:
+            return
+        await self.db.exec(
+            select(
+                sa.func.set_config(
+                    "pg_trgm.word_similarity_threshold",
+                    str(self.similarity_threshold),
+                    True,
+                )
             )
+        )
+        self._similarity_threshold_applied = True
+
+    async def _load_suggestions(self, query: str) -> list[str]:
+        """Project titles and taxonomy names whose words resemble `query`.
+
+        Titles come from published projects only. Each candidate keeps its
+        best word similarity, and the closest `_SUGGESTION_LIMIT` are returned.
+        """
+        await self._apply_similarity_threshold()
+        needle = sa.literal(query.lower(), sa.Text)
+        project_cols = getattr(Project, "__table__").c
+        title = sa.func.lower(project_cols.title)
+        candidates = [
+            select(
+                project_cols.title.label("suggestion"),
+                sa.func.word_similarity(needle, title).label("score"),
+            ).where(
+                project_cols.is_published.is_(True),
+                project_cols.deleted_at.is_(None),
+                needle.op("<%")(title),
+            )
+        ]
+        for _, model, _, _ in TAXONOMY_FAMILIES:
+            model_cols = getattr(model, "__table__").c
+            candidates.append(
+                select(
+                    model_cols.name.label("suggestion"),
+                    sa.func.word_similarity(needle, model_cols.normalized_name).label(
+                        "score"
+                    ),
+                ).where(needle.op("<%")(model_cols.normalized_name))
+            )
+        matched = sa.union_all(*candidates).subquery("suggestion_candidates")
+        best_score = sa.func.max(matched.c.score)
+        rows = await self.db.exec(
+            select(matched.c.suggestion)
+            .group_by(matched.c.suggestion)
+            .order_by(best_score.desc(), matched.c.suggestion)
+            .limit(self._SUGGESTION_LIMIT)
+        )
+        return list(rows.all())
+
+    async def _load_facets(
+        self, statement: Any, *, context: _SearchContext
+    ) -> ProjectSearchFacets:
+        """Count each family's terms over the projects `statement` matches.
 
-        return ProjectSearchResponse(items=items, next_cursor=next_cursor)
+        One query aggregates all three join tables against the matching ids,
+        keeping the `_FACET_LIMIT_PER_FAMILY` most frequent terms per family.
+        Results are cached by search signature, so later pages reuse them.
+        """
+        cached = self.facet_cache.get(context.search_signature)
+        if cached is not None:
+            return cached
+
+        project_cols = getattr(Project, "__table__").c
+        matched = statement.with_only_columns(project_cols.id).cte("matched_projects")
+        family_counts = []
+        for family, _, join_model, join_term_fk in TAXONOMY_FAMILIES:
+            join_cols = getattr(join_model, "__table__").c
+            term_fk_col = getattr(join_cols, join_term_fk)
+            family_counts.append(
+                select(
+                    sa.literal(family).label("family"),
+                    term_fk_col.label("term_id"),
+                    sa.func.count().label("project_count"),
+                )
+                .select_from(
+                    getattr(join_model, "__table__").join(
+                        matched, matched.c.id == join_cols.project_id
+                    )
+                )
+                .group_by(term_fk_col)
+            )
+        counts = sa.union_all(*family_counts).subquery("facet_counts")
+        ranked = select(
+            counts.c.family,
+            counts.c.term_id,
+            counts.c.project_count,
+            sa.func.row_number()
+            .over(
+                partition_by=counts.c.family,
+                order_by=(counts.c.project_count.desc(), counts.c.term_id),
+            )
+            .label("facet_rank"),
+        ).subquery("ranked_facets")
+        result = await self.db.exec(
+            select(ranked.c.family, ranked.c.term_id, ranked.c.project_count).where(
+                ranked.c.facet_rank <= self._FACET_LIMIT_PER_FAMILY
+            )
+        )
+        counts_by_family: dict[str, dict[UUID, int]] = {
+            family: {} for family, *_ in TAXONOMY_FAMILIES
+        }
+        for row in result.all():
+            counts_by_family[row.family][row.term_id] = row.project_count
+        return await self._cache_facets(counts_by_family, context=context)
+
+    async def _cache_facets(
+        self,
+        counts_by_family: dict[str, dict[UUID, int]],
+        *,
+        context: _SearchContext,
+    ) -> ProjectSearchFacets:
+        """Name and order capped term counts, then cache them for the search."""
+        facet_lists: dict[str, list[SearchFacetCount]] = {}
+        for family, model, _, _ in TAXONOMY_FAMILIES:
+            family_counts_by_id = counts_by_family[family]
+            terms = await self.taxonomy_dictionary.terms_by_id(
+                self.db, model, family_counts_by_id
+            )
+            facet_lists[family] = sorted(
+                (
+                    SearchFacetCount(
+                        id=term_id, name=terms[term_id].name, count=project_count
+                    )
+                    for term_id, project_count in family_counts_by_id.items()
+                    if term_id in terms
+                ),
+                key=lambda facet: (-facet.count, facet.name.lower()),
+            )
+        facets = ProjectSearchFacets(**facet_lists)
+        self.facet_cache.put(
+            context.search_signature, facets, generation=context.facet_generation
+        )
+        return facets
 
     def _apply_keyword_filter(
         self,
@@ -190,6 +567,18 @@ class PostgresSearchService(SearchService):
             return statement
 
         project_cols = getattr(Project, "__table__").c
+        if request.sort == "relevance":
+            return statement.where(
+                project_cols.search_vector.op("@@")(self._text_search_query(request.q))
+            )
+        if request.sort == "similarity":
+            needle = sa.literal(request.q.lower(), sa.Text)
+            return statement.where(
+                sa.or_(
+                    needle.op("<%")(sa.func.lower(project_cols.title)),
+                    needle.op("<%")(sa.func.lower(project_cols.short_description)),
+                )
+            )
         escaped_query = self._escape_like_query(request.q.lower())
         pattern = f"%{escaped_query}%"
         return statement.where(
@@ -201,81 +590,141 @@ class PostgresSearchService(SearchService):
             )
         )
 
+    @staticmethod
+    def _text_search_query(query: str) -> Any:
+        return sa.func.websearch_to_tsquery(
+            sa.literal_column(f"'{PROJECT_SEARCH_CONFIG}'::regconfig"), query
+        )
+
+    def _relevance_rank(self, request: ProjectSearchRequest) -> Any:
+        if request.q is None:
+            raise CursorError("Relevance sort requires a keyword query")
+        project_cols = getattr(Project, "__table__").c
+        return sa.func.ts_rank_cd(
+            project_cols.search_vector,
+            self._text_search_query(request.q),
+            self._RELEVANCE_NORMALIZATION,
+            type_=sa.REAL,
+        ).label("search_rank")
+
+    def _similarity_rank(self, request: ProjectSearchRequest) -> Any:
+        if request.q is None:
+            raise CursorError("Similarity sort requires a keyword query")
+        project_cols = getattr(Project, "__table__").c
+        needle = sa.literal(request.q.lower(), sa.Text)
+        return sa.func.greatest(
+            sa.func.word_similarity(needle, sa.func.lower(project_cols.title)),
+            sa.func.word_similarity(
+                needle, sa.func.lower(project_cols.short_description)
+            ),
+            type_=sa.REAL,
+        ).label("search_rank")
+
+    @staticmethod
+    def _requested_terms(request: ProjectSearchRequest) -> dict[str, tuple[str, ...]]:
+        """Normalized filter names per family, for the families given."""
+        requested_terms = {
+            "categories": request.categories,
+            "tags": request.tags,
+            "tech_stack": request.tech_stack,
+        }
+        return {
+            family: tuple(
+                dict.fromkeys(normalize_taxonomy_name(value) for value in values)
+            )
+            for family, values in requested_terms.items()
+            if values
+        }
+
     async def _apply_taxonomy_filters(
         self,
         statement: Any,
         *,
         request: ProjectSearchRequest,
     ) -> Any:
-        category_terms = [
-            normalize_taxonomy_name(value) for value in request.categories
-        ]
-        tag_terms = [normalize_taxonomy_name(value) for value in request.tags]
-        tech_stack_terms = [
-            normalize_taxonomy_name(value) for value in request.tech_stack
-        ]
+        """Keep projects carrying the requested terms.
 
-        statement = await self._apply_taxonomy_filter_family(
-            statement=statement,
-            model=Category,
-            join_model=ProjectCategory,
-            join_term_fk="category_id",
-            normalized_terms=category_terms,
-        )
-        statement = await self._apply_taxonomy_filter_family(
-            statement=statement,
-            model=Tag,
-            join_model=ProjectTag,
-            join_term_fk="tag_id",
-            normalized_terms=tag_terms,
-        )
-        statement = await self._apply_taxonomy_filter_family(
-            statement=statement,
-            model=TechStack,
-            join_model=ProjectTechStack,
-            join_term_fk="tech_stack_id",
-            normalized_terms=tech_stack_terms,
-        )
+        The `bitmap` filter resolves the terms to project ids in memory, so
+        only the surviving ids reach the query. The `exists` filter adds an
+        `EXISTS` per family, or per term with `match=all`.
+        """
+        terms = self._requested_terms(request)
+        if not terms:
+            return statement
+        match_all = request.match == "all"
+
+        if self.taxonomy_filter == "bitmap":
+            await self.taxonomy_bitmaps.ensure_fresh()
+            project_ids = self.taxonomy_bitmaps.match(terms, match_all=match_all)
+            if not project_ids:
+                return statement.where(sa.sql.false())
+            project_cols = getattr(Project, "__table__").c
+            # One array parameter, however many ids survive.
+            return statement.where(
+                project_cols.id == sa.any_(sa.literal(project_ids, ARRAY(sa.Uuid())))
+            )
+
+        for family, model, join_model, join_term_fk in TAXONOMY_FAMILIES:
+            if family in terms:
+                statement = await self._apply_taxonomy_filter_family(
+                    statement=statement,
+                    model=model,
+                    join_model=join_model,
+                    join_term_fk=join_term_fk,
+                    normalized_terms=list(terms[family]),
+                    match_all=match_all,
+                )
         return statement
 
     async def _apply_taxonomy_filter_family(
         self,
         *,
         statement: Any,
-        model: type[Category] | type[Tag] | type[TechStack],
-        join_model: type[ProjectCategory] | type[ProjectTag] | type[ProjectTechStack],
+        model: TaxonomyModel,
+        join_model: TaxonomyJoinModel,
         join_term_fk: str,
         normalized_terms: list[str],
+        match_all: bool = False,
     ) -> Any:
         if not normalized_terms:
             return statement
 
         term_ids = await self._resolve_term_ids(model, normalized_terms)
-        if not term_ids:
+        if not term_ids or (match_all and len(term_ids) < len(normalized_terms)):
             return statement.where(sa.sql.false())
 
         project_cols = getattr(Project, "__table__").c
         join_cols = getattr(join_model, "__table__").c
+        term_fk_col = getattr(join_cols, join_term_fk)
+        if match_all:
+            return statement.where(
+                *(
+                    sa.exists(
+                        select(1).where(
+                            join_cols.project_id == project_cols.id,
+                            term_fk_col == term_id,
+                        )
+                    )
+                    for term_id in term_ids
+                )
+            )
         return statement.where(
             sa.exists(
                 select(1).where(
                     join_cols.project_id == project_cols.id,
-                    getattr(join_cols, join_term_fk).in_(term_ids),
+                    term_fk_col.in_(term_ids),
                 )
             )
         )
 
     async def _resolve_term_ids(
         self,
-        model: type[Category] | type[Tag] | type[TechStack],
+        model: TaxonomyModel,
         normalized_terms: list[str],
     ) -> list[UUID]:
-        model_cols = getattr(model, "__table__").c
-        statement = select(model_cols.id).where(
-            model_cols.normalized_name.in_(normalized_terms)
+        return await self.taxonomy_dictionary.resolve_ids(
+            self.db, model, normalized_terms
         )
-        result = await self.db.exec(statement)
-        return [row for row in result.all()]
 
     def _encode_cursor(
         self,
@@ -284,11 +733,21 @@ class PostgresSearchService(SearchService):
         sort: SearchSort,
         search_signature: str,
         top_range: tuple[date, date] | None,
+        rank: float | None = None,
     ) -> str:
-        if sort == "new":
-            if project.published_at is None:
+        if sort in RANKED_SEARCH_SORTS:
+            if rank is None:
                 raise CursorError("Invalid cursor")
             payload: dict[str, str | int] = {
+                "sort": sort,
+                "id": str(project.id),
+                "rank": repr(rank),
+                "search_sig": search_signature,
+            }
+        elif sort == "new":
+            if project.published_at is None:
+                raise CursorError("Invalid cursor")
+            payload = {
                 "sort": "new",
                 "id": str(project.id),
                 "published_at": project.published_at.isoformat(),
@@ -317,7 +776,9 @@ class PostgresSearchService(SearchService):
         top_range: tuple[date, date] | None,
     ) -> dict[str, str | int]:
         payload = decode_cursor_payload(cursor)
-        if sort == "new":
+        if sort in RANKED_SEARCH_SORTS:
+            required = {"sort", "id", "rank", "search_sig"}
+        elif sort == "new":
             required = {"sort", "id", "published_at", "search_sig"}
         else:
             required = {
@@ -339,7 +800,9 @@ class PostgresSearchService(SearchService):
 
         try:
             UUID(str(payload["id"]))
-            if sort == "new":
+            if sort in RANKED_SEARCH_SORTS:
+                self._parse_rank(payload["rank"])
+            elif sort == "new":
                 self._parse_datetime(payload["published_at"])
             else:
                 self._parse_datetime(payload["created_at"])
@@ -386,6 +849,10 @@ class PostgresSearchService(SearchService):
             ),
             "sort": request.sort,
         }
+        # Only added when set, so cursors from before `match` existed still
+        # verify.
+        if request.match != "any":
+            signature_payload["match"] = request.match
         if request.sort == "top":
             if top_range is None:
                 raise CursorError("Invalid date range")
@@ -430,6 +897,18 @@ class PostgresSearchService(SearchService):
         except ValueError as exc:
             raise CursorError("Invalid cursor") from exc
 
+    @staticmethod
+    def _parse_rank(value: str | int) -> float:
+        if not isinstance(value, str):
+            raise CursorError("Invalid cursor")
+        try:
+            rank = float(value)
+        except ValueError as exc:
+            raise CursorError("Invalid cursor") from exc
+        if not math.isfinite(rank):
+            raise CursorError("Invalid cursor")
+        return rank
+
     @staticmethod
     def _parse_date(value: str | int) -> date:
         if not isinstance(value, str):
@@ -445,3 +924,115 @@ class PostgresSearchService(SearchService):
         escaped = escaped.replace("%", "\\%")
         escaped = escaped.replace("_", "\\_")
         return escaped
+
+
+class InMemorySearchService(PostgresSearchService):
+    """Serves `top` and `new` searches from the process's project search index.
+
+    Filtering and ordering run against `ProjectSearchIndex`; only card
+    hydration reads Postgres. Signatures and cursors are the parent's, so a
+    cursor from either backend pages the other. `relevance` and `similarity`
+    rank with Postgres functions and are delegated to the parent, as are
+    "did you mean" suggestions.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        search_index: ProjectSearchIndex | None = None,
+        taxonomy_dictionary: TaxonomyDictionary | None = None,
+        facet_cache: SearchFacetCache | None = None,
+        similarity_threshold: float | None = None,
+        taxonomy_bitmaps: TaxonomyBitmapIndex | None = None,
+        taxonomy_filter: Literal["exists", "bitmap"] | None = None,
+        result_cache: SearchResultCache | None = None,
+    ):
+        super().__init__(
+            db,
+            taxonomy_dictionary=taxonomy_dictionary,
+            facet_cache=facet_cache,
+            similarity_threshold=similarity_threshold,
+            taxonomy_bitmaps=taxonomy_bitmaps,
+            taxonomy_filter=taxonomy_filter,
+            result_cache=result_cache,
+        )
+        self.search_index = search_index or get_project_search_index()
+
+    async def search_projects(
+        self,
+        *,
+        request: ProjectSearchRequest,
+        current_user_id: UUID | None = None,
+    ) -> ProjectSearchResponse:
+        if request.sort not in INDEXED_SEARCH_SORTS:
+            return await super().search_projects(
+                request=request, current_user_id=current_user_id
+            )
+        context = self._search_context(request)
+        cached = await self._cached_search_response(
+            request, context=context, current_user_id=current_user_id
+        )
+        if cached is not None:
+            return cached
+        await self.search_index.ensure_fresh()
+        query = self._index_query(request, top_range=context.top_range)
+
+        facets: ProjectSearchFacets | None = None
+        if request.facets:
+            facets = self.facet_cache.get(context.search_signature)
+            if facets is None:
+                facets = await self._cache_facets(
+                    self.search_index.facet_counts(
+                        query, limit_per_family=self._FACET_LIMIT_PER_FAMILY
+                    ),
+                    context=context,
+                )
+
+        projects, has_more = self.search_index.page(
+            query,
+            sort="top" if request.sort == "top" else "new",
+            after=self._index_cursor_key(request.sort, context.cursor_payload),
+            limit=context.limit,
+        )
+        return await self._search_response(
+            request,
+            context=context,
+            projects=projects,
+            has_more=has_more,
+            last_rank=None,
+            facets=facets,
+            current_user_id=current_user_id,
+        )
+
+    def _index_query(
+        self,
+        request: ProjectSearchRequest,
+        *,
+        top_range: tuple[date, date] | None,
+    ) -> SearchIndexQuery:
+        published_from: datetime | None = None
+        published_before: datetime | None = None
+        if top_range is not None:
+            published_from, published_before = self._top_range_bounds(top_range)
+        return SearchIndexQuery(
+            keyword=request.q.lower() if request.q is not None else None,
+            terms=self._requested_terms(request),
+            match_all=request.match == "all",
+            published_from=published_from,
+            published_before=published_before,
+        )
+
+    def _index_cursor_key(
+        self, sort: SearchSort, cursor_payload: dict[str, str | int] | None
+    ) -> TopKey | NewKey | None:
+        if cursor_payload is None:
+            return None
+        cursor_id = UUID(str(cursor_payload["id"]))
+        if sort == "new":
+            return (self._parse_datetime(cursor_payload["published_at"]), cursor_id)
+        return (
+            int(cursor_payload["vote_count"]),
+            self._parse_datetime(cursor_payload["created_at"]),
+            cursor_id,
+        )
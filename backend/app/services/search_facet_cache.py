@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.schemas.search import ProjectSearchFacets
+from app.utils.cache import CacheStats, ExpiringLRUCache
+
+
+class SearchFacetCache:
+    """Process-local search signature -> facet counts cache.
+
+    The signature covers the keyword, filters, sort and date window but not
+    the cursor, so every page of one search shares an entry. Project writers
+    in this process clear it; other processes' writes show up within
+    `ttl_seconds`.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self._cache: ExpiringLRUCache[str, ProjectSearchFacets] = ExpiringLRUCache(
+            max_entries=max_entries
+        )
+        # Bumped by `clear`. Counts read before a clear must not be stored
+        # after it, or the write that cleared them stays hidden for the TTL.
+        self.generation = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, search_signature: str) -> ProjectSearchFacets | None:
+        return self._cache.get(search_signature)
+
+    def put(
+        self, search_signature: str, facets: ProjectSearchFacets, *, generation: int
+    ) -> None:
+        """Store `facets` unless the cache was cleared since `generation`."""
+        if generation == self.generation:
+            self._cache.set(search_signature, facets, ttl=self.ttl_seconds)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.generation += 1
+
+
+@lru_cache
+def get_search_facet_cache() -> SearchFacetCache:
+    settings = get_settings()
+    return SearchFacetCache(
+        ttl_seconds=settings.SEARCH_FACET_CACHE_TTL_SECONDS,
+        max_entries=settings.SEARCH_FACET_CACHE_MAX_ENTRIES,
+    )
@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+import heapq
+import time
+from typing import Any, Literal
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.models.project import Project
+from app.models.taxonomy import (
+    Category,
+    ProjectCategory,
+    ProjectTag,
+    ProjectTechStack,
+    Tag,
+    TechStack,
+)
+from app.utils.bitmaps import IdBitmaps
+from app.utils.snapshots import SnapshotReloader
+
+TaxonomyModel = type[Category] | type[Tag] | type[TechStack]
+TaxonomyJoinModel = type[ProjectCategory] | type[ProjectTag] | type[ProjectTechStack]
+
+# Request/response field, term model, join model and join term column per family.
+TAXONOMY_FAMILIES: tuple[tuple[str, TaxonomyModel, TaxonomyJoinModel, str], ...] = (
+    ("categories", Category, ProjectCategory, "category_id"),
+    ("tags", Tag, ProjectTag, "tag_id"),
+    ("tech_stack", TechStack, ProjectTechStack, "tech_stack_id"),
+)
+
+IndexedSort = Literal["top", "new"]
+# Sorts the index can answer; the others rank with Postgres functions.
+INDEXED_SEARCH_SORTS: frozenset[str] = frozenset({"top", "new"})
+
+TopKey = tuple[int, datetime, UUID]
+NewKey = tuple[datetime, UUID]
+# (family, normalized name) of a taxonomy term.
+TermKey = tuple[str, str]
+# Opens a session on the primary for snapshot reloads.
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[start : start + 3] for start in range(len(text) - 2)}
+
+
+@dataclass
+class _IndexedProject:
+    # Never attached to a session; shared by every request that pages it.
+    project: Project
+    title: str
+    short_description: str
+    # Family -> (term id, normalized name) pairs.
+    terms: dict[str, tuple[tuple[UUID, str], ...]]
+
+    @classmethod
+    def from_row(cls, row: Any) -> _IndexedProject:
+        project = Project.model_validate(
+            {name: getattr(row, name) for name in Project.model_fields}
+        )
+        return cls(
+            project=project,
+            title=project.title.lower(),
+            short_description=project.short_description.lower(),
+            terms={
+                family: tuple(
+                    (UUID(str(term_id)), normalized_name)
+                    for term_id, normalized_name in getattr(row, f"{family}_terms")
+                    or []
+                )
+                for family, *_ in TAXONOMY_FAMILIES
+            },
+        )
+
+    @property
+    def top_key(self) -> TopKey:
+        return (self.project.vote_count, self.project.created_at, self.project.id)
+
+    @property
+    def new_key(self) -> NewKey:
+        published_at = self.project.published_at
+        if published_at is None:
+            raise ValueError("Indexed projects must be published")
+        return (published_at, self.project.id)
+
+    def term_keys(self) -> set[TermKey]:
+        return {
+            (family, normalized_name)
+            for family, terms in self.terms.items()
+            for _, normalized_name in terms
+        }
+
+    def trigrams(self) -> set[str]:
+        # Title and description are matched separately, so no trigram spans both.
+        return _trigrams(self.title) | _trigrams(self.short_description)
+
+    def matches_keyword(self, keyword: str) -> bool:
+        return keyword in self.title or keyword in self.short_description
+
+
+@dataclass
+class _IndexState:
+    documents: dict[UUID, _IndexedProject] = field(default_factory=dict)
+    trigram_postings: dict[str, set[UUID]] = field(default_factory=dict)
+    term_bitmaps: IdBitmaps[TermKey] = field(default_factory=IdBitmaps)
+    # Ascending; pages walk them from the end.
+    top_order: list[TopKey] = field(default_factory=list)
+    new_order: list[NewKey] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, documents: Iterable[_IndexedProject]) -> _IndexState:
+        state = cls()
+        for document in documents:
+            state._add_postings(document)
+        state.top_order = sorted(doc.top_key for doc in state.documents.values())
+        state.new_order = sorted(doc.new_key for doc in state.documents.values())
+        return state
+
+    def upsert(self, document: _IndexedProject) -> None:
+        self.remove(document.project.id)
+        self._add_postings(document)
+        bisect.insort(self.top_order, document.top_key)
+        bisect.insort(self.new_order, document.new_key)
+
+    def remove(self, project_id: UUID) -> None:
+        document = self.documents.pop(project_id, None)
+        if document is None:
+            return
+        for trigram in document.trigrams():
+            self._discard(self.trigram_postings, trigram, project_id)
+        self.term_bitmaps.remove(project_id)
+        self._remove_key(self.top_order, document.top_key)
+        self._remove_key(self.new_order, document.new_key)
+
+    def set_vote_count(self, project_id: UUID, vote_count: int) -> None:
+        document = self.documents.get(project_id)
+        if document is None or document.project.vote_count == vote_count:
+            return
+        self._remove_key(self.top_order, document.top_key)
+        document.project.vote_count = vote_count
+        bisect.insort(self.top_order, document.top_key)
+
+    def _add_postings(self, document: _IndexedProject) -> None:
+        project_id = document.project.id
+        self.documents[project_id] = document
+        for trigram in document.trigrams():
+            self.trigram_postings.setdefault(trigram, set()).add(project_id)
+        self.term_bitmaps.set(project_id, document.term_keys())
+
+    @staticmethod
+    def _discard(postings: dict[Any, set[UUID]], key: Any, project_id: UUID) -> None:
+        posting = postings.get(key)
+        if posting is None:
+            return
+        posting.discard(project_id)
+        if not posting:
+            del postings[key]
+
+    @staticmethod
+    def _remove_key(order: list[Any], key: Any) -> None:
+        position = bisect.bisect_left(order, key)
+        if position < len(order) and order[position] == key:
+            del order[position]
+
+
+@dataclass(frozen=True)
+class SearchIndexQuery:
+    """Filters with the same meaning as the Postgres search statement.
+
+    `keyword` is already lowercased and matches as a substring of the title
+    or short description. `terms` maps a family to normalized names, matched
+    with OR inside the family (AND with `match_all`) and AND across families.
+    `published_from` and `published_before` bound `published_at` when set.
+    """
+
+    keyword: str | None = None
+    terms: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    match_all: bool = False
+    published_from: datetime | None = None
+    published_before: datetime | None = None
+
+    def in_window(self, document: _IndexedProject) -> bool:
+        published_at = document.project.published_at
+        if published_at is None:
+            return False
+        if self.published_from is not None and published_at < self.published_from:
+            return False
+        return self.published_before is None or published_at < self.published_before
+
+
+class ProjectSearchIndex:
+    """In-process inverted index over published, non-deleted projects.
+
+    Keyword matching intersects trigram postings and then confirms the
+    substring, like the trigram indexes behind the Postgres `LIKE`. Taxonomy
+    filters combine per-term bitmaps. `top` and `new` keep their keyset order
+    precomputed, so an unfiltered page is a walk from the cursor.
+
+    Writers in this process report publishes, edits, removals and vote counts
+    after they commit. Changes made by other processes appear when the
+    snapshot is rebuilt, which happens once it is older than
+    `max_age_seconds`. Rebuilds read the primary through `session_factory`,
+    since a lagging replica would drop writes this process already applied,
+    and concurrent callers share one rebuild. Until the first load every
+    writer hook is a no-op, so deployments that search Postgres pay nothing
+    for it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age_seconds: float,
+        session_factory: SessionFactory | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self._session_factory = session_factory
+        self._snapshots: SnapshotReloader[_IndexState] = SnapshotReloader(
+            max_age_seconds=max_age_seconds, clock=clock
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshots.snapshot is not None
+
+    def is_fresh(self) -> bool:
+        return self._snapshots.is_fresh()
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    async def load(self, db: AsyncSession) -> None:
+        """Replace the index with a fresh read of every published project."""
+        await self._snapshots.load(lambda: _read_index_state(db))
+
+    async def ensure_fresh(self) -> None:
+        """Reload a stale snapshot from the primary, sharing one reload."""
+        await self._snapshots.ensure_fresh(self._read_from_primary)
+
+    async def _read_from_primary(self) -> _IndexState:
+        if self._session_factory is None:
+            raise RuntimeError("Project search index has no session factory")
+        async with self._session_factory() as db:
+            return await _read_index_state(db)
+
+    async def refresh_project(self, db: AsyncSession, project_id: UUID) -> None:
+        """Re-read one project after a committed write and index what is live."""
+        if not self.is_loaded:
+            return
+        result = await db.exec(_snapshot_statement(project_id))
+        row = result.first()
+        if row is None:
+            self._snapshots.apply(lambda state: state.remove(project_id))
+            return
+        document = _IndexedProject.from_row(row)
+        self._snapshots.apply(lambda state: state.upsert(document))
+
+    def remove(self, project_id: UUID) -> None:
+        self._snapshots.apply(lambda state: state.remove(project_id))
+
+    def update_vote_count(self, project_id: UUID, vote_count: int) -> None:
+        self._snapshots.apply(
+            lambda state: state.set_vote_count(project_id, vote_count)
+        )
+
+    def page(
+        self,
+        query: SearchIndexQuery,
+        *,
+        sort: IndexedSort,
+        after: TopKey | NewKey | None,
+        limit: int,
+    ) -> tuple[list[Project], bool]:
+        """Return up to `limit` projects ordered after `after`, and whether more follow."""
+        state = self._loaded_state()
+        candidates = self._matching_ids(state, query)
+        if candidates is None:
+            projects = self._walk_order(
+                state, query, sort=sort, after=after, limit=limit
+            )
+        else:
+            keys: list[Any] = []
+            for project_id in candidates:
+                document = state.documents[project_id]
+                if not query.in_window(document):
+                    continue
+                key = document.top_key if sort == "top" else document.new_key
+                if after is None or key < after:
+                    keys.append(key)
+            projects = [
+                state.documents[key[-1]].project
+                for key in heapq.nlargest(limit + 1, keys)
+            ]
+        return projects[:limit], len(projects) > limit
+
+    def facet_counts(
+        self, query: SearchIndexQuery, *, limit_per_family: int
+    ) -> dict[str, dict[UUID, int]]:
+        """Count each family's terms over every match, most frequent first."""
+        state = self._loaded_state()
+        candidates = self._matching_ids(state, query)
+        documents = (
+            state.documents.values()
+            if candidates is None
+            else (state.documents[project_id] for project_id in candidates)
+        )
+        counters: dict[str, Counter[UUID]] = {
+            family: Counter() for family, *_ in TAXONOMY_FAMILIES
+        }
+        for document in documents:
+            if not query.in_window(document):
+                continue
+            for family, terms in document.terms.items():
+                counters[family].update(term_id for term_id, _ in terms)
+        return {
+            family: dict(
+                sorted(counter.items(), key=lambda item: (-item[1], item[0]))[
+                    :limit_per_family
+                ]
+            )
+            for family, counter in counters.items()
+        }
+
+    def _loaded_state(self) -> _IndexState:
+        state = self._snapshots.snapshot
+        if state is None:
+            raise RuntimeError("Project search index is not loaded")
+        return state
+
+    @staticmethod
+    def _matching_ids(state: _IndexState, query: SearchIndexQuery) -> set[UUID] | None:
+        """Ids passing the keyword and taxonomy filters; None when unfiltered."""
+        candidates: set[UUID] | None = None
+        if query.terms:
+            matched = state.term_bitmaps.match(
+                {
+                    family: [(family, name) for name in names]
+                    for family, names in query.terms.items()
+                },
+                match_all=query.match_all,
+            )
+            if not matched:
+                return set()
+            candidates = set(state.term_bitmaps.ids(matched))
+        if query.keyword is None:
+            return candidates
+
+        keyword = query.keyword
+        if len(keyword) >= 3:
+            postings = sorted(
+                (
+                    state.trigram_postings.get(trigram, set())
+                    for trigram in _trigrams(keyword)
+                ),
+                key=len,
+            )
+            pool = set(postings[0])
+            if candidates is not None:
+                pool &= candidates
+            for posting in postings[1:]:
+                if not pool:
+                    break
+                pool &= posting
+        else:
+            pool = set(state.documents) if candidates is None else candidates
+        return {
+            project_id
+            for project_id in pool
+            if state.documents[project_id].matches_keyword(keyword)
+        }
+
+    @staticmethod
+    def _walk_order(
+        state: _IndexState,
+        query: SearchIndexQuery,
+        *,
+        sort: IndexedSort,
+        after: TopKey | NewKey | None,
+        limit: int,
+    ) -> list[Project]:
+        order: list[Any] = state.top_order if sort == "top" else state.new_order
+        position = len(order) if after is None else bisect.bisect_left(order, after)
+        projects: list[Project] = []
+        while position > 0 and len(projects) <= limit:
+            position -= 1
+            document = state.documents[order[position][-1]]
+            if query.in_window(document):
+                projects.append(document.project)
+        return projects
+
+
+async def _read_index_state(db: AsyncSession) -> _IndexState:
+    result = await db.exec(_snapshot_statement())
+    return _IndexState.build(_IndexedProject.from_row(row) for row in result.all())
+
+
+def _snapshot_statement(project_id: UUID | None = None) -> Any:
+    """Published projects with each family's (term id, normalized name) pairs."""
+    project_table = getattr(Project, "__table__")
+    project_cols = project_table.c
+    term_columns = []
+    for family, model, join_model, join_term_fk in TAXONOMY_FAMILIES:
+        term_cols = getattr(model, "__table__").c
+        join_table = getattr(join_model, "__table__")
+        term_columns.append(
+            select(
+                sa.func.json_agg(
+                    sa.func.json_build_array(term_cols.id, term_cols.normalized_name),
+                    type_=JSON,
+                )
+            )
+            .select_from(
+                join_table.join(
+                    getattr(model, "__table__"),
+                    term_cols.id == getattr(join_table.c, join_term_fk),
+                )
+            )
+            .where(join_table.c.project_id == project_cols.id)
+            .scalar_subquery()
+            .label(f"{family}_terms")
+        )
+    statement = select(
+        *(project_cols[name] for name in Project.model_fields), *term_columns
+    ).where(
+        project_cols.is_published.is_(True),
+        project_cols.deleted_at.is_(None),
+        project_cols.published_at.is_not(None),
+    )
+    if project_id is not None:
+        statement = statement.where(project_cols.id == project_id)
+    return statement
+
+
+@lru_cache
+def get_project_search_index() -> ProjectSearchIndex:
+    # Imported here so importing the index does not create the engines.
+    from app.db.database import AsyncSessionLocal
+
+    settings = get_settings()
+    return ProjectSearchIndex(
+        max_age_seconds=settings.SEARCH_INDEX_MAX_AGE_SECONDS,
+        session_factory=AsyncSessionLocal,
+    )
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+import time
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.models.project import Project
+from app.schemas.search import RANKED_SEARCH_SORTS, SearchSort
+from app.utils.cache import CacheStats, ExpiringLRUCache
+
+# (search signature, cursor, page size, similarity threshold). The threshold
+# decides similarity matches and suggestions but is not in the signature.
+SearchPageKey = tuple[str, str | None, int, float]
+
+_PagePredicate = Callable[["CachedSearchPage"], bool]
+
+
+@dataclass(frozen=True)
+class CachedSearchPage:
+    """One result page, without anything that depends on the viewer."""
+
+    sort: SearchSort
+    project_ids: tuple[UUID, ...]
+    next_cursor: str | None
+    suggestions: tuple[str, ...] = ()
+    # Bounds of the leading sort key (vote count for `top`, publish time for
+    # `new`) the page covers; None where the page is open-ended.
+    span_high: int | datetime | None = None
+    span_low: int | datetime | None = None
+
+    def spans(self, low: int | datetime, high: int | datetime) -> bool:
+        """Whether a project keyed anywhere in [low, high] could fall in this page."""
+        return (self.span_high is None or low <= self.span_high) and (
+            self.span_low is None or high >= self.span_low
+        )
+
+
+class SearchResultCache:
+    """Process-local (signature, cursor, limit) -> result page cache.
+
+    Pages hold ordered project ids, so cards, vote counts and viewer state are
+    still loaded per request. Writers in this process drop only the pages a
+    change can reach. Writes from other processes show up within
+    `ttl_seconds`. A page read from a replica is not stored while a write
+    that would drop it is younger than `replica_lag_seconds`, since the
+    replica may not have that write yet.
+    """
+
+    # Invalidations are remembered at least this long, and at most this many,
+    # so a search still in flight can check its page against the ones it missed.
+    _INVALIDATION_LOG_SECONDS = 10.0
+    _INVALIDATION_LOG_MAX_ENTRIES = 256
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        replica_lag_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.replica_lag_seconds = replica_lag_seconds
+        self._clock = clock
+        self._cache: ExpiringLRUCache[SearchPageKey, CachedSearchPage] = (
+            ExpiringLRUCache(max_entries=max_entries)
+        )
+        # Bumped by every invalidation. A search that read the database
+        # before a write must not store a page that write would have dropped.
+        self.generation = 0
+        # (generation, time, affected) per recent invalidation, oldest first.
+        self._invalidations: deque[tuple[int, float, _PagePredicate]] = deque()
+        # Generation and time of the newest invalidation no longer in the log.
+        self._forgotten_generation = 0
+        self._forgotten_at = float("-inf")
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, key: SearchPageKey) -> CachedSearchPage | None:
+        return self._cache.get(key)
+
+    def put(
+        self,
+        key: SearchPageKey,
+        page: CachedSearchPage,
+        *,
+        generation: int,
+        from_replica: bool = False,
+    ) -> None:
+        """Store `page` unless an invalidation it may predate would drop it.
+
+        That is any invalidation since `generation`, plus, for a page read
+        from a replica, any within the last `replica_lag_seconds`.
+        """
+        lagging_since = (
+            self._clock() - self.replica_lag_seconds if from_replica else float("inf")
+        )
+        if (
+            generation < self._forgotten_generation
+            or self._forgotten_at >= lagging_since
+        ):
+            return
+        for invalidated, at, affected in reversed(self._invalidations):
+            if invalidated <= generation and at < lagging_since:
+                break
+            if affected(page):
+                return
+        self._cache.set(key, page, ttl=self.ttl_seconds)
+
+    def discard(self, key: SearchPageKey) -> None:
+        self._cache.pop(key)
+
+    def project_removed(self, project_id: UUID) -> None:
+        """Drop pages listing a project that was unpublished or deleted.
+
+        Later pages page by keyset, so they never listed it and stay valid.
+        """
+        self._discard_where(lambda page: project_id in page.project_ids)
+
+    def project_changed(self, project: Project) -> None:
+        """Drop pages a published or edited project could have left or entered."""
+        # Copied out: the predicate is kept in the invalidation log.
+        project_id = project.id
+        vote_count = project.vote_count
+        published_at = project.published_at
+
+        def affected(page: CachedSearchPage) -> bool:
+            if project_id in page.project_ids or page.sort in RANKED_SEARCH_SORTS:
+                return True
+            if page.sort == "top":
+                return page.spans(vote_count, vote_count)
+            return published_at is None or page.spans(published_at, published_at)
+
+        self._discard_where(affected)
+
+    def vote_count_changed(self, vote_count: int) -> None:
+        """Drop `top` pages the project's one-vote move could cross."""
+        self._discard_where(
+            lambda page: (
+                page.sort == "top" and page.spans(vote_count - 1, vote_count + 1)
+            )
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.generation += 1
+        self._invalidations.clear()
+        self._forgotten_generation = self.generation
+        self._forgotten_at = self._clock()
+
+    def _discard_where(self, affected: _PagePredicate) -> None:
+        self.generation += 1
+        now = self._clock()
+        self._invalidations.append((self.generation, now, affected))
+        keep_seconds = max(self._INVALIDATION_LOG_SECONDS, self.replica_lag_seconds)
+        while self._invalidations and (
+            len(self._invalidations) > self._INVALIDATION_LOG_MAX_ENTRIES
+            or now - self._invalidations[0][1] > keep_seconds
+        ):
+            self._forgotten_generation, self._forgotten_at, _ = (
+                self._invalidations.popleft()
+            )
+        self._cache.discard_where(lambda _, page: affected(page))
+
+
+@lru_cache
+def get_search_result_cache() -> SearchResultCache:
+    settings = get_settings()
+    return SearchResultCache(
+        ttl_seconds=settings.SEARCH_RESULT_CACHE_TTL_SECONDS,
+        max_entries=settings.SEARCH_RESULT_CACHE_MAX_ENTRIES,
+        # Read-your-writes already assumes the replica catches up in this long.
+        replica_lag_seconds=settings.DATABASE_READ_STICKY_SECONDS,
+    )
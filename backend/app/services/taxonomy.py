@@ -1,14 +1,34 @@
+from collections.abc import Callable, Sequence
 from typing import TypeAlias
 
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.taxonomy import Category, Tag, TechStack
-from app.schemas.taxonomy import TaxonomyTermCreateRequest, TaxonomyTermResponse
+from app.schemas.taxonomy import (
+    TaxonomyFamily,
+    TaxonomyTermCreateRequest,
+    TaxonomyTermResponse,
+)
+from app.services.taxonomy_dictionary import (
+    TAXONOMY_CHANGED_CHANNEL,
+    TaxonomyDictionary,
+    TaxonomyListing,
+    get_taxonomy_dictionary,
+    taxonomy_table_name,
+)
 
 TaxonomyModel: TypeAlias = Category | Tag | TechStack
 
+_FAMILY_MODELS: dict[TaxonomyFamily, type[TaxonomyModel]] = {
+    "categories": Category,
+    "tags": Tag,
+    "tech-stacks": TechStack,
+}
+
 
 class TaxonomyConflictError(ValueError):
     """Raised when a taxonomy term conflicts with an existing normalized value."""
@@ -18,9 +38,96 @@ def normalize_taxonomy_name(value: str) -> str:
     return value.strip().lower()
 
 
+async def resolve_or_create_taxonomy_terms(
+    db: AsyncSession,
+    model: type[TaxonomyModel],
+    values: Sequence[str],
+    *,
+    authorize_create: Callable[[], None] | None = None,
+) -> tuple[list[TaxonomyTermResponse], bool]:
+    """Resolve `values` to terms of one family, creating the missing ones.
+
+    Returns one term per value in input order, and whether any term was
+    inserted, using at most three statements: a lookup, a multi-row
+    `INSERT ... ON CONFLICT DO NOTHING`, and a re-read of names a concurrent
+    writer inserted first. `authorize_create` runs before anything is
+    inserted and may raise to refuse the create. Inserts notify
+    `TAXONOMY_CHANGED_CHANNEL` so other processes reload the listing once the
+    caller commits; the caller marks this process's listing stale then.
+    """
+    if not values:
+        return [], False
+
+    model_cols = getattr(model, "__table__").c
+    display_names: dict[str, str] = {}
+    for value in values:
+        display_names.setdefault(normalize_taxonomy_name(value), value.strip())
+
+    resolved: dict[str, TaxonomyTermResponse] = {}
+    created = False
+
+    async def select_terms(normalized_names: list[str]) -> None:
+        result = await db.exec(
+            select(model_cols.id, model_cols.name, model_cols.normalized_name).where(
+                model_cols.normalized_name.in_(normalized_names)
+            )
+        )
+        for row in result.all():
+            resolved[row.normalized_name] = TaxonomyTermResponse(
+                id=row.id, name=row.name
+            )
+
+    await select_terms(list(display_names))
+    missing = sorted(name for name in display_names if name not in resolved)
+    if missing:
+        if authorize_create is not None:
+            authorize_create()
+        # Sorted rows take unique-index locks in a stable order across writers.
+        inserted = (
+            pg_insert(getattr(model, "__table__"))
+            .values(
+                [
+                    {"name": display_names[name], "normalized_name": name}
+                    for name in missing
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["normalized_name"])
+            .returning(model_cols.id, model_cols.name, model_cols.normalized_name)
+            .cte("inserted_terms")
+        )
+        # Postgres folds the per-row notifications into one, sent on commit.
+        insert_result = await db.exec(
+            select(
+                inserted.c.id,
+                inserted.c.name,
+                inserted.c.normalized_name,
+                sa.func.pg_notify(
+                    TAXONOMY_CHANGED_CHANNEL, taxonomy_table_name(model)
+                ).label("notified"),
+            )
+        )
+        inserted_rows = insert_result.all()
+        for row in inserted_rows:
+            resolved[row.normalized_name] = TaxonomyTermResponse(
+                id=row.id, name=row.name
+            )
+        created = bool(inserted_rows)
+
+        raced = [name for name in missing if name not in resolved]
+        if raced:
+            await select_terms(raced)
+            if any(name not in resolved for name in raced):
+                raise RuntimeError("Taxonomy term could not be resolved")
+
+    return [resolved[normalize_taxonomy_name(value)] for value in values], created
+
+
 class TaxonomyService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self, db: AsyncSession, *, dictionary: TaxonomyDictionary | None = None
+    ):
         self.db = db
+        self.dictionary = dictionary or get_taxonomy_dictionary()
 
     async def list_categories(self) -> list[TaxonomyTermResponse]:
         return await self._list_terms(Category)
@@ -31,6 +138,26 @@ class TaxonomyService:
     async def list_tech_stacks(self) -> list[TaxonomyTermResponse]:
         return await self._list_terms(TechStack)
 
+    async def get_categories_listing(self) -> TaxonomyListing:
+        return await self.dictionary.listing(self.db, Category)
+
+    async def get_tags_listing(self) -> TaxonomyListing:
+        return await self.dictionary.listing(self.db, Tag)
+
+    async def get_tech_stacks_listing(self) -> TaxonomyListing:
+        return await self.dictionary.listing(self.db, TechStack)
+
+    async def suggest_terms(
+        self, family: TaxonomyFamily, prefix: str, *, limit: int
+    ) -> list[TaxonomyTermResponse]:
+        """Return the most used terms in `family` whose name starts with `prefix`."""
+        return await self.dictionary.suggest(
+            self.db,
+            _FAMILY_MODELS[family],
+            normalize_taxonomy_name(prefix),
+            limit=limit,
+        )
+
     async def create_category(
         self, payload: TaxonomyTermCreateRequest
     ) -> TaxonomyTermResponse:
@@ -49,13 +176,7 @@ class TaxonomyService:
     async def _list_terms(
         self, model: type[TaxonomyModel]
     ) -> list[TaxonomyTermResponse]:
-        model_cols = getattr(model, "__table__").c
-        statement = select(model).order_by(
-            model_cols.normalized_name.asc(),
-            model_cols.id.asc(),
-        )
-        result = await self.db.exec(statement)
-        return [TaxonomyTermResponse.model_validate(term) for term in result.all()]
+        return await self.dictionary.list_terms(self.db, model)
 
     async def _create_term(
         self,
@@ -78,6 +199,14 @@ class TaxonomyService:
         )
         try:
             self.db.add(term)
+            await self.db.flush()
+            await self.db.exec(
+                select(
+                    sa.func.pg_notify(
+                        TAXONOMY_CHANGED_CHANNEL, taxonomy_table_name(model)
+                    )
+                )
+            )
             await self.db.commit()
             await self.db.refresh(term)
         except IntegrityError as exc:
@@ -87,4 +216,7 @@ class TaxonomyService:
             await self.db.rollback()
             raise
 
+        self.dictionary.put(
+            model, term_id=term.id, name=term.name, normalized_name=normalized_name
+        )
         return TaxonomyTermResponse.model_validate(term)
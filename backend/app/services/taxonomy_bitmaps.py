@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+import time
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.models.project import Project
+from app.services.search_index import TAXONOMY_FAMILIES, SessionFactory, TermKey
+from app.utils.bitmaps import IdBitmaps
+from app.utils.snapshots import SnapshotReloader
+
+
+class TaxonomyBitmapIndex:
+    """Per-term bitmaps of the published, non-deleted projects carrying each term.
+
+    Keyed by (family, normalized name), so a taxonomy filter resolves to
+    project ids without reading the term or join tables. Like
+    `ProjectSearchIndex`, writers in this process report changes after they
+    commit, other processes' writes appear once the snapshot is older than
+    `max_age_seconds`, reloads are shared and read the primary through
+    `session_factory`, and every writer hook is a no-op until the first load.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age_seconds: float,
+        session_factory: SessionFactory | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self._session_factory = session_factory
+        self._snapshots: SnapshotReloader[IdBitmaps[TermKey]] = SnapshotReloader(
+            max_age_seconds=max_age_seconds, clock=clock
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshots.snapshot is not None
+
+    def is_fresh(self) -> bool:
+        return self._snapshots.is_fresh()
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    async def load(self, db: AsyncSession) -> None:
+        """Replace the bitmaps with a fresh read of every term assignment."""
+        await self._snapshots.load(lambda: _read_bitmaps(db))
+
+    async def ensure_fresh(self) -> None:
+        """Reload stale bitmaps from the primary, sharing one reload."""
+        await self._snapshots.ensure_fresh(self._read_from_primary)
+
+    async def _read_from_primary(self) -> IdBitmaps[TermKey]:
+        if self._session_factory is None:
+            raise RuntimeError("Taxonomy bitmap index has no session factory")
+        async with self._session_factory() as db:
+            return await _read_bitmaps(db)
+
+    async def refresh_project(self, db: AsyncSession, project_id: UUID) -> None:
+        """Re-read one project's terms after a committed write."""
+        if not self.is_loaded:
+            return
+        result = await db.exec(_assignments_statement(project_id))
+        keys = {(row.family, row.normalized_name) for row in result.all()}
+        self._snapshots.apply(lambda bitmaps: bitmaps.set(project_id, keys))
+
+    def remove(self, project_id: UUID) -> None:
+        self._snapshots.apply(lambda bitmaps: bitmaps.remove(project_id))
+
+    def match(
+        self, terms: Mapping[str, tuple[str, ...]], *, match_all: bool
+    ) -> list[UUID]:
+        """Ids of projects matching `terms`, a family -> normalized names map.
+
+        Names are ORed inside a family, or ANDed with `match_all`, and
+        families are ANDed.
+        """
+        bitmaps = self._snapshots.snapshot
+        if bitmaps is None:
+            raise RuntimeError("Taxonomy bitmap index is not loaded")
+        matched = bitmaps.match(
+            {
+                family: [(family, name) for name in names]
+                for family, names in terms.items()
+            },
+            match_all=match_all,
+        )
+        return bitmaps.ids(matched)
+
+
+async def _read_bitmaps(db: AsyncSession) -> IdBitmaps[TermKey]:
+    result = await db.exec(_assignments_statement())
+    keys_by_project: dict[UUID, set[TermKey]] = {}
+    for row in result.all():
+        keys_by_project.setdefault(row.project_id, set()).add(
+            (row.family, row.normalized_name)
+        )
+    bitmaps: IdBitmaps[TermKey] = IdBitmaps()
+    for project_id, keys in keys_by_project.items():
+        bitmaps.set(project_id, keys)
+    return bitmaps
+
+
+def _assignments_statement(project_id: UUID | None = None) -> Any:
+    """(project id, family, normalized name) for every live project's terms."""
+    project_cols = getattr(Project, "__table__").c
+    family_rows = []
+    for family, model, join_model, join_term_fk in TAXONOMY_FAMILIES:
+        term_table = getattr(model, "__table__")
+        join_table = getattr(join_model, "__table__")
+        statement = (
+            select(
+                join_table.c.project_id,
+                sa.literal(family).label("family"),
+                term_table.c.normalized_name,
+            )
+            .select_from(
+                join_table.join(
+                    term_table,
+                    term_table.c.id == getattr(join_table.c, join_term_fk),
+                ).join(
+                    getattr(Project, "__table__"),
+                    project_cols.id == join_table.c.project_id,
+                )
+            )
+            .where(
+                project_cols.is_published.is_(True),
+                project_cols.deleted_at.is_(None),
+                project_cols.published_at.is_not(None),
+            )
+        )
+        if project_id is not None:
+            statement = statement.where(join_table.c.project_id == project_id)
+        family_rows.append(statement)
+    assignments = sa.union_all(*family_rows).subquery("term_assignments")
+    return select(
+        assignments.c.project_id,
+        assignments.c.family,
+        assignments.c.normalized_name,
+    )
+
+
+@lru_cache
+def get_taxonomy_bitmap_index() -> TaxonomyBitmapIndex:
+    # Imported here so importing the index does not create the engines.
+    from app.db.database import AsyncSessionLocal
+
+    settings = get_settings()
+    return TaxonomyBitmapIndex(
+        max_age_seconds=settings.SEARCH_INDEX_MAX_AGE_SECONDS,
+        session_factory=AsyncSessionLocal,
+    )
@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+import hashlib
+import heapq
+import itertools
+import logging
+import time
+from typing import Any
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.models.taxonomy import Category, Tag, TechStack
+from app.schemas.taxonomy import TaxonomyTermResponse
+
+logger = logging.getLogger(__name__)
+
+TAXONOMY_CHANGED_CHANNEL = "taxonomy_changed"
+
+TaxonomyTermModel = type[Category] | type[Tag] | type[TechStack]
+
+_TAXONOMY_MODELS: tuple[TaxonomyTermModel, ...] = (Category, Tag, TechStack)
+_MODELS_BY_TABLE: dict[str, TaxonomyTermModel] = {
+    getattr(model, "__table__").name: model for model in _TAXONOMY_MODELS
+}
+
+# Up to this many prefix matches are ranked directly. The prefix index keeps
+# names in blocks of this size, each pre-sorted by usage, for broader prefixes.
+_SUGGEST_RANK_ALL_LIMIT = 256
+
+
+_LISTING_ADAPTER = TypeAdapter(list[TaxonomyTermResponse])
+
+
+@dataclass(frozen=True)
+class TaxonomyListing:
+    """A vocabulary's full term list with its JSON body and a strong ETag.
+
+    The ETag hashes the body, so every process serving the same terms sends
+    the same validator and any new term changes it.
+    """
+
+    terms: tuple[TaxonomyTermResponse, ...]
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[TaxonomyTermResponse]) -> TaxonomyListing:
+        ordered = tuple(terms)
+        body = _LISTING_ADAPTER.dump_json(list(ordered))
+        return cls(
+            terms=ordered,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        )
+
+
+def taxonomy_table_name(model: TaxonomyTermModel) -> str:
+    """Name sent as the `TAXONOMY_CHANGED_CHANNEL` payload for `model`."""
+    return getattr(model, "__table__").name
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+@dataclass(frozen=True)
+class _PrefixIndex:
+    """Normalized names in code point order, each with its usage rank.
+
+    `blocks` splits the name positions into runs of `_SUGGEST_RANK_ALL_LIMIT`,
+    each sorted by rank, so a broad prefix merges a few pre-sorted blocks
+    instead of scanning the whole vocabulary.
+    """
+
+    names: tuple[str, ...]
+    ids: tuple[UUID, ...]
+    # Position in the usage ranking; ties rank in name order.
+    rank: tuple[int, ...]
+    blocks: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple[str, UUID, int]]) -> _PrefixIndex:
+        ordered = sorted(rows)
+        by_usage = sorted(range(len(ordered)), key=lambda index: -ordered[index][2])
+        rank = [0] * len(ordered)
+        for position, index in enumerate(by_usage):
+            rank[index] = position
+        size = _SUGGEST_RANK_ALL_LIMIT
+        return cls(
+            names=tuple(row[0] for row in ordered),
+            ids=tuple(row[1] for row in ordered),
+            rank=tuple(rank),
+            blocks=tuple(
+                tuple(
+                    sorted(
+                        range(start, min(start + size, len(ordered))),
+                        key=rank.__getitem__,
+                    )
+                )
+                for start in range(0, len(ordered), size)
+            ),
+        )
+
+    def match(self, prefix: str, limit: int) -> list[UUID]:
+        """Ids of up to `limit` names starting with `prefix`, most used first."""
+        lo = bisect.bisect_left(self.names, prefix)
+        hi = bisect.bisect_left(self.names, _prefix_upper_bound(prefix), lo)
+        if hi - lo <= _SUGGEST_RANK_ALL_LIMIT:
+            best = heapq.nsmallest(limit, range(lo, hi), key=self.rank.__getitem__)
+            return [self.ids[index] for index in best]
+        # Whole blocks inside the range are already ranked; only the partial
+        # blocks at either end are sorted here.
+        size = _SUGGEST_RANK_ALL_LIMIT
+        first_block = -(-lo // size)
+        last_block = hi // size
+        runs = [
+            sorted(range(lo, first_block * size), key=self.rank.__getitem__),
+            sorted(range(last_block * size, hi), key=self.rank.__getitem__),
+            *self.blocks[first_block:last_block],
+        ]
+        best = heapq.merge(*runs, key=self.rank.__getitem__)
+        return [self.ids[index] for index in itertools.islice(best, limit)]
+
+
+@dataclass
+class _Vocabulary:
+    by_id: dict[UUID, TaxonomyTermResponse] = field(default_factory=dict)
+    id_by_normalized_name: dict[str, UUID] = field(default_factory=dict)
+    # Listings keep the database's collation order, so a new term drops the
+    # listing instead of being sorted in.
+    listing: TaxonomyListing | None = None
+    prefix_index: _PrefixIndex | None = None
+    loaded_at: float | None = None
+
+    def put(self, term_id: UUID, name: str, normalized_name: str) -> None:
+        if term_id in self.by_id:
+            return
+        self.by_id[term_id] = TaxonomyTermResponse(id=term_id, name=name)
+        self.id_by_normalized_name[normalized_name] = term_id
+        self.listing = None
+        self.prefix_index = None
+
+
+class TaxonomyDictionary:
+    """Process-wide id -> term and normalized name -> id maps per vocabulary.
+
+    Terms are never renamed or deleted by the API, so a cached entry stays
+    correct; the only staleness is a term created elsewhere. Lookups for
+    unknown ids or names read just those from the database and remember
+    them. Full listings and prefix suggestions come from a vocabulary
+    snapshot that is reloaded once it is older than `max_age_seconds` or
+    marked stale by a change notification.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._vocabularies: dict[TaxonomyTermModel, _Vocabulary] = {
+            model: _Vocabulary() for model in _TAXONOMY_MODELS
+        }
+
+    def clear(self) -> None:
+        self._vocabularies = {model: _Vocabulary() for model in _TAXONOMY_MODELS}
+
+    def mark_stale(self, model: TaxonomyTermModel | None = None) -> None:
+        """Reload the vocabulary listing (all of them by default) on next use."""
+        for vocabulary_model in (model,) if model is not None else _TAXONOMY_MODELS:
+            vocabulary = self._vocabularies[vocabulary_model]
+            vocabulary.listing = None
+            vocabulary.prefix_index = None
+
+    def mark_stale_by_table(self, table_name: str) -> None:
+        model = _MODELS_BY_TABLE.get(table_name)
+        if model is None:
+            self.mark_stale()
+            return
+        self.mark_stale(model)
+
+    def is_fresh(self, model: TaxonomyTermModel) -> bool:
+        vocabulary = self._vocabularies[model]
+        return (
+            vocabulary.listing is not None
+            and vocabulary.loaded_at is not None
+            and self._clock() - vocabulary.loaded_at < self.max_age_seconds
+        )
+
+    def put(
+        self,
+        model: TaxonomyTermModel,
+        *,
+        term_id: UUID,
+        name: str,
+        normalized_name: str,
+    ) -> None:
+        self._vocabularies[model].put(term_id, name, normalized_name)
+
+    async def load(
+        self, db: AsyncSession, models: Iterable[TaxonomyTermModel] | None = None
+    ) -> None:
+        """Replace the given vocabularies (all by default) with a fresh read."""
+        for model in models if models is not None else _TAXONOMY_MODELS:
+            await self._load_vocabulary(db, model)
+
+    async def listing(
+        self, db: AsyncSession, model: TaxonomyTermModel
+    ) -> TaxonomyListing:
+        """Return every term ordered by normalized name, then id."""
+        listing = self._vocabularies[model].listing
+        if listing is not None and self.is_fresh(model):
+            return listing
+        listing, _ = await self._load_vocabulary(db, model)
+        return listing
+
+    async def list_terms(
+        self, db: AsyncSession, model: TaxonomyTermModel
+    ) -> list[TaxonomyTermResponse]:
+        return list((await self.listing(db, model)).terms)
+
+    async def suggest(
+        self,
+        db: AsyncSession,
+        model: TaxonomyTermModel,
+        normalized_prefix: str,
+        *,
+        limit: int,
+    ) -> list[TaxonomyTermResponse]:
+        """Return up to `limit` terms whose normalized name starts with the prefix.
+
+        Terms used by more published projects come first, then by name. Usage
+        counts are as of the last vocabulary load.
+        """
+        if not normalized_prefix or limit <= 0:
+            return []
+        prefix_index = self._vocabularies[model].prefix_index
+        if prefix_index is None or not self.is_fresh(model):
+            _, prefix_index = await self._load_vocabulary(db, model)
+        by_id = self._vocabularies[model].by_id
+        return [
+            by_id[term_id] for term_id in prefix_index.match(normalized_prefix, limit)
+        ]
+
+    async def resolve_ids(
+        self,
+        db: AsyncSession,
+        model: TaxonomyTermModel,
+        normalized_names: Iterable[str],
+    ) -> list[UUID]:
+        """Return ids for the names that exist; unknown names are looked up once."""
+        vocabulary = self._vocabularies[model]
+        wanted = list(dict.fromkeys(normalized_names))
+        missing = [
+            name for name in wanted if name not in vocabulary.id_by_normalized_name
+        ]
+        if missing:
+            model_cols = getattr(model, "__table__").c
+            await self._remember(
+                db,
+                model,
+                select(
+                    model_cols.id, model_cols.name, model_cols.normalized_name
+                ).where(model_cols.normalized_name.in_(missing)),
+            )
+        return [
+            vocabulary.id_by_normalized_name[name]
+            for name in wanted
+            if name in vocabulary.id_by_normalized_name
+        ]
+
+    async def terms_by_id(
+        self,
+        db: AsyncSession,
+        model: TaxonomyTermModel,
+        term_ids: Iterable[UUID],
+    ) -> dict[UUID, TaxonomyTermResponse]:
+        """Return terms for the ids that exist; unknown ids are looked up once."""
+        vocabulary = self._vocabularies[model]
+        wanted = list(dict.fromkeys(term_ids))
+        missing = [term_id for term_id in wanted if term_id not in vocabulary.by_id]
+        if missing:
+            model_cols = getattr(model, "__table__").c
+            await self._remember(
+                db,
+                model,
+                select(
+                    model_cols.id, model_cols.name, model_cols.normalized_name
+                ).where(model_cols.id.in_(missing)),
+            )
+        return {
+            term_id: vocabulary.by_id[term_id]
+            for term_id in wanted
+            if term_id in vocabulary.by_id
+        }
+
+    async def _load_vocabulary(
+        self, db: AsyncSession, model: TaxonomyTermModel
+    ) -> tuple[TaxonomyListing, _PrefixIndex]:
+        model_cols = getattr(model, "__table__").c
+        loaded_at = self._clock()
+        result = await db.exec(
+            select(
+                model_cols.id,
+                model_cols.name,
+                model_cols.normalized_name,
+                model_cols.usage_count,
+            ).order_by(model_cols.normalized_name.asc(), model_cols.id.asc())
+        )
+        vocabulary = _Vocabulary(loaded_at=loaded_at)
+        usage_rows: list[tuple[str, UUID, int]] = []
+        for row in result.all():
+            vocabulary.put(row.id, row.name, row.normalized_name)
+            usage_rows.append((row.normalized_name, row.id, row.usage_count))
+        listing = TaxonomyListing.from_terms(vocabulary.by_id.values())
+        vocabulary.listing = listing
+        prefix_index = _PrefixIndex.build(usage_rows)
+        vocabulary.prefix_index = prefix_index
+        self._vocabularies[model] = vocabulary
+        return listing, prefix_index
+
+    async def _remember(
+        self, db: AsyncSession, model: TaxonomyTermModel, statement: Any
+    ) -> None:
+        result = await db.exec(statement)
+        vocabulary = self._vocabularies[model]
+        for row in result.all():
+            vocabulary.put(row.id, row.name, row.normalized_name)
+
+
+class TaxonomyChangeListener:
+    """Marks dictionary vocabularies stale when another process changes them.
+
+    Holds one connection from `engine` with `LISTEN` on
+    `TAXONOMY_CHANGED_CHANNEL`. Writers send the changed table name with
+    `pg_notify` in the transaction that inserts terms, so notifications only
+    arrive for committed changes. After a reconnect every vocabulary is marked
+    stale, since notifications sent in between were lost.
+    """
+
+    def __init__(
+        self,
+        dictionary: TaxonomyDictionary,
+        engine: AsyncEngine,
+        *,
+        ping_interval_seconds: float = 30.0,
+        reconnect_seconds: float = 5.0,
+    ):
+        self._dictionary = dictionary
+        self._engine = engine
+        self._ping_interval_seconds = ping_interval_seconds
+        self._reconnect_seconds = reconnect_seconds
+        self._task: asyncio.Task[None] | None = None
+        self.listening = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._listen_loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _on_notification(
+        self, _connection: Any, _pid: int, _channel: str, payload: str
+    ) -> None:
+        self._dictionary.mark_stale_by_table(payload)
+
+    async def _listen_loop(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Taxonomy change listener disconnected: %s", exc)
+            self.listening.clear()
+            await asyncio.sleep(self._reconnect_seconds)
+
+    async def _listen_once(self) -> None:
+        async with self._engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            driver_connection: Any = raw_connection.driver_connection
+            await driver_connection.add_listener(
+                TAXONOMY_CHANGED_CHANNEL, self._on_notification
+            )
+            try:
+                self._dictionary.mark_stale()
+                self.listening.set()
+                while True:
+                    await asyncio.sleep(self._ping_interval_seconds)
+                    await driver_connection.fetchval("SELECT 1")
+            finally:
+                if not driver_connection.is_closed():
+                    await driver_connection.remove_listener(
+                        TAXONOMY_CHANGED_CHANNEL, self._on_notification
+                    )
+
+
+@lru_cache
+def get_taxonomy_dictionary() -> TaxonomyDictionary:
+    settings = get_settings()
+    return TaxonomyDictionary(
+        max_age_seconds=settings.TAXONOMY_DICTIONARY_MAX_AGE_SECONDS
+    )
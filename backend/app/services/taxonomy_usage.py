@@ -0,0 +1,188 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.project import Project
+from app.models.taxonomy import (
+    Category,
+    ProjectCategory,
+    ProjectTag,
+    ProjectTechStack,
+    Tag,
+    TechStack,
+)
+
+TaxonomyUsageModel = type[Category] | type[Tag] | type[TechStack]
+
+TAXONOMY_USAGE_MODELS: tuple[TaxonomyUsageModel, ...] = (Category, Tag, TechStack)
+
+_ASSIGNMENT_COLUMNS: dict[TaxonomyUsageModel, sa.Column[Any]] = {
+    Category: getattr(ProjectCategory, "__table__").c.category_id,
+    Tag: getattr(ProjectTag, "__table__").c.tag_id,
+    TechStack: getattr(ProjectTechStack, "__table__").c.tech_stack_id,
+}
+
+
+def counted_usage(model: TaxonomyUsageModel) -> Any:
+    """Correlated count of published, non-deleted projects assigned the term."""
+    assignment_fk = _ASSIGNMENT_COLUMNS[model]
+    assignment_cols = assignment_fk.table.c
+    project_cols = getattr(Project, "__table__").c
+    model_cols = getattr(model, "__table__").c
+    return (
+        select(sa.func.count())
+        .select_from(
+            assignment_fk.table.join(
+                Project, project_cols.id == assignment_cols.project_id
+            )
+        )
+        .where(
+            assignment_fk == model_cols.id,
+            project_cols.is_published.is_(True),
+            project_cols.deleted_at.is_(None),
+        )
+        .scalar_subquery()
+    )
+
+
+def _locked_term_ids(model: TaxonomyUsageModel, term_ids: Any) -> Any:
+    # Lock counters in id order so concurrent writers sharing terms queue
+    # instead of deadlocking.
+    model_cols = getattr(model, "__table__").c
+    return (
+        select(model_cols.id)
+        .where(model_cols.id.in_(term_ids))
+        .order_by(model_cols.id)
+        .with_for_update()
+    )
+
+
+async def adjust_term_usage(
+    db: AsyncSession,
+    model: TaxonomyUsageModel,
+    *,
+    added: Sequence[UUID] = (),
+    removed: Sequence[UUID] = (),
+) -> None:
+    """Count `added` terms up and `removed` terms down by one."""
+    if not added and not removed:
+        return
+    model_cols = getattr(model, "__table__").c
+    delta = sa.case((model_cols.id.in_(list(added)), 1), else_=-1) if added else -1
+    await db.exec(
+        sa.update(model)
+        .where(model_cols.id.in_(_locked_term_ids(model, [*added, *removed])))
+        .values(usage_count=model_cols.usage_count + delta)
+    )
+
+
+async def adjust_project_term_usage(
+    db: AsyncSession, project_id: UUID, delta: int
+) -> None:
+    """Add `delta` to every term assigned to the project, in one statement.
+
+    Call in the transaction that publishes, unpublishes or soft-deletes the
+    project, and only when that transaction changed its visibility.
+    """
+    updates = []
+    for model in TAXONOMY_USAGE_MODELS:
+        assignment_fk = _ASSIGNMENT_COLUMNS[model]
+        model_cols = getattr(model, "__table__").c
+        assigned = select(assignment_fk).where(
+            assignment_fk.table.c.project_id == project_id
+        )
+        updates.append(
+            sa.update(model)
+            .where(model_cols.id.in_(_locked_term_ids(model, assigned)))
+            .values(usage_count=model_cols.usage_count + delta)
+        )
+    *leading, last = updates
+    statement = last
+    for index, leading_update in enumerate(leading):
+        leading_cols = getattr(leading_update.table, "c")
+        statement = statement.add_cte(
+            leading_update.returning(leading_cols.id).cte(f"usage_update_{index}")
+        )
+    await db.exec(statement)
+
+
+@dataclass(frozen=True)
+class TaxonomyUsageDrift:
+    table: str
+    term_id: UUID
+    name: str
+    stored: int
+    counted: int
+
+
+@dataclass
+class TaxonomyUsageReport:
+    checked: dict[str, int] = field(default_factory=dict)
+    drift: list[TaxonomyUsageDrift] = field(default_factory=list)
+
+
+async def reconcile_taxonomy_usage(
+    db: AsyncSession,
+    *,
+    batch_size: int = 500,
+    fix: bool = True,
+    models: Iterable[TaxonomyUsageModel] = TAXONOMY_USAGE_MODELS,
+) -> TaxonomyUsageReport:
+    """Recount term usage in id-ordered batches and report drifted terms.
+
+    With `fix`, drifted counters are rewritten from a fresh count and each
+    batch is committed on its own, so row locks are held briefly.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    report = TaxonomyUsageReport()
+    for model in models:
+        model_cols = getattr(model, "__table__").c
+        table_name = getattr(model, "__table__").name
+        report.checked[table_name] = 0
+        last_id: UUID | None = None
+        while True:
+            statement = (
+                select(
+                    model_cols.id,
+                    model_cols.name,
+                    model_cols.usage_count,
+                    counted_usage(model).label("counted"),
+                )
+                .order_by(model_cols.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                statement = statement.where(model_cols.id > last_id)
+            rows = (await db.exec(statement)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            report.checked[table_name] += len(rows)
+            drifted = [
+                TaxonomyUsageDrift(
+                    table=table_name,
+                    term_id=row.id,
+                    name=row.name,
+                    stored=row.usage_count,
+                    counted=row.counted,
+                )
+                for row in rows
+                if row.usage_count != row.counted
+            ]
+            report.drift.extend(drifted)
+            if fix and drifted:
+                await db.exec(
+                    sa.update(model)
+                    .where(model_cols.id.in_([entry.term_id for entry in drifted]))
+                    .values(usage_count=counted_usage(model))
+                )
+                await db.commit()
+            if len(rows) < batch_size:
+                break
+    return report
@@ -5,6 +5,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.user import User
 from app.schemas.user import UserUpdate
+from app.services.user_cache import get_user_snapshot_cache
 from app.utils.username import normalize_username
 
 
@@ -39,4 +40,5 @@ class UserService:
         self.db.add(user)
         await self.db.commit()
         await self.db.refresh(user)
+        get_user_snapshot_cache().invalidate(user.auth_user_id)
         return user
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.models.user import User
+from app.utils.cache import CacheStats, ExpiringLRUCache
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Immutable copy of a `users` row used to skip the per-request lookup."""
+
+    id: UUID
+    auth_user_id: UUID
+    email: str
+    username: str
+    role: str
+    full_name: str | None
+    profile_picture_url: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> UserSnapshot:
+        return cls(
+            id=user.id,
+            auth_user_id=user.auth_user_id,
+            email=user.email,
+            username=user.username,
+            role=user.role,
+            full_name=user.full_name,
+            profile_picture_url=user.profile_picture_url,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    def to_user(self) -> User:
+        # Hand each request its own detached instance so mutations never leak.
+        return User(  # pyright: ignore[reportCallIssue]
+            id=self.id,
+            auth_user_id=self.auth_user_id,
+            email=self.email,
+            username=self.username,
+            role=self.role,
+            full_name=self.full_name,
+            profile_picture_url=self.profile_picture_url,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+
+class UserSnapshotCache:
+    """Process-local `auth_user_id` -> user snapshot cache.
+
+    Writes made through `UserService` invalidate entries explicitly; changes made
+    by other processes become visible once `ttl_seconds` (the accepted
+    staleness window) elapses. A TTL of zero disables caching.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self._cache: ExpiringLRUCache[UUID, UserSnapshot] = ExpiringLRUCache(
+            max_entries=max_entries
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, auth_user_id: UUID) -> User | None:
+        if not self.enabled:
+            return None
+        snapshot = self._cache.get(auth_user_id)
+        if snapshot is None:
+            return None
+        return snapshot.to_user()
+
+    def put(self, user: User) -> None:
+        if not self.enabled:
+            return
+        self._cache.set(
+            user.auth_user_id, UserSnapshot.from_user(user), ttl=self.ttl_seconds
+        )
+
+    def invalidate(self, auth_user_id: UUID) -> None:
+        self._cache.pop(auth_user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+@lru_cache
+def get_user_snapshot_cache() -> UserSnapshotCache:
+    settings = get_settings()
+    return UserSnapshotCache(
+        ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+        max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    )
@@ -8,9 +8,13 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.project import Project, Vote
-from app.schemas.project import ProjectListItemResponse, ProjectListResponse
-from app.services.project import ProjectService
-from app.services.project_members import get_members_for_projects
+from app.schemas.project import ProjectListResponse
+from app.services.project_cards import hydrate_project_cards
+from app.services.search_index import ProjectSearchIndex, get_project_search_index
+from app.services.search_result_cache import (
+    SearchResultCache,
+    get_search_result_cache,
+)
 from app.utils.pagination import (
     CursorError,
     decode_cursor_payload,
@@ -25,8 +29,16 @@ class VoteTargetNotFoundError(LookupError):
 
 
 class VoteService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        search_index: ProjectSearchIndex | None = None,
+        result_cache: SearchResultCache | None = None,
+    ):
         self.db = db
+        self.search_index = search_index or get_project_search_index()
+        self.result_cache = result_cache or get_search_result_cache()
 
     async def add_vote(self, *, project_id: UUID, user_id: UUID) -> bool:
         """Add a vote if absent. Returns True when a new vote is created."""
@@ -47,12 +59,14 @@ class VoteService:
                 await self.db.commit()
                 return False
 
-            await self._increment_vote_count(project_id)
+            vote_count = await self._increment_vote_count(project_id)
             await self.db.commit()
-            return True
         except Exception:
             await self.db.rollback()
             raise
+        self.search_index.update_vote_count(project_id, vote_count)
+        self.result_cache.vote_count_changed(vote_count)
+        return True
 
     async def remove_vote(self, *, project_id: UUID, user_id: UUID) -> bool:
         """Remove a vote if present. Returns True when an existing vote is removed."""
@@ -73,13 +87,17 @@ class VoteService:
         try:
             result = await self.db.exec(delete_stmt)
             removed_vote_id = result.one_or_none()
+            vote_count: int | None = None
             if removed_vote_id is not None:
-                await self._decrement_vote_count(project_id)
+                vote_count = await self._decrement_vote_count(project_id)
             await self.db.commit()
-            return removed_vote_id is not None
         except Exception:
             await self.db.rollback()
             raise
+        if vote_count is not None:
+            self.search_index.update_vote_count(project_id, vote_count)
+            self.result_cache.vote_count_changed(vote_count)
+        return removed_vote_id is not None
 
     async def list_my_voted_projects(
         self,
@@ -125,31 +143,7 @@ class VoteService:
         page_rows = rows[:limit]
         projects = [project for _, project in page_rows]
 
-        members_by_project = await get_members_for_projects(
-            self.db, [project.id for project in projects]
-        )
-        project_service = ProjectService(self.db)
-        taxonomy_by_project = await project_service.get_project_taxonomy_by_project_ids(
-            [project.id for project in projects]
-        )
-        items: list[ProjectListItemResponse] = []
-        voted_project_ids = {project.id for project in projects}
-        for _, project in page_rows:
-            members = members_by_project.get(project.id, [])
-            taxonomy = taxonomy_by_project.get(
-                project.id, {"categories": [], "tags": [], "tech_stack": []}
-            )
-            items.append(
-                ProjectListItemResponse(
-                    **project.model_dump(),
-                    members=members,
-                    team_size=len(members),
-                    viewer_has_voted=project.id in voted_project_ids,
-                    categories=taxonomy["categories"],
-                    tags=taxonomy["tags"],
-                    tech_stack=taxonomy["tech_stack"],
-                )
-            )
+        items = await hydrate_project_cards(self.db, projects, viewer_id=user_id)
 
         next_cursor: str | None = None
         if has_more and page_rows:
@@ -171,16 +165,17 @@ class VoteService:
         result = await self.db.exec(statement)
         return result.first()
 
-    async def _increment_vote_count(self, project_id: UUID) -> None:
+    async def _increment_vote_count(self, project_id: UUID) -> int:
         project_cols = getattr(Project, "__table__").c
         statement = (
             update(Project)
             .where(project_cols.id == project_id)
             .values(vote_count=project_cols.vote_count + 1)
+            .returning(project_cols.vote_count)
         )
-        await self.db.exec(statement)
+        return (await self.db.exec(statement)).scalar_one()
 
-    async def _decrement_vote_count(self, project_id: UUID) -> None:
+    async def _decrement_vote_count(self, project_id: UUID) -> int:
         project_cols = getattr(Project, "__table__").c
         statement = (
             update(Project)
@@ -191,8 +186,9 @@ class VoteService:
                     else_=0,
                 )
             )
+            .returning(project_cols.vote_count)
         )
-        await self.db.exec(statement)
+        return (await self.db.exec(statement)).scalar_one()
 
     def _encode_recent_votes_cursor(
         self, *, voted_at: datetime, project_id: UUID
@@ -1,21 +1,36 @@
+import asyncio
+import time
 from collections.abc import Iterator
 from types import SimpleNamespace
 from typing import cast
+from unittest.mock import Mock
 from uuid import UUID, uuid4
 
+import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import APIRouter, Depends
 from fastapi.testclient import TestClient
+from jwt.algorithms import RSAAlgorithm
 from starlette.requests import Request
 
+from app.api.deps import auth as auth_deps
 from app.api.deps.auth import (
     get_current_user,
     get_current_user_id_optional,
     get_current_user_optional,
 )
+from app.db.read_routing import ReadYourWritesTracker
 from app.main import app
 from app.models.user import User
-from app.services.auth_bootstrap import EmailPolicyError, UsernameConflictError
+from app.services.auth_bootstrap import (
+    EmailPolicyError,
+    SupabaseAdminUnavailableError,
+    UsernameConflictError,
+)
+from app.services.jwks import JwksFetchError, JwksProvider, SigningKeyNotFoundError
+from app.tests.local_http import LocalHTTPServer, LocalResponse
+from app.utils.cache import ExpiringLRUCache
 
 router = APIRouter()
 
@@ -42,6 +57,11 @@ async def check_auth_optional(
     }
 
 
+@router.post("/test-auth-write")
+async def check_auth_write(current_user: User = Depends(get_current_user)):
+    return {"id": str(current_user.id)}
+
+
 app.include_router(router)
 
 
@@ -177,6 +197,37 @@ def test_optional_auth_email_policy_failure_returns_403(client, monkeypatch):
     assert response.json()["detail"] == "Email confirmation required"
 
 
+def test_optional_auth_admin_api_outage_returns_503(client, monkeypatch):
+    auth_user_id = uuid4()
+
+    monkeypatch.setattr(
+        "app.api.deps.auth._decode_supabase_jwt",
+        lambda _token: {
+            "sub": str(auth_user_id),
+            "email": "student@ufl.edu",
+            "aud": "authenticated",
+            "iss": "https://issuer.example/auth/v1",
+            "iat": 1,
+            "exp": 9999999999,
+        },
+    )
+
+    async def fail_admin(self, _identity):
+        raise SupabaseAdminUnavailableError("Supabase admin API unavailable")
+
+    monkeypatch.setattr(
+        "app.services.auth_bootstrap.AuthBootstrapService.get_or_create_user",
+        fail_admin,
+    )
+
+    response = client.get(
+        "/test-auth-optional",
+        headers={"Authorization": "Bearer first-login"},
+    )
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Supabase admin API unavailable"
+
+
 def test_optional_auth_username_conflict_returns_409(client, monkeypatch):
     auth_user_id = uuid4()
 
@@ -234,3 +285,158 @@ def test_get_current_user_id_optional_with_invalid_string_returns_none():
 def test_get_current_user_id_optional_with_missing_value_returns_none():
     request = cast(Request, SimpleNamespace(state=SimpleNamespace()))
     assert get_current_user_id_optional(request) is None
+
+
+def _claims(exp: float) -> dict[str, object]:
+    return {"sub": str(uuid4()), "email": "student@ufl.edu", "exp": exp}
+
+
+def test_decode_supabase_jwt_reuses_verified_claims_until_exp(monkeypatch):
+    claims = _claims(time.time() + 300)
+    verify = Mock(return_value=claims)
+    monkeypatch.setattr(auth_deps, "_verify_supabase_jwt", verify)
+    monkeypatch.setattr(auth_deps, "_claims_cache", ExpiringLRUCache(max_entries=8))
+
+    assert auth_deps._decode_supabase_jwt("token-a") == claims
+    assert auth_deps._decode_supabase_jwt("token-a") == claims
+
+    verify.assert_called_once_with("token-a")
+    stats = auth_deps.get_jwt_claims_cache_stats()
+    assert stats is not None
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_decode_supabase_jwt_does_not_cache_expired_claims(monkeypatch):
+    verify = Mock(return_value=_claims(time.time() - 1))
+    monkeypatch.setattr(auth_deps, "_verify_supabase_jwt", verify)
+    monkeypatch.setattr(auth_deps, "_claims_cache", ExpiringLRUCache(max_entries=8))
+
+    auth_deps._decode_supabase_jwt("token-a")
+    auth_deps._decode_supabase_jwt("token-a")
+
+    assert verify.call_count == 2
+
+
+def test_decode_supabase_jwt_does_not_cache_failed_verification(monkeypatch):
+    verify = Mock(side_effect=ValueError("bad token"))
+    monkeypatch.setattr(auth_deps, "_verify_supabase_jwt", verify)
+    monkeypatch.setattr(auth_deps, "_claims_cache", ExpiringLRUCache(max_entries=8))
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            auth_deps._decode_supabase_jwt("token-a")
+
+    assert verify.call_count == 2
+
+
+def test_decode_supabase_jwt_verifies_every_call_when_cache_disabled(monkeypatch):
+    verify = Mock(return_value=_claims(time.time() + 300))
+    monkeypatch.setattr(auth_deps, "_verify_supabase_jwt", verify)
+    monkeypatch.setattr(auth_deps, "_claims_cache", None)
+
+    auth_deps._decode_supabase_jwt("token-a")
+    auth_deps._decode_supabase_jwt("token-a")
+
+    assert verify.call_count == 2
+    assert auth_deps.get_jwt_claims_cache_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_load_verified_claims_refreshes_jwks_for_rotated_key(monkeypatch):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = {
+        **RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True),
+        "kid": "rotated",
+        "use": "sig",
+    }
+    now = int(time.time())
+    claims = {
+        "sub": str(uuid4()),
+        "email": "student@ufl.edu",
+        "aud": "authenticated",
+        "iss": auth_deps.settings.SUPABASE_ISSUER,
+        "iat": now,
+        "exp": now + 300,
+    }
+    token = jwt.encode(
+        claims, private_key, algorithm="RS256", headers={"kid": "rotated"}
+    )
+
+    with LocalHTTPServer() as server:
+        server.route("GET", "/jwks", LocalResponse.json({"keys": [jwk]}))
+        provider = JwksProvider(
+            f"{server.url}/jwks",
+            refresh_interval=600.0,
+            min_refresh_interval=30.0,
+            timeout=2.0,
+        )
+        monkeypatch.setattr(auth_deps, "jwks_provider", provider)
+        monkeypatch.setattr(auth_deps, "_claims_cache", None)
+
+        assert await auth_deps._load_verified_claims(token) == claims
+        assert await auth_deps._load_verified_claims(token) == claims
+        assert server.count("GET", "/jwks") == 1
+
+
+def test_auth_returns_503_when_jwks_cannot_be_fetched(client, monkeypatch):
+    def missing_key(_token: str):
+        raise SigningKeyNotFoundError("unknown")
+
+    async def fail_ensure_key(_kid):
+        raise JwksFetchError("JWKS fetch failed")
+
+    monkeypatch.setattr("app.api.deps.auth._decode_supabase_jwt", missing_key)
+    monkeypatch.setattr(auth_deps.jwks_provider, "ensure_key", fail_ensure_key)
+
+    response = client.get(
+        "/test-auth-optional",
+        headers={"Authorization": "Bearer rotated"},
+    )
+    assert response.status_code == 503
+
+
+def test_auth_returns_503_when_jwks_never_loaded(client, monkeypatch):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token = jwt.encode(
+        {"sub": str(uuid4())}, private_key, algorithm="RS256", headers={"kid": "k1"}
+    )
+
+    with LocalHTTPServer() as server:
+        provider = JwksProvider(
+            f"{server.url}/jwks",
+            refresh_interval=600.0,
+            min_refresh_interval=30.0,
+            timeout=2.0,
+        )
+        with pytest.raises(JwksFetchError):
+            asyncio.run(provider.refresh())
+        monkeypatch.setattr(auth_deps, "jwks_provider", provider)
+        monkeypatch.setattr(auth_deps, "_claims_cache", None)
+
+        response = client.get(
+            "/test-auth-optional", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert response.status_code == 503
+    assert server.count("GET", "/jwks") == 1
+
+
+def test_authenticated_write_makes_user_reads_sticky_to_primary(client, monkeypatch):
+    user = _user()
+    tracker = ReadYourWritesTracker(window_seconds=30)
+    monkeypatch.setattr(auth_deps, "read_your_writes", tracker)
+
+    async def fake_resolve(_request, _token, _db):
+        return user
+
+    monkeypatch.setattr(auth_deps, "_resolve_authenticated_user", fake_resolve)
+
+    response = client.get("/test-auth", headers={"Authorization": "Bearer valid"})
+    assert response.status_code == 200
+    assert tracker.should_read_primary(user.id) is False
+
+    response = client.post(
+        "/test-auth-write", headers={"Authorization": "Bearer valid"}
+    )
+    assert response.status_code == 200
+    assert tracker.should_read_primary(user.id) is True
@@ -6,6 +6,12 @@ from fastapi.testclient import TestClient
 from app.api.deps.auth import get_current_user
 from app.main import app
 from app.models.user import User
+from app.services.project_slug_cache import get_project_slug_cache
+from app.services.search_facet_cache import get_search_facet_cache
+from app.services.search_index import get_project_search_index
+from app.services.search_result_cache import get_search_result_cache
+from app.services.taxonomy_bitmaps import get_taxonomy_bitmap_index
+from app.services.taxonomy_dictionary import get_taxonomy_dictionary
 
 
 @pytest.fixture
@@ -29,3 +35,39 @@ def authenticated_client(client, mock_user):
     app.dependency_overrides[get_current_user] = lambda: mock_user
     yield client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_project_slug_cache():
+    # Slug entries are process-wide; tests reuse slugs across rolled-back data.
+    get_project_slug_cache().clear()
+    yield
+    get_project_slug_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_taxonomy_dictionary():
+    # Terms seeded by one test are rolled back before the next one runs.
+    get_taxonomy_dictionary().clear()
+    yield
+    get_taxonomy_dictionary().clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_search_facet_cache():
+    # Facet counts are keyed by search signature, which tests repeat.
+    get_search_facet_cache().clear()
+    yield
+    get_search_facet_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_search_indexes():
+    # A loaded index or cached page would keep serving rolled-back projects.
+    get_project_search_index().clear()
+    get_taxonomy_bitmap_index().clear()
+    get_search_result_cache().clear()
+    yield
+    get_project_search_index().clear()
+    get_taxonomy_bitmap_index().clear()
+    get_search_result_cache().clear()
@@ -69,7 +69,7 @@ async def test_get_current_user_returns_existing_user(
         },
     )
 
-    def fake_admin_get_user(self, _auth_user_id):
+    async def fake_admin_get_user(self, _auth_user_id):
         return {
             "id": str(auth_user_id),
             "email_confirmed_at": "2026-01-01T00:00:00Z",
@@ -123,7 +123,7 @@ async def test_get_current_user_bootstraps_missing_user(
         },
     )
 
-    def fake_admin_get_user(self, _auth_user_id):
+    async def fake_admin_get_user(self, _auth_user_id):
         return {
             "id": str(auth_user_id),
             "email_confirmed_at": "2026-01-01T00:00:00Z",
@@ -182,13 +182,16 @@ async def test_get_current_user_allows_non_ufl_email(
         },
     )
 
-    monkeypatch.setattr(
-        "app.services.auth_bootstrap.SupabaseAdminClient.get_user",
-        lambda self, _auth_user_id: {
+    async def fake_admin_get_user(self, _auth_user_id):
+        return {
             "id": str(auth_user_id),
             "email_confirmed_at": "2026-01-01T00:00:00Z",
             "user_metadata": {"username": "outside_user"},
-        },
+        }
+
+    monkeypatch.setattr(
+        "app.services.auth_bootstrap.SupabaseAdminClient.get_user",
+        fake_admin_get_user,
     )
 
     async def override_get_db():
@@ -229,13 +232,16 @@ async def test_get_current_user_rejects_unconfirmed_email(
         },
     )
 
-    monkeypatch.setattr(
-        "app.services.auth_bootstrap.SupabaseAdminClient.get_user",
-        lambda self, _auth_user_id: {
+    async def fake_admin_get_user(self, _auth_user_id):
+        return {
             "id": str(auth_user_id),
             "email_confirmed_at": None,
             "user_metadata": {"username": "pending_user"},
-        },
+        }
+
+    monkeypatch.setattr(
+        "app.services.auth_bootstrap.SupabaseAdminClient.get_user",
+        fake_admin_get_user,
     )
 
     async def override_get_db():
@@ -275,13 +281,16 @@ async def test_get_current_user_concurrent_bootstrap_is_idempotent(
         lambda _token: payload,
     )
 
-    monkeypatch.setattr(
-        "app.services.auth_bootstrap.SupabaseAdminClient.get_user",
-        lambda self, _auth_user_id: {
+    async def fake_admin_get_user(self, _auth_user_id):
+        return {
             "id": str(auth_user_id),
             "email_confirmed_at": "2026-01-01T00:00:00Z",
             "user_metadata": {"username": "race_user"},
-        },
+        }
+
+    monkeypatch.setattr(
+        "app.services.auth_bootstrap.SupabaseAdminClient.get_user",
+        fake_admin_get_user,
     )
 
     async def authenticate_once():
@@ -0,0 +1,129 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import get_settings
+from app.db.database import create_database_engine
+from app.db.pool import InstrumentedAsyncQueuePool, install_idle_ping
+
+
+async def _backend_pid(connection) -> int:
+    result = await connection.execute(text("SELECT pg_backend_pid()"))
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_idle_ping_replaces_terminated_connection(async_engine, database_urls):
+    engine = create_async_engine(
+        database_urls["async"],
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    install_idle_ping(engine, idle_seconds=0)
+    try:
+        async with engine.connect() as connection:
+            stale_pid = await _backend_pid(connection)
+
+        async with async_engine.connect() as admin:
+            await admin.execute(
+                text("SELECT pg_terminate_backend(:pid)"), {"pid": stale_pid}
+            )
+
+        async with engine.connect() as connection:
+            fresh_pid = await _backend_pid(connection)
+
+        assert fresh_pid != stale_pid
+        assert engine.sync_engine.pool.wait_stats.checkouts >= 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_recently_used_connection_skips_idle_ping(database_urls, monkeypatch):
+    engine = create_async_engine(
+        database_urls["async"],
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    install_idle_ping(engine, idle_seconds=3600)
+    pings: list[object] = []
+    original_ping = engine.sync_engine.dialect.do_ping
+    monkeypatch.setattr(
+        engine.sync_engine.dialect,
+        "do_ping",
+        lambda dbapi_connection: (
+            pings.append(dbapi_connection) or original_ping(dbapi_connection)
+        ),
+    )
+    try:
+        for _ in range(3):
+            async with engine.connect() as connection:
+                await _backend_pid(connection)
+        assert pings == []
+    finally:
+        await engine.dispose()
+
+
+async def _prepared_statement_count(connection, marker: str) -> int:
+    result = await connection.execute(
+        text(
+            "SELECT count(*) FROM pg_prepared_statements "
+            "WHERE statement LIKE :pattern AND statement NOT LIKE '%pg_prepared%'"
+        ),
+        {"pattern": f"%{marker}%"},
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_direct_mode_reuses_prepared_statements(database_urls):
+    settings = get_settings().model_copy(
+        update={
+            "DATABASE_URL": database_urls["async"],
+            "DATABASE_SSL": False,
+            "DATABASE_CONNECTION_MODE": "direct",
+            "DATABASE_POOL_SIZE": 1,
+            "DATABASE_POOL_MAX_OVERFLOW": 0,
+        }
+    )
+    engine = create_database_engine(settings)
+    try:
+        async with engine.connect() as connection:
+            for _ in range(5):
+                await connection.execute(text("SELECT 1 AS direct_mode_marker"))
+            assert (
+                await _prepared_statement_count(connection, "direct_mode_marker") == 1
+            )
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pooler_mode_executes_with_unique_statement_names(database_urls):
+    settings = get_settings().model_copy(
+        update={
+            "DATABASE_URL": database_urls["async"],
+            "DATABASE_SSL": False,
+            "DATABASE_CONNECTION_MODE": "pooler",
+            "DATABASE_POOL_SIZE": 1,
+            "DATABASE_POOL_MAX_OVERFLOW": 0,
+        }
+    )
+    engine = create_database_engine(settings)
+    try:
+        async with engine.connect() as connection:
+            for _ in range(3):
+                result = await connection.execute(text("SELECT 1 AS pooler_marker"))
+                assert result.scalar_one() == 1
+            result = await connection.execute(
+                text(
+                    "SELECT name FROM pg_prepared_statements "
+                    "WHERE statement LIKE '%pooler_marker%' "
+                    "AND statement NOT LIKE '%pg_prepared%'"
+                )
+            )
+            assert all(name.startswith("__asyncpg_") for name in result.scalars())
+    finally:
+        await engine.dispose()
@@ -3,11 +3,12 @@ from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy import event
 from sqlmodel import select
 from sqlalchemy.sql.dml import Update
 
 from app.models.project import Project, ProjectMember, Vote
-from app.models.taxonomy import Category
+from app.models.taxonomy import Category, ProjectCategory, ProjectTag, Tag
 from app.models.user import User
 from app.schemas.project import ProjectCreateRequest, ProjectUpdateRequest
 from app.services.project import (
@@ -15,6 +16,9 @@ from app.services.project import (
     ProjectService,
     ProjectValidationError,
 )
+from app.services.project_slug_cache import UNKNOWN_SLUG, ProjectSlugCache
+from app.services.taxonomy_dictionary import get_taxonomy_dictionary
+from app.tests.query_budget import assert_max_queries
 
 
 async def _seed_user(db_session, email: str, name: str) -> User:
@@ -388,6 +392,84 @@ async def test_members_included_and_ordered_for_list_and_detail(db_session):
     assert listed.team_size == 2
 
 
+@pytest.mark.asyncio
+async def test_list_projects_hydrates_cards_with_one_statement_after_page_query(
+    db_session,
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "owner-hydrate@ufl.edu", "Owner")
+    member = await _seed_user(db_session, "member-hydrate@ufl.edu", "Member")
+    voter = await _seed_user(db_session, "voter-hydrate@ufl.edu", "Voter")
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Hydrated Card",
+        vote_count=3,
+        is_published=True,
+        created_at=now,
+    )
+    await _seed_member(
+        db_session,
+        project_id=project.id,
+        user_id=owner.id,
+        role="owner",
+        added_at=now,
+    )
+    await _seed_member(
+        db_session,
+        project_id=project.id,
+        user_id=member.id,
+        role="contributor",
+        added_at=now + timedelta(seconds=5),
+    )
+    second_category = Category(name="Hydrate Zeta", normalized_name="hydrate zeta")
+    first_category = Category(name="Hydrate Alpha", normalized_name="hydrate alpha")
+    db_session.add(second_category)
+    db_session.add(first_category)
+    await db_session.flush()
+    db_session.add(
+        ProjectCategory(
+            project_id=project.id, category_id=second_category.id, position=0
+        )
+    )
+    db_session.add(
+        ProjectCategory(
+            project_id=project.id, category_id=first_category.id, position=1
+        )
+    )
+    await db_session.flush()
+    await _seed_vote(db_session, project_id=project.id, user_id=voter.id)
+
+    # The taxonomy dictionary is loaded at startup, so names cost no query.
+    await get_taxonomy_dictionary().load(db_session)
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    connection = await db_session.connection()
+    event.listen(connection.sync_connection, "before_cursor_execute", _record)
+    try:
+        listing = await ProjectService(db_session).list_projects(
+            sort="new", limit=10, current_user_id=voter.id
+        )
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", _record)
+
+    assert len(statements) == 2
+    listed = next(item for item in listing.items if item.id == project.id)
+    assert [m.user_id for m in listed.members] == [owner.id, member.id]
+    assert [m.role for m in listed.members] == ["owner", "contributor"]
+    assert listed.team_size == 2
+    assert [term.id for term in listed.categories] == [
+        second_category.id,
+        first_category.id,
+    ]
+    assert listed.tags == []
+    assert listed.tech_stack == []
+    assert listed.viewer_has_voted is True
+
+
 @pytest.mark.asyncio
 async def test_create_project_creates_draft_and_owner_membership_and_returns_detail(
     db_session,
@@ -507,6 +589,88 @@ async def test_get_project_detail_by_slug_resolves_existing_project(db_session):
     assert by_slug.slug == created.slug
 
 
+def _slug_cache() -> ProjectSlugCache:
+    return ProjectSlugCache(ttl_seconds=3600, negative_ttl_seconds=60, max_entries=100)
+
+
+@pytest.mark.asyncio
+async def test_get_project_detail_by_slug_caches_unknown_slugs(db_session):
+    service = ProjectService(db_session, slug_cache=_slug_cache())
+
+    assert await service.get_project_detail_by_slug("no-such-project", None) is None
+    with assert_max_queries(0):
+        assert (
+            await service.get_project_detail_by_slug(" No-Such-Project ", None) is None
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_project_clears_cached_miss_for_its_slug(db_session):
+    creator = await _seed_user(db_session, "slug-cache-create@ufl.edu", "Creator")
+    service = ProjectService(db_session, slug_cache=_slug_cache())
+
+    assert await service.get_project_detail_by_slug("slug-cache-fresh", None) is None
+    created = await service.create_project(
+        created_by_id=creator.id,
+        payload=ProjectCreateRequest(
+            title="Slug Cache Fresh",
+            short_description="Created after a cached miss",
+            github_url="https://github.com/example/slug-cache-fresh",
+        ),
+    )
+
+    assert created.slug == "slug-cache-fresh"
+    detail = await service.get_project_detail_by_slug(created.slug, creator.id)
+    assert detail is not None
+    assert detail.id == created.id
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_invalidates_cached_slug(db_session):
+    owner = await _seed_user(db_session, "slug-cache-delete@ufl.edu", "Owner")
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Slug Cache Delete",
+        vote_count=0,
+        is_published=True,
+        created_at=datetime.now(timezone.utc),
+    )
+    slug_cache = _slug_cache()
+    service = ProjectService(db_session, slug_cache=slug_cache)
+
+    assert await service.get_project_detail_by_slug(project.slug, None) is not None
+    assert slug_cache.get(project.slug) == project.id
+
+    assert await service.soft_delete_project(project.id, owner.id) is True
+    assert slug_cache.get(project.slug) is None
+    assert await service.get_project_detail_by_slug(project.slug, None) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_slug_is_rechecked_when_project_deleted_elsewhere(db_session):
+    owner = await _seed_user(db_session, "slug-cache-stale@ufl.edu", "Owner")
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Slug Cache Stale",
+        vote_count=0,
+        is_published=True,
+        created_at=datetime.now(timezone.utc),
+    )
+    slug_cache = _slug_cache()
+    service = ProjectService(db_session, slug_cache=slug_cache)
+    assert await service.get_project_detail_by_slug(project.slug, None) is not None
+
+    # Another process soft-deletes the project; this cache never hears about it.
+    project.deleted_at = datetime.now(timezone.utc)
+    db_session.add(project)
+    await db_session.flush()
+
+    assert await service.get_project_detail_by_slug(project.slug, None) is None
+    assert slug_cache.get(project.slug) == UNKNOWN_SLUG
+
+
 @pytest.mark.asyncio
 async def test_create_project_defaults_group_flag_and_persists_optional_urls(
     db_session,
@@ -1092,6 +1256,125 @@ async def test_publish_project_rolls_back_when_commit_fails(db_session, monkeypa
     assert rollback_spy.await_count == 1
 
 
+@pytest.mark.asyncio
+async def test_resolve_or_create_terms_is_set_based_and_keeps_input_order(
+    db_session,
+):
+    unique = uuid4().hex[:8]
+    existing = Tag(name=f"Existing {unique}", normalized_name=f"existing {unique}")
+    db_session.add(existing)
+    await db_session.flush()
+    owner = await _seed_user(db_session, f"terms-{unique}@ufl.edu", "Terms Owner")
+    service = ProjectService(db_session)
+
+    with assert_max_queries(2):
+        terms = await service._resolve_or_create_terms(
+            Tag,
+            [f"New B {unique}", f"  EXISTING {unique} ", f"New A {unique}"],
+            taxonomy_principal=owner,
+        )
+
+    assert [term.name for term in terms] == [
+        f"New B {unique}",
+        f"Existing {unique}",
+        f"New A {unique}",
+    ]
+    assert terms[1].id == existing.id
+    persisted = await db_session.exec(
+        select(Tag).where(Tag.normalized_name.like(f"new % {unique}"))
+    )
+    assert {tag.id for tag in persisted.all()} == {terms[0].id, terms[2].id}
+
+
+@pytest.mark.asyncio
+async def test_resolve_or_create_terms_reuses_terms_inserted_concurrently(
+    db_session, monkeypatch
+):
+    unique = uuid4().hex[:8]
+    owner = await _seed_user(db_session, f"race-{unique}@ufl.edu", "Race Owner")
+    service = ProjectService(db_session)
+    raced_ids: list[UUID] = []
+    calls = 0
+    original_exec = db_session.exec
+
+    async def exec_with_race(statement, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        # Land a concurrent insert between the lookup and the insert.
+        if calls == 2:
+            raced = Tag(name=f"Raced {unique}", normalized_name=f"raced {unique}")
+            db_session.add(raced)
+            await db_session.flush()
+            raced_ids.append(raced.id)
+        return await original_exec(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db_session, "exec", exec_with_race)
+
+    terms = await service._resolve_or_create_terms(
+        Tag,
+        [f"raced {unique}", f"Fresh {unique}"],
+        taxonomy_principal=owner,
+    )
+
+    assert [term.name for term in terms] == [f"Raced {unique}", f"Fresh {unique}"]
+    assert terms[0].id == raced_ids[0]
+
+
+async def _tag_assignments(db_session, project_id: UUID) -> dict[str, tuple]:
+    result = await db_session.exec(
+        select(ProjectTag, Tag)
+        .join(Tag, Tag.id == ProjectTag.tag_id)
+        .where(ProjectTag.project_id == project_id)
+    )
+    return {
+        tag.name: (assignment.id, assignment.position) for assignment, tag in result
+    }
+
+
+@pytest.mark.asyncio
+async def test_replace_taxonomy_assignments_only_touches_changed_rows(db_session):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "owner-tag-diff@ufl.edu", "Owner Diff")
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Tag Diff Target",
+        vote_count=0,
+        is_published=False,
+        created_at=now,
+    )
+    service = ProjectService(db_session)
+
+    async def replace_tags(tags: list[str]) -> None:
+        await service._replace_project_taxonomy_assignments(
+            project_id=project.id,
+            categories=None,
+            tags=tags,
+            tech_stack=None,
+            taxonomy_principal=owner,
+        )
+        await db_session.flush()
+
+    await replace_tags(["Diff A", "Diff B", "Diff C", "Diff D"])
+    before = await _tag_assignments(db_session, project.id)
+
+    with assert_max_queries(2):
+        await replace_tags(["Diff A", "Diff B", "Diff C", "Diff D"])
+    assert await _tag_assignments(db_session, project.id) == before
+
+    await replace_tags(["Diff C", "Diff B", "Diff E", "Diff A"])
+    after = await _tag_assignments(db_session, project.id)
+
+    assert {name: position for name, (_, position) in after.items()} == {
+        "Diff C": 0,
+        "Diff B": 1,
+        "Diff E": 2,
+        "Diff A": 3,
+    }
+    for name in ("Diff A", "Diff B", "Diff C"):
+        assert after[name][0] == before[name][0]
+
+
 @pytest.mark.asyncio
 async def test_publish_project_does_not_overwrite_published_at_after_race(
     db_session, monkeypatch
@@ -1141,6 +1424,56 @@ async def test_publish_project_does_not_overwrite_published_at_after_race(
     assert published.published_at == raced_published_at
 
 
+@pytest.mark.asyncio
+async def test_unpublish_project_reports_concurrent_unpublish(db_session, monkeypatch):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(
+        db_session, "owner-unpublish-race@ufl.edu", "Owner Unpublish Race"
+    )
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Unpublish Race Target",
+        vote_count=0,
+        is_published=True,
+        created_at=now,
+    )
+    project.github_url = "https://github.com/example/unpublish-race"
+    await db_session.flush()
+
+    service = ProjectService(db_session)
+    race_applied = False
+    original_exec = db_session.exec
+    usage_adjustments = AsyncMock()
+    monkeypatch.setattr(
+        "app.services.project.adjust_project_term_usage", usage_adjustments
+    )
+
+    async def exec_with_race(statement, *args, **kwargs):
+        nonlocal race_applied
+        table_name = getattr(getattr(statement, "table", None), "name", None)
+        if (
+            not race_applied
+            and isinstance(statement, Update)
+            and table_name == "projects"
+        ):
+            race_applied = True
+            project.is_published = False
+            project.published_at = None
+            await db_session.flush()
+        return await original_exec(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db_session, "exec", exec_with_race)
+
+    unpublished = await service.unpublish_project(
+        project_id=project.id, current_user_id=owner.id
+    )
+    assert race_applied is True
+    assert unpublished is not None
+    assert unpublished.is_published is False
+    usage_adjustments.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_unpublish_project_rolls_back_when_commit_fails(db_session, monkeypatch):
     now = datetime.now(timezone.utc)
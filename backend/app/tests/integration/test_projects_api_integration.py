@@ -12,7 +12,7 @@ from sqlmodel import delete, select
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
 from app.api.deps.auth import get_current_user, get_current_user_optional
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.main import app
 from app.models.project import Project, ProjectMember, Vote
 from app.models.taxonomy import (
@@ -24,6 +24,8 @@ from app.models.taxonomy import (
     TechStack,
 )
 from app.models.user import User
+from app.services.taxonomy_dictionary import get_taxonomy_dictionary
+from app.tests.query_budget import assert_max_queries
 
 
 @pytest_asyncio.fixture
@@ -156,6 +158,7 @@ async def test_get_project_detail_published_visible_anonymous(api_client, db_ses
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -185,6 +188,7 @@ async def test_get_project_detail_by_slug_published_visible_anonymous(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(f"/api/v1/projects/slug/{project.slug}")
@@ -215,6 +219,7 @@ async def test_get_project_detail_by_slug_unpublished_hidden_anonymous(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(f"/api/v1/projects/slug/{project.slug}")
@@ -244,6 +249,7 @@ async def test_get_project_detail_by_slug_normalizes_case_and_whitespace(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(
@@ -278,6 +284,7 @@ async def test_get_project_detail_by_slug_soft_deleted_returns_404(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(f"/api/v1/projects/slug/{project.slug}")
@@ -298,6 +305,7 @@ async def test_create_project_authenticated_returns_201_and_persists_draft(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -346,6 +354,7 @@ async def test_create_project_unauthenticated_returns_401(api_client, db_session
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.post(
             "/api/v1/projects",
@@ -370,6 +379,7 @@ async def test_create_project_missing_title_returns_422(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post("/api/v1/projects", json=payload)
@@ -389,6 +399,7 @@ async def test_create_project_blank_title_or_description_returns_422(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         title_response = await api_client.post(
@@ -416,6 +427,7 @@ async def test_create_project_requires_at_least_one_url_returns_422(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -446,6 +458,7 @@ async def test_create_project_invalid_url_returns_422(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -470,6 +483,7 @@ async def test_create_project_rejects_timeline_end_without_start(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -495,6 +509,7 @@ async def test_create_project_rejects_timeline_start_after_end(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -518,6 +533,7 @@ async def test_create_project_accepts_http_and_https_urls(api_client, db_session
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -547,6 +563,7 @@ async def test_create_project_normalizes_empty_urls_to_null_in_response_and_db(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -591,6 +608,7 @@ async def test_get_project_detail_unpublished_hidden_anonymous(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -619,6 +637,7 @@ async def test_patch_project_owner_can_update_published_project(api_client, db_s
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -668,6 +687,7 @@ async def test_patch_project_owner_updates_non_url_fields_with_existing_url(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -706,6 +726,7 @@ async def test_patch_project_title_does_not_mutate_slug(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -744,6 +765,7 @@ async def test_patch_project_unauthenticated_returns_401(api_client, db_session)
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.patch(
             f"/api/v1/projects/{project.id}",
@@ -779,6 +801,7 @@ async def test_patch_project_non_owner_returns_403(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(maintainer)
     try:
         response = await api_client.patch(
@@ -800,6 +823,7 @@ async def test_patch_project_not_found_returns_404(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -827,6 +851,7 @@ async def test_patch_project_empty_payload_returns_422(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(f"/api/v1/projects/{project.id}", json={})
@@ -850,6 +875,7 @@ async def test_patch_project_rejects_is_group_project_field(api_client, db_sessi
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -880,6 +906,7 @@ async def test_patch_project_invalid_url_returns_422(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -910,6 +937,7 @@ async def test_patch_project_rejects_timeline_end_without_start(api_client, db_s
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -945,6 +973,7 @@ async def test_patch_project_allows_clearing_timeline_end(api_client, db_session
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -983,6 +1012,7 @@ async def test_patch_project_rejects_clearing_last_url(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -1017,6 +1047,7 @@ async def test_patch_project_rejects_null_title_and_description(api_client, db_s
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         null_title = await api_client.patch(
@@ -1054,6 +1085,7 @@ async def test_patch_project_updates_updated_at_timestamp(api_client, db_session
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -1090,6 +1122,7 @@ async def test_publish_project_owner_can_publish(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/publish")
@@ -1128,6 +1161,7 @@ async def test_publish_project_makes_draft_visible_to_anonymous(api_client, db_s
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         publish_response = await api_client.post(
@@ -1139,6 +1173,7 @@ async def test_publish_project_makes_draft_visible_to_anonymous(api_client, db_s
     assert publish_response.status_code == 200
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         detail_response = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -1168,6 +1203,7 @@ async def test_publish_project_unauthenticated_returns_401(api_client, db_sessio
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/publish")
     finally:
@@ -1193,6 +1229,7 @@ async def test_unpublish_project_unauthenticated_returns_401(api_client, db_sess
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/unpublish")
     finally:
@@ -1220,6 +1257,7 @@ async def test_publish_project_is_idempotent(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/publish")
@@ -1251,6 +1289,7 @@ async def test_publish_project_not_found_returns_404(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(
@@ -1288,6 +1327,7 @@ async def test_publish_project_non_owner_returns_403(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(maintainer)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/publish")
@@ -1319,6 +1359,7 @@ async def test_publish_project_authenticated_non_member_returns_403(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(stranger)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/publish")
@@ -1350,6 +1391,7 @@ async def test_unpublish_project_owner_can_unpublish_and_hide_from_public(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         unpublish_response = await api_client.post(
@@ -1371,6 +1413,7 @@ async def test_unpublish_project_owner_can_unpublish_and_hide_from_public(
     assert refreshed.published_at is None
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         anonymous_detail = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -1381,6 +1424,7 @@ async def test_unpublish_project_owner_can_unpublish_and_hide_from_public(
     assert anonymous_detail.json()["detail"] == "Project not found"
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: stranger
     try:
         non_member_detail = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -1418,6 +1462,7 @@ async def test_unpublish_project_preserves_owner_and_member_visibility(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         unpublish_response = await api_client.post(
@@ -1432,6 +1477,7 @@ async def test_unpublish_project_preserves_owner_and_member_visibility(
     assert payload["published_at"] is None
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: owner
     try:
         owner_detail = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -1441,6 +1487,7 @@ async def test_unpublish_project_preserves_owner_and_member_visibility(
     assert owner_detail.status_code == 200
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: member
     try:
         member_detail = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -1469,6 +1516,7 @@ async def test_unpublish_project_is_idempotent(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/unpublish")
@@ -1491,6 +1539,7 @@ async def test_unpublish_project_not_found_returns_404(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(
@@ -1528,6 +1577,7 @@ async def test_unpublish_project_non_owner_returns_403(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(maintainer)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/unpublish")
@@ -1559,6 +1609,7 @@ async def test_unpublish_project_authenticated_non_member_returns_403(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(stranger)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/unpublish")
@@ -1594,6 +1645,7 @@ async def test_get_project_detail_unpublished_visible_to_member(api_client, db_s
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: member
     try:
         response = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -1627,6 +1679,7 @@ async def test_get_project_detail_unpublished_forbidden_to_authenticated_non_mem
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: stranger
     try:
         response = await api_client.get(f"/api/v1/projects/{project.id}")
@@ -1657,6 +1710,7 @@ async def test_list_projects_returns_only_published(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get("/api/v1/projects")
     finally:
@@ -1685,6 +1739,7 @@ async def test_list_projects_updates_visibility_after_publish_and_unpublish(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         initial_feed = await api_client.get("/api/v1/projects")
     finally:
@@ -1695,6 +1750,7 @@ async def test_list_projects_updates_visibility_after_publish_and_unpublish(
     assert str(project.id) not in initial_ids
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         publish_response = await api_client.post(
@@ -1706,6 +1762,7 @@ async def test_list_projects_updates_visibility_after_publish_and_unpublish(
     assert publish_response.status_code == 200
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         after_publish_feed = await api_client.get("/api/v1/projects")
     finally:
@@ -1716,6 +1773,7 @@ async def test_list_projects_updates_visibility_after_publish_and_unpublish(
     assert str(project.id) in after_publish_ids
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         unpublish_response = await api_client.post(
@@ -1727,6 +1785,7 @@ async def test_list_projects_updates_visibility_after_publish_and_unpublish(
     assert unpublish_response.status_code == 200
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         after_unpublish_feed = await api_client.get("/api/v1/projects")
     finally:
@@ -1777,6 +1836,7 @@ async def test_list_projects_sort_new_and_cursor_pagination(api_client, db_sessi
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         page_one = await api_client.get("/api/v1/projects?sort=new&limit=2")
         assert page_one.status_code == 200
@@ -1814,6 +1874,7 @@ async def test_list_projects_invalid_cursor_returns_400(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get("/api/v1/projects?cursor=not-a-cursor")
     finally:
@@ -1838,6 +1899,7 @@ async def test_list_projects_limit_is_clamped(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response_low = await api_client.get("/api/v1/projects?limit=0")
         response_high = await api_client.get("/api/v1/projects?limit=500")
@@ -1884,6 +1946,7 @@ async def test_list_projects_top_default_window_excludes_old_projects(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get("/api/v1/projects?sort=top")
     finally:
@@ -1913,6 +1976,7 @@ async def test_list_projects_top_cursor_range_mismatch_returns_400(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         page_one = await api_client.get("/api/v1/projects?sort=top&limit=1")
         assert page_one.status_code == 200
@@ -1952,6 +2016,7 @@ async def test_list_projects_cursor_sort_mismatch_returns_400(api_client, db_ses
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         top_page = await api_client.get("/api/v1/projects?sort=top&limit=1")
         assert top_page.status_code == 200
@@ -2067,6 +2132,7 @@ async def test_search_projects_combines_keyword_and_taxonomy_filters(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(
@@ -2104,6 +2170,7 @@ async def test_search_projects_rejects_cursor_reuse_across_different_query_conte
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         page_one = await api_client.get(
@@ -2205,6 +2272,7 @@ async def test_search_projects_accepts_bracketed_taxonomy_alias_params(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(
@@ -2254,6 +2322,7 @@ async def test_search_projects_top_default_window_excludes_old_projects(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get("/api/v1/projects/search?sort=top")
@@ -2287,6 +2356,7 @@ async def test_search_projects_cursor_sort_mismatch_returns_400(api_client, db_s
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         top_page = await api_client.get("/api/v1/projects/search?sort=top&limit=1")
@@ -2328,6 +2398,7 @@ async def test_search_projects_top_cursor_range_mismatch_returns_400(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         page_one = await api_client.get("/api/v1/projects/search?sort=top&limit=1")
@@ -2385,6 +2456,7 @@ async def test_search_projects_unknown_taxonomy_terms_behavior(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         unknown_only = await api_client.get(
@@ -2429,6 +2501,7 @@ async def test_search_projects_excludes_soft_deleted_matches(api_client, db_sess
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get("/api/v1/projects/search?q=soft delete search")
@@ -2474,6 +2547,7 @@ async def test_search_projects_whitespace_query_is_treated_as_omitted(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get("/api/v1/projects/search?q=%20%20%20&sort=new")
@@ -2508,6 +2582,7 @@ async def test_search_projects_viewer_has_voted_anonymous_vs_authenticated(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         anonymous = await api_client.get(
@@ -2517,6 +2592,7 @@ async def test_search_projects_viewer_has_voted_anonymous_vs_authenticated(
         app.dependency_overrides.clear()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = _override_authed_user(voter)
     try:
         authed = await api_client.get(
@@ -2550,6 +2626,7 @@ async def test_search_projects_invalid_top_date_range_returns_400(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(
@@ -2603,6 +2680,7 @@ async def test_search_projects_mixed_duplicate_plain_and_alias_params(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(
@@ -2632,6 +2710,7 @@ async def test_search_projects_invalid_limit_returns_422(api_client, db_session)
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get("/api/v1/projects/search?limit=0")
@@ -2668,6 +2747,7 @@ async def test_get_project_members_published_visible_anonymous(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(f"/api/v1/projects/{project.id}/members")
@@ -2698,6 +2778,7 @@ async def test_get_project_members_draft_rejects_non_member(api_client, db_sessi
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = _override_authed_user(
         outsider
     )
@@ -2734,6 +2815,7 @@ async def test_add_project_member_owner_only_case_insensitive_email_and_group_fl
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(
@@ -2783,6 +2865,7 @@ async def test_add_project_member_rejects_duplicate_membership(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(
@@ -2826,6 +2909,7 @@ async def test_remove_project_member_updates_group_flag(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.delete(
@@ -2860,6 +2944,7 @@ async def test_leave_project_last_owner_returns_409(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/leave")
@@ -2895,6 +2980,7 @@ async def test_add_project_member_non_owner_returns_403(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(non_owner)
     try:
         response = await api_client.post(
@@ -2924,6 +3010,7 @@ async def test_add_project_member_missing_target_user_returns_404(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.post(
@@ -2965,6 +3052,7 @@ async def test_update_project_member_non_owner_returns_403(api_client, db_sessio
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(non_owner)
     try:
         response = await api_client.patch(
@@ -2994,6 +3082,7 @@ async def test_update_project_member_owner_role_returns_409(api_client, db_sessi
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -3035,6 +3124,7 @@ async def test_remove_project_member_non_owner_returns_403(api_client, db_sessio
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(non_owner)
     try:
         response = await api_client.delete(
@@ -3065,6 +3155,7 @@ async def test_remove_project_member_owner_membership_returns_409(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.delete(
@@ -3097,6 +3188,7 @@ async def test_leave_project_member_success_updates_group_flag(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(member)
     try:
         response = await api_client.post(f"/api/v1/projects/{project.id}/leave")
@@ -3168,6 +3260,7 @@ async def test_get_project_members_draft_anonymous_returns_404(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         response = await api_client.get(f"/api/v1/projects/{project.id}/members")
@@ -3198,6 +3291,7 @@ async def test_delete_project_owner_returns_204_and_hides_project_everywhere(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     app.dependency_overrides[get_current_user_optional] = lambda: owner
     try:
@@ -3247,6 +3341,7 @@ async def test_delete_project_is_idempotent_for_owner(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         first_response = await api_client.delete(f"/api/v1/projects/{project.id}")
@@ -3283,6 +3378,7 @@ async def test_delete_project_non_owner_returns_403(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(stranger)
     try:
         response = await api_client.delete(f"/api/v1/projects/{project.id}")
@@ -3310,6 +3406,7 @@ async def test_delete_project_missing_returns_404(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.delete(f"/api/v1/projects/{uuid4()}")
@@ -3341,6 +3438,7 @@ async def test_add_vote_soft_deleted_project_returns_404(api_client, db_session)
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         delete_response = await api_client.delete(f"/api/v1/projects/{project.id}")
@@ -3350,6 +3448,7 @@ async def test_add_vote_soft_deleted_project_returns_404(api_client, db_session)
     assert delete_response.status_code == 204
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(voter)
     try:
         vote_response = await api_client.post(f"/api/v1/projects/{project.id}/vote")
@@ -3385,6 +3484,7 @@ async def test_remove_vote_soft_deleted_project_returns_404(api_client, db_sessi
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(voter)
     try:
         add_vote_response = await api_client.post(f"/api/v1/projects/{project.id}/vote")
@@ -3393,6 +3493,7 @@ async def test_remove_vote_soft_deleted_project_returns_404(api_client, db_sessi
     assert add_vote_response.status_code == 204
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         delete_response = await api_client.delete(f"/api/v1/projects/{project.id}")
@@ -3401,6 +3502,7 @@ async def test_remove_vote_soft_deleted_project_returns_404(api_client, db_sessi
     assert delete_response.status_code == 204
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(voter)
     try:
         remove_vote_response = await api_client.delete(
@@ -3488,6 +3590,7 @@ async def test_add_project_member_concurrent_duplicate_requests_one_success_one_
         email = owner_email
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = lambda: CurrentUser()
     project_member_cols = getattr(ProjectMember, "__table__").c
     project_cols = getattr(Project, "__table__").c
@@ -3554,6 +3657,7 @@ async def test_update_project_member_role_does_not_change_group_flag(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         response = await api_client.patch(
@@ -3608,6 +3712,7 @@ async def test_get_project_members_smoke_with_large_member_count(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         start = perf_counter()
@@ -3638,6 +3743,7 @@ async def test_add_project_vote_idempotent_and_count_consistent(api_client, db_s
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(voter)
     try:
         first = await api_client.post(f"/api/v1/projects/{project.id}/vote")
@@ -3684,6 +3790,7 @@ async def test_remove_project_vote_idempotent_and_count_consistent(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(voter)
     try:
         first = await api_client.delete(f"/api/v1/projects/{project.id}/vote")
@@ -3721,6 +3828,7 @@ async def test_vote_endpoints_draft_project_returns_404(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(voter)
     try:
         add_response = await api_client.post(
@@ -3754,6 +3862,7 @@ async def test_vote_endpoints_and_my_votes_require_auth_integration(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         add_response = await api_client.post(f"/api/v1/projects/{project.id}/vote")
         remove_response = await api_client.delete(f"/api/v1/projects/{project.id}/vote")
@@ -3831,6 +3940,7 @@ async def test_my_votes_contract_order_cursor_and_filtering(api_client, db_sessi
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(voter)
     try:
         page_one = await api_client.get("/api/v1/users/me/votes?limit=2")
@@ -3888,6 +3998,7 @@ async def test_viewer_has_voted_project_endpoints_authenticated_vs_anonymous(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = _override_authed_user(viewer)
     try:
         list_response = await api_client.get("/api/v1/projects?sort=new&limit=10")
@@ -3915,6 +4026,7 @@ async def test_viewer_has_voted_project_endpoints_authenticated_vs_anonymous(
     assert user_items[str(unvoted_project.id)]["viewer_has_voted"] is False
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         anonymous_list = await api_client.get("/api/v1/projects?sort=new&limit=10")
@@ -3974,6 +4086,7 @@ async def test_team_size_in_detail_feed_user_projects_and_my_votes(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = _override_authed_user(viewer)
     app.dependency_overrides[get_current_user] = _override_authed_user(viewer)
     try:
@@ -4021,6 +4134,7 @@ async def test_team_size_updates_after_add_and_remove_member(api_client, db_sess
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     app.dependency_overrides[get_current_user_optional] = _override_authed_user(owner)
     try:
@@ -4108,6 +4222,7 @@ async def test_add_project_vote_concurrent_requests_one_effective_vote(
         email = voter_email
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = lambda: CurrentUser()
     project_cols = getattr(Project, "__table__").c
     vote_cols = getattr(Vote, "__table__").c
@@ -4171,6 +4286,7 @@ async def test_create_project_with_taxonomy_create_on_miss_and_canonical_reuse(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -4241,6 +4357,7 @@ async def test_update_project_taxonomy_omitted_replace_and_clear_semantics(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         create_response = await api_client.post(
@@ -4258,6 +4375,7 @@ async def test_update_project_taxonomy_omitted_replace_and_clear_semantics(
     project_id = create_response.json()["id"]
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         replace_response = await api_client.patch(
@@ -4274,6 +4392,7 @@ async def test_update_project_taxonomy_omitted_replace_and_clear_semantics(
     assert [term["name"] for term in replaced["tech_stack"]] == ["FastAPI"]
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         clear_response = await api_client.patch(
@@ -4300,6 +4419,7 @@ async def test_create_project_rejects_duplicate_taxonomy_terms(api_client, db_se
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -4322,6 +4442,7 @@ async def test_create_project_rejects_taxonomy_limit_exceeded(api_client, db_ses
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         response = await api_client.post(
@@ -4348,6 +4469,7 @@ async def test_update_project_taxonomy_rewrites_position_order_on_replace(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         create_response = await api_client.post(
@@ -4361,6 +4483,7 @@ async def test_update_project_taxonomy_rewrites_position_order_on_replace(
     project_id = create_response.json()["id"]
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(creator)
     try:
         update_response = await api_client.patch(
@@ -4402,6 +4525,7 @@ async def test_list_endpoints_include_taxonomy_payloads(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
         create_response = await api_client.post(
@@ -4432,6 +4556,7 @@ async def test_list_endpoints_include_taxonomy_payloads(api_client, db_session):
     assert created_project_slug is not None
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_optional] = _override_authed_user(owner)
     app.dependency_overrides[get_current_user] = _override_authed_user(owner)
     try:
@@ -4553,6 +4678,7 @@ async def test_create_project_taxonomy_create_on_miss_concurrency_converges_one_
     created_project_ids: list[str] = []
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = lambda: CurrentUser()
     try:
         try:
@@ -4693,6 +4819,7 @@ async def test_update_project_taxonomy_create_on_miss_concurrency_converges_one_
     user_cols = getattr(User, "__table__").c
     try:
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = lambda: CurrentUser()
         try:
             first_response, second_response = await asyncio.gather(
@@ -4800,6 +4927,7 @@ async def test_concurrent_create_normalization_variants_share_single_taxonomy_te
     created_project_ids: list[str] = []
     try:
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = lambda: CurrentUser()
         try:
             first_response, second_response = await asyncio.gather(
@@ -4914,6 +5042,7 @@ async def test_concurrent_cross_vocabulary_create_on_miss_is_independent(
     created_project_ids: list[str] = []
     try:
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = lambda: CurrentUser()
         try:
             category_response, tag_response, stack_response = await asyncio.gather(
@@ -5032,3 +5161,177 @@ async def test_concurrent_cross_vocabulary_create_on_miss_is_independent(
             )
             await cleanup_session.exec(delete(User).where(user_cols.id == owner_id))
             await cleanup_session.commit()
+
+
+async def _seed_budget_projects(
+    db_session, *, owner: User, count: int
+) -> list[Project]:
+    category = await _seed_taxonomy_term(
+        db_session, model=Category, name=f"Budget {uuid4().hex[:8]}"
+    )
+    tag = await _seed_taxonomy_term(
+        db_session, model=Tag, name=f"Budget {uuid4().hex[:8]}"
+    )
+    tech_stack = await _seed_taxonomy_term(
+        db_session, model=TechStack, name=f"Budget {uuid4().hex[:8]}"
+    )
+    projects = []
+    for index in range(count):
+        project = await _seed_project(
+            db_session,
+            created_by_id=owner.id,
+            title=f"Budget Project {uuid4().hex[:8]} {index}",
+            is_published=True,
+        )
+        await _seed_member(
+            db_session, project_id=project.id, user_id=owner.id, role="owner"
+        )
+        voter = await _seed_user(
+            db_session, f"budget_voter_{uuid4().hex[:8]}@ufl.edu", "Budget Voter"
+        )
+        await _seed_vote(db_session, project_id=project.id, user_id=voter.id)
+        join_now = datetime.now(timezone.utc)
+        db_session.add(
+            ProjectCategory(
+                project_id=project.id,
+                category_id=category.id,
+                position=0,
+                created_at=join_now,
+            )
+        )
+        db_session.add(
+            ProjectTag(
+                project_id=project.id, tag_id=tag.id, position=0, created_at=join_now
+            )
+        )
+        db_session.add(
+            ProjectTechStack(
+                project_id=project.id,
+                tech_stack_id=tech_stack.id,
+                position=0,
+                created_at=join_now,
+            )
+        )
+        projects.append(project)
+    await db_session.flush()
+    return projects
+
+
+# Budgets stay flat as the page grows; raising one needs a reason in review.
+_PROJECT_READ_QUERY_BUDGETS = [
+    ("list", lambda project: "/api/v1/projects?sort=new", 2),
+    ("search", lambda project: "/api/v1/projects/search?q=budget&sort=new", 2),
+    ("detail", lambda project: f"/api/v1/projects/{project.id}", 1),
+    ("detail_by_slug", lambda project: f"/api/v1/projects/slug/{project.slug}", 1),
+    ("members", lambda project: f"/api/v1/projects/{project.id}/members", 3),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("project_count", [2, 6])
+@pytest.mark.parametrize(
+    ("endpoint", "build_url", "budget"),
+    _PROJECT_READ_QUERY_BUDGETS,
+    ids=[entry[0] for entry in _PROJECT_READ_QUERY_BUDGETS],
+)
+async def test_project_read_endpoints_stay_within_query_budget(
+    api_client, db_session, project_count, endpoint, build_url, budget
+):
+    owner = await _seed_user(
+        db_session, f"budget_{uuid4().hex[:8]}@ufl.edu", "Budget Owner"
+    )
+    projects = await _seed_budget_projects(db_session, owner=owner, count=project_count)
+    # The app loads the taxonomy dictionary at startup.
+    await get_taxonomy_dictionary().load(db_session)
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_current_user_optional] = lambda: owner
+    try:
+        with assert_max_queries(budget):
+            response = await api_client.get(build_url(projects[0]))
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200, endpoint
+    assert response.headers["server-timing"].startswith("db;dur=")
+
+
+@pytest.mark.asyncio
+async def test_project_write_responses_match_a_fresh_detail_read(
+    api_client, db_session
+):
+    owner = await _seed_user(db_session, "write_through_owner@ufl.edu", "Owner")
+    teammate = await _seed_user(db_session, "write_through_mate@ufl.edu", "Mate")
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_current_user] = _override_authed_user(owner)
+    app.dependency_overrides[get_current_user_optional] = _override_authed_user(owner)
+
+    async def assert_matches_detail(response, expected_status: int = 200) -> dict:
+        assert response.status_code == expected_status
+        detail = await api_client.get(f"/api/v1/projects/{response.json()['id']}")
+        assert detail.status_code == 200
+        assert response.json() == detail.json()
+        return response.json()
+
+    try:
+        # Every statement is part of the write; the response needs no reads.
+        with assert_max_queries(10):
+            create_response = await api_client.post(
+                "/api/v1/projects",
+                json=_create_project_payload(
+                    title="Write Through",
+                    categories=["Write Through AI"],
+                    tags=["Write Through Py", "Write Through Go"],
+                ),
+            )
+        created = await assert_matches_detail(create_response, expected_status=201)
+        assert [term["name"] for term in created["tags"]] == [
+            "Write Through Py",
+            "Write Through Go",
+        ]
+        project_id = created["id"]
+
+        await _seed_member(
+            db_session, project_id=project_id, user_id=teammate.id, role="contributor"
+        )
+        patched = await assert_matches_detail(
+            await api_client.patch(
+                f"/api/v1/projects/{project_id}",
+                json={"title": "Write Through 2", "tech_stack": ["Write Through DB"]},
+            )
+        )
+        assert patched["team_size"] == 2
+        assert patched["categories"] == created["categories"]
+
+        published = await assert_matches_detail(
+            await api_client.post(f"/api/v1/projects/{project_id}/publish")
+        )
+        assert published["is_published"] is True
+        await assert_matches_detail(
+            await api_client.post(f"/api/v1/projects/{project_id}/publish")
+        )
+
+        await _seed_vote(db_session, project_id=project_id, user_id=owner.id)
+        voted = await assert_matches_detail(
+            await api_client.patch(
+                f"/api/v1/projects/{project_id}", json={"tags": ["Write Through Go"]}
+            )
+        )
+        assert voted["viewer_has_voted"] is True
+
+        unpublished = await assert_matches_detail(
+            await api_client.post(f"/api/v1/projects/{project_id}/unpublish")
+        )
+        assert unpublished["viewer_has_voted"] is False
+        assert unpublished["published_at"] is None
+    finally:
+        app.dependency_overrides.clear()
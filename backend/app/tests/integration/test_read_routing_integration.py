@@ -0,0 +1,140 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.read_routing import ReadRoutingSession
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.search import ProjectSearchRequest
+from app.services.search import PostgresSearchService
+from app.services.search_result_cache import SearchResultCache
+
+
+def _engine(url: str, application_name: str):
+    return create_async_engine(
+        url, connect_args={"server_settings": {"application_name": application_name}}
+    )
+
+
+async def _application_name(session: AsyncSession) -> str:
+    result = await session.exec(text("SELECT current_setting('application_name')"))
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_read_session_routes_between_replica_and_primary(database_urls):
+    primary = _engine(database_urls["async"], "gatorrank-primary")
+    replica = _engine(database_urls["async"], "gatorrank-replica")
+    sticky = {"primary": False}
+    session_factory = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ReadRoutingSession,
+        primary_bind=primary.sync_engine.execution_options(postgresql_readonly=True),
+        replica_bind=replica.sync_engine.execution_options(postgresql_readonly=True),
+        expire_on_commit=False,
+    )
+    try:
+        async with session_factory(prefer_primary=lambda: sticky["primary"]) as session:
+            assert await _application_name(session) == "gatorrank-replica"
+
+        sticky["primary"] = True
+        async with session_factory(prefer_primary=lambda: sticky["primary"]) as session:
+            assert await _application_name(session) == "gatorrank-primary"
+    finally:
+        await primary.dispose()
+        await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_session_rejects_writes(database_urls):
+    engine = _engine(database_urls["async"], "gatorrank-replica")
+    readonly_bind = engine.sync_engine.execution_options(postgresql_readonly=True)
+    session_factory = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ReadRoutingSession,
+        primary_bind=readonly_bind,
+        replica_bind=readonly_bind,
+    )
+    try:
+        async with session_factory() as session:
+            with pytest.raises(DBAPIError, match="read-only transaction"):
+                await session.exec(text("CREATE TEMP TABLE read_only_probe (id int)"))
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_search_result_cache_never_serves_or_stores_stale_replica_pages(
+    database_urls, db_session
+):
+    # Rows seeded in the test transaction are visible to the primary, which
+    # shares its connection, and not yet to the replica, which lags behind.
+    now = datetime.now(timezone.utc)
+    owner = User(
+        email="read-routing-search@ufl.edu",
+        username=f"user_{uuid4().hex[:10]}",
+        role="student",
+        created_at=now,
+        updated_at=now,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    keyword = f"replicalag{uuid4().hex[:8]}"
+    project = Project(
+        created_by_id=owner.id,
+        title="Replica lag project",
+        slug=f"replica-lag-{uuid4().hex[:8]}",
+        short_description=f"{keyword} match",
+        vote_count=0,
+        is_group_project=False,
+        is_published=True,
+        published_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+    db_session.add(project)
+    await db_session.flush()
+
+    replica = _engine(database_urls["async"], "gatorrank-replica")
+    sticky = {"primary": False}
+    session_factory = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ReadRoutingSession,
+        primary_bind=db_session.bind.sync_connection,
+        replica_bind=replica.sync_engine.execution_options(postgresql_readonly=True),
+        expire_on_commit=False,
+    )
+    cache = SearchResultCache(ttl_seconds=60, max_entries=16, replica_lag_seconds=60)
+
+    async def search() -> list:
+        async with session_factory(prefer_primary=lambda: sticky["primary"]) as session:
+            response = await PostgresSearchService(
+                session, result_cache=cache
+            ).search_projects(request=ProjectSearchRequest(q=keyword, sort="new"))
+        return [item.id for item in response.items]
+
+    try:
+        # With no write in sight, the replica's page is cached and reused.
+        assert await search() == []
+        assert await search() == []
+        assert cache.stats.hits == 1
+
+        # A recent writer reads the primary and skips the cached page.
+        sticky["primary"] = True
+        assert await search() == [project.id]
+        assert cache.stats.hits == 1
+
+        # The write drops the page, and replica pages read inside the lag
+        # window are not stored in its place.
+        cache.project_changed(project)
+        sticky["primary"] = False
+        assert await search() == []
+        assert await search() == []
+        assert cache.stats.hits == 1
+    finally:
+        await replica.dispose()
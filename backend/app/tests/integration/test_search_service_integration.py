@@ -1,14 +1,66 @@
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 
+from app.db.query_stats import track_queries
 from app.models.project import Project
 from app.models.project import Vote
 from app.models.user import User
+from app.schemas.project import ProjectUpdateRequest
 from app.schemas.search import ProjectSearchRequest
 from app.services.project import CursorError, ProjectService
-from app.services.search import PostgresSearchService
+from app.services.search import InMemorySearchService, PostgresSearchService
+from app.services.search_facet_cache import SearchFacetCache
+from app.services.search_index import ProjectSearchIndex
+from app.services.search_result_cache import SearchResultCache
+from app.services.taxonomy_bitmaps import TaxonomyBitmapIndex
+from app.services.taxonomy_dictionary import get_taxonomy_dictionary
+from app.services.vote import VoteService
+
+
+def _primary_sessions(db_session):
+    """Reload from the test transaction, which plays the primary."""
+
+    @asynccontextmanager
+    async def session():
+        yield db_session
+
+    return session
+
+
+@pytest.fixture(params=["postgres", "bitmap", "memory"])
+def make_search_service(request):
+    """Build each backend and taxonomy filter; all satisfy one search contract."""
+
+    def make(db_session, **kwargs):
+        # Rows are seeded and edited directly, which no cache hears about.
+        kwargs.setdefault(
+            "result_cache", SearchResultCache(ttl_seconds=0, max_entries=1)
+        )
+        # Max age 0 rebuilds per search, so rows seeded mid-test are seen.
+        if request.param == "memory":
+            return InMemorySearchService(
+                db_session,
+                search_index=ProjectSearchIndex(
+                    max_age_seconds=0, session_factory=_primary_sessions(db_session)
+                ),
+                **kwargs,
+            )
+        if request.param == "bitmap":
+            return PostgresSearchService(
+                db_session,
+                taxonomy_bitmaps=TaxonomyBitmapIndex(
+                    max_age_seconds=0, session_factory=_primary_sessions(db_session)
+                ),
+                taxonomy_filter="bitmap",
+                **kwargs,
+            )
+        return PostgresSearchService(db_session, **kwargs)
+
+    return make
 
 
 async def _seed_user(db_session, email: str) -> User:
@@ -56,7 +108,9 @@ async def _seed_project(
 
 
 @pytest.mark.asyncio
-async def test_search_projects_keyword_matches_title_and_short_description(db_session):
+async def test_search_projects_keyword_matches_title_and_short_description(
+    db_session, make_search_service
+):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-keyword@ufl.edu")
     title_match = await _seed_project(
@@ -84,7 +138,7 @@ async def test_search_projects_keyword_matches_title_and_short_description(db_se
         created_at=now - timedelta(minutes=2),
     )
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     response = await service.search_projects(
         request=ProjectSearchRequest(q="  GATOR  ", sort="new")
     )
@@ -96,7 +150,9 @@ async def test_search_projects_keyword_matches_title_and_short_description(db_se
 
 
 @pytest.mark.asyncio
-async def test_search_projects_new_orders_by_published_at_not_created_at(db_session):
+async def test_search_projects_new_orders_by_published_at_not_created_at(
+    db_session, make_search_service
+):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-new-published-order@ufl.edu")
     first_created = await _seed_project(
@@ -119,7 +175,7 @@ async def test_search_projects_new_orders_by_published_at_not_created_at(db_sess
     second_created.published_at = now - timedelta(minutes=3)
     await db_session.flush()
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     response = await service.search_projects(
         request=ProjectSearchRequest(q="published sort", sort="new")
     )
@@ -128,7 +184,9 @@ async def test_search_projects_new_orders_by_published_at_not_created_at(db_sess
 
 
 @pytest.mark.asyncio
-async def test_search_projects_taxonomy_or_within_and_across_families(db_session):
+async def test_search_projects_taxonomy_or_within_and_across_families(
+    db_session, make_search_service
+):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-taxonomy@ufl.edu")
     match_all = await _seed_project(
@@ -180,7 +238,7 @@ async def test_search_projects_taxonomy_or_within_and_across_families(db_session
     )
     await db_session.flush()
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     response = await service.search_projects(
         request=ProjectSearchRequest(
             categories=["ai"],
@@ -197,7 +255,43 @@ async def test_search_projects_taxonomy_or_within_and_across_families(db_session
 
 
 @pytest.mark.asyncio
-async def test_search_projects_cursor_is_bound_to_search_context(db_session):
+async def test_search_taxonomy_filters_resolve_from_the_dictionary(
+    db_session, make_search_service
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-dictionary@ufl.edu")
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Dictionary match",
+        short_description="Resolved without a term lookup",
+        vote_count=1,
+        created_at=now,
+    )
+    await ProjectService(db_session)._replace_project_taxonomy_assignments(
+        project_id=project.id,
+        categories=None,
+        tags=["Dictionary Tag"],
+        tech_stack=None,
+        taxonomy_principal=owner,
+    )
+    await db_session.flush()
+    await get_taxonomy_dictionary().load(db_session)
+
+    with track_queries(keep_statements=True) as stats:
+        response = await make_search_service(db_session).search_projects(
+            request=ProjectSearchRequest(tags=["dictionary tag"], sort="new")
+        )
+
+    assert [item.id for item in response.items] == [project.id]
+    assert [term.name for term in response.items[0].tags] == ["Dictionary Tag"]
+    assert not any("FROM tags" in statement for statement in stats.statements)
+
+
+@pytest.mark.asyncio
+async def test_search_projects_cursor_is_bound_to_search_context(
+    db_session, make_search_service
+):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-cursor-context@ufl.edu")
     await _seed_project(
@@ -217,7 +311,7 @@ async def test_search_projects_cursor_is_bound_to_search_context(db_session):
         created_at=now - timedelta(minutes=1),
     )
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     first_page = await service.search_projects(
         request=ProjectSearchRequest(q="alpha", sort="new", limit=1)
     )
@@ -235,7 +329,9 @@ async def test_search_projects_cursor_is_bound_to_search_context(db_session):
 
 
 @pytest.mark.asyncio
-async def test_search_projects_top_default_window_excludes_old_projects(db_session):
+async def test_search_projects_top_default_window_excludes_old_projects(
+    db_session, make_search_service
+):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-top-window@ufl.edu")
     recent = await _seed_project(
@@ -255,7 +351,7 @@ async def test_search_projects_top_default_window_excludes_old_projects(db_sessi
         created_at=now - timedelta(days=150),
     )
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     response = await service.search_projects(
         request=ProjectSearchRequest(q="window search", sort="top")
     )
@@ -266,6 +362,7 @@ async def test_search_projects_top_default_window_excludes_old_projects(db_sessi
 @pytest.mark.asyncio
 async def test_search_projects_keyword_special_chars_are_treated_as_literals(
     db_session,
+    make_search_service,
 ):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-keyword-literals@ufl.edu")
@@ -286,7 +383,7 @@ async def test_search_projects_keyword_special_chars_are_treated_as_literals(
         created_at=now - timedelta(minutes=1),
     )
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     response = await service.search_projects(
         request=ProjectSearchRequest(q="% coverage _guide\\", sort="new")
     )
@@ -295,7 +392,9 @@ async def test_search_projects_keyword_special_chars_are_treated_as_literals(
 
 
 @pytest.mark.asyncio
-async def test_search_projects_top_cursor_continuity_and_range_mismatch(db_session):
+async def test_search_projects_top_cursor_continuity_and_range_mismatch(
+    db_session, make_search_service
+):
     now = datetime.now(UTC)
     owner = await _seed_user(db_session, "search-top-cursor-window@ufl.edu")
     first = await _seed_project(
@@ -323,7 +422,7 @@ async def test_search_projects_top_cursor_continuity_and_range_mismatch(db_sessi
         created_at=now - timedelta(days=3),
     )
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     page_one = await service.search_projects(
         request=ProjectSearchRequest(q="top cursor", sort="top", limit=2)
     )
@@ -356,6 +455,7 @@ async def test_search_projects_top_cursor_continuity_and_range_mismatch(db_sessi
 @pytest.mark.asyncio
 async def test_search_projects_filter_truth_table_or_within_and_across_families(
     db_session,
+    make_search_service,
 ):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-filter-matrix@ufl.edu")
@@ -407,7 +507,7 @@ async def test_search_projects_filter_truth_table_or_within_and_across_families(
     )
     await db_session.flush()
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     tags_only = await service.search_projects(
         request=ProjectSearchRequest(tags=["python", "rust"], sort="new")
     )
@@ -422,7 +522,63 @@ async def test_search_projects_filter_truth_table_or_within_and_across_families(
 
 
 @pytest.mark.asyncio
-async def test_search_projects_unknown_term_mixed_filter_behavior(db_session):
+async def test_search_projects_match_all_requires_every_term_in_a_family(
+    db_session,
+    make_search_service,
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-match-all@ufl.edu")
+    both = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Match both",
+        short_description="tags python and rust",
+        vote_count=10,
+        created_at=now,
+    )
+    python_only = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Match python",
+        short_description="tag python",
+        vote_count=9,
+        created_at=now - timedelta(minutes=1),
+    )
+    project_service = ProjectService(db_session)
+    await project_service._replace_project_taxonomy_assignments(
+        project_id=both.id,
+        categories=["AI"],
+        tags=["Python", "Rust"],
+        tech_stack=[],
+        taxonomy_principal=owner,
+    )
+    await project_service._replace_project_taxonomy_assignments(
+        project_id=python_only.id,
+        categories=["AI", "Web"],
+        tags=["Python"],
+        tech_stack=[],
+        taxonomy_principal=owner,
+    )
+    await db_session.flush()
+
+    service = make_search_service(db_session)
+
+    async def ids(**filters) -> list:
+        response = await service.search_projects(
+            request=ProjectSearchRequest(sort="new", match="all", **filters)
+        )
+        return [item.id for item in response.items]
+
+    assert await ids(tags=["python", "rust"]) == [both.id]
+    assert await ids(tags=["python"], categories=["ai", "web"]) == [python_only.id]
+    assert await ids(tags=["python", "rust"], categories=["web"]) == []
+    assert await ids(tags=["python", "no-such-tag"]) == []
+
+
+@pytest.mark.asyncio
+async def test_search_projects_unknown_term_mixed_filter_behavior(
+    db_session, make_search_service
+):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-unknown-mixed@ufl.edu")
     match = await _seed_project(
@@ -443,7 +599,7 @@ async def test_search_projects_unknown_term_mixed_filter_behavior(db_session):
     )
     await db_session.flush()
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     mixed = await service.search_projects(
         request=ProjectSearchRequest(tags=["python", "no-such-tag"], sort="new")
     )
@@ -462,6 +618,7 @@ async def test_search_projects_unknown_term_mixed_filter_behavior(db_session):
 @pytest.mark.asyncio
 async def test_search_projects_viewer_has_voted_differs_for_authenticated_user(
     db_session,
+    make_search_service,
 ):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-voted-owner@ufl.edu")
@@ -485,7 +642,7 @@ async def test_search_projects_viewer_has_voted_differs_for_authenticated_user(
     db_session.add(Vote(user_id=voter.id, project_id=voted.id, created_at=now))
     await db_session.flush()
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     anonymous = await service.search_projects(
         request=ProjectSearchRequest(q="viewer vote check", sort="new")
     )
@@ -503,7 +660,9 @@ async def test_search_projects_viewer_has_voted_differs_for_authenticated_user(
 
 
 @pytest.mark.asyncio
-async def test_search_projects_excludes_soft_deleted_matches(db_session):
+async def test_search_projects_excludes_soft_deleted_matches(
+    db_session, make_search_service
+):
     now = datetime.now(timezone.utc)
     owner = await _seed_user(db_session, "search-soft-delete@ufl.edu")
     visible = await _seed_project(
@@ -526,9 +685,648 @@ async def test_search_projects_excludes_soft_deleted_matches(db_session):
     db_session.add(deleted)
     await db_session.flush()
 
-    service = PostgresSearchService(db_session)
+    service = make_search_service(db_session)
     response = await service.search_projects(
         request=ProjectSearchRequest(q="deleted scope", sort="new")
     )
 
     assert [item.id for item in response.items] == [visible.id]
+
+
+@pytest.mark.asyncio
+async def test_search_relevance_ranks_weighted_full_text_matches(
+    db_session, make_search_service
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-relevance@ufl.edu")
+    title_match = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Gator Robotics Lab",
+        short_description="Autonomous rovers",
+        vote_count=0,
+        created_at=now - timedelta(days=400),
+    )
+    summary_match = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Campus rover",
+        short_description="Built by the robotic club",
+        vote_count=50,
+        created_at=now,
+    )
+    long_match = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Field notes",
+        short_description="Sensor logs",
+        vote_count=90,
+        created_at=now,
+    )
+    long_match.long_description = "Telemetry collected during robotics practice."
+    await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Robot-free zone",
+        short_description="Gardening planner",
+        vote_count=100,
+        created_at=now,
+    )
+    await db_session.flush()
+
+    service = make_search_service(db_session)
+    response = await service.search_projects(
+        request=ProjectSearchRequest(q="robotics -gardening", sort="relevance")
+    )
+
+    # Stemming matches "robotic" and "Robot"; the negated term drops the last
+    # project. Dates and votes play no part in the order.
+    assert [item.id for item in response.items] == [
+        title_match.id,
+        summary_match.id,
+        long_match.id,
+    ]
+
+    # The generated column follows writes without any application code.
+    title_match.title = "Gator Lab"
+    await db_session.flush()
+    response = await service.search_projects(
+        request=ProjectSearchRequest(q="robotics -gardening", sort="relevance")
+    )
+
+    assert [item.id for item in response.items] == [summary_match.id, long_match.id]
+
+
+@pytest.mark.asyncio
+async def test_search_relevance_cursor_pages_through_tied_ranks(
+    db_session, make_search_service
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-relevance-cursor@ufl.edu")
+    projects = [
+        await _seed_project(
+            db_session,
+            created_by_id=owner.id,
+            title=f"Swamp sensor {index}",
+            short_description="Water quality" if index % 2 else "Swamp water",
+            vote_count=index,
+            created_at=now,
+        )
+        for index in range(5)
+    ]
+
+    service = make_search_service(db_session)
+    seen = []
+    cursor = None
+    while True:
+        page = await service.search_projects(
+            request=ProjectSearchRequest(
+                q="swamp", sort="relevance", limit=2, cursor=cursor
+            )
+        )
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    swamp_twice = sorted((p.id for p in projects[::2]), reverse=True)
+    swamp_once = sorted((p.id for p in projects[1::2]), reverse=True)
+    assert seen == swamp_twice + swamp_once
+
+    first_page = await service.search_projects(
+        request=ProjectSearchRequest(q="swamp", sort="relevance", limit=2)
+    )
+    assert first_page.next_cursor is not None
+    with pytest.raises(CursorError, match="Cursor does not match requested search"):
+        await service.search_projects(
+            request=ProjectSearchRequest(
+                q="sensor", sort="relevance", limit=2, cursor=first_page.next_cursor
+            )
+        )
+    with pytest.raises(CursorError, match="Invalid cursor"):
+        await service.search_projects(
+            request=ProjectSearchRequest(
+                q="swamp", sort="new", limit=2, cursor=first_page.next_cursor
+            )
+        )
+
+
+async def _seed_scheduler_projects(db_session, email: str):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, email)
+    title_match = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Course Scheduler",
+        short_description="Plan semesters",
+        vote_count=0,
+        created_at=now - timedelta(days=400),
+    )
+    summary_match = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Study Planner",
+        short_description="Exam schedule builder",
+        vote_count=40,
+        created_at=now,
+    )
+    await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Gator Rank",
+        short_description="Vote on projects",
+        vote_count=90,
+        created_at=now,
+    )
+    return owner, title_match, summary_match
+
+
+@pytest.mark.asyncio
+async def test_search_similarity_tolerates_typos_and_orders_by_score(
+    db_session, make_search_service
+):
+    _, title_match, summary_match = await _seed_scheduler_projects(
+        db_session, "search-similarity@ufl.edu"
+    )
+
+    service = make_search_service(db_session, similarity_threshold=0.5)
+    exact = await service.search_projects(
+        request=ProjectSearchRequest(q="Scheduler", sort="similarity")
+    )
+    typo = await service.search_projects(
+        request=ProjectSearchRequest(q="scheduelr", sort="similarity")
+    )
+    strict = await make_search_service(
+        db_session, similarity_threshold=0.9
+    ).search_projects(request=ProjectSearchRequest(q="scheduler", sort="similarity"))
+
+    assert [item.id for item in exact.items] == [title_match.id, summary_match.id]
+    assert {item.id for item in typo.items} == {title_match.id, summary_match.id}
+    assert typo.suggestions == []
+    assert [item.id for item in strict.items] == [title_match.id]
+
+
+@pytest.mark.asyncio
+async def test_search_similarity_cursor_pages_in_score_order(
+    db_session, make_search_service
+):
+    _, title_match, summary_match = await _seed_scheduler_projects(
+        db_session, "search-similarity-cursor@ufl.edu"
+    )
+
+    service = make_search_service(db_session, similarity_threshold=0.5)
+    first_page = await service.search_projects(
+        request=ProjectSearchRequest(q="scheduler", sort="similarity", limit=1)
+    )
+    assert first_page.next_cursor is not None
+    second_page = await service.search_projects(
+        request=ProjectSearchRequest(
+            q="scheduler", sort="similarity", limit=1, cursor=first_page.next_cursor
+        )
+    )
+
+    assert [item.id for item in first_page.items] == [title_match.id]
+    assert [item.id for item in second_page.items] == [summary_match.id]
+    assert second_page.next_cursor is None
+    with pytest.raises(CursorError, match="does not match requested sort"):
+        await service.search_projects(
+            request=ProjectSearchRequest(
+                q="scheduler", sort="relevance", cursor=first_page.next_cursor
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_search_empty_keyword_results_suggest_similar_titles_and_terms(
+    db_session,
+    make_search_service,
+):
+    owner, title_match, _ = await _seed_scheduler_projects(
+        db_session, "search-suggestions@ufl.edu"
+    )
+    await ProjectService(db_session)._replace_project_taxonomy_assignments(
+        project_id=title_match.id,
+        categories=[],
+        tags=["Scheduling"],
+        tech_stack=[],
+        taxonomy_principal=owner,
+    )
+    draft = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Schedulr Draft",
+        short_description="Not published",
+        vote_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+    draft.is_published = False
+    await db_session.flush()
+
+    service = make_search_service(db_session, similarity_threshold=0.5)
+    response = await service.search_projects(
+        request=ProjectSearchRequest(q="scheduelr", sort="new")
+    )
+
+    assert response.items == []
+    assert response.suggestions == ["Course Scheduler", "Scheduling"]
+
+
+@pytest.mark.asyncio
+async def test_search_facets_count_every_match_and_are_reused_across_pages(
+    db_session,
+    make_search_service,
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-facets@ufl.edu")
+    keyword = f"facet{uuid4().hex[:8]}"
+    assignments = [
+        (["Facet AI"], ["Facet Python", "Facet Web"], ["Facet Postgres"]),
+        (["Facet AI"], ["Facet Python"], []),
+        (["Facet Games"], ["Facet Rust"], ["Facet Postgres"]),
+    ]
+    project_service = ProjectService(db_session)
+    for index, (categories, tags, tech_stack) in enumerate(assignments):
+        project = await _seed_project(
+            db_session,
+            created_by_id=owner.id,
+            title=f"Facet project {index}",
+            short_description=f"{keyword} match {index}",
+            vote_count=10 - index,
+            created_at=now - timedelta(minutes=index),
+        )
+        await project_service._replace_project_taxonomy_assignments(
+            project_id=project.id,
+            categories=categories,
+            tags=tags,
+            tech_stack=tech_stack,
+            taxonomy_principal=owner,
+        )
+    await db_session.flush()
+
+    service = make_search_service(db_session)
+    first_page = await service.search_projects(
+        request=ProjectSearchRequest(q=keyword, sort="new", limit=1, facets=True)
+    )
+    assert len(first_page.items) == 1
+    assert first_page.facets is not None
+    assert [(f.name, f.count) for f in first_page.facets.categories] == [
+        ("Facet AI", 2),
+        ("Facet Games", 1),
+    ]
+    assert [(f.name, f.count) for f in first_page.facets.tags] == [
+        ("Facet Python", 2),
+        ("Facet Rust", 1),
+        ("Facet Web", 1),
+    ]
+    assert [(f.name, f.count) for f in first_page.facets.tech_stack] == [
+        ("Facet Postgres", 2)
+    ]
+
+    with track_queries(keep_statements=True) as stats:
+        second_page = await service.search_projects(
+            request=ProjectSearchRequest(
+                q=keyword,
+                sort="new",
+                limit=1,
+                cursor=first_page.next_cursor,
+                facets=True,
+            )
+        )
+    assert second_page.facets == first_page.facets
+    assert not any("matched_projects" in sql for sql in stats.statements)
+
+    filtered = await service.search_projects(
+        request=ProjectSearchRequest(
+            q=keyword, tags=["facet python"], sort="new", facets=True
+        )
+    )
+    assert filtered.facets is not None
+    assert [(f.name, f.count) for f in filtered.facets.categories] == [("Facet AI", 2)]
+
+    without_facets = await service.search_projects(
+        request=ProjectSearchRequest(q=keyword, sort="new")
+    )
+    assert without_facets.facets is None
+
+
+@pytest.mark.asyncio
+async def test_search_facets_are_capped_per_family(
+    db_session, make_search_service, monkeypatch
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-facet-cap@ufl.edu")
+    keyword = f"facetcap{uuid4().hex[:8]}"
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Facet cap project",
+        short_description=f"{keyword} match",
+        vote_count=1,
+        created_at=now,
+    )
+    await ProjectService(db_session)._replace_project_taxonomy_assignments(
+        project_id=project.id,
+        categories=None,
+        tags=[f"Cap tag {index}" for index in range(5)],
+        tech_stack=None,
+        taxonomy_principal=owner,
+    )
+    await db_session.flush()
+    monkeypatch.setattr(PostgresSearchService, "_FACET_LIMIT_PER_FAMILY", 2)
+
+    response = await make_search_service(db_session).search_projects(
+        request=ProjectSearchRequest(q=keyword, sort="new", facets=True)
+    )
+
+    assert response.facets is not None
+    assert len(response.facets.tags) == 2
+    assert response.facets.categories == []
+
+
+@pytest.mark.asyncio
+async def test_search_facets_follow_project_writes(db_session):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-facet-writes@ufl.edu")
+    keyword = f"facetwrite{uuid4().hex[:8]}"
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Facet write project",
+        short_description=f"{keyword} match",
+        vote_count=0,
+        created_at=now,
+    )
+    project.demo_url = "https://example.com/demo"
+    await db_session.flush()
+
+    facet_cache = SearchFacetCache(ttl_seconds=60, max_entries=16)
+    search = PostgresSearchService(db_session, facet_cache=facet_cache)
+    projects = ProjectService(db_session, facet_cache=facet_cache)
+
+    async def tag_counts() -> list[tuple[str, int]]:
+        response = await search.search_projects(
+            request=ProjectSearchRequest(q=keyword, sort="new", facets=True)
+        )
+        assert response.facets is not None
+        return [(facet.name, facet.count) for facet in response.facets.tags]
+
+    assert await tag_counts() == []
+
+    await projects.update_project(
+        project_id=project.id,
+        current_user_id=owner.id,
+        payload=ProjectUpdateRequest(tags=["Facet Write Tag"]),
+    )
+    assert await tag_counts() == [("Facet Write Tag", 1)]
+
+    await projects.unpublish_project(project_id=project.id, current_user_id=owner.id)
+    assert await tag_counts() == []
+
+    await projects.publish_project(project_id=project.id, current_user_id=owner.id)
+    assert await tag_counts() == [("Facet Write Tag", 1)]
+
+
+@pytest.mark.asyncio
+async def test_search_facets_read_before_a_clear_are_not_cached(
+    db_session, monkeypatch
+):
+    owner = await _seed_user(db_session, "search-facet-race@ufl.edu")
+    keyword = f"facetrace{uuid4().hex[:8]}"
+    await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Facet race project",
+        short_description=f"{keyword} match",
+        vote_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+    facet_cache = SearchFacetCache(ttl_seconds=60, max_entries=16)
+    search = PostgresSearchService(db_session, facet_cache=facet_cache)
+    terms_by_id = search.taxonomy_dictionary.terms_by_id
+
+    async def terms_by_id_across_a_write(*args, **kwargs):
+        # A project write clears the cache after the counts were read.
+        facet_cache.clear()
+        return await terms_by_id(*args, **kwargs)
+
+    monkeypatch.setattr(
+        search.taxonomy_dictionary, "terms_by_id", terms_by_id_across_a_write
+    )
+    request = ProjectSearchRequest(q=keyword, sort="new", facets=True)
+    await search.search_projects(request=request)
+    monkeypatch.undo()
+
+    with track_queries(keep_statements=True) as stats:
+        await search.search_projects(request=request)
+    assert any("matched_projects" in sql for sql in stats.statements)
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_project_vote_and_publish_events(db_session):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-index-events@ufl.edu")
+    voter = await _seed_user(db_session, "search-index-voter@ufl.edu")
+    leader = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Index leader",
+        short_description="Indexed from the start",
+        vote_count=1,
+        created_at=now - timedelta(minutes=1),
+    )
+    draft = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Index draft",
+        short_description="Published later",
+        vote_count=0,
+        created_at=now - timedelta(minutes=2),
+    )
+    draft.is_published = False
+    draft.published_at = None
+    draft.demo_url = "https://example.com/demo"
+    await db_session.flush()
+
+    index = ProjectSearchIndex(max_age_seconds=3600)
+    await index.load(db_session)
+    search = InMemorySearchService(db_session, search_index=index)
+    projects = ProjectService(db_session, search_index=index)
+    votes = VoteService(db_session, search_index=index)
+
+    async def top_titles(q: str | None = None) -> list[str]:
+        with track_queries(keep_statements=True) as stats:
+            response = await search.search_projects(
+                request=ProjectSearchRequest(q=q, sort="top")
+            )
+        # Only card hydration of a non-empty page reads Postgres.
+        assert stats.count == (1 if response.items else 0)
+        return [item.title for item in response.items]
+
+    assert await top_titles() == ["Index leader"]
+
+    await projects.publish_project(project_id=draft.id, current_user_id=owner.id)
+    await votes.add_vote(project_id=draft.id, user_id=voter.id)
+    await votes.add_vote(project_id=draft.id, user_id=owner.id)
+    assert await top_titles() == ["Index draft", "Index leader"]
+
+    await votes.remove_vote(project_id=draft.id, user_id=voter.id)
+    await votes.remove_vote(project_id=draft.id, user_id=owner.id)
+    assert await top_titles() == ["Index leader", "Index draft"]
+
+    await projects.update_project(
+        project_id=draft.id,
+        current_user_id=owner.id,
+        payload=ProjectUpdateRequest(title="Renamed entry"),
+    )
+    assert await top_titles("renamed") == ["Renamed entry"]
+    stale = await search.search_projects(
+        request=ProjectSearchRequest(q="index draft", sort="top")
+    )
+    assert stale.items == []
+
+    await projects.unpublish_project(project_id=draft.id, current_user_id=owner.id)
+    await projects.soft_delete_project(leader.id, owner.id)
+    assert await top_titles() == []
+
+
+@pytest.mark.asyncio
+async def test_taxonomy_bitmaps_follow_project_taxonomy_writes(db_session):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-bitmap-events@ufl.edu")
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Bitmap project",
+        short_description="Tagged after load",
+        vote_count=0,
+        created_at=now,
+    )
+    project.demo_url = "https://example.com/demo"
+    await db_session.flush()
+
+    bitmaps = TaxonomyBitmapIndex(max_age_seconds=3600)
+    await bitmaps.load(db_session)
+    search = PostgresSearchService(
+        db_session, taxonomy_bitmaps=bitmaps, taxonomy_filter="bitmap"
+    )
+    projects = ProjectService(db_session, taxonomy_bitmaps=bitmaps)
+
+    async def tagged(tag: str) -> list[str]:
+        with track_queries(keep_statements=True) as stats:
+            response = await search.search_projects(
+                request=ProjectSearchRequest(tags=[tag], sort="new")
+            )
+        # Terms resolve in memory: no join-table EXISTS, no term-id lookup.
+        assert not any("EXISTS" in statement for statement in stats.statements)
+        return [item.title for item in response.items]
+
+    assert await tagged("bitmap tag") == []
+
+    await projects.update_project(
+        project_id=project.id,
+        current_user_id=owner.id,
+        payload=ProjectUpdateRequest(tags=["Bitmap Tag"]),
+    )
+    assert await tagged("bitmap tag") == ["Bitmap project"]
+
+    await projects.unpublish_project(project_id=project.id, current_user_id=owner.id)
+    assert await tagged("bitmap tag") == []
+
+    await projects.publish_project(project_id=project.id, current_user_id=owner.id)
+    assert await tagged("bitmap tag") == ["Bitmap project"]
+
+
+@pytest.mark.asyncio
+async def test_taxonomy_bitmap_reloads_are_shared_by_concurrent_searches(
+    db_session,
+):
+    owner = await _seed_user(db_session, "search-bitmap-reload@ufl.edu")
+    project = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Shared reload project",
+        short_description="Tagged before load",
+        vote_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+    await ProjectService(db_session)._replace_project_taxonomy_assignments(
+        project_id=project.id,
+        categories=None,
+        tags=["Shared Reload"],
+        tech_stack=None,
+        taxonomy_principal=owner,
+    )
+    await db_session.flush()
+
+    bitmaps = TaxonomyBitmapIndex(
+        max_age_seconds=3600, session_factory=_primary_sessions(db_session)
+    )
+    with track_queries() as stats:
+        await asyncio.gather(*(bitmaps.ensure_fresh() for _ in range(3)))
+
+    assert stats.count == 1
+    assert bitmaps.match({"tags": ("shared reload",)}, match_all=False) == [project.id]
+
+
+@pytest.mark.asyncio
+async def test_search_result_cache_skips_the_search_query_and_follows_writes(
+    db_session,
+):
+    now = datetime.now(timezone.utc)
+    owner = await _seed_user(db_session, "search-result-cache@ufl.edu")
+    voter = await _seed_user(db_session, "search-result-cache-voter@ufl.edu")
+    leader = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Cached leader",
+        short_description="Cached page",
+        vote_count=1,
+        created_at=now - timedelta(minutes=1),
+    )
+    runner = await _seed_project(
+        db_session,
+        created_by_id=owner.id,
+        title="Cached runner",
+        short_description="Cached page",
+        vote_count=0,
+        created_at=now - timedelta(minutes=2),
+    )
+    await db_session.flush()
+
+    cache = SearchResultCache(ttl_seconds=60, max_entries=16)
+    search = PostgresSearchService(db_session, result_cache=cache)
+    projects = ProjectService(db_session, result_cache=cache)
+    votes = VoteService(db_session, result_cache=cache)
+
+    async def page(sort: str, viewer_id=None):
+        with track_queries() as stats:
+            response = await search.search_projects(
+                request=ProjectSearchRequest(q="cached", sort=sort),
+                current_user_id=viewer_id,
+            )
+        return response, stats.count
+
+    first, _ = await page("top")
+    await page("new")
+    cached, query_count = await page("top", viewer_id=voter.id)
+
+    # One round trip for the cards; the filter and sort query is skipped.
+    assert query_count == 1
+    assert [item.id for item in cached.items] == [item.id for item in first.items]
+    assert [item.id for item in cached.items] == [leader.id, runner.id]
+
+    await votes.add_vote(project_id=runner.id, user_id=voter.id)
+    await votes.add_vote(project_id=runner.id, user_id=owner.id)
+
+    reordered, query_count = await page("top", viewer_id=voter.id)
+    assert query_count == 2
+    assert [item.id for item in reordered.items] == [runner.id, leader.id]
+    assert reordered.items[0].viewer_has_voted is True
+    # A vote cannot reorder `new`, so that page is still cached, with fresh cards.
+    by_date, query_count = await page("new")
+    assert query_count == 1
+    assert [item.vote_count for item in by_date.items] == [1, 2]
+
+    await projects.unpublish_project(project_id=runner.id, current_user_id=owner.id)
+    remaining, _ = await page("top")
+    assert [item.id for item in remaining.items] == [leader.id]
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.slow_query import SlowQueryLog, install_slow_query_log
+
+
+@pytest.mark.asyncio
+async def test_sampled_slow_query_captures_explain_analyze_plan(database_urls):
+    lines: list[str] = []
+    engine = create_async_engine(database_urls["async"])
+    install_slow_query_log(
+        engine,
+        SlowQueryLog(
+            threshold_ms=0.001,
+            explain_sample_rate=1.0,
+            explain_writer=lines.append,
+        ),
+    )
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(
+                text("SELECT count(*) FROM users WHERE email LIKE :pattern"),
+                {"pattern": "%@ufl.edu"},
+            )
+            assert result.scalar_one() >= 0
+            # The caller's transaction is still usable after the EXPLAIN.
+            assert (await connection.execute(text("SELECT 1"))).scalar_one() == 1
+    finally:
+        await engine.dispose()
+
+    entries = [json.loads(line) for line in lines]
+    plan_entry = next(entry for entry in entries if "FROM users" in entry["statement"])
+    plan = plan_entry["plan"][0]
+    assert "Plan" in plan
+    assert "Execution Time" in plan
+    assert plan_entry["parameter_shapes"] == ["str[9]"]
+
+
+@pytest.mark.asyncio
+async def test_failed_explain_does_not_abort_caller_transaction(
+    database_urls, monkeypatch
+):
+    engine = create_async_engine(database_urls["async"])
+    install_slow_query_log(
+        engine,
+        SlowQueryLog(
+            threshold_ms=0.001,
+            explain_sample_rate=1.0,
+            explain_writer=lambda _line: None,
+        ),
+    )
+    monkeypatch.setattr("app.db.slow_query._EXPLAIN_OPTIONS", "NOT_AN_OPTION")
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert (await connection.execute(text("SELECT 2"))).scalar_one() == 2
+    finally:
+        await engine.dispose()
@@ -1,16 +1,26 @@
+import asyncio
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlmodel import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
 from app.api.deps.auth import get_current_user
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.main import app
 from app.models.taxonomy import Category, Tag, TechStack
 from app.models.user import User
+from app.schemas.taxonomy import TaxonomyTermCreateRequest
+from app.services.taxonomy import TaxonomyService
+from app.services.taxonomy_dictionary import (
+    TaxonomyChangeListener,
+    TaxonomyDictionary,
+)
+from app.tests.query_budget import assert_max_queries
 
 
 @pytest_asyncio.fixture
@@ -68,6 +78,7 @@ async def test_list_categories_requires_auth(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get("/api/v1/taxonomy/categories")
     finally:
@@ -89,6 +100,7 @@ async def test_list_categories_returns_full_alphabetical_list(api_client, db_ses
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(viewer)
     try:
         response = await api_client.get("/api/v1/taxonomy/categories")
@@ -109,6 +121,7 @@ async def test_create_category_requires_admin(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(viewer)
     try:
         response = await api_client.post(
@@ -132,6 +145,7 @@ async def test_create_category_admin_success_and_normalized_persisted(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(admin)
     try:
         response = await api_client.post(
@@ -163,6 +177,7 @@ async def test_create_category_duplicate_returns_409(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(admin)
     try:
         response = await api_client.post(
@@ -189,6 +204,7 @@ async def test_create_category_duplicate_preserves_existing_display_casing(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(admin)
     try:
         response = await api_client.post(
@@ -214,6 +230,7 @@ async def test_create_category_rejects_control_characters(api_client, db_session
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(admin)
     try:
         response = await api_client.post(
@@ -236,6 +253,7 @@ async def test_create_category_rejects_c1_control_characters(api_client, db_sess
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(admin)
     try:
         response = await api_client.post(
@@ -265,6 +283,7 @@ async def test_create_tags_and_tech_stacks_match_admin_and_conflict_rules(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(student)
     try:
         non_admin_tag = await api_client.post(
@@ -282,6 +301,7 @@ async def test_create_tags_and_tech_stacks_match_admin_and_conflict_rules(
     assert non_admin_stack.status_code == 403
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = _override_authed_user(admin)
     try:
         admin_tag_duplicate = await api_client.post(
@@ -297,3 +317,166 @@ async def test_create_tags_and_tech_stacks_match_admin_and_conflict_rules(
 
     assert admin_tag_duplicate.status_code == 409
     assert admin_stack_duplicate.status_code == 409
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/v1/taxonomy/categories",
+        "/api/v1/taxonomy/tags",
+        "/api/v1/taxonomy/tech-stacks",
+    ],
+)
+async def test_taxonomy_list_endpoints_run_one_query(api_client, db_session, path):
+    viewer = await _seed_user(
+        db_session, email="taxonomy-budget@ufl.edu", role="student"
+    )
+    for index in range(5):
+        await _seed_category(
+            db_session, name=f"Budget {index}", normalized_name=f"budget {index}"
+        )
+        await _seed_tag(
+            db_session, name=f"Budget {index}", normalized_name=f"budget {index}"
+        )
+        await _seed_tech_stack(
+            db_session, name=f"Budget {index}", normalized_name=f"budget {index}"
+        )
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_current_user] = _override_authed_user(viewer)
+    try:
+        with assert_max_queries(1):
+            response = await api_client.get(path)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_taxonomy_list_revalidates_without_queries_until_a_term_is_created(
+    api_client, db_session
+):
+    admin = await _seed_user(db_session, email="taxonomy-etag@ufl.edu", role="admin")
+    await _seed_tag(db_session, name="Cached", normalized_name="cached")
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_current_user] = _override_authed_user(admin)
+    try:
+        first = await api_client.get("/api/v1/taxonomy/tags")
+        etag = first.headers["etag"]
+        with assert_max_queries(0):
+            revalidated = await api_client.get(
+                "/api/v1/taxonomy/tags", headers={"If-None-Match": etag}
+            )
+        created = await api_client.post("/api/v1/taxonomy/tags", json={"name": "Fresh"})
+        changed = await api_client.get(
+            "/api/v1/taxonomy/tags", headers={"If-None-Match": etag}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert created.status_code == 201
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert "Fresh" in {term["name"] for term in changed.json()}
+
+
+@pytest.mark.asyncio
+async def test_suggest_ranks_terms_by_usage_count(api_client, db_session):
+    viewer = await _seed_user(
+        db_session, email="taxonomy-suggest@ufl.edu", role="student"
+    )
+    stem = f"Zq{uuid4().hex[:6]}"
+    pandas = await _seed_tag(
+        db_session, name=f"{stem} Pandas", normalized_name=f"{stem} pandas".lower()
+    )
+    pathfinding = await _seed_tag(
+        db_session,
+        name=f"{stem} Pathfinding",
+        normalized_name=f"{stem} pathfinding".lower(),
+    )
+    await _seed_tag(
+        db_session, name=f"{stem} Parsing", normalized_name=f"{stem} parsing".lower()
+    )
+    await _seed_tag(
+        db_session, name=f"{stem} Robotics", normalized_name=f"{stem} robotics".lower()
+    )
+    pathfinding.usage_count = 2
+    pandas.usage_count = 1
+    await db_session.flush()
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_current_user] = _override_authed_user(viewer)
+    try:
+        response = await api_client.get(
+            "/api/v1/taxonomy/tags/suggest", params={"prefix": f"{stem.upper()} PA"}
+        )
+        with assert_max_queries(0):
+            capped = await api_client.get(
+                "/api/v1/taxonomy/tags/suggest",
+                params={"prefix": f"{stem} pa", "limit": 1},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert [term["name"] for term in response.json()] == [
+        f"{stem} Pathfinding",
+        f"{stem} Pandas",
+        f"{stem} Parsing",
+    ]
+    assert [term["name"] for term in capped.json()] == [f"{stem} Pathfinding"]
+
+
+@pytest.mark.asyncio
+async def test_committed_term_creates_notify_listening_dictionaries(
+    async_engine, db_session
+):
+    session_factory = async_sessionmaker(
+        async_engine, expire_on_commit=False, class_=SQLModelAsyncSession
+    )
+    dictionary = TaxonomyDictionary(max_age_seconds=3600)
+    listener = TaxonomyChangeListener(dictionary, async_engine)
+    await listener.start()
+    name = f"Notified {uuid4().hex[:8]}"
+    try:
+        await asyncio.wait_for(listener.listening.wait(), timeout=5)
+        await dictionary.load(db_session)
+
+        async with session_factory() as session:
+            writer = TaxonomyService(
+                session, dictionary=TaxonomyDictionary(max_age_seconds=3600)
+            )
+            created = await writer.create_tag(TaxonomyTermCreateRequest(name=name))
+
+        async def wait_until_stale() -> None:
+            while dictionary.is_fresh(Tag):
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(wait_until_stale(), timeout=5)
+        assert dictionary.is_fresh(Category)
+        async with session_factory() as session:
+            listed = await dictionary.list_terms(session, Tag)
+        assert created.id in {term.id for term in listed}
+    finally:
+        await listener.stop()
+        async with session_factory() as session:
+            await session.exec(delete(Tag).where(Tag.name == name))
+            await session.commit()
@@ -0,0 +1,158 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlmodel import select
+
+from app.models.project import Project
+from app.models.taxonomy import Category, ProjectTag, Tag, TechStack
+from app.models.user import User
+from app.schemas.project import ProjectUpdateRequest
+from app.services.project import ProjectService
+from app.services.taxonomy_usage import reconcile_taxonomy_usage
+
+
+async def _seed_user(db_session, *, email: str) -> User:
+    now = datetime.now(timezone.utc)
+    user = User(
+        email=email,
+        username=f"user_{uuid4().hex[:10]}",
+        created_at=now,
+        updated_at=now,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def _seed_project(db_session, owner: User, *, is_published: bool) -> Project:
+    now = datetime.now(timezone.utc)
+    project = Project(
+        created_by_id=owner.id,
+        title=f"Usage {uuid4().hex[:8]}",
+        slug=f"usage-{uuid4().hex[:12]}",
+        short_description="Usage counter fixture",
+        github_url="https://github.com/example/usage",
+        is_published=is_published,
+        published_at=now if is_published else None,
+        created_at=now,
+        updated_at=now,
+    )
+    db_session.add(project)
+    await db_session.flush()
+    return project
+
+
+async def _tag_usage(db_session, names: list[str]) -> dict[str, int]:
+    tag_cols = getattr(Tag, "__table__").c
+    result = await db_session.exec(
+        select(tag_cols.name, tag_cols.usage_count).where(tag_cols.name.in_(names))
+    )
+    usage = {row.name: row.usage_count for row in result.all()}
+    return {name: usage.get(name, 0) for name in names}
+
+
+@pytest.mark.asyncio
+async def test_usage_counts_follow_publication_assignments_and_soft_delete(
+    db_session,
+):
+    owner = await _seed_user(db_session, email="usage-owner@ufl.edu")
+    project = await _seed_project(db_session, owner, is_published=False)
+    other = await _seed_project(db_session, owner, is_published=False)
+    stem = uuid4().hex[:6]
+    shared, dropped, added = (f"{stem} shared", f"{stem} dropped", f"{stem} added")
+    names = [shared, dropped, added]
+    service = ProjectService(db_session)
+
+    async def set_tags(target: Project, tags: list[str]) -> None:
+        await service.update_project(
+            project_id=target.id,
+            current_user_id=owner.id,
+            payload=ProjectUpdateRequest(tags=tags),
+        )
+
+    await set_tags(project, [shared, dropped])
+    await set_tags(other, [shared])
+    assert await _tag_usage(db_session, names) == {shared: 0, dropped: 0, added: 0}
+
+    await service.publish_project(project_id=project.id, current_user_id=owner.id)
+    await service.publish_project(project_id=other.id, current_user_id=owner.id)
+    assert await _tag_usage(db_session, names) == {shared: 2, dropped: 1, added: 0}
+
+    await set_tags(project, [added, shared])
+    assert await _tag_usage(db_session, names) == {shared: 2, dropped: 0, added: 1}
+
+    await service.unpublish_project(project_id=project.id, current_user_id=owner.id)
+    await service.unpublish_project(project_id=project.id, current_user_id=owner.id)
+    assert await _tag_usage(db_session, names) == {shared: 1, dropped: 0, added: 0}
+
+    await service.soft_delete_project(other.id, owner.id)
+    await service.soft_delete_project(other.id, owner.id)
+    assert await _tag_usage(db_session, names) == {shared: 0, dropped: 0, added: 0}
+
+
+@pytest.mark.asyncio
+async def test_update_counts_usage_from_the_locked_project_row(db_session):
+    owner = await _seed_user(db_session, email="usage-locked@ufl.edu")
+    project = await _seed_project(db_session, owner, is_published=True)
+    tag = f"{uuid4().hex[:6]} locked"
+    service = ProjectService(db_session)
+    # Another transaction unpublishes the project after this session loaded it.
+    connection = await db_session.connection()
+    await connection.execute(
+        sa.update(getattr(Project, "__table__"))
+        .where(getattr(Project, "__table__").c.id == project.id)
+        .values(is_published=False, published_at=None)
+    )
+    assert project.is_published is True
+
+    await service.update_project(
+        project_id=project.id,
+        current_user_id=owner.id,
+        payload=ProjectUpdateRequest(tags=[tag]),
+    )
+
+    assert await _tag_usage(db_session, [tag]) == {tag: 0}
+    assert project.is_published is False
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reports_drift_and_rewrites_counters(db_session):
+    owner = await _seed_user(db_session, email="usage-reconcile@ufl.edu")
+    published = await _seed_project(db_session, owner, is_published=True)
+    draft = await _seed_project(db_session, owner, is_published=False)
+    stem = uuid4().hex[:6]
+    used = Tag(name=f"{stem} used", normalized_name=f"{stem} used", usage_count=5)
+    unused = Tag(name=f"{stem} unused", normalized_name=f"{stem} unused")
+    db_session.add_all([used, unused])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            ProjectTag(project_id=published.id, tag_id=used.id, position=0),
+            ProjectTag(project_id=draft.id, tag_id=used.id, position=0),
+            ProjectTag(project_id=draft.id, tag_id=unused.id, position=1),
+        ]
+    )
+    await db_session.flush()
+
+    def drift_for(report) -> dict[UUID, tuple[int, int]]:
+        return {
+            entry.term_id: (entry.stored, entry.counted)
+            for entry in report.drift
+            if entry.term_id in {used.id, unused.id}
+        }
+
+    dry_run = await reconcile_taxonomy_usage(db_session, batch_size=2, fix=False)
+    assert drift_for(dry_run) == {used.id: (5, 1)}
+    assert await _tag_usage(db_session, [used.name]) == {used.name: 5}
+    assert set(dry_run.checked) == {"categories", "tags", "tech_stacks"}
+
+    fixed = await reconcile_taxonomy_usage(
+        db_session, batch_size=2, models=[Tag, Category, TechStack]
+    )
+    assert drift_for(fixed) == {used.id: (5, 1)}
+    assert await _tag_usage(db_session, [used.name]) == {used.name: 1}
+
+    again = await reconcile_taxonomy_usage(db_session, models=[Tag])
+    assert drift_for(again) == {}
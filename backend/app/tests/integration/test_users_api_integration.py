@@ -7,12 +7,14 @@ from datetime import UTC, datetime, timedelta
 from sqlmodel import select
 
 from app.main import app
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.models.user import User
 from app.models.project import Project, ProjectMember, Vote
 from app.services.project import ProjectService
+from app.services.user_cache import get_user_snapshot_cache
 from app.core.config import get_settings
 from app.services.vote import VoteService
+from app.tests.query_budget import assert_max_queries
 
 settings = get_settings()
 _TOKEN_PAYLOADS: dict[str, dict[str, object]] = {}
@@ -50,7 +52,7 @@ def _mock_supabase_jwt(monkeypatch):
             raise ValueError("Invalid token")
         return payload
 
-    def fake_admin_get_user(self, auth_user_id):
+    async def fake_admin_get_user(self, auth_user_id):
         return {
             "id": str(auth_user_id),
             "email_confirmed_at": "2026-01-01T00:00:00Z",
@@ -138,6 +140,7 @@ async def test_get_current_user_profile(api_client, db_session, monkeypatch):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me",
@@ -168,6 +171,7 @@ async def test_patch_current_user_profile(api_client, db_session, monkeypatch):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.patch(
             "/api/v1/users/me",
@@ -206,6 +210,7 @@ async def test_patch_current_user_profile_partial_update(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.patch(
             "/api/v1/users/me",
@@ -243,6 +248,7 @@ async def test_patch_current_user_profile_empty_payload_returns_422(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.patch(
             "/api/v1/users/me",
@@ -270,6 +276,7 @@ async def test_patch_current_user_profile_invalid_url_returns_422(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.patch(
             "/api/v1/users/me",
@@ -297,6 +304,7 @@ async def test_patch_current_user_profile_rejects_null_full_name(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         setup_response = await api_client.patch(
             "/api/v1/users/me",
@@ -331,6 +339,7 @@ async def test_patch_current_user_profile_rejects_username_update(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.patch(
             "/api/v1/users/me",
@@ -357,6 +366,7 @@ async def test_get_current_user_profile_bootstraps_missing_user(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me",
@@ -400,6 +410,7 @@ async def test_get_user_profile(api_client, db_session, monkeypatch):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(f"/api/v1/users/{user_id}")
         assert response.status_code == 200
@@ -432,6 +443,7 @@ async def test_get_user_profile_by_username_case_insensitive(api_client, db_sess
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(f"/api/v1/users/by-username/{username.upper()}")
         assert response.status_code == 200
@@ -488,6 +500,7 @@ async def test_list_user_projects(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(f"/api/v1/users/{user_id}/projects")
         assert response.status_code == 200
@@ -551,6 +564,7 @@ async def test_list_user_projects_includes_published_member_projects_only(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(f"/api/v1/users/{target_user_id}/projects")
     finally:
@@ -592,6 +606,7 @@ async def test_list_user_projects_dedupes_when_user_is_creator_and_member(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         public_response = await api_client.get(f"/api/v1/users/{user_id}/projects")
         my_response = await api_client.get(
@@ -651,6 +666,7 @@ async def test_list_user_projects_by_username(api_client, db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             f"/api/v1/users/by-username/{username.upper()}/projects"
@@ -719,6 +735,7 @@ async def test_list_user_projects_by_username_includes_published_member_projects
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             f"/api/v1/users/by-username/{target_username.upper()}/projects"
@@ -796,6 +813,7 @@ async def test_list_my_projects_includes_associated_member_drafts(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me/projects?visibility=all&sort=new",
@@ -858,6 +876,7 @@ async def test_list_my_projects_member_visibility_filters_split_draft_and_publis
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         draft_response = await api_client.get(
             "/api/v1/users/me/projects?visibility=draft",
@@ -928,6 +947,7 @@ async def test_associated_projects_removed_after_membership_removal(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         before_my = await api_client.get(
             "/api/v1/users/me/projects?visibility=all",
@@ -1023,6 +1043,7 @@ async def test_list_my_projects_default_includes_drafts_and_published_excludes_d
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me/projects",
@@ -1088,6 +1109,7 @@ async def test_list_my_projects_visibility_filters_and_taxonomy_order(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         draft_response = await api_client.get(
             "/api/v1/users/me/projects?visibility=draft",
@@ -1166,6 +1188,7 @@ async def test_list_my_projects_sort_new_paginates_mixed_results(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         first_page = await api_client.get(
             "/api/v1/users/me/projects?sort=new&limit=2",
@@ -1258,6 +1281,7 @@ async def test_list_my_projects_sort_new_paginates_stably_for_associated_project
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         first_page = await api_client.get(
             "/api/v1/users/me/projects?sort=new&visibility=all&limit=2",
@@ -1328,6 +1352,7 @@ async def test_list_my_projects_sort_new_uses_coalesced_published_and_created_ti
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me/projects?sort=new&visibility=all&limit=10",
@@ -1392,6 +1417,7 @@ async def test_list_my_projects_sort_top_published_matches_top_window(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me/projects?sort=top&visibility=published",
@@ -1465,6 +1491,7 @@ async def test_list_my_projects_sort_top_paginates_stably_for_associated_publish
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         first_page = await api_client.get(
             "/api/v1/users/me/projects?sort=top&visibility=published&limit=2",
@@ -1543,6 +1570,7 @@ async def test_list_my_projects_sort_top_all_transitions_from_published_to_draft
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         first_page = await api_client.get(
             "/api/v1/users/me/projects?sort=top&visibility=all&limit=2",
@@ -1608,6 +1636,7 @@ async def test_list_my_projects_sort_top_draft_returns_newest_first_and_ignores_
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me/projects"
@@ -1666,6 +1695,7 @@ async def test_list_my_voted_projects_excludes_soft_deleted_projects(
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         response = await api_client.get(
             "/api/v1/users/me/votes",
@@ -1677,3 +1707,84 @@ async def test_list_my_voted_projects_excludes_soft_deleted_projects(
     assert response.status_code == 200
     payload = response.json()
     assert [item["id"] for item in payload["items"]] == [str(visible.id)]
+
+
+async def _seed_budget_profile(db_session, *, project_count: int):
+    user_id = uuid4()
+    email = f"budget-{uuid4().hex[:8]}@ufl.edu"
+    username = f"budget_{uuid4().hex[:8]}"
+    await seed_auth_user(db_session, user_id=user_id, email=email, username=username)
+    now = datetime.now(UTC)
+    for index in range(project_count):
+        project = await _seed_owned_project(
+            db_session,
+            created_by_id=user_id,
+            title=f"Budget Project {index}",
+            slug=f"budget-project-{uuid4().hex[:8]}",
+            is_published=True,
+            created_at=now - timedelta(minutes=index),
+        )
+        await _seed_project_member(
+            db_session, project_id=project.id, user_id=user_id, role="owner"
+        )
+        db_session.add(Vote(user_id=user_id, project_id=project.id, created_at=now))
+    await db_session.commit()
+    return user_id, email, username
+
+
+# Budgets assume a cold user cache, so authenticated calls include the user
+# lookup. They stay flat as the page grows.
+_USER_READ_QUERY_BUDGETS = [
+    ("me", lambda user_id, username: "/api/v1/users/me", 1),
+    ("my_projects", lambda user_id, username: "/api/v1/users/me/projects", 3),
+    ("my_votes", lambda user_id, username: "/api/v1/users/me/votes", 3),
+    ("profile", lambda user_id, username: f"/api/v1/users/{user_id}", 1),
+    (
+        "profile_by_username",
+        lambda user_id, username: f"/api/v1/users/by-username/{username}",
+        1,
+    ),
+    (
+        "user_projects",
+        lambda user_id, username: f"/api/v1/users/{user_id}/projects",
+        4,
+    ),
+    (
+        "user_projects_by_username",
+        lambda user_id, username: f"/api/v1/users/by-username/{username}/projects",
+        4,
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("project_count", [2, 6])
+@pytest.mark.parametrize(
+    ("endpoint", "build_url", "budget"),
+    _USER_READ_QUERY_BUDGETS,
+    ids=[entry[0] for entry in _USER_READ_QUERY_BUDGETS],
+)
+async def test_user_read_endpoints_stay_within_query_budget(
+    api_client, db_session, project_count, endpoint, build_url, budget
+):
+    user_id, email, username = await _seed_budget_profile(
+        db_session, project_count=project_count
+    )
+    token = generate_token(user_id, email, "integration-test-jwt-secret-at-least-32b")
+    get_user_snapshot_cache().clear()
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        with assert_max_queries(budget):
+            response = await api_client.get(
+                build_url(user_id, username),
+                headers={"Authorization": f"Bearer {token}"},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200, endpoint
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RecordedRequest:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class LocalResponse:
+    status: int = 200
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+    @classmethod
+    def json(
+        cls,
+        payload: Any,
+        *,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+        delay: float = 0.0,
+    ) -> LocalResponse:
+        return cls(
+            status=status,
+            body=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", **(headers or {})},
+            delay=delay,
+        )
+
+
+Responder = LocalResponse | Callable[[RecordedRequest], LocalResponse]
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients that time out close the socket before a delayed response.
+        return
+
+
+class LocalHTTPServer:
+    """Real loopback HTTP server serving canned responses for client tests.
+
+    Routes are keyed by `(method, path)` and may be swapped while the server
+    runs; every request is recorded in `requests`.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], Responder] = {}
+        self.requests: list[RecordedRequest] = []
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "server is not running"
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def route(self, method: str, path: str, responder: Responder) -> None:
+        self.routes[(method.upper(), path)] = responder
+
+    def count(self, method: str, path: str) -> int:
+        with self._lock:
+            return sum(
+                1
+                for request in self.requests
+                if request.method == method.upper() and request.path == path
+            )
+
+    def __enter__(self) -> LocalHTTPServer:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                recorded = RecordedRequest(
+                    method=self.command,
+                    path=self.path,
+                    headers={key.lower(): value for key, value in self.headers.items()},
+                    body=self.rfile.read(length) if length else b"",
+                )
+                with server._lock:
+                    server.requests.append(recorded)
+                responder = server.routes.get((self.command, self.path))
+                if responder is None:
+                    response = LocalResponse(status=404)
+                elif isinstance(responder, LocalResponse):
+                    response = responder
+                else:
+                    response = responder(recorded)
+                if response.delay:
+                    time.sleep(response.delay)
+                self.send_response(response.status)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_PUT = _handle
+            do_PATCH = _handle
+            do_DELETE = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        self._server = _QuietHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.db.query_stats import QueryStats, track_queries
+
+
+@contextmanager
+def assert_max_queries(budget: int) -> Iterator[QueryStats]:
+    """Fail if the block executes more than `budget` SQL statements.
+
+    Wrap a single API call to pin an endpoint's query count, so an N+1
+    regression fails the test instead of showing up as production latency.
+    """
+    with track_queries(keep_statements=True) as stats:
+        yield stats
+    if stats.count > budget:
+        statements = "\n".join(
+            f"  {index}. {' '.join(statement.split())[:200]}"
+            for index, statement in enumerate(stats.statements, start=1)
+        )
+        raise AssertionError(
+            f"Expected at most {budget} queries, executed {stats.count}:\n{statements}"
+        )
@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+from app.utils.bitmaps import IdBitmaps
+
+
+def test_match_ors_within_a_group_and_ands_across_groups():
+    python_ai, python_web, rust_ai = uuid4(), uuid4(), uuid4()
+    bitmaps: IdBitmaps[str] = IdBitmaps()
+    bitmaps.set(python_ai, ["python", "ai"])
+    bitmaps.set(python_web, ["python", "web"])
+    bitmaps.set(rust_ai, ["rust", "ai"])
+
+    def matched(groups, *, match_all=False):
+        return set(bitmaps.ids(bitmaps.match(groups, match_all=match_all)))
+
+    assert matched({"tags": ["python", "rust"]}) == {python_ai, python_web, rust_ai}
+    assert matched({"tags": ["python", "rust"], "categories": ["ai"]}) == {
+        python_ai,
+        rust_ai,
+    }
+    assert matched({"tags": ["python", "ai"]}, match_all=True) == {python_ai}
+    assert matched({"tags": ["python", "unknown"]}, match_all=True) == set()
+    assert matched({}) == set()
+
+
+def test_set_replaces_keys_and_remove_clears_bits():
+    project_id, other_id = uuid4(), uuid4()
+    bitmaps: IdBitmaps[str] = IdBitmaps()
+    bitmaps.set(project_id, ["python"])
+    bitmaps.set(other_id, ["python"])
+
+    bitmaps.set(project_id, ["rust"])
+    bitmaps.remove(other_id)
+
+    assert bitmaps.ids(bitmaps.match({"tags": ["python"]}, match_all=False)) == []
+    assert bitmaps.ids(bitmaps.match({"tags": ["rust"]}, match_all=False)) == [
+        project_id
+    ]
+    assert len(bitmaps) == 1
+
+
+def test_ids_decode_bits_past_the_first_byte_in_ordinal_order():
+    ids = [uuid4() for _ in range(20)]
+    bitmaps: IdBitmaps[str] = IdBitmaps()
+    for position, item_id in enumerate(ids):
+        bitmaps.set(item_id, ["even" if position % 2 == 0 else "odd"])
+
+    assert (
+        bitmaps.ids(bitmaps.match({"parity": ["odd"]}, match_all=False)) == (ids[1::2])
+    )
@@ -0,0 +1,64 @@
+import pytest
+
+from app.utils.cache import ExpiringLRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_expiring_lru_cache_returns_value_until_ttl_elapses():
+    clock = FakeClock()
+    cache: ExpiringLRUCache[str, int] = ExpiringLRUCache(max_entries=4, clock=clock)
+
+    cache.set("a", 1, ttl=10)
+    assert cache.get("a") == 1
+
+    clock.now += 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_expiring_lru_cache_evicts_least_recently_used_entry():
+    cache: ExpiringLRUCache[str, int] = ExpiringLRUCache(max_entries=2)
+
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_expiring_lru_cache_non_positive_ttl_drops_entry():
+    cache: ExpiringLRUCache[str, int] = ExpiringLRUCache(max_entries=2)
+
+    cache.set("a", 1, ttl=60)
+    cache.set("a", 2, ttl=0)
+
+    assert cache.get("a") is None
+    assert cache.stats.hit_rate == 0.0
+
+
+def test_expiring_lru_cache_discard_where_drops_only_matching_entries():
+    cache: ExpiringLRUCache[str, int] = ExpiringLRUCache(max_entries=4)
+    for key, value in (("a", 1), ("b", 2), ("c", 3)):
+        cache.set(key, value, ttl=60)
+
+    dropped = cache.discard_where(lambda key, value: key == "a" or value == 3)
+
+    assert dropped == 2
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (None, 2, None)
+
+
+def test_expiring_lru_cache_rejects_non_positive_capacity():
+    with pytest.raises(ValueError, match="max_entries"):
+        ExpiringLRUCache(max_entries=0)
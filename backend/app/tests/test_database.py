@@ -0,0 +1,59 @@
+from app.core.config import get_settings
+from app.db.database import build_connect_args, build_slow_query_log
+
+
+def _settings(**overrides: object):
+    return get_settings().model_copy(update={"DATABASE_SSL": False, **overrides})
+
+
+def test_pooler_mode_disables_statement_caches_and_uses_unique_names():
+    connect_args = build_connect_args(_settings(DATABASE_CONNECTION_MODE="pooler"))
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert callable(name_func)
+    first, second = name_func(), name_func()
+    assert first != second
+    assert first.startswith("__asyncpg_")
+
+
+def test_direct_mode_enables_tunable_statement_cache():
+    connect_args = build_connect_args(
+        _settings(DATABASE_CONNECTION_MODE="direct", DATABASE_STATEMENT_CACHE_SIZE=250)
+    )
+
+    assert connect_args["statement_cache_size"] == 250
+    assert connect_args["prepared_statement_cache_size"] == 250
+    assert "prepared_statement_name_func" not in connect_args
+
+
+def test_connect_args_include_ssl_context_when_enabled():
+    connect_args = build_connect_args(
+        _settings(DATABASE_SSL=True, DATABASE_SSL_VERIFY=False)
+    )
+
+    assert "ssl" in connect_args
+    assert connect_args["timeout"] == get_settings().DATABASE_CONNECT_TIMEOUT
+
+
+def test_slow_query_log_opens_explain_file_only_when_sampling(tmp_path):
+    explain_path = tmp_path / "logs" / "explain.jsonl"
+
+    unsampled = build_slow_query_log(
+        _settings(
+            DATABASE_SLOW_QUERY_EXPLAIN_SAMPLE_RATE=0.0,
+            DATABASE_SLOW_QUERY_EXPLAIN_PATH=str(explain_path),
+        )
+    )
+    assert unsampled.should_explain() is False
+    assert not explain_path.parent.exists()
+
+    sampled = build_slow_query_log(
+        _settings(
+            DATABASE_SLOW_QUERY_EXPLAIN_SAMPLE_RATE=1.0,
+            DATABASE_SLOW_QUERY_EXPLAIN_PATH=str(explain_path),
+        )
+    )
+    assert sampled.should_explain() is True
+    assert explain_path.exists()
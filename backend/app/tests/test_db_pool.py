@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.db.pool import InstrumentedAsyncQueuePool, PoolWaitStats
+
+
+def test_pool_wait_stats_reports_nearest_rank_percentiles():
+    stats = PoolWaitStats()
+    for value in range(100, 0, -1):
+        stats.record_wait(value / 1000)
+
+    assert stats.checkouts == 100
+    assert stats.percentiles() == pytest.approx(
+        {"p50": 50.0, "p95": 95.0, "p99": 99.0, "max": 100.0}
+    )
+
+
+def test_pool_wait_stats_without_samples_reports_none():
+    assert PoolWaitStats().percentiles() == {
+        "p50": None,
+        "p95": None,
+        "p99": None,
+        "max": None,
+    }
+
+
+def test_pool_wait_stats_keeps_only_recent_samples():
+    stats = PoolWaitStats(max_samples=2)
+    for seconds in (5.0, 0.001, 0.002):
+        stats.record_wait(seconds)
+
+    assert stats.checkouts == 3
+    assert stats.percentiles()["max"] == pytest.approx(2.0)
+
+
+def test_instrumented_pool_records_checkouts_and_survives_recreate():
+    pool = InstrumentedAsyncQueuePool(Mock, pool_size=1, max_overflow=0)
+
+    connection = pool.connect()
+    connection.close()
+    recreated = pool.recreate()
+
+    assert pool.wait_stats.checkouts == 1
+    assert recreated.wait_stats is pool.wait_stats
+    assert recreated.max_overflow == 0
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_counts_checkout_timeouts():
+    pool = InstrumentedAsyncQueuePool(Mock, pool_size=1, max_overflow=0, timeout=0.01)
+    held = await greenlet_spawn(pool.connect)
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    await greenlet_spawn(held.close)
+    assert pool.wait_stats.checkouts == 1
+    assert pool.wait_stats.timeouts == 1
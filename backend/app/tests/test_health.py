@@ -62,3 +62,14 @@ def test_db_health_endpoint_failure():
     assert response.status_code == 503
     payload = response.json()
     assert payload["detail"] == "Database unavailable"
+
+
+def test_db_pool_stats_endpoint_reports_pool_usage():
+    response = client.get("/api/v1/db-pool")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["pool_size"] >= 0
+    assert payload["checked_out"] >= 0
+    assert payload["overflow"] >= 0
+    assert set(payload["wait_ms"]) == {"p50", "p95", "p99", "max"}
@@ -0,0 +1,13 @@
+from app.utils.http_cache import etag_matches
+
+
+def test_etag_matches_uses_weak_comparison_over_header_lists():
+    etag = '"abc123"'
+
+    assert etag_matches('"abc123"', etag)
+    assert etag_matches('W/"abc123"', etag)
+    assert etag_matches('"other", "abc123"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+import jwt
+from jwt.algorithms import RSAAlgorithm
+import pytest
+
+from app.services.jwks import JwksFetchError, JwksProvider, SigningKeyNotFoundError
+from app.tests.local_http import LocalHTTPServer, LocalResponse
+
+JWKS_PATH = "/auth/v1/.well-known/jwks.json"
+
+
+def _rsa_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _jwk(private_key: rsa.RSAPrivateKey, kid: str) -> dict[str, Any]:
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    return {**jwk, "kid": kid, "use": "sig", "alg": "RS256"}
+
+
+def _provider(server: LocalHTTPServer, **overrides: float) -> JwksProvider:
+    options = {
+        "refresh_interval": 600.0,
+        "min_refresh_interval": 30.0,
+        "timeout": 2.0,
+        **overrides,
+    }
+    return JwksProvider(f"{server.url}{JWKS_PATH}", **options)
+
+
+@pytest.mark.asyncio
+async def test_start_loads_keys_and_records_fetch_timing():
+    private_key = _rsa_key()
+    with LocalHTTPServer() as server:
+        server.route(
+            "GET", JWKS_PATH, LocalResponse.json({"keys": [_jwk(private_key, "k1")]})
+        )
+        provider = _provider(server)
+        await provider.start()
+        try:
+            token = jwt.encode(
+                {"sub": "user"}, private_key, algorithm="RS256", headers={"kid": "k1"}
+            )
+            signing_key = provider.get_signing_key("k1").key
+            assert jwt.decode(token, signing_key, algorithms=["RS256"]) == {
+                "sub": "user"
+            }
+        finally:
+            await provider.stop()
+
+    assert provider.stats.fetches == 1
+    assert provider.stats.failures == 0
+    assert provider.stats.key_count == 1
+    assert provider.stats.last_duration_ms is not None
+    assert provider.stats.avg_duration_ms == provider.stats.last_duration_ms
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_triggers_one_coalesced_refresh():
+    old_key = _rsa_key()
+    new_key = _rsa_key()
+    with LocalHTTPServer() as server:
+        server.route(
+            "GET", JWKS_PATH, LocalResponse.json({"keys": [_jwk(old_key, "old")]})
+        )
+        provider = _provider(server, min_refresh_interval=0.0)
+        await provider.refresh()
+
+        server.route(
+            "GET",
+            JWKS_PATH,
+            LocalResponse.json(
+                {"keys": [_jwk(old_key, "old"), _jwk(new_key, "new")]}, delay=0.05
+            ),
+        )
+        with pytest.raises(SigningKeyNotFoundError):
+            provider.get_signing_key("new")
+
+        await asyncio.gather(*(provider.ensure_key("new") for _ in range(10)))
+
+        assert provider.get_signing_key("new").key_id == "new"
+        assert server.count("GET", JWKS_PATH) == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_does_not_refetch_during_cooldown():
+    with LocalHTTPServer() as server:
+        server.route(
+            "GET", JWKS_PATH, LocalResponse.json({"keys": [_jwk(_rsa_key(), "k1")]})
+        )
+        provider = _provider(server)
+        await provider.refresh()
+
+        await provider.ensure_key("forged")
+        await provider.ensure_key("forged")
+
+        assert server.count("GET", JWKS_PATH) == 1
+        with pytest.raises(SigningKeyNotFoundError):
+            provider.get_signing_key("forged")
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_keys():
+    with LocalHTTPServer() as server:
+        server.route(
+            "GET", JWKS_PATH, LocalResponse.json({"keys": [_jwk(_rsa_key(), "k1")]})
+        )
+        provider = _provider(server, min_refresh_interval=0.0)
+        await provider.refresh()
+
+        server.route("GET", JWKS_PATH, LocalResponse(status=500))
+        with pytest.raises(JwksFetchError):
+            await provider.ensure_key("k2")
+
+    assert provider.get_signing_key("k1").key_id == "k1"
+    assert provider.stats.fetches == 2
+    assert provider.stats.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_runs_before_max_age_expires():
+    with LocalHTTPServer() as server:
+        server.route(
+            "GET",
+            JWKS_PATH,
+            LocalResponse.json(
+                {"keys": [_jwk(_rsa_key(), "k1")]},
+                headers={"Cache-Control": "public, max-age=1"},
+            ),
+        )
+        provider = _provider(server, min_refresh_interval=0.1)
+        await provider.start()
+        try:
+            deadline = time.monotonic() + 5
+            while server.count("GET", JWKS_PATH) < 2 and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+        finally:
+            await provider.stop()
+
+    assert server.count("GET", JWKS_PATH) >= 2
+
+
+@pytest.mark.asyncio
+async def test_start_tolerates_unreachable_jwks_endpoint():
+    with LocalHTTPServer() as server:
+        provider = _provider(server)
+        await provider.start()
+        await provider.stop()
+
+    assert provider.stats.failures == 1
+    with pytest.raises(SigningKeyNotFoundError):
+        provider.get_signing_key("k1")
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_after_failed_cold_start_reports_fetch_error():
+    with LocalHTTPServer() as server:
+        provider = _provider(server)
+        await provider.start()
+        await provider.stop()
+
+        # Still in the cooldown: no new fetch, but not a bad credential either.
+        with pytest.raises(JwksFetchError):
+            await provider.ensure_key("k1")
+
+    assert server.count("GET", JWKS_PATH) == 1
@@ -0,0 +1,215 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.project import Project
+from app.models.taxonomy import Category, Tag
+from app.services.project_cards import (
+    build_project_card_hydration_statement,
+    build_project_detail_statement,
+    hydrate_project_cards,
+)
+from app.services.taxonomy_dictionary import get_taxonomy_dictionary
+
+
+def _make_project() -> Project:
+    now = datetime.now(timezone.utc)
+    return Project(
+        id=uuid4(),
+        created_by_id=uuid4(),
+        title="Card Project",
+        slug=f"card-{uuid4().hex[:8]}",
+        short_description="Card description",
+        vote_count=3,
+        is_group_project=True,
+        is_published=True,
+        published_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _compile(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_hydration_statement_aggregates_members_and_taxonomy_in_one_query():
+    compiled = _compile(
+        build_project_card_hydration_statement([uuid4()], viewer_id=uuid4())
+    )
+
+    assert compiled.count("LATERAL") == 4
+    assert "json_agg(json_build_object" in compiled
+    assert "ORDER BY project_members.added_at ASC" in compiled
+    assert "ORDER BY project_categories.position ASC" in compiled
+    assert "ORDER BY project_tags.position ASC" in compiled
+    assert "ORDER BY project_tech_stacks.position ASC" in compiled
+    assert "EXISTS (SELECT" in compiled
+    # Term names come from the taxonomy dictionary, not a join.
+    assert "JOIN categories" not in compiled
+    assert "JOIN tags" not in compiled
+    assert "JOIN tech_stacks" not in compiled
+
+
+def test_hydration_statement_skips_vote_lookup_for_anonymous_viewer():
+    compiled = _compile(
+        build_project_card_hydration_statement([uuid4()], viewer_id=None)
+    )
+
+    assert "votes" not in compiled
+    assert "false AS viewer_has_voted" in compiled
+
+
+@pytest.mark.asyncio
+async def test_hydrate_project_cards_skips_query_for_empty_page():
+    db = AsyncMock()
+
+    items = await hydrate_project_cards(cast(AsyncSession, db), [], viewer_id=uuid4())
+
+    assert items == []
+    db.exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_hydrate_project_cards_preserves_page_order_and_json_payloads():
+    first = _make_project()
+    second = _make_project()
+    member_id = uuid4()
+    category_id = uuid4()
+    tag_ids = [uuid4(), uuid4()]
+    rows = [
+        SimpleNamespace(
+            project_id=second.id,
+            members=None,
+            categories=None,
+            tags=None,
+            tech_stack=None,
+            viewer_has_voted=False,
+        ),
+        SimpleNamespace(
+            project_id=first.id,
+            members=[
+                {
+                    "user_id": str(member_id),
+                    "username": "member_one",
+                    "role": "owner",
+                    "full_name": "Member One",
+                    "profile_picture_url": None,
+                }
+            ],
+            categories=[str(category_id)],
+            tags=[str(tag_ids[0]), str(tag_ids[1])],
+            tech_stack=[],
+            viewer_has_voted=True,
+        ),
+    ]
+    dictionary = get_taxonomy_dictionary()
+    dictionary.put(Category, term_id=category_id, name="Web", normalized_name="web")
+    dictionary.put(Tag, term_id=tag_ids[0], name="Second", normalized_name="second")
+    dictionary.put(Tag, term_id=tag_ids[1], name="First", normalized_name="first")
+    db = AsyncMock()
+    db.exec = AsyncMock(return_value=Mock(all=lambda: rows))
+
+    items = await hydrate_project_cards(
+        cast(AsyncSession, db), [first, second], viewer_id=uuid4()
+    )
+
+    assert db.exec.await_count == 1
+    assert [item.id for item in items] == [first.id, second.id]
+    assert [member.user_id for member in items[0].members] == [member_id]
+    assert items[0].team_size == 1
+    assert items[0].viewer_has_voted is True
+    assert [term.id for term in items[0].categories] == [category_id]
+    assert [term.name for term in items[0].tags] == ["Second", "First"]
+    assert items[1].members == []
+    assert items[1].team_size == 0
+    assert items[1].viewer_has_voted is False
+
+
+@pytest.mark.asyncio
+async def test_hydrate_project_cards_rejects_unknown_member_role():
+    project = _make_project()
+    rows = [
+        SimpleNamespace(
+            project_id=project.id,
+            members=[
+                {
+                    "user_id": str(uuid4()),
+                    "username": "bad_role",
+                    "role": "superuser",
+                    "full_name": None,
+                    "profile_picture_url": None,
+                }
+            ],
+            categories=None,
+            tags=None,
+            tech_stack=None,
+            viewer_has_voted=False,
+        )
+    ]
+    db = AsyncMock()
+    db.exec = AsyncMock(return_value=Mock(all=lambda: rows))
+
+    with pytest.raises(RuntimeError, match="Unexpected project member role"):
+        await hydrate_project_cards(cast(AsyncSession, db), [project], viewer_id=None)
+
+
+def test_detail_statement_loads_project_role_and_hydration_together():
+    compiled = _compile(
+        build_project_detail_statement(viewer_id=uuid4(), project_id=uuid4())
+    )
+
+    assert compiled.count("LATERAL") == 4
+    assert "projects.title" in compiled
+    assert "(SELECT project_members.role" in compiled
+    assert "AS viewer_role" in compiled
+    assert "projects.deleted_at IS NULL" in compiled
+
+
+def test_detail_statement_by_slug_for_anonymous_viewer():
+    compiled = _compile(build_project_detail_statement(viewer_id=None, slug="demo"))
+
+    assert "projects.slug = %(slug_1)s" in compiled
+    assert "NULL AS viewer_role" in compiled
+    assert "false AS viewer_has_voted" in compiled
+
+
+def test_detail_statement_requires_exactly_one_lookup():
+    with pytest.raises(ValueError):
+        build_project_detail_statement(viewer_id=None)
+    with pytest.raises(ValueError):
+        build_project_detail_statement(viewer_id=None, project_id=uuid4(), slug="x")
+
+
+@pytest.mark.asyncio
+async def test_hydrate_project_cards_looks_up_terms_missing_from_dictionary():
+    project = _make_project()
+    tag_id = uuid4()
+    rows = [
+        SimpleNamespace(
+            project_id=project.id,
+            members=None,
+            categories=None,
+            tags=[str(tag_id)],
+            tech_stack=None,
+            viewer_has_voted=False,
+        )
+    ]
+    term_rows = [SimpleNamespace(id=tag_id, name="New Tag", normalized_name="new tag")]
+    db = AsyncMock()
+    db.exec = AsyncMock(
+        side_effect=[Mock(all=lambda: rows), Mock(all=lambda: term_rows)]
+    )
+
+    items = await hydrate_project_cards(
+        cast(AsyncSession, db), [project], viewer_id=None
+    )
+
+    assert db.exec.await_count == 2
+    assert [term.name for term in items[0].tags] == ["New Tag"]
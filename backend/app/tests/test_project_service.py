@@ -1,4 +1,5 @@
 from datetime import date, datetime, timezone
+from types import SimpleNamespace
 from typing import cast
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
@@ -258,7 +259,8 @@ async def test_create_project_skips_taxonomy_assignment_when_create_lists_empty(
     )
     detail_stub = type("Detail", (), {"id": project_id})()
 
-    service.get_project_detail = AsyncMock(return_value=detail_stub)  # type: ignore[method-assign]
+    service._project_detail_from_write = Mock(return_value=detail_stub)  # type: ignore[method-assign]
+    service._member_to_info = Mock()  # type: ignore[method-assign]
     service.get_user_by_id = AsyncMock(  # type: ignore[method-assign]
         return_value=type("Principal", (), {"role": USER_ROLE_STUDENT})()
     )
@@ -301,7 +303,8 @@ async def test_create_project_retries_on_slug_unique_conflict():
     )
 
     db.flush = AsyncMock(side_effect=[slug_conflict, None])
-    service.get_project_detail = AsyncMock(return_value=detail_stub)  # type: ignore[method-assign]
+    service._project_detail_from_write = Mock(return_value=detail_stub)  # type: ignore[method-assign]
+    service._member_to_info = Mock()  # type: ignore[method-assign]
     service.get_user_by_id = AsyncMock(  # type: ignore[method-assign]
         return_value=type("Principal", (), {"role": USER_ROLE_STUDENT})()
     )
@@ -317,11 +320,63 @@ async def test_create_project_retries_on_slug_unique_conflict():
     assert db.rollback.await_count == 1
 
 
+@pytest.mark.asyncio
+async def test_create_project_marks_new_terms_stale_only_after_commit():
+    db = AsyncMock()
+    db.add = Mock()
+    dictionary = Mock()
+    events: list[str] = []
+    db.commit = AsyncMock(side_effect=lambda: events.append("commit"))
+    dictionary.mark_stale = Mock(side_effect=lambda model: events.append(model))
+    service = ProjectService(cast(AsyncSession, db), taxonomy_dictionary=dictionary)
+    payload = ProjectCreateRequest(
+        title="New Term Project",
+        short_description="Description",
+        github_url="https://github.com/example/new-term",
+        categories=["Brand New"],
+    )
+    created_term = TaxonomyTermResponse(id=uuid4(), name="Brand New")
+    db.exec = AsyncMock(
+        side_effect=[
+            Mock(all=Mock(return_value=[])),
+            Mock(
+                all=Mock(
+                    return_value=[
+                        SimpleNamespace(
+                            id=created_term.id,
+                            name="Brand New",
+                            normalized_name="brand new",
+                        )
+                    ]
+                )
+            ),
+        ]
+    )
+
+    async def replace_assignments(**kwargs):
+        await service._resolve_or_create_terms(
+            Category, kwargs["categories"], kwargs["taxonomy_principal"]
+        )
+        return {"categories": [created_term]}
+
+    service._project_detail_from_write = Mock()  # type: ignore[method-assign]
+    service._member_to_info = Mock()  # type: ignore[method-assign]
+    service.get_user_by_id = AsyncMock(  # type: ignore[method-assign]
+        return_value=type("Principal", (), {"role": USER_ROLE_STUDENT})()
+    )
+    service._generate_unique_slug = AsyncMock(return_value="new-term-project")  # type: ignore[method-assign]
+    service._replace_project_taxonomy_assignments = replace_assignments  # type: ignore[method-assign]
+
+    await service.create_project(created_by_id=uuid4(), payload=payload)
+
+    assert events == ["commit", Category]
+
+
 @pytest.mark.asyncio
 async def test_resolve_or_create_terms_rejects_create_on_miss_without_principal():
     db = AsyncMock()
     service = ProjectService(cast(AsyncSession, db))
-    empty_result = Mock(first=Mock(return_value=None))
+    empty_result = Mock(all=Mock(return_value=[]))
     db.exec = AsyncMock(return_value=empty_result)
 
     with pytest.raises(
@@ -349,6 +404,29 @@ async def test_replace_join_assignments_invalid_term_fk_field_raises():
         )
 
 
+def test_diff_join_assignments_reports_only_changed_rows():
+    kept_row, moved_row, removed_row = uuid4(), uuid4(), uuid4()
+    first, second, dropped, added = uuid4(), uuid4(), uuid4(), uuid4()
+
+    removed_ids, moves, inserts = ProjectService._diff_join_assignments(
+        [(kept_row, first, 0), (removed_row, dropped, 1), (moved_row, second, 2)],
+        [first, second, added],
+    )
+
+    assert removed_ids == [removed_row]
+    assert moves == {moved_row: 1}
+    assert inserts == [(added, 2)]
+
+
+def test_diff_join_assignments_is_empty_for_unchanged_order():
+    term_ids = [uuid4(), uuid4()]
+    current = [
+        (uuid4(), term_id, position) for position, term_id in enumerate(term_ids)
+    ]
+
+    assert ProjectService._diff_join_assignments(current, term_ids) == ([], {}, [])
+
+
 @pytest.mark.asyncio
 async def test_assert_owner_access_rejects_non_owner():
     service = ProjectService(cast(AsyncSession, DummySession()))
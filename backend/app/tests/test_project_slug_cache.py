@@ -0,0 +1,42 @@
+from uuid import uuid4
+
+from app.services.project_slug_cache import UNKNOWN_SLUG, ProjectSlugCache
+
+
+def test_slug_cache_stores_ids_and_unknown_slugs():
+    cache = ProjectSlugCache(ttl_seconds=60, negative_ttl_seconds=5, max_entries=10)
+    project_id = uuid4()
+
+    cache.put("known", project_id)
+    cache.put_unknown("missing")
+
+    assert cache.get("known") == project_id
+    assert cache.get("missing") == UNKNOWN_SLUG
+    assert cache.get("never-seen") is None
+
+
+def test_slug_cache_invalidate_drops_entry():
+    cache = ProjectSlugCache(ttl_seconds=60, negative_ttl_seconds=5, max_entries=10)
+    cache.put("known", uuid4())
+
+    cache.invalidate("known")
+
+    assert cache.get("known") is None
+
+
+def test_zero_negative_ttl_disables_negative_caching():
+    cache = ProjectSlugCache(ttl_seconds=60, negative_ttl_seconds=0, max_entries=10)
+
+    cache.put_unknown("missing")
+
+    assert cache.get("missing") is None
+
+
+def test_slug_cache_is_bounded():
+    cache = ProjectSlugCache(ttl_seconds=60, negative_ttl_seconds=5, max_entries=2)
+
+    for slug in ("a", "b", "c"):
+        cache.put_unknown(slug)
+
+    assert cache.get("a") is None
+    assert cache.stats.evictions == 1
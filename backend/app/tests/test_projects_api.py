@@ -7,7 +7,7 @@ from fastapi.testclient import TestClient
 
 from app.api.deps.auth import get_current_user, get_current_user_optional
 from app.api.deps.search import get_search_service
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.main import app
 from app.models.project_roles import ProjectMemberRole
 from app.policy.roles import PolicyDeniedError
@@ -205,6 +205,7 @@ def test_create_project_returns_201_and_payload():
     response_model = _build_draft_project_response(project_id, user_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -237,6 +238,7 @@ def test_create_project_policy_denied_returns_403():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -263,6 +265,7 @@ def test_create_project_passes_user_and_payload_to_service():
     response_model = _build_draft_project_response(project_id, user_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -291,6 +294,7 @@ def test_create_project_validation_missing_title_returns_422():
     payload.pop("title")
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -309,6 +313,7 @@ def test_create_project_validation_blank_title_returns_422():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -332,6 +337,7 @@ def test_create_project_validation_missing_description_returns_422():
     payload.pop("short_description")
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -350,6 +356,7 @@ def test_create_project_validation_blank_description_returns_422():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -371,6 +378,7 @@ def test_create_project_rejects_is_group_project_field_returns_422():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -392,6 +400,7 @@ def test_create_project_validation_requires_at_least_one_project_url():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -423,6 +432,7 @@ def test_create_project_validation_invalid_url_returns_422():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -444,6 +454,7 @@ def test_create_project_validation_rejects_timeline_end_without_start():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -468,6 +479,7 @@ def test_create_project_validation_rejects_timeline_start_after_end():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -494,6 +506,7 @@ def test_create_project_validation_accepts_http_and_https_urls():
     response_model = _build_draft_project_response(project_id, user_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -525,6 +538,7 @@ def test_create_project_normalizes_empty_optional_urls_to_none():
     response_model = _build_draft_project_response(project_id, user_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -556,6 +570,7 @@ def test_get_project_detail_published_visible_anonymous():
     response_model = _build_project_response(project_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         with patch(
@@ -580,6 +595,7 @@ def test_get_project_detail_by_slug_published_visible_anonymous():
     slug = "project"
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         with patch(
@@ -601,6 +617,7 @@ def test_get_project_detail_by_slug_forbidden_returns_403():
     member_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: SimpleNamespace(
         id=member_id
     )
@@ -623,6 +640,7 @@ def test_get_project_detail_unpublished_hidden_anonymous():
     project_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         with patch(
@@ -643,6 +661,7 @@ def test_get_project_detail_unpublished_visible_to_member():
     response_model = _build_project_response(project_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: SimpleNamespace(
         id=member_id
     )
@@ -663,6 +682,7 @@ def test_get_project_detail_not_found_returns_404():
     project_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         with patch(
@@ -682,6 +702,7 @@ def test_get_project_detail_forbidden_returns_403():
     stranger_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: SimpleNamespace(
         id=stranger_id
     )
@@ -706,6 +727,7 @@ def test_update_project_returns_200_and_payload():
     response_model = _build_project_response(project_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -746,6 +768,7 @@ def test_update_project_empty_payload_returns_422():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -764,6 +787,7 @@ def test_update_project_rejects_non_editable_field_returns_422():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -785,6 +809,7 @@ def test_update_project_not_found_returns_404():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -806,6 +831,7 @@ def test_update_project_forbidden_returns_403():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -829,6 +855,7 @@ def test_update_project_policy_denied_returns_403():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -854,6 +881,7 @@ def test_update_project_validation_error_returns_422():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -884,6 +912,7 @@ def test_publish_project_returns_200_and_payload():
     response_model = _build_project_response(project_id)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -915,6 +944,7 @@ def test_publish_project_not_found_returns_404():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -933,6 +963,7 @@ def test_publish_project_forbidden_returns_403():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -957,6 +988,7 @@ def test_unpublish_project_returns_200_and_payload():
     response_model.published_at = None
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -990,6 +1022,7 @@ def test_unpublish_project_not_found_returns_404():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1008,6 +1041,7 @@ def test_unpublish_project_forbidden_returns_403():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1028,6 +1062,7 @@ def test_list_projects_default_sort_top():
     response_model = _build_project_list_response()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.projects.ProjectService.list_projects",
@@ -1057,6 +1092,7 @@ def test_list_projects_passes_sort_limit_and_cursor():
     cursor = "abc123"
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.projects.ProjectService.list_projects",
@@ -1081,6 +1117,7 @@ def test_list_projects_passes_top_date_range():
     response_model = _build_project_list_response()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.projects.ProjectService.list_projects",
@@ -1102,6 +1139,7 @@ def test_list_projects_passes_top_date_range():
 
 def test_list_projects_invalid_cursor_returns_400():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.projects.ProjectService.list_projects",
@@ -1144,8 +1182,10 @@ def test_search_projects_defaults():
     assert request.limit == 20
     assert request.cursor is None
     assert request.sort == "top"
+    assert request.match == "any"
     assert request.published_from is None
     assert request.published_to is None
+    assert request.facets is False
     assert kwargs["current_user_id"] is None
 
 
@@ -1169,6 +1209,7 @@ def test_search_projects_merges_legacy_aliases_and_passes_user():
             "&tech_stack=postgres&tech_stack[]=redis"
             "&limit=5&cursor=abc123&sort=new"
             "&published_from=2025-01-01&published_to=2025-03-31"
+            "&facets=true&match=all"
         )
     finally:
         app.dependency_overrides.clear()
@@ -1187,6 +1228,8 @@ def test_search_projects_merges_legacy_aliases_and_passes_user():
     assert request.sort == "new"
     assert str(request.published_from) == "2025-01-01"
     assert str(request.published_to) == "2025-03-31"
+    assert request.facets is True
+    assert request.match == "all"
     assert kwargs["current_user_id"] == user_id
 
 
@@ -1242,11 +1285,28 @@ def test_search_projects_invalid_taxonomy_term_returns_422():
     mock_service.search_projects.assert_not_awaited()
 
 
+def test_search_projects_relevance_without_query_returns_422():
+    mock_service = SimpleNamespace(search_projects=AsyncMock())
+
+    app.dependency_overrides[get_search_service] = lambda: mock_service
+    app.dependency_overrides[get_current_user_optional] = lambda: None
+    try:
+        response = client.get("/api/v1/projects/search?sort=relevance")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 422
+    payload = response.json()
+    assert any("requires a keyword query" in item["msg"] for item in payload["detail"])
+    mock_service.search_projects.assert_not_awaited()
+
+
 def test_list_project_members_returns_200():
     project_id = uuid4()
     member = _build_member_info(uuid4(), role="maintainer")
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = lambda: None
     try:
         with patch(
@@ -1270,6 +1330,7 @@ def test_add_project_member_returns_201():
     member = _build_member_info(uuid4(), role="contributor")
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1299,6 +1360,7 @@ def test_add_project_member_conflict_returns_409():
     owner_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1327,6 +1389,7 @@ def test_update_project_member_returns_200():
     member = _build_member_info(target_user_id, role="maintainer")
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1357,6 +1420,7 @@ def test_remove_project_member_returns_204():
     owner_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1378,6 +1442,7 @@ def test_leave_project_last_owner_returns_409():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1397,6 +1462,7 @@ def test_leave_project_not_member_returns_404():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1473,6 +1539,7 @@ def test_add_project_member_validation_rejects_invalid_payload_shapes():
     ]
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1505,6 +1572,7 @@ def test_update_project_member_validation_rejects_invalid_payload_shapes():
     ]
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1527,6 +1595,7 @@ def test_add_project_vote_returns_204_and_calls_service():
     project_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1556,6 +1625,7 @@ def test_add_project_vote_not_found_returns_404():
     project_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1575,6 +1645,7 @@ def test_remove_project_vote_returns_204_and_calls_service():
     project_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1604,6 +1675,7 @@ def test_remove_project_vote_not_found_returns_404():
     project_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -1623,6 +1695,7 @@ def test_delete_project_owner_returns_204():
     owner_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1645,6 +1718,7 @@ def test_delete_project_non_owner_returns_403():
     owner_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -1666,6 +1740,7 @@ def test_delete_project_missing_returns_404():
     owner_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(owner_id)
     try:
         with patch(
@@ -0,0 +1,63 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from app.api.middleware import QueryStatsMiddleware
+from app.db.query_stats import current_query_stats, track_queries
+from app.tests.query_budget import assert_max_queries
+
+
+def test_track_queries_records_count_total_and_slowest():
+    with track_queries() as stats:
+        current_query_stats().record("SELECT 1", 0.002)
+        current_query_stats().record("SELECT 2", 0.005)
+
+    assert current_query_stats() is None
+    assert stats.count == 2
+    assert stats.total_ms == pytest.approx(7.0)
+    assert stats.slowest_ms == pytest.approx(5.0)
+    assert stats.slowest_statement == "SELECT 2"
+    assert stats.server_timing() == 'db;dur=7.00;desc="queries=2", db-slowest;dur=5.00'
+
+
+def test_nested_tracking_records_in_every_enclosing_block():
+    with track_queries() as outer:
+        with track_queries() as inner:
+            current_query_stats().record("SELECT 1", 0.001)
+        current_query_stats().record("SELECT 2", 0.001)
+
+    assert inner.count == 1
+    assert outer.count == 2
+
+
+def test_assert_max_queries_lists_statements_when_over_budget():
+    with pytest.raises(AssertionError, match="at most 1 queries, executed 2") as info:
+        with assert_max_queries(1):
+            current_query_stats().record("SELECT  *\n  FROM projects", 0.001)
+            current_query_stats().record("SELECT * FROM votes", 0.001)
+
+    assert "1. SELECT * FROM projects" in str(info.value)
+    assert "2. SELECT * FROM votes" in str(info.value)
+
+
+def test_middleware_sets_server_timing_header_and_logs(caplog):
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/probe")
+    async def probe():
+        stats = current_query_stats()
+        assert stats is not None
+        stats.record("SELECT 1", 0.003)
+        return {"ok": True}
+
+    with caplog.at_level(logging.INFO, logger="app.api.middleware"):
+        response = TestClient(app).get("/probe")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"] == (
+        'db;dur=3.00;desc="queries=1", db-slowest;dur=3.00'
+    )
+    assert "GET /probe queries=1 db_ms=3.0 slowest_ms=3.0" in caplog.text
@@ -0,0 +1,23 @@
+from uuid import uuid4
+
+from app.db.read_routing import ReadYourWritesTracker
+
+
+def test_tracker_routes_recent_writer_to_primary():
+    tracker = ReadYourWritesTracker(window_seconds=30)
+    writer_id = uuid4()
+
+    tracker.mark_write(writer_id)
+
+    assert tracker.should_read_primary(writer_id) is True
+    assert tracker.should_read_primary(uuid4()) is False
+    assert tracker.should_read_primary(None) is False
+
+
+def test_tracker_with_zero_window_never_sticks():
+    tracker = ReadYourWritesTracker(window_seconds=0)
+    writer_id = uuid4()
+
+    tracker.mark_write(writer_id)
+
+    assert tracker.should_read_primary(writer_id) is False
@@ -0,0 +1,205 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from app.models.project import Project
+from app.services.search_index import ProjectSearchIndex, SearchIndexQuery
+
+_NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _row(
+    title: str,
+    *,
+    short_description: str = "Project",
+    vote_count: int = 0,
+    published_at: datetime = _NOW,
+    tags: tuple[str, ...] = (),
+):
+    project = Project(
+        id=uuid4(),
+        created_by_id=uuid4(),
+        title=title,
+        slug=f"search-index-{uuid4().hex[:8]}",
+        short_description=short_description,
+        long_description=None,
+        demo_url=None,
+        github_url=None,
+        video_url=None,
+        vote_count=vote_count,
+        is_group_project=False,
+        is_published=True,
+        published_at=published_at,
+        created_at=published_at,
+        updated_at=published_at,
+    )
+    return SimpleNamespace(
+        **project.model_dump(),
+        categories_terms=None,
+        tags_terms=[[str(uuid4()), tag] for tag in tags],
+        tech_stack_terms=None,
+    )
+
+
+def _db(rows):
+    db = AsyncMock()
+    db.exec = AsyncMock(return_value=Mock(all=Mock(return_value=rows)))
+    return db
+
+
+def _titles(page):
+    projects, _ = page
+    return [project.title for project in projects]
+
+
+@pytest.mark.asyncio
+async def test_keyword_postings_match_substrings_like_the_database():
+    index = ProjectSearchIndex(max_age_seconds=60)
+    await index.load(
+        _db(
+            [
+                _row("Gator Rank", published_at=_NOW),
+                _row("Alligator", published_at=_NOW - timedelta(days=1)),
+                _row("Rank", short_description="gat or", published_at=_NOW),
+                _row("Go", short_description="100% done", published_at=_NOW),
+            ]
+        )
+    )
+
+    def search(keyword: str) -> list[str]:
+        return _titles(
+            index.page(
+                SearchIndexQuery(keyword=keyword), sort="new", after=None, limit=10
+            )
+        )
+
+    assert sorted(search("gator")) == ["Alligator", "Gator Rank"]
+    # Title and description are separate fields, as in the SQL `OR`.
+    assert search("rank gat") == []
+    assert search("% d") == ["Go"]
+    # Keywords shorter than a trigram are checked against every project.
+    assert search("go") == ["Go"]
+
+
+@pytest.mark.asyncio
+async def test_pages_walk_precomputed_order_from_the_cursor():
+    rows = [_row(f"Top {votes}", vote_count=votes) for votes in (5, 9, 1, 7)]
+    index = ProjectSearchIndex(max_age_seconds=60)
+    await index.load(_db(rows))
+
+    first, has_more = index.page(SearchIndexQuery(), sort="top", after=None, limit=2)
+    last = first[-1]
+    second, second_has_more = index.page(
+        SearchIndexQuery(),
+        sort="top",
+        after=(last.vote_count, last.created_at, last.id),
+        limit=2,
+    )
+
+    assert [project.title for project in first] == ["Top 9", "Top 7"]
+    assert has_more is True
+    assert [project.title for project in second] == ["Top 5", "Top 1"]
+    assert second_has_more is False
+
+
+@pytest.mark.asyncio
+async def test_vote_and_removal_events_update_order_and_postings():
+    low, high = _row("Low", vote_count=1, tags=("ml",)), _row("High", vote_count=4)
+    index = ProjectSearchIndex(max_age_seconds=60)
+    await index.load(_db([low, high]))
+
+    index.update_vote_count(low.id, 10)
+    assert _titles(index.page(SearchIndexQuery(), sort="top", after=None, limit=5)) == [
+        "Low",
+        "High",
+    ]
+
+    index.remove(low.id)
+    tagged = SearchIndexQuery(terms={"tags": ("ml",)})
+    assert _titles(index.page(tagged, sort="top", after=None, limit=5)) == []
+    assert index.facet_counts(SearchIndexQuery(), limit_per_family=5)["tags"] == {}
+
+
+@pytest.mark.asyncio
+async def test_writer_hooks_are_noops_until_loaded():
+    db = _db([])
+    index = ProjectSearchIndex(max_age_seconds=60)
+
+    await index.refresh_project(db, uuid4())
+    index.update_vote_count(uuid4(), 3)
+
+    db.exec.assert_not_awaited()
+    assert not index.is_loaded
+
+
+@pytest.mark.asyncio
+async def test_events_during_a_load_are_replayed_onto_the_new_snapshot():
+    first, second = _row("First", vote_count=2), _row("Second", vote_count=3)
+    index = ProjectSearchIndex(max_age_seconds=60)
+    await index.load(_db([first, second]))
+
+    async def exec_with_concurrent_vote(_statement):
+        # The vote commits after the load has read its rows.
+        index.update_vote_count(first.id, 8)
+        return Mock(all=Mock(return_value=[first, second]))
+
+    db = AsyncMock()
+    db.exec = AsyncMock(side_effect=exec_with_concurrent_vote)
+    await index.load(db)
+
+    assert _titles(index.page(SearchIndexQuery(), sort="top", after=None, limit=5)) == [
+        "First",
+        "Second",
+    ]
+
+
+def _sessions(db):
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    return session
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reloaded_after_max_age():
+    clock = SimpleNamespace(now=0.0)
+    db = _db([_row("Only")])
+    index = ProjectSearchIndex(
+        max_age_seconds=60, session_factory=_sessions(db), clock=lambda: clock.now
+    )
+
+    await index.ensure_fresh()
+    await index.ensure_fresh()
+    clock.now = 61
+    await index.ensure_fresh()
+
+    assert db.exec.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reloads_share_one_snapshot_read():
+    release = asyncio.Event()
+
+    async def slow_exec(_statement):
+        await release.wait()
+        return Mock(all=Mock(return_value=[_row("Only")]))
+
+    db = AsyncMock()
+    db.exec = AsyncMock(side_effect=slow_exec)
+    index = ProjectSearchIndex(max_age_seconds=60, session_factory=_sessions(db))
+
+    waiters = [asyncio.create_task(index.ensure_fresh()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*waiters)
+
+    assert db.exec.await_count == 1
+    assert _titles(index.page(SearchIndexQuery(), sort="new", after=None, limit=5)) == [
+        "Only"
+    ]
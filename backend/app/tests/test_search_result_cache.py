@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.models.project import Project
+from app.services.search_result_cache import CachedSearchPage, SearchResultCache
+
+_NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _project(*, vote_count: int = 0, published_at: datetime = _NOW) -> Project:
+    return Project(
+        id=uuid4(),
+        created_by_id=uuid4(),
+        title="Cached",
+        slug=f"cached-{uuid4().hex[:8]}",
+        short_description="Cached page project",
+        vote_count=vote_count,
+        is_published=True,
+        published_at=published_at,
+        created_at=published_at,
+        updated_at=published_at,
+    )
+
+
+def _cache_with(**pages: CachedSearchPage) -> SearchResultCache:
+    cache = SearchResultCache(ttl_seconds=60, max_entries=16)
+    for name, page in pages.items():
+        cache.put((name, None, 20, 0.5), page, generation=cache.generation)
+    return cache
+
+
+def _cached(cache: SearchResultCache, *names: str) -> list[str]:
+    return [name for name in names if cache.get((name, None, 20, 0.5)) is not None]
+
+
+def test_vote_drops_only_top_pages_spanning_the_vote_count():
+    cache = _cache_with(
+        first=CachedSearchPage(
+            sort="top", project_ids=(), next_cursor="c", span_low=10
+        ),
+        middle=CachedSearchPage(
+            sort="top", project_ids=(), next_cursor="c", span_high=10, span_low=5
+        ),
+        last=CachedSearchPage(
+            sort="top", project_ids=(), next_cursor=None, span_high=5
+        ),
+        new=CachedSearchPage(sort="new", project_ids=(), next_cursor=None),
+    )
+
+    cache.vote_count_changed(8)
+
+    assert _cached(cache, "first", "middle", "last", "new") == ["first", "last", "new"]
+
+
+def test_removal_drops_only_pages_listing_the_project():
+    project_id = uuid4()
+    cache = _cache_with(
+        listed=CachedSearchPage(
+            sort="new", project_ids=(project_id,), next_cursor=None
+        ),
+        other=CachedSearchPage(sort="new", project_ids=(uuid4(),), next_cursor=None),
+    )
+
+    cache.project_removed(project_id)
+
+    assert _cached(cache, "listed", "other") == ["other"]
+
+
+def test_change_drops_pages_the_project_could_enter():
+    project = _project(vote_count=3, published_at=_NOW - timedelta(days=2))
+    cache = _cache_with(
+        ranked=CachedSearchPage(sort="relevance", project_ids=(), next_cursor=None),
+        top_above=CachedSearchPage(
+            sort="top", project_ids=(), next_cursor="c", span_low=7
+        ),
+        top_below=CachedSearchPage(
+            sort="top", project_ids=(), next_cursor=None, span_high=7
+        ),
+        new_recent=CachedSearchPage(
+            sort="new", project_ids=(), next_cursor="c", span_low=_NOW
+        ),
+        new_older=CachedSearchPage(
+            sort="new", project_ids=(), next_cursor=None, span_high=_NOW
+        ),
+    )
+
+    cache.project_changed(project)
+
+    assert _cached(
+        cache, "ranked", "top_above", "top_below", "new_recent", "new_older"
+    ) == ["top_above", "new_recent"]
+
+
+def test_page_read_before_a_matching_invalidation_is_not_stored():
+    cache = SearchResultCache(ttl_seconds=60, max_entries=16)
+    generation = cache.generation
+    top = CachedSearchPage(sort="top", project_ids=(uuid4(),), next_cursor=None)
+    new = CachedSearchPage(sort="new", project_ids=(uuid4(),), next_cursor=None)
+
+    cache.vote_count_changed(1)
+    cache.put(("top", None, 20, 0.5), top, generation=generation)
+    cache.put(("new", None, 20, 0.5), new, generation=generation)
+
+    # The vote could have moved the `top` page but never the `new` one.
+    assert _cached(cache, "top", "new") == ["new"]
+
+
+def test_page_is_not_stored_once_the_invalidations_it_missed_are_forgotten():
+    clock = SimpleNamespace(now=0.0)
+    cache = SearchResultCache(ttl_seconds=60, max_entries=16, clock=lambda: clock.now)
+    generation = cache.generation
+    page = CachedSearchPage(sort="new", project_ids=(uuid4(),), next_cursor=None)
+
+    cache.vote_count_changed(1)
+    clock.now = 60
+    cache.vote_count_changed(1)
+    cache.put(("slow", None, 20, 0.5), page, generation=generation)
+
+    assert _cached(cache, "slow") == []
+
+
+def test_replica_page_is_not_stored_while_a_matching_write_may_still_lag():
+    clock = SimpleNamespace(now=0.0)
+    cache = SearchResultCache(
+        ttl_seconds=60, max_entries=16, replica_lag_seconds=5, clock=lambda: clock.now
+    )
+    cache.vote_count_changed(1)
+    top = CachedSearchPage(sort="top", project_ids=(uuid4(),), next_cursor=None)
+    new = CachedSearchPage(sort="new", project_ids=(uuid4(),), next_cursor=None)
+
+    # Read after the vote, but the replica may not have applied it yet.
+    cache.put(
+        ("top", None, 20, 0.5), top, generation=cache.generation, from_replica=True
+    )
+    cache.put(
+        ("new", None, 20, 0.5), new, generation=cache.generation, from_replica=True
+    )
+    assert _cached(cache, "top", "new") == ["new"]
+
+    clock.now = 6
+    cache.put(
+        ("top", None, 20, 0.5), top, generation=cache.generation, from_replica=True
+    )
+    assert _cached(cache, "top", "new") == ["top", "new"]
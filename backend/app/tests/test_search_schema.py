@@ -12,8 +12,10 @@ def test_project_search_request_defaults():
     assert payload.tags == []
     assert payload.tech_stack == []
     assert payload.sort == "top"
+    assert payload.match == "any"
     assert payload.limit == 20
     assert payload.cursor is None
+    assert payload.facets is False
 
 
 def test_project_search_request_normalizes_query_and_cursor():
@@ -43,3 +45,11 @@ def test_project_search_request_normalizes_and_deduplicates_taxonomy_terms():
 def test_project_search_request_rejects_control_chars_in_filter_terms():
     with pytest.raises(ValidationError, match="control characters"):
         ProjectSearchRequest(tags=["bad\x01term"])
+
+
+@pytest.mark.parametrize("sort", ["relevance", "similarity"])
+def test_project_search_request_ranked_sorts_require_query(sort):
+    with pytest.raises(ValidationError, match=f"sort={sort} requires a keyword query"):
+        ProjectSearchRequest(sort=sort, q="   ")
+
+    assert ProjectSearchRequest(sort=sort, q="gator").sort == sort
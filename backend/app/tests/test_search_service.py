@@ -65,6 +65,20 @@ def test_build_search_signature_is_order_insensitive_for_filter_lists():
     assert first_sig == second_sig
 
 
+def test_build_search_signature_separates_match_modes():
+    service = PostgresSearchService(cast(AsyncSession, DummySession()))
+    top_range = (date(2026, 1, 1), date(2026, 1, 31))
+
+    def signature(**kwargs) -> str:
+        return service._build_search_signature(
+            request=ProjectSearchRequest(tags=["python", "rust"], **kwargs),
+            top_range=top_range,
+        )
+
+    assert signature(match="all") != signature(match="any")
+    assert signature(match="any") == signature()
+
+
 def test_decode_cursor_rejects_search_signature_mismatch():
     service = PostgresSearchService(cast(AsyncSession, DummySession()))
     project = _make_project()
@@ -163,3 +177,27 @@ def test_decode_cursor_rejects_tampered_or_malformed_payloads(
             search_signature="sig-a",
             top_range=top_range,
         )
+
+
+@pytest.mark.parametrize("rank", ["not-a-number", "nan", "inf", 3])
+def test_decode_cursor_rejects_malformed_relevance_rank(rank):
+    service = PostgresSearchService(cast(AsyncSession, DummySession()))
+    cursor = service._encode_cursor(
+        project=_make_project(),
+        sort="relevance",
+        search_signature="sig-a",
+        top_range=None,
+        rank=0.25,
+    )
+    payload = decode_cursor_payload(cursor)
+    assert service._decode_cursor(
+        cursor=cursor, sort="relevance", search_signature="sig-a", top_range=None
+    ) == {**payload, "rank": "0.25"}
+
+    with pytest.raises(CursorError, match="Invalid cursor"):
+        service._decode_cursor(
+            cursor=encode_cursor_payload({**payload, "rank": rank}),
+            sort="relevance",
+            search_signature="sig-a",
+            top_range=None,
+        )
@@ -0,0 +1,174 @@
+import json
+import logging
+
+from app.db.slow_query import (
+    SlowQueryLog,
+    build_explain_writer,
+    is_explainable,
+    normalize_statement,
+    parameter_shapes,
+    statement_fingerprint,
+)
+
+
+def test_fingerprint_ignores_literals_placeholder_numbers_and_in_list_length():
+    short = "SELECT * FROM projects WHERE id IN ($1::UUID, $2::UUID) LIMIT 20"
+    long = (
+        "SELECT *  FROM projects\n WHERE id IN ($4::UUID, $5::UUID, $6::UUID) LIMIT 50"
+    )
+
+    assert normalize_statement(short) == (
+        "SELECT * FROM projects WHERE id IN ($?::UUID, ...) LIMIT ?"
+    )
+    assert statement_fingerprint(short) == statement_fingerprint(long)
+    assert statement_fingerprint(short) != statement_fingerprint(
+        "SELECT * FROM users WHERE id IN ($1::UUID, $2::UUID) LIMIT 20"
+    )
+
+
+def test_parameter_shapes_never_include_values():
+    shapes = parameter_shapes(("secret@ufl.edu", 3, None, ["a", "b"]))
+
+    assert shapes == ["str[14]", "int", "null", "list[2]"]
+    assert parameter_shapes([(1,), (2,)], executemany=True) == ["rows[2]", "int"]
+
+
+def test_only_plain_reads_are_explainable():
+    assert is_explainable("SELECT projects.created_at FROM projects")
+    assert is_explainable("WITH ranked AS (SELECT 1) SELECT * FROM ranked")
+    assert not is_explainable("UPDATE projects SET vote_count = 1")
+    assert not is_explainable("WITH gone AS (DELETE FROM votes RETURNING *) SELECT 1")
+    assert not is_explainable("SELECT * FROM projects FOR UPDATE")
+
+
+def test_reads_with_side_effects_are_not_explainable():
+    assert not is_explainable(
+        "WITH inserted AS (INSERT INTO taxonomy_terms (name) VALUES ($1) "
+        "RETURNING id) SELECT pg_notify($2, $3) FROM inserted"
+    )
+    assert not is_explainable("SELECT pg_notify('taxonomy_terms', '')")
+    assert not is_explainable(
+        "SELECT set_config('pg_trgm.similarity_threshold', $1, true)"
+    )
+    assert not is_explainable("SELECT pg_advisory_xact_lock($1)")
+    assert is_explainable("SELECT projects.config_notes FROM projects")
+
+
+def test_fast_statements_are_not_logged(caplog):
+    slow_log = SlowQueryLog(threshold_ms=100)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        slow_log.record(
+            statement="SELECT 1",
+            parameters=(),
+            executemany=False,
+            duration_ms=5,
+            explain=None,
+        )
+
+    assert caplog.text == ""
+
+
+def test_slow_statement_is_logged_with_fingerprint_and_shapes(caplog):
+    slow_log = SlowQueryLog(threshold_ms=100)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        slow_log.record(
+            statement="SELECT * FROM projects WHERE title ILIKE $1::VARCHAR",
+            parameters=("%gator%",),
+            executemany=False,
+            duration_ms=250,
+            explain=None,
+        )
+
+    assert "fingerprint=" in caplog.text
+    assert "duration_ms=250.0" in caplog.text
+    assert "params=['str[7]']" in caplog.text
+    assert "gator" not in caplog.text
+
+
+def test_sampled_slow_read_writes_plan_line():
+    lines: list[str] = []
+    slow_log = SlowQueryLog(
+        threshold_ms=100,
+        explain_sample_rate=0.5,
+        explain_writer=lines.append,
+        sample=lambda: 0.1,
+    )
+
+    slow_log.record(
+        statement="SELECT * FROM projects",
+        parameters=(),
+        executemany=False,
+        duration_ms=150,
+        explain=lambda: [{"Plan": {"Node Type": "Seq Scan"}}],
+    )
+
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["fingerprint"] == statement_fingerprint("SELECT * FROM projects")
+    assert entry["plan"] == [{"Plan": {"Node Type": "Seq Scan"}}]
+
+
+def test_unsampled_writes_and_failed_explains_are_skipped(caplog):
+    lines: list[str] = []
+    explained: list[str] = []
+
+    def explain():
+        explained.append("called")
+        raise RuntimeError("boom")
+
+    unsampled = SlowQueryLog(
+        threshold_ms=1,
+        explain_sample_rate=0.5,
+        explain_writer=lines.append,
+        sample=lambda: 0.9,
+    )
+    unsampled.record(
+        statement="SELECT 1",
+        parameters=(),
+        executemany=False,
+        duration_ms=10,
+        explain=explain,
+    )
+
+    sampled = SlowQueryLog(
+        threshold_ms=1,
+        explain_sample_rate=1.0,
+        explain_writer=lines.append,
+        sample=lambda: 0.0,
+    )
+    sampled.record(
+        statement="DELETE FROM votes",
+        parameters=(),
+        executemany=False,
+        duration_ms=10,
+        explain=explain,
+    )
+    assert explained == []
+
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        sampled.record(
+            statement="SELECT 1",
+            parameters=(),
+            executemany=False,
+            duration_ms=10,
+            explain=explain,
+        )
+
+    assert explained == ["called"]
+    assert lines == []
+    assert "EXPLAIN capture failed" in caplog.text
+
+
+def test_explain_writer_rotates_local_file(tmp_path):
+    path = tmp_path / "explain" / "plans.jsonl"
+    write = build_explain_writer(str(path), max_bytes=200, backup_count=2)
+
+    for index in range(10):
+        write(json.dumps({"index": index, "padding": "x" * 40}))
+
+    assert path.exists()
+    assert (tmp_path / "explain" / "plans.jsonl.1").exists()
+    assert not (tmp_path / "explain" / "plans.jsonl.3").exists()
+    assert json.loads(path.read_text().splitlines()[-1])["index"] == 9
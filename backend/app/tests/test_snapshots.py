@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.utils.snapshots import SnapshotReloader
+
+
+@pytest.mark.asyncio
+async def test_writes_during_a_read_are_replayed_onto_its_snapshot():
+    reloader: SnapshotReloader[list[str]] = SnapshotReloader(max_age_seconds=60)
+    await reloader.load(lambda: _value(["initial"]))
+
+    async def read_with_concurrent_write() -> list[str]:
+        # The write commits after the read has taken its rows.
+        reloader.apply(lambda items: items.append("written"))
+        return ["reloaded"]
+
+    await reloader.load(read_with_concurrent_write)
+
+    assert reloader.snapshot == ["reloaded", "written"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_read():
+    reloader: SnapshotReloader[list[str]] = SnapshotReloader(max_age_seconds=60)
+    release = asyncio.Event()
+    reads = 0
+
+    async def slow_read() -> list[str]:
+        nonlocal reads
+        reads += 1
+        await release.wait()
+        return ["loaded"]
+
+    waiters = [asyncio.create_task(reloader.ensure_fresh(slow_read)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*waiters)
+
+    assert reads == 1
+    assert reloader.snapshot == ["loaded"]
+
+
+@pytest.mark.asyncio
+async def test_read_started_before_clear_is_discarded():
+    reloader: SnapshotReloader[list[str]] = SnapshotReloader(max_age_seconds=60)
+
+    async def read_across_clear() -> list[str]:
+        reloader.clear()
+        return ["stale"]
+
+    await reloader.load(read_across_clear)
+
+    assert reloader.snapshot is None
+    assert not reloader.is_fresh()
+
+
+async def _value(value: list[str]) -> list[str]:
+    return value
@@ -0,0 +1,191 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.auth_bootstrap import (
+    AuthBootstrapError,
+    SupabaseAdminClient,
+    SupabaseAdminUnavailableError,
+)
+from app.tests.local_http import LocalHTTPServer, LocalResponse
+
+
+def _client(server: LocalHTTPServer, **overrides: object) -> SupabaseAdminClient:
+    settings = get_settings().model_copy(
+        update={
+            "SUPABASE_URL": server.url,
+            "SUPABASE_SECRET_KEY": "service-secret",
+            "SUPABASE_ADMIN_TIMEOUT_SECONDS": 2.0,
+            "SUPABASE_ADMIN_BREAKER_FAILURE_THRESHOLD": 2,
+            "SUPABASE_ADMIN_BREAKER_RESET_SECONDS": 60.0,
+            **overrides,
+        }
+    )
+    return SupabaseAdminClient(settings)
+
+
+def _user_path(auth_user_id) -> str:
+    return f"/auth/v1/admin/users/{auth_user_id}"
+
+
+@pytest.mark.asyncio
+async def test_get_user_returns_payload_with_service_credentials():
+    auth_user_id = uuid4()
+    with LocalHTTPServer() as server:
+        server.route(
+            "GET",
+            _user_path(auth_user_id),
+            LocalResponse.json({"id": str(auth_user_id), "email_confirmed_at": "x"}),
+        )
+        client = _client(server)
+        try:
+            payload = await client.get_user(auth_user_id)
+        finally:
+            await client.aclose()
+
+    assert payload["id"] == str(auth_user_id)
+    request = server.requests[0]
+    assert request.headers["authorization"] == "Bearer service-secret"
+    assert request.headers["apikey"] == "service-secret"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_user_for_same_id_shares_one_request():
+    auth_user_id = uuid4()
+    other_user_id = uuid4()
+    with LocalHTTPServer() as server:
+        for user_id in (auth_user_id, other_user_id):
+            server.route(
+                "GET",
+                _user_path(user_id),
+                LocalResponse.json({"id": str(user_id)}, delay=0.05),
+            )
+        client = _client(server)
+        try:
+            results = await asyncio.gather(
+                *(client.get_user(auth_user_id) for _ in range(5)),
+                client.get_user(other_user_id),
+            )
+        finally:
+            await client.aclose()
+
+    assert [result["id"] for result in results[:5]] == [str(auth_user_id)] * 5
+    assert results[5]["id"] == str(other_user_id)
+    assert server.count("GET", _user_path(auth_user_id)) == 1
+    assert server.count("GET", _user_path(other_user_id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_server_errors_open_circuit_and_fail_fast():
+    auth_user_id = uuid4()
+    with LocalHTTPServer() as server:
+        server.route("GET", _user_path(auth_user_id), LocalResponse(status=503))
+        client = _client(server)
+        try:
+            for _ in range(2):
+                with pytest.raises(SupabaseAdminUnavailableError, match="503"):
+                    await client.get_user(auth_user_id)
+            with pytest.raises(SupabaseAdminUnavailableError, match="unavailable"):
+                await client.get_user(auth_user_id)
+        finally:
+            await client.aclose()
+
+    assert server.count("GET", _user_path(auth_user_id)) == 2
+    assert client.breaker.state == client.breaker.OPEN
+
+
+@pytest.mark.asyncio
+async def test_circuit_closes_after_successful_trial_call():
+    auth_user_id = uuid4()
+    with LocalHTTPServer() as server:
+        server.route("GET", _user_path(auth_user_id), LocalResponse(status=500))
+        client = _client(server, SUPABASE_ADMIN_BREAKER_RESET_SECONDS=0.05)
+        try:
+            for _ in range(2):
+                with pytest.raises(SupabaseAdminUnavailableError):
+                    await client.get_user(auth_user_id)
+
+            server.route(
+                "GET",
+                _user_path(auth_user_id),
+                LocalResponse.json({"id": str(auth_user_id)}),
+            )
+            await asyncio.sleep(0.06)
+            payload = await client.get_user(auth_user_id)
+        finally:
+            await client.aclose()
+
+    assert payload["id"] == str(auth_user_id)
+    assert client.breaker.state == client.breaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_call_releases_the_trial_slot():
+    auth_user_id = uuid4()
+    with LocalHTTPServer() as server:
+        server.route("GET", _user_path(auth_user_id), LocalResponse(status=500))
+        client = _client(server, SUPABASE_ADMIN_BREAKER_RESET_SECONDS=0.05)
+        try:
+            for _ in range(2):
+                with pytest.raises(SupabaseAdminUnavailableError):
+                    await client.get_user(auth_user_id)
+
+            server.route(
+                "GET",
+                _user_path(auth_user_id),
+                LocalResponse.json({"id": str(auth_user_id)}, delay=1.0),
+            )
+            await asyncio.sleep(0.06)
+            # get_user shields the shared fetch, so cancel the fetch itself.
+            trial = asyncio.create_task(client._fetch_user(auth_user_id))
+            await asyncio.sleep(0.05)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+
+            server.route(
+                "GET",
+                _user_path(auth_user_id),
+                LocalResponse.json({"id": str(auth_user_id)}),
+            )
+            payload = await client.get_user(auth_user_id)
+        finally:
+            await client.aclose()
+
+    assert payload["id"] == str(auth_user_id)
+    assert client.breaker.state == client.breaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip_circuit():
+    auth_user_id = uuid4()
+    with LocalHTTPServer() as server:
+        client = _client(server)
+        try:
+            for _ in range(3):
+                with pytest.raises(AuthBootstrapError, match="404") as exc_info:
+                    await client.get_user(auth_user_id)
+                assert not isinstance(exc_info.value, SupabaseAdminUnavailableError)
+        finally:
+            await client.aclose()
+
+    assert client.breaker.state == client.breaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_timeout_raises_unavailable_error():
+    auth_user_id = uuid4()
+    with LocalHTTPServer() as server:
+        server.route(
+            "GET",
+            _user_path(auth_user_id),
+            LocalResponse.json({"id": str(auth_user_id)}, delay=0.5),
+        )
+        client = _client(server, SUPABASE_ADMIN_TIMEOUT_SECONDS=0.05)
+        try:
+            with pytest.raises(SupabaseAdminUnavailableError, match="timed out"):
+                await client.get_user(auth_user_id)
+        finally:
+            await client.aclose()
@@ -6,9 +6,11 @@ from uuid import uuid4
 from fastapi.testclient import TestClient
 
 from app.api.deps.auth import get_current_user
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.main import app
+from app.schemas.taxonomy import TaxonomyTermResponse
 from app.services.taxonomy import TaxonomyConflictError
+from app.services.taxonomy_dictionary import TaxonomyListing
 
 client = TestClient(app)
 
@@ -20,6 +22,12 @@ async def _override_get_db():
     yield MockSession()
 
 
+def _listing(terms: list[dict[str, str]]) -> TaxonomyListing:
+    return TaxonomyListing.from_terms(
+        TaxonomyTermResponse.model_validate(term) for term in terms
+    )
+
+
 def _override_current_user(*, role: str):
     now = datetime.now(timezone.utc)
     return lambda: SimpleNamespace(
@@ -38,12 +46,13 @@ def test_list_taxonomy_categories_requires_auth():
 
 def test_list_taxonomy_categories_returns_terms_for_authenticated_user():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="student")
     terms = [{"id": str(uuid4()), "name": "Backend"}]
     try:
         with patch(
-            "app.api.v1.taxonomy.TaxonomyService.list_categories",
-            new=AsyncMock(return_value=terms),
+            "app.api.v1.taxonomy.TaxonomyService.get_categories_listing",
+            new=AsyncMock(return_value=_listing(terms)),
         ):
             response = client.get("/api/v1/taxonomy/categories")
     finally:
@@ -53,8 +62,41 @@ def test_list_taxonomy_categories_returns_terms_for_authenticated_user():
     assert response.json() == terms
 
 
+def test_list_taxonomy_categories_sends_etag_and_honors_if_none_match():
+    app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
+    app.dependency_overrides[get_current_user] = _override_current_user(role="student")
+    listing = _listing([{"id": str(uuid4()), "name": "Backend"}])
+    try:
+        with patch(
+            "app.api.v1.taxonomy.TaxonomyService.get_categories_listing",
+            new=AsyncMock(return_value=listing),
+        ):
+            first = client.get("/api/v1/taxonomy/categories")
+            revalidated = client.get(
+                "/api/v1/taxonomy/categories",
+                headers={"If-None-Match": f'"stale", W/{listing.etag}'},
+            )
+            changed = client.get(
+                "/api/v1/taxonomy/categories", headers={"If-None-Match": '"stale"'}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert first.headers["etag"] == listing.etag
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert first.content == listing.body
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == listing.etag
+    assert changed.status_code == 200
+    assert changed.json() == first.json()
+
+
 def test_create_taxonomy_category_requires_admin_role():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="student")
     try:
         with patch(
@@ -76,6 +118,7 @@ def test_create_taxonomy_category_requires_admin_role():
 def test_create_taxonomy_category_admin_success():
     term = {"id": str(uuid4()), "name": "Backend"}
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="admin")
     try:
         with patch(
@@ -95,6 +138,7 @@ def test_create_taxonomy_category_admin_success():
 
 def test_create_taxonomy_category_conflict_returns_409():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="admin")
     try:
         with patch(
@@ -116,6 +160,7 @@ def test_create_taxonomy_category_conflict_returns_409():
 
 def test_create_taxonomy_category_invalid_name_returns_422():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="admin")
     try:
         with patch(
@@ -140,12 +185,13 @@ def test_create_taxonomy_category_requires_auth():
 
 def test_list_taxonomy_tags_returns_terms_for_authenticated_user():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="student")
     terms = [{"id": str(uuid4()), "name": "API"}]
     try:
         with patch(
-            "app.api.v1.taxonomy.TaxonomyService.list_tags",
-            new=AsyncMock(return_value=terms),
+            "app.api.v1.taxonomy.TaxonomyService.get_tags_listing",
+            new=AsyncMock(return_value=_listing(terms)),
         ):
             response = client.get("/api/v1/taxonomy/tags")
     finally:
@@ -162,6 +208,7 @@ def test_create_taxonomy_tag_requires_auth():
 
 def test_create_taxonomy_tag_requires_admin_role():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="student")
     try:
         with patch(
@@ -179,6 +226,7 @@ def test_create_taxonomy_tag_requires_admin_role():
 
 def test_create_taxonomy_tag_conflict_returns_409():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="admin")
     try:
         with patch(
@@ -197,12 +245,13 @@ def test_create_taxonomy_tag_conflict_returns_409():
 
 def test_list_taxonomy_tech_stacks_returns_terms_for_authenticated_user():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="student")
     terms = [{"id": str(uuid4()), "name": "FastAPI"}]
     try:
         with patch(
-            "app.api.v1.taxonomy.TaxonomyService.list_tech_stacks",
-            new=AsyncMock(return_value=terms),
+            "app.api.v1.taxonomy.TaxonomyService.get_tech_stacks_listing",
+            new=AsyncMock(return_value=_listing(terms)),
         ):
             response = client.get("/api/v1/taxonomy/tech-stacks")
     finally:
@@ -219,6 +268,7 @@ def test_create_taxonomy_tech_stack_requires_auth():
 
 def test_create_taxonomy_tech_stack_requires_admin_role():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="student")
     try:
         with patch(
@@ -238,6 +288,7 @@ def test_create_taxonomy_tech_stack_requires_admin_role():
 
 def test_create_taxonomy_tech_stack_conflict_returns_409():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(role="admin")
     try:
         with patch(
@@ -254,3 +305,50 @@ def test_create_taxonomy_tech_stack_conflict_returns_409():
 
     assert response.status_code == 409
     assert response.json()["detail"] == "Taxonomy term already exists"
+
+
+def test_suggest_taxonomy_terms_requires_auth():
+    response = client.get("/api/v1/taxonomy/tags/suggest", params={"prefix": "py"})
+    assert response.status_code == 401
+
+
+def test_suggest_taxonomy_terms_passes_family_prefix_and_limit():
+    app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
+    app.dependency_overrides[get_current_user] = _override_current_user(role="student")
+    terms = [{"id": str(uuid4()), "name": "Python"}]
+    suggest_terms = AsyncMock(return_value=terms)
+    try:
+        with patch(
+            "app.api.v1.taxonomy.TaxonomyService.suggest_terms", new=suggest_terms
+        ):
+            response = client.get(
+                "/api/v1/taxonomy/tech-stacks/suggest",
+                params={"prefix": "Py", "limit": 3},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == terms
+    suggest_terms.assert_awaited_once_with("tech-stacks", "Py", limit=3)
+
+
+def test_suggest_taxonomy_terms_validates_family_prefix_and_limit():
+    app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
+    app.dependency_overrides[get_current_user] = _override_current_user(role="student")
+    try:
+        unknown_family = client.get(
+            "/api/v1/taxonomy/colors/suggest", params={"prefix": "re"}
+        )
+        missing_prefix = client.get("/api/v1/taxonomy/tags/suggest")
+        too_many = client.get(
+            "/api/v1/taxonomy/tags/suggest", params={"prefix": "re", "limit": 500}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert unknown_family.status_code == 422
+    assert missing_prefix.status_code == 422
+    assert too_many.status_code == 422
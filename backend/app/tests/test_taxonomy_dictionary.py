@@ -0,0 +1,186 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from app.models.taxonomy import Category, Tag, TechStack
+from app.services.taxonomy_dictionary import TaxonomyDictionary, TaxonomyListing
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _row(name: str, usage_count: int = 0):
+    return SimpleNamespace(
+        id=uuid4(), name=name, normalized_name=name.lower(), usage_count=usage_count
+    )
+
+
+def _db(*results):
+    db = AsyncMock()
+    db.exec = AsyncMock(side_effect=[Mock(all=Mock(return_value=r)) for r in results])
+    return db
+
+
+@pytest.mark.asyncio
+async def test_list_terms_loads_once_and_serves_from_memory():
+    rows = [_row("Alpha"), _row("Beta")]
+    db = _db(rows)
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+
+    first = await dictionary.list_terms(db, Tag)
+    second = await dictionary.list_terms(db, Tag)
+
+    assert [term.name for term in first] == ["Alpha", "Beta"]
+    assert second == first
+    assert db.exec.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_list_terms_reloads_after_max_age():
+    clock = _Clock()
+    db = _db([_row("Old")], [_row("Old"), _row("New")])
+    dictionary = TaxonomyDictionary(max_age_seconds=60, clock=clock)
+
+    await dictionary.list_terms(db, Category)
+    clock.now = 61
+    terms = await dictionary.list_terms(db, Category)
+
+    assert [term.name for term in terms] == ["Old", "New"]
+    assert db.exec.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_change_notification_marks_only_that_vocabulary_stale():
+    db = _db([_row("Go")], [_row("Rust")], [_row("Go"), _row("Zig")])
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+    await dictionary.load(db, [TechStack, Tag])
+
+    dictionary.mark_stale_by_table("tech_stacks")
+
+    assert dictionary.is_fresh(Tag)
+    assert not dictionary.is_fresh(TechStack)
+    terms = await dictionary.list_terms(db, TechStack)
+    assert [term.name for term in terms] == ["Go", "Zig"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_ids_reads_only_unknown_names():
+    known, fresh = _row("known"), _row("fresh")
+    db = _db([known], [fresh])
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+    await dictionary.load(db, [Tag])
+
+    ids = await dictionary.resolve_ids(db, Tag, ["fresh", "known", "absent"])
+    again = await dictionary.resolve_ids(db, Tag, ["known", "fresh"])
+
+    assert ids == [fresh.id, known.id]
+    assert again == [known.id, fresh.id]
+    assert db.exec.await_count == 2
+    # A term learned outside a full load means the listing is out of date.
+    assert not dictionary.is_fresh(Tag)
+
+
+@pytest.mark.asyncio
+async def test_terms_by_id_skips_queries_for_known_ids():
+    term_id = uuid4()
+    db = _db()
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+    dictionary.put(Category, term_id=term_id, name="Web", normalized_name="web")
+
+    terms = await dictionary.terms_by_id(db, Category, [term_id, term_id])
+
+    assert [(term.id, term.name) for term in terms.values()] == [(term_id, "Web")]
+    db.exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_listing_reuses_the_serialized_body_until_a_term_is_added():
+    alpha = _row("Alpha")
+    db = _db([alpha])
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+
+    first = await dictionary.listing(db, Tag)
+    assert await dictionary.listing(db, Tag) is first
+    assert json.loads(first.body) == [{"id": str(alpha.id), "name": "Alpha"}]
+
+    beta = _row("Beta")
+    dictionary.put(Tag, term_id=beta.id, name=beta.name, normalized_name="beta")
+    db.exec = AsyncMock(return_value=Mock(all=Mock(return_value=[alpha, beta])))
+    updated = await dictionary.listing(db, Tag)
+
+    assert updated.etag != first.etag
+    assert TaxonomyListing.from_terms(first.terms).etag == first.etag
+
+
+@pytest.mark.asyncio
+async def test_suggest_ranks_prefix_matches_by_usage_then_name():
+    rows = [
+        _row("React", 3),
+        _row("Redis", 9),
+        _row("Regex", 3),
+        _row("Rust", 20),
+        _row("Ruby", 1),
+    ]
+    db = _db(rows)
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+
+    suggested = await dictionary.suggest(db, TechStack, "re", limit=3)
+    capped = await dictionary.suggest(db, TechStack, "r", limit=2)
+    none = await dictionary.suggest(db, TechStack, "zz", limit=3)
+
+    assert [term.name for term in suggested] == ["Redis", "React", "Regex"]
+    assert [term.name for term in capped] == ["Rust", "Redis"]
+    assert none == []
+    assert db.exec.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_suggest_walks_usage_order_for_broad_prefixes():
+    rows = [_row(f"Term {index:03}", usage_count=index % 7) for index in range(300)]
+    rows.append(_row("Other", usage_count=100))
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+
+    suggested = await dictionary.suggest(_db(rows), Tag, "term", limit=3)
+
+    assert [term.name for term in suggested] == ["Term 006", "Term 013", "Term 020"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_ranks_broad_prefixes_across_index_blocks():
+    # Matches start and end mid-block, and the most used ones sit far apart.
+    rows = [_row(f"A{index:04}", usage_count=1000) for index in range(100)]
+    rows += [
+        _row(f"B{index:04}", usage_count=(index * 37) % 101) for index in range(900)
+    ]
+    rows += [_row(f"C{index:04}", usage_count=1000) for index in range(100)]
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+
+    suggested = await dictionary.suggest(_db(rows), Tag, "b", limit=5)
+
+    expected = sorted(
+        (row for row in rows if row.name.startswith("B")),
+        key=lambda row: (-row.usage_count, row.name),
+    )[:5]
+    assert [term.name for term in suggested] == [row.name for row in expected]
+
+
+@pytest.mark.asyncio
+async def test_suggest_reloads_after_a_new_term_is_added():
+    rust = _row("Rust", 5)
+    db = _db([rust], [rust, _row("Ruby", 0)])
+    dictionary = TaxonomyDictionary(max_age_seconds=60)
+    await dictionary.load(db, [TechStack])
+
+    dictionary.put(TechStack, term_id=uuid4(), name="Ruby", normalized_name="ruby")
+    suggested = await dictionary.suggest(db, TechStack, "ru", limit=5)
+
+    assert [term.name for term in suggested] == ["Rust", "Ruby"]
+    assert db.exec.await_count == 2
@@ -1,12 +1,18 @@
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from app.models.taxonomy import Tag
+from app.policy.roles import PolicyDeniedError
 from app.schemas.taxonomy import TaxonomyTermCreateRequest
 from app.services.taxonomy import (
     TaxonomyConflictError,
     TaxonomyService,
     normalize_taxonomy_name,
+    resolve_or_create_taxonomy_terms,
 )
 
 
@@ -18,6 +24,20 @@ class _ResultWithFirst:
         return self._value
 
 
+class _ResultWithAll:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+def _term_row(name: str):
+    return SimpleNamespace(
+        id=uuid4(), name=name, normalized_name=normalize_taxonomy_name(name)
+    )
+
+
 def test_normalize_taxonomy_name_trims_and_lowercases():
     assert normalize_taxonomy_name("  React Native  ") == "react native"
 
@@ -34,3 +54,100 @@ async def test_create_category_raises_conflict_when_normalized_name_exists():
 
     db.add.assert_not_called()
     db.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_resolve_or_create_taxonomy_terms_skips_queries_for_no_values():
+    db = AsyncMock()
+
+    assert await resolve_or_create_taxonomy_terms(db, Tag, []) == ([], False)
+
+    db.exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resolve_or_create_taxonomy_terms_resolves_existing_in_one_query():
+    python, go = _term_row("Python"), _term_row("Go")
+    db = AsyncMock()
+    db.exec = AsyncMock(return_value=_ResultWithAll([python, go]))
+    authorize_create = Mock()
+
+    terms, created = await resolve_or_create_taxonomy_terms(
+        db, Tag, [" go ", "PYTHON"], authorize_create=authorize_create
+    )
+
+    assert [(term.id, term.name) for term in terms] == [
+        (go.id, "Go"),
+        (python.id, "Python"),
+    ]
+    assert created is False
+    assert db.exec.await_count == 1
+    authorize_create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_resolve_or_create_taxonomy_terms_inserts_missing_in_one_statement():
+    existing = _term_row("Rust")
+    inserted = [_term_row("Zig"), _term_row("Elm")]
+    db = AsyncMock()
+    db.exec = AsyncMock(
+        side_effect=[_ResultWithAll([existing]), _ResultWithAll(inserted)]
+    )
+    authorize_create = Mock()
+
+    terms, created = await resolve_or_create_taxonomy_terms(
+        db, Tag, ["  Zig ", "rust", "Elm"], authorize_create=authorize_create
+    )
+
+    assert [term.name for term in terms] == ["Zig", "Rust", "Elm"]
+    assert created is True
+    authorize_create.assert_called_once_with()
+    compiled = db.exec.await_args_list[1].args[0].compile(dialect=postgresql.dialect())
+    assert "INSERT INTO tags" in str(compiled)
+    assert "pg_notify" in str(compiled)
+    # Rows are inserted sorted by normalized name.
+    assert [
+        value for key, value in compiled.params.items() if key.startswith("param_")
+    ] == ["Elm", "elm", "Zig", "zig"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_or_create_taxonomy_terms_denied_create_inserts_nothing():
+    db = AsyncMock()
+    db.exec = AsyncMock(return_value=_ResultWithAll([]))
+    authorize_create = Mock(side_effect=PolicyDeniedError("denied"))
+
+    with pytest.raises(PolicyDeniedError, match="denied"):
+        await resolve_or_create_taxonomy_terms(
+            db, Tag, ["New"], authorize_create=authorize_create
+        )
+
+    assert db.exec.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_or_create_taxonomy_terms_rereads_terms_lost_to_a_race():
+    raced = _term_row("Raced")
+    db = AsyncMock()
+    db.exec = AsyncMock(
+        side_effect=[
+            _ResultWithAll([]),
+            _ResultWithAll([]),
+            _ResultWithAll([raced]),
+        ]
+    )
+
+    terms, created = await resolve_or_create_taxonomy_terms(db, Tag, ["raced"])
+
+    assert [(term.id, term.name) for term in terms] == [(raced.id, "Raced")]
+    assert created is False
+    assert db.exec.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_resolve_or_create_taxonomy_terms_raises_when_race_reread_misses():
+    db = AsyncMock()
+    db.exec = AsyncMock(return_value=_ResultWithAll([]))
+
+    with pytest.raises(RuntimeError, match="could not be resolved"):
+        await resolve_or_create_taxonomy_terms(db, Tag, ["Ghost"])
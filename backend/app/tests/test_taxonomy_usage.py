@@ -0,0 +1,37 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.taxonomy import Tag
+from app.services.taxonomy_usage import adjust_term_usage, reconcile_taxonomy_usage
+
+
+@pytest.mark.asyncio
+async def test_adjust_term_usage_skips_the_query_without_changes():
+    db = AsyncMock()
+
+    await adjust_term_usage(db, Tag, added=[], removed=[])
+
+    db.exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_adjust_term_usage_counts_added_up_and_removed_down():
+    db = AsyncMock()
+    added, removed = uuid4(), uuid4()
+
+    await adjust_term_usage(db, Tag, added=[added], removed=[removed])
+
+    compiled = db.exec.await_args.args[0].compile()
+    assert "CASE WHEN" in str(compiled)
+    assert "FOR UPDATE" in str(compiled)
+    params = list(compiled.params.values())
+    assert 1 in params and -1 in params
+    assert [added] in params and [added, removed] in params
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rejects_empty_batches():
+    with pytest.raises(ValueError, match="batch_size"):
+        await reconcile_taxonomy_usage(AsyncMock(), batch_size=0)
@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.models.user import User
+from app.services.auth_bootstrap import AuthBootstrapService, AuthIdentity
+from app.services.user_cache import UserSnapshotCache
+
+
+def _build_user() -> User:
+    now = datetime.now(timezone.utc)
+    return User(  # pyright: ignore[reportCallIssue]
+        id=uuid4(),
+        auth_user_id=uuid4(),
+        email="cached@ufl.edu",
+        username="cached_user",
+        role="student",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_user_snapshot_cache_returns_detached_copy():
+    cache = UserSnapshotCache(ttl_seconds=30, max_entries=8)
+    user = _build_user()
+    cache.put(user)
+
+    cached = cache.get(user.auth_user_id)
+    assert cached is not None
+    assert cached is not user
+    assert cached.model_dump() == user.model_dump()
+
+    cached.role = "admin"
+    again = cache.get(user.auth_user_id)
+    assert again is not None
+    assert again.role == "student"
+    assert cache.stats.hits == 2
+
+
+def test_user_snapshot_cache_invalidate_drops_entry():
+    cache = UserSnapshotCache(ttl_seconds=30, max_entries=8)
+    user = _build_user()
+    cache.put(user)
+
+    cache.invalidate(user.auth_user_id)
+
+    assert cache.get(user.auth_user_id) is None
+    assert cache.stats.misses == 1
+
+
+def test_user_snapshot_cache_zero_ttl_disables_caching():
+    cache = UserSnapshotCache(ttl_seconds=0, max_entries=8)
+    user = _build_user()
+    cache.put(user)
+
+    assert cache.enabled is False
+    assert cache.get(user.auth_user_id) is None
+    assert cache.stats.hit_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_user_skips_lookup_on_cache_hit():
+    user = _build_user()
+    db = SimpleNamespace(exec=AsyncMock(return_value=Mock(one_or_none=lambda: user)))
+    cache = UserSnapshotCache(ttl_seconds=30, max_entries=8)
+    service = AuthBootstrapService(
+        cast(AsyncSession, db), get_settings(), user_cache=cache
+    )
+    identity = AuthIdentity(
+        auth_user_id=user.auth_user_id,
+        email=user.email,
+        username=None,
+        full_name=None,
+        email_confirmed=True,
+    )
+
+    first = await service.get_or_create_user(identity)
+    second = await service.get_or_create_user(identity)
+
+    assert first is user
+    assert second.id == user.id
+    db.exec.assert_awaited_once()
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
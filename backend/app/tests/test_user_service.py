@@ -9,6 +9,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models.user import User
 from app.schemas.user import UserUpdate
 from app.services.user import UserService
+from app.services.user_cache import UserSnapshotCache
 
 
 class DummySession:
@@ -80,3 +81,18 @@ async def test_update_user_returns_none_when_user_is_missing():
     assert updated is None
     db.commit.assert_not_awaited()
     db.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_cached_auth_snapshot(monkeypatch):
+    cache = UserSnapshotCache(ttl_seconds=30, max_entries=8)
+    monkeypatch.setattr("app.services.user.get_user_snapshot_cache", lambda: cache)
+    db = DummySession()
+    service = UserService(cast(AsyncSession, db))
+    user = _build_user()
+    cache.put(user)
+    service.get_user_by_id = AsyncMock(return_value=user)  # type: ignore[method-assign]
+
+    await service.update_user(user.id, UserUpdate(full_name="Renamed"))
+
+    assert cache.get(user.auth_user_id) is None
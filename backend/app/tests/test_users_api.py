@@ -4,7 +4,7 @@ from uuid import UUID, uuid4
 from fastapi.testclient import TestClient
 
 from app.api.deps.auth import get_current_user, get_current_user_optional
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.main import app
 from app.models.user import User
 from app.schemas.project import ProjectListResponse
@@ -51,6 +51,7 @@ def test_get_current_user_profile():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         response = client.get("/api/v1/users/me")
@@ -86,6 +87,7 @@ def test_update_current_user_profile():
     )
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -123,6 +125,7 @@ def test_update_current_user_allows_partial_payload():
     )
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -146,6 +149,7 @@ def test_update_current_user_requires_at_least_one_field():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         response = client.patch("/api/v1/users/me", json={})
@@ -159,6 +163,7 @@ def test_update_current_user_rejects_invalid_profile_url():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         response = client.patch(
@@ -174,6 +179,7 @@ def test_update_current_user_rejects_null_full_name():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         response = client.patch("/api/v1/users/me", json={"full_name": None})
@@ -187,6 +193,7 @@ def test_update_current_user_rejects_username_change():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         response = client.patch("/api/v1/users/me", json={"username": "new_handle"})
@@ -200,6 +207,7 @@ def test_update_current_user_missing_user_returns_500():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -235,6 +243,7 @@ def test_get_user_profile():
     )
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.users.UserService.get_user_by_id",
@@ -257,6 +266,7 @@ def test_get_user_profile_not_found():
     target_user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.users.UserService.get_user_by_id",
@@ -287,6 +297,7 @@ def test_get_user_profile_by_username_case_insensitive():
     )
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.users.UserService.get_user_by_username",
@@ -307,6 +318,7 @@ def test_get_user_profile_by_username_case_insensitive():
 
 def test_get_user_profile_by_username_not_found():
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.users.UserService.get_user_by_username",
@@ -336,6 +348,7 @@ def test_list_user_projects():
     empty_project_list = ProjectListResponse(items=[], next_cursor=None)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with (
             patch(
@@ -365,6 +378,7 @@ def test_list_user_projects_user_not_found():
     target_user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with patch(
             "app.api.v1.users.UserService.get_user_by_id",
@@ -392,6 +406,7 @@ def test_list_user_projects_invalid_cursor_returns_400():
     )
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with (
             patch(
@@ -429,6 +444,7 @@ def test_list_user_projects_by_username():
     empty_project_list = ProjectListResponse(items=[], next_cursor=None)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     try:
         with (
             patch(
@@ -473,6 +489,7 @@ def test_list_user_projects_passes_current_user_when_authenticated():
     empty_project_list = ProjectListResponse(items=[], next_cursor=None)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user_optional] = _override_current_user(
         current_user_id
     )
@@ -514,6 +531,7 @@ def test_list_my_projects_returns_payload_and_calls_service_with_defaults():
     empty_project_list = ProjectListResponse(items=[], next_cursor=None)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -543,6 +561,7 @@ def test_list_my_projects_passes_explicit_filters_to_service():
     empty_project_list = ProjectListResponse(items=[], next_cursor=None)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -572,6 +591,7 @@ def test_list_my_projects_invalid_cursor_returns_400():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -591,6 +611,7 @@ def test_list_my_voted_projects_returns_payload_and_calls_service():
     empty_project_list = ProjectListResponse(items=[], next_cursor=None)
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
@@ -614,6 +635,7 @@ def test_list_my_voted_projects_invalid_cursor_returns_400():
     user_id = uuid4()
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[get_current_user] = _override_current_user(user_id)
     try:
         with patch(
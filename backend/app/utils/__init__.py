@@ -1,3 +1,5 @@
+from app.utils.cache import CacheStats, ExpiringLRUCache
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from app.utils.pagination import (
     CursorError,
     decode_cursor_payload,
@@ -12,6 +14,10 @@ from app.utils.username import (
 )
 
 __all__ = [
+    "CacheStats",
+    "ExpiringLRUCache",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "CursorError",
     "encode_cursor_payload",
     "decode_cursor_payload",
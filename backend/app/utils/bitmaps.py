@@ -0,0 +1,88 @@
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Generic, TypeVar
+from uuid import UUID
+
+K = TypeVar("K", bound=Hashable)
+
+# Bit positions set in each byte value, for walking a bitmap a byte at a time.
+_BYTE_BITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+)
+
+
+class IdBitmaps(Generic[K]):
+    """Id sets per key, stored as bitmaps over dense id ordinals.
+
+    Each id gets the next free ordinal the first time it is added and keeps
+    it until the structure is rebuilt, so a set is one Python int with bit
+    `n` standing for the id at ordinal `n`. Unions and intersections are
+    then single integer operations whatever the set sizes.
+    """
+
+    def __init__(self) -> None:
+        self._ordinals: dict[UUID, int] = {}
+        self._ids: list[UUID] = []
+        self._bitmaps: dict[K, int] = {}
+        self._keys_by_id: dict[UUID, frozenset[K]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys_by_id)
+
+    def set(self, item_id: UUID, keys: Iterable[K]) -> None:
+        """Replace the keys `item_id` belongs to."""
+        self.remove(item_id)
+        key_set = frozenset(keys)
+        if not key_set:
+            return
+        ordinal = self._ordinals.get(item_id)
+        if ordinal is None:
+            ordinal = len(self._ids)
+            self._ordinals[item_id] = ordinal
+            self._ids.append(item_id)
+        bit = 1 << ordinal
+        for key in key_set:
+            self._bitmaps[key] = self._bitmaps.get(key, 0) | bit
+        self._keys_by_id[item_id] = key_set
+
+    def remove(self, item_id: UUID) -> None:
+        keys = self._keys_by_id.pop(item_id, None)
+        if keys is None:
+            return
+        bit = 1 << self._ordinals[item_id]
+        for key in keys:
+            bitmap = self._bitmaps[key] & ~bit
+            if bitmap:
+                self._bitmaps[key] = bitmap
+            else:
+                del self._bitmaps[key]
+
+    def match(self, groups: Mapping[str, Iterable[K]], *, match_all: bool) -> int:
+        """AND the groups together; keys inside a group are ORed, or ANDed
+        with `match_all`. An empty mapping matches nothing.
+        """
+        matched: int | None = None
+        for keys in groups.values():
+            group: int | None = None
+            for key in keys:
+                bitmap = self._bitmaps.get(key, 0)
+                if group is None:
+                    group = bitmap
+                elif match_all:
+                    group &= bitmap
+                else:
+                    group |= bitmap
+            group = group or 0
+            matched = group if matched is None else matched & group
+            if not matched:
+                return 0
+        return matched or 0
+
+    def ids(self, bitmap: int) -> list[UUID]:
+        """Ids whose bits are set, in ordinal order."""
+        ids: list[UUID] = []
+        raw = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+        for byte_index, byte in enumerate(raw):
+            if byte:
+                base = byte_index * 8
+                ids.extend(self._ids[base + bit] for bit in _BYTE_BITS[byte])
+        return ids
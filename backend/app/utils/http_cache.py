@@ -0,0 +1,14 @@
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an `If-None-Match` header matches `etag`.
+
+    Uses the weak comparison RFC 9110 prescribes for `If-None-Match`, so a
+    `W/` prefix on either side is ignored; `*` matches any current body.
+    """
+    if not if_none_match:
+        return False
+    expected = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == expected:
+            return True
+    return False
@@ -0,0 +1,91 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import Generic, TypeVar
+
+S = TypeVar("S")
+
+SnapshotOperation = Callable[[S], None]
+
+
+class SnapshotReloader(Generic[S]):
+    """An in-memory snapshot rebuilt in full and patched between rebuilds.
+
+    `load` swaps in a snapshot built by a `read` callback. Writers patch the
+    current snapshot through `apply`. Each operation is also journaled for
+    every read in progress and replayed onto its result, so a rebuild never
+    loses a write that committed after its read began. `ensure_fresh`
+    coalesces concurrent callers into one rebuild once the snapshot is older
+    than `max_age_seconds`. Until the first load `apply` is a no-op.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._snapshot: S | None = None
+        self._loaded_at: float | None = None
+        # Writes seen while a read is in progress; replayed onto its result.
+        self._journals: list[list[SnapshotOperation[S]]] = []
+        self._inflight: asyncio.Task[None] | None = None
+
+    @property
+    def snapshot(self) -> S | None:
+        return self._snapshot
+
+    def is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and self._clock() - self._loaded_at < self.max_age_seconds
+        )
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._loaded_at = None
+        # Reads still in progress keep their own journals and are discarded.
+        self._journals = []
+        self._inflight = None
+
+    async def load(self, read: Callable[[], Awaitable[S]]) -> None:
+        """Replace the snapshot with `read()`, replaying writes made meanwhile."""
+        journals = self._journals
+        journal: list[SnapshotOperation[S]] = []
+        journals.append(journal)
+        try:
+            loaded_at = self._clock()
+            snapshot = await read()
+            for operation in journal:
+                operation(snapshot)
+        finally:
+            journals.remove(journal)
+        if journals is self._journals:
+            self._snapshot = snapshot
+            self._loaded_at = loaded_at
+
+    async def ensure_fresh(self, read: Callable[[], Awaitable[S]]) -> None:
+        """Reload a stale snapshot, joining any reload already in flight."""
+        if self.is_fresh():
+            return
+        if self._inflight is None:
+            task = asyncio.create_task(self.load(read))
+            task.add_done_callback(self._clear_inflight)
+            self._inflight = task
+        await asyncio.shield(self._inflight)
+
+    def apply(self, operation: SnapshotOperation[S]) -> None:
+        if self._snapshot is None:
+            return
+        operation(self._snapshot)
+        for journal in self._journals:
+            journal.append(operation)
+
+    def _clear_inflight(self, task: asyncio.Task[None]) -> None:
+        if self._inflight is task:
+            self._inflight = None
+        if not task.cancelled():
+            # Mark the exception retrieved; awaiting callers re-raise it.
+            task.exception()